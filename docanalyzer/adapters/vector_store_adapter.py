@@ -464,6 +464,96 @@ class VectorStoreAdapter:
             logger.error(f"Chunk deletion failed: {e}")
             self._handle_vector_store_error(e, "delete_chunks")
     
+    async def update_source_path(
+        self,
+        source_path: str,
+        new_source_path: str,
+        limit: int = DEFAULT_LIMIT
+    ) -> int:
+        """
+        Move chunks of a source file to a new source path.
+        
+        The vector store has no partial update command, so every chunk is
+        stored again under a new UUID with its existing embedding and the
+        new source_path, then the old chunks are deleted. Content is not
+        re-embedded. If storing the copies or deleting the old chunks
+        fails, copies already stored are removed and the error is raised,
+        so the new path never holds chunks next to a reprocessed file.
+        
+        Args:
+            source_path (str): Current source_path of the chunks.
+                Must be non-empty string.
+            new_source_path (str): New source_path.
+                Must be non-empty string.
+            limit (int): Maximum number of chunks to move.
+                Must be positive integer. Defaults to DEFAULT_LIMIT.
+        
+        Returns:
+            int: Number of chunks moved, 0 if source_path has no chunks.
+        
+        Raises:
+            ValidationError: If a source path is empty
+            ProcessingError: If chunks are returned without embeddings or
+                cannot be stored or deleted
+            ConnectionError: If vector store is not connected
+        """
+        if not source_path or not new_source_path:
+            raise ValidationError("Source paths cannot be empty")
+        
+        results = await self.search_by_metadata({"source_path": source_path}, limit=limit)
+        if not results:
+            return 0
+        
+        # Search returns SearchResult wrappers around the stored chunks
+        chunks = [result.chunk for result in results]
+        if any(not chunk.embedding for chunk in chunks):
+            raise ProcessingError(
+                "vector_store_error",
+                f"Chunks of {source_path} were returned without embeddings",
+                ErrorCategory.PROCESSING
+            )
+        
+        try:
+            copies = [
+                chunk.model_copy(update={"uuid": str(uuid.uuid4()), "source_path": new_source_path})
+                for chunk in chunks
+            ]
+            stored = []
+            try:
+                for i in range(0, len(copies), self.batch_size):
+                    batch = copies[i:i + self.batch_size]
+                    response = await self.client.create_chunks(batch)
+                    if not response.success or response.failed_count:
+                        raise ProcessingError(
+                            "vector_store_error",
+                            f"Failed to store chunks for {new_source_path}: {response}",
+                            ErrorCategory.PROCESSING
+                        )
+                    stored.extend(chunk.uuid for chunk in batch)
+                
+                if not await self.delete_chunks([chunk.uuid for chunk in chunks]):
+                    raise ProcessingError(
+                        "vector_store_error",
+                        f"Failed to delete chunks of {source_path}",
+                        ErrorCategory.PROCESSING
+                    )
+            except Exception:
+                if stored:
+                    try:
+                        await self.client.delete_chunks(stored)
+                    except Exception as cleanup_error:
+                        logger.error(f"Failed to remove chunk copies under {new_source_path}: {cleanup_error}")
+                raise
+            
+            logger.info(f"Moved {len(chunks)} chunks from {source_path} to {new_source_path}")
+            return len(chunks)
+        
+        except ProcessingError:
+            raise
+        except Exception as e:
+            logger.error(f"Source path update failed: {e}")
+            self._handle_vector_store_error(e, "update_source_path")
+    
     async def get_chunk_count(self) -> int:
         """
         Get total number of chunks in vector store.
@@ -549,6 +639,16 @@ class VectorStoreAdapter:
             if block.metadata:
                 metadata.update(block.metadata)
             
+            chunk_kwargs = {}
+            # Keep caller-assigned chunk UUID so stored chunks can be rolled back
+            if block.metadata and block.metadata.get("uuid"):
+                chunk_kwargs["uuid"] = block.metadata["uuid"]
+            
+            # Precomputed embedding travels on the chunk, not in its metadata
+            embedding = metadata.pop("embedding", None)
+            if embedding:
+                chunk_kwargs["embedding"] = embedding
+
             # Create SemanticChunk instance using new model
             chunk = SemanticChunk(
                 source_path=source_path,
@@ -557,7 +657,8 @@ class VectorStoreAdapter:
                 status=ChunkStatus.NEW,
                 metadata=metadata,
                 chunk_type="text",  # Default chunk type
-                language="en"  # Default language
+                language="en",  # Default language
+                **chunk_kwargs
             )
             
             return chunk
@@ -30,6 +30,7 @@ def get_file_watcher_settings() -> Dict[str, Any]:
         Dict[str, Any]: File watcher settings with the following structure:
             - directories (List[str]): List of directories to monitor
             - scan_interval (int): Interval between scans in seconds
+            - watch_mode (str): Change detection mode ('inotify' or 'poll')
             - lock_timeout (int): Lock timeout in seconds
             - max_processes (int): Maximum number of concurrent processes
     
@@ -48,6 +49,7 @@ def get_file_watcher_settings() -> Dict[str, Any]:
         settings = {
             'directories': ["./documents", "./docs"],
             'scan_interval': 300,
+            'watch_mode': 'inotify',
             'lock_timeout': 3600,
             'max_processes': 5
         }
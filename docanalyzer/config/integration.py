@@ -123,6 +123,7 @@ class DocAnalyzerConfig:
             'file_watcher': {
                 'directories': ["./documents", "./docs"],
                 'scan_interval': 300,
+                'watch_mode': 'inotify',
                 'lock_timeout': 3600,
                 'max_processes': 5
             },
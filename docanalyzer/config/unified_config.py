@@ -116,7 +116,11 @@ class FileWatcherConfig:
         directories (List[str]): List of directories to monitor.
             Defaults to ["./documents", "./docs"].
         scan_interval (int): Interval between scans in seconds.
+            Used when watch_mode is 'poll' or inotify is unavailable.
             Must be positive integer. Defaults to 300.
+        watch_mode (str): Change detection mode, 'inotify' for
+            event-driven watching on Linux or 'poll' for periodic scans.
+            Defaults to 'inotify'.
         lock_timeout (int): Lock timeout in seconds.
             Must be positive integer. Defaults to 3600.
         max_processes (int): Maximum number of concurrent processes.
@@ -124,6 +128,7 @@ class FileWatcherConfig:
     """
     directories: list[str] = field(default_factory=lambda: ["./documents", "./docs"])
     scan_interval: int = 300
+    watch_mode: str = "inotify"
     lock_timeout: int = 3600
     max_processes: int = 5
 
@@ -182,10 +187,30 @@ class EmbeddingConfig:
             Defaults to 8001.
         timeout (int): Request timeout in seconds. Must be positive integer.
             Defaults to 30.
+        max_batch_texts (int): Maximum number of texts per embed request.
+            Must be positive integer. Defaults to 64.
+        max_batch_bytes (int): Maximum total UTF-8 size of texts per embed
+            request in bytes. Must be positive integer. Defaults to 1048576.
+        max_wait_ms (int): Maximum time in milliseconds a queued text waits
+            for other texts before its batch is sent. Must be non-negative
+            integer. Defaults to 10.
+        model_name (str): Embedding model identifier. Part of embedding
+            cache keys. Defaults to "default".
+        cache_path (str): Path to the persistent embedding cache file.
+            Empty string disables the cache. Defaults to
+            "./data/embedding_cache.sqlite".
+        cache_max_bytes (int): Maximum size of cached vectors in bytes.
+            Must be positive integer. Defaults to 268435456.
     """
     base_url: str = "http://localhost"
     port: int = 8001
     timeout: int = 30
+    max_batch_texts: int = 64
+    max_batch_bytes: int = 1048576
+    max_wait_ms: int = 10
+    model_name: str = "default"
+    cache_path: str = "./data/embedding_cache.sqlite"
+    cache_max_bytes: int = 268435456
 
 
 class UnifiedConfig:
@@ -326,6 +351,7 @@ class UnifiedConfig:
         return FileWatcherConfig(
             directories=file_watcher_settings.get('directories', ["./documents", "./docs"]),
             scan_interval=file_watcher_settings.get('scan_interval', 300),
+            watch_mode=file_watcher_settings.get('watch_mode', "inotify"),
             lock_timeout=file_watcher_settings.get('lock_timeout', 3600),
             max_processes=file_watcher_settings.get('max_processes', 5)
         )
@@ -369,7 +395,13 @@ class UnifiedConfig:
         return EmbeddingConfig(
             base_url=embedding_settings.get('base_url', 'http://localhost'),
             port=embedding_settings.get('port', 8001),
-            timeout=embedding_settings.get('timeout', 30)
+            timeout=embedding_settings.get('timeout', 30),
+            max_batch_texts=embedding_settings.get('max_batch_texts', 64),
+            max_batch_bytes=embedding_settings.get('max_batch_bytes', 1048576),
+            max_wait_ms=embedding_settings.get('max_wait_ms', 10),
+            model_name=embedding_settings.get('model_name', 'default'),
+            cache_path=embedding_settings.get('cache_path', './data/embedding_cache.sqlite'),
+            cache_max_bytes=embedding_settings.get('cache_max_bytes', 268435456)
         )
     
     def reload_configuration(self) -> None:
@@ -423,6 +455,9 @@ class UnifiedConfig:
         if self.file_watcher.scan_interval <= 0:
             errors.append("Scan interval must be positive")
         
+        if self.file_watcher.watch_mode not in ['inotify', 'poll']:
+            errors.append(f"Invalid watch mode: {self.file_watcher.watch_mode}")
+        
         if self.file_watcher.lock_timeout <= 0:
             errors.append("Lock timeout must be positive")
         
@@ -441,6 +476,18 @@ class UnifiedConfig:
             if service_config.timeout <= 0:
                 errors.append(f"{service_name} timeout must be positive")
         
+        if self.embedding.max_batch_texts <= 0:
+            errors.append("embedding max_batch_texts must be positive")
+        
+        if self.embedding.max_batch_bytes <= 0:
+            errors.append("embedding max_batch_bytes must be positive")
+        
+        if self.embedding.max_wait_ms < 0:
+            errors.append("embedding max_wait_ms must be non-negative")
+        
+        if self.embedding.cache_max_bytes <= 0:
+            errors.append("embedding cache_max_bytes must be positive")
+        
         if errors:
             logger.warning(f"Configuration validation failed with {len(errors)} errors")
             raise ValidationError("Configuration validation failed", errors)
@@ -515,6 +562,7 @@ class UnifiedConfig:
             'file_watcher': {
                 'directories': self.file_watcher.directories,
                 'scan_interval': self.file_watcher.scan_interval,
+                'watch_mode': self.file_watcher.watch_mode,
                 'lock_timeout': self.file_watcher.lock_timeout,
                 'max_processes': self.file_watcher.max_processes
             },
@@ -531,7 +579,13 @@ class UnifiedConfig:
             'embedding': {
                 'base_url': self.embedding.base_url,
                 'port': self.embedding.port,
-                'timeout': self.embedding.timeout
+                'timeout': self.embedding.timeout,
+                'max_batch_texts': self.embedding.max_batch_texts,
+                'max_batch_bytes': self.embedding.max_batch_bytes,
+                'max_wait_ms': self.embedding.max_wait_ms,
+                'model_name': self.embedding.model_name,
+                'cache_path': self.embedding.cache_path,
+                'cache_max_bytes': self.embedding.cache_max_bytes
             }
         }
 
@@ -158,6 +158,12 @@ def validate_file_watcher_settings() -> List[str]:
             elif scan_interval <= 0:
                 errors.append("file_watcher.scan_interval must be positive")
         
+        # Validate watch_mode
+        if 'watch_mode' in settings:
+            watch_mode = settings['watch_mode']
+            if watch_mode not in ['inotify', 'poll']:
+                errors.append("file_watcher.watch_mode must be 'inotify' or 'poll'")
+        
         # Validate lock_timeout
         if 'lock_timeout' in settings:
             lock_timeout = settings['lock_timeout']
@@ -382,6 +388,25 @@ def validate_embedding_settings() -> List[str]:
             elif batch_size <= 0:
                 errors.append("embedding.batch_size must be positive")
         
+        # Validate request batch and cache size limits
+        for key in ('max_batch_texts', 'max_batch_bytes', 'cache_max_bytes'):
+            if key in settings:
+                value = settings[key]
+                if not isinstance(value, int):
+                    errors.append(f"embedding.{key} must be an integer")
+                elif value <= 0:
+                    errors.append(f"embedding.{key} must be positive")
+        
+        if 'max_wait_ms' in settings:
+            max_wait_ms = settings['max_wait_ms']
+            if not isinstance(max_wait_ms, int):
+                errors.append("embedding.max_wait_ms must be an integer")
+            elif max_wait_ms < 0:
+                errors.append("embedding.max_wait_ms must be non-negative")
+        
+        if 'cache_path' in settings and not isinstance(settings['cache_path'], str):
+            errors.append("embedding.cache_path must be a string")
+        
     except Exception as e:
         errors.append(f"Failed to validate embedding settings: {e}")
     
@@ -9,11 +9,13 @@ Version: 1.0.0
 """
 
 from .file_filter import FileFilter, FileFilterResult, SupportedFileTypes
+from .pattern_matcher import PatternMatcher
 
 __all__ = [
     "FileFilter",
     "FileFilterResult", 
-    "SupportedFileTypes"
+    "SupportedFileTypes",
+    "PatternMatcher"
 ]
 
 __version__ = "1.0.0" 
\ No newline at end of file
@@ -14,12 +14,12 @@ Author: DocAnalyzer Team
 Version: 1.0.0
 """
 
-from typing import List, Dict, Optional, Set, Union
-from pathlib import Path
+from typing import List, Dict, Optional, Set, Tuple, Union
 from enum import Enum
 import logging
 
 from docanalyzer.models.file_system import FileInfo
+from docanalyzer.filters.pattern_matcher import PatternMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -190,7 +190,8 @@ class FileFilter:
         min_file_size (int): Minimum file size in bytes.
             Files smaller than this will be rejected.
         exclude_patterns (List[str]): Patterns to exclude from processing.
-            Supports glob patterns for file matching.
+            Supports glob patterns for file matching. Directories below a
+            scanned root that match a pattern are not traversed.
         include_patterns (List[str]): Patterns to include in processing.
             Supports glob patterns for file matching.
     
@@ -253,6 +254,11 @@ class FileFilter:
         self.min_file_size = min_file_size
         self.exclude_patterns = exclude_patterns or []
         self.include_patterns = include_patterns or []
+        
+        # Compiled on first use and recompiled if a pattern list changes
+        self._matchers: Dict[str, Tuple[Tuple[str, ...], PatternMatcher]] = {}
+        self._extension_key: Optional[frozenset] = None
+        self._normalized_extensions: Set[str] = set()
     
     def filter_file(self, file_info: FileInfo) -> FileFilterResult:
         """
@@ -396,7 +402,7 @@ class FileFilter:
             )
         
         # Check if file extension is supported
-        if file_info.file_extension.lower() in {ext.lower().lstrip('.') for ext in self.supported_extensions}:
+        if file_info.file_extension.lower() in self._get_normalized_extensions():
             return FileFilterResult(
                 should_process=True,
                 reason=f"Extension {file_info.file_extension} is supported",
@@ -498,33 +504,33 @@ class FileFilter:
         file_path = file_info.file_path
         
         # Check exclude patterns first
-        for pattern in self.exclude_patterns:
-            if Path(file_path).match(pattern):
+        pattern = self._get_matcher("exclude", self.exclude_patterns).match(file_path)
+        if pattern is not None:
+            return FileFilterResult(
+                should_process=False,
+                reason=f"File matches exclude pattern: {pattern}",
+                filter_name="pattern_filter",
+                metadata={
+                    "file_path": file_path,
+                    "matched_pattern": pattern,
+                    "pattern_type": "exclude"
+                }
+            )
+        
+        # Check include patterns (if any specified)
+        if self.include_patterns:
+            pattern = self._get_matcher("include", self.include_patterns).match(file_path)
+            if pattern is not None:
                 return FileFilterResult(
-                    should_process=False,
-                    reason=f"File matches exclude pattern: {pattern}",
+                    should_process=True,
+                    reason=f"File matches include pattern: {pattern}",
                     filter_name="pattern_filter",
                     metadata={
                         "file_path": file_path,
                         "matched_pattern": pattern,
-                        "pattern_type": "exclude"
+                        "pattern_type": "include"
                     }
                 )
-        
-        # Check include patterns (if any specified)
-        if self.include_patterns:
-            for pattern in self.include_patterns:
-                if Path(file_path).match(pattern):
-                    return FileFilterResult(
-                        should_process=True,
-                        reason=f"File matches include pattern: {pattern}",
-                        filter_name="pattern_filter",
-                        metadata={
-                            "file_path": file_path,
-                            "matched_pattern": pattern,
-                            "pattern_type": "include"
-                        }
-                    )
             
             # No include patterns matched
             return FileFilterResult(
@@ -545,6 +551,114 @@ class FileFilter:
             metadata={"file_path": file_path}
         )
     
+    def is_directory_excluded(self, directory_path: str) -> bool:
+        """
+        Check if a directory matches any exclude pattern.
+        
+        Used by directory traversal to skip excluded subtrees, such as
+        "node_modules" or ".git", without listing them. The directory
+        path is matched like a file path, so a pattern that names a
+        directory excludes everything below it.
+        
+        Args:
+            directory_path (str): Path to the directory.
+                Must be non-empty string.
+        
+        Returns:
+            bool: True if the directory matches an exclude pattern.
+        
+        Raises:
+            ValueError: If directory_path is empty
+        
+        Example:
+            >>> filter = FileFilter(exclude_patterns=["node_modules"])
+            >>> filter.is_directory_excluded("/project/node_modules")  # True
+        """
+        if not directory_path:
+            raise ValueError("directory_path cannot be empty")
+        
+        if not self.exclude_patterns:
+            return False
+        
+        return self._get_matcher("exclude", self.exclude_patterns).match(directory_path) is not None
+    
+    def accepts_file_name(self, file_name: str) -> bool:
+        """
+        Check if a file name passes the extension filter.
+        
+        Gives the same decision as the extension check of filter_file
+        from the name alone, so directory traversal can reject files
+        before stat'ing them or building FileInfo.
+        
+        Args:
+            file_name (str): File name or path.
+        
+        Returns:
+            bool: True if the extension is supported.
+        
+        Example:
+            >>> filter = FileFilter(supported_extensions={".txt"})
+            >>> filter.accepts_file_name("notes.TXT")  # True
+        """
+        if not self.supported_extensions:
+            return True
+        
+        # Same rules as Path.suffix
+        name = file_name[file_name.rfind("/") + 1:]
+        dot = name.rfind(".")
+        extension = name[dot + 1:].lower() if 0 < dot < len(name) - 1 else ""
+        return extension in self._get_normalized_extensions()
+    
+    def accepts_file_size(self, file_size: int) -> bool:
+        """
+        Check if a file size passes the size filter.
+        
+        Args:
+            file_size (int): File size in bytes.
+        
+        Returns:
+            bool: True if the size is within min_file_size and max_file_size.
+        
+        Example:
+            >>> filter = FileFilter(max_file_size=1024)
+            >>> filter.accepts_file_size(2048)  # False
+        """
+        return self.min_file_size <= file_size <= self.max_file_size
+    
+    def _get_matcher(self, name: str, patterns: List[str]) -> PatternMatcher:
+        """
+        Get compiled matcher for a pattern list.
+        
+        Args:
+            name (str): Name of the pattern list, used as cache key.
+            patterns (List[str]): Current patterns of the list.
+        
+        Returns:
+            PatternMatcher: Matcher compiled from the current patterns.
+        
+        Raises:
+            ValueError: If any pattern is empty
+        """
+        key = tuple(patterns)
+        cached = self._matchers.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, PatternMatcher(key))
+            self._matchers[name] = cached
+        return cached[1]
+    
+    def _get_normalized_extensions(self) -> Set[str]:
+        """
+        Get supported extensions lowercased and without leading dot.
+        
+        Returns:
+            Set[str]: Normalized supported extensions.
+        """
+        key = frozenset(self.supported_extensions)
+        if key != self._extension_key:
+            self._normalized_extensions = {ext.lower().lstrip('.') for ext in key}
+            self._extension_key = key
+        return self._normalized_extensions
+    
     def get_supported_extensions(self) -> Set[str]:
         """
         Get the set of supported file extensions.
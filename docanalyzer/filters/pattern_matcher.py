@@ -0,0 +1,178 @@
+"""
+Pattern Matcher - Compiled Glob Pattern Sets
+
+Compiles a list of glob patterns once so that a path can be tested
+against all of them without building Path objects or calling
+Path.match per pattern.
+
+Matching follows PurePosixPath.match: relative patterns match the last
+components of a path, absolute patterns match the whole path, and
+wildcards never cross a path separator. Patterns that are a plain file
+name (e.g. "node_modules") or a wildcard followed by an extension
+(e.g. "*.log") are answered with hash lookups; all other patterns are
+combined into one regular expression.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import re
+from pathlib import PurePosixPath
+from typing import Dict, Iterable, List, Optional, Pattern
+
+MAGIC_CHARACTERS = frozenset("*?[")
+
+
+def _translate_part(part: str) -> str:
+    """
+    Translate one glob path component into a regular expression.
+
+    Mirrors fnmatch.translate, except that wildcards and character
+    classes never match a path separator.
+
+    Args:
+        part (str): Glob pattern of a single path component.
+
+    Returns:
+        str: Regular expression source for the component.
+    """
+    result: List[str] = []
+    i, n = 0, len(part)
+    while i < n:
+        c = part[i]
+        i += 1
+        if c == "*":
+            while i < n and part[i] == "*":
+                i += 1
+            result.append("[^/]*")
+        elif c == "?":
+            result.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and part[j] == "!":
+                j += 1
+            if j < n and part[j] == "]":
+                j += 1
+            while j < n and part[j] != "]":
+                j += 1
+            if j >= n:
+                result.append("\\[")
+            else:
+                stuff = part[i:j].replace("\\", "\\\\")
+                i = j + 1
+                if stuff[0] == "!":
+                    stuff = "^" + stuff[1:]
+                elif stuff[0] in ("^", "["):
+                    stuff = "\\" + stuff
+                result.append(f"(?!/)[{stuff}]")
+        else:
+            result.append(re.escape(c))
+    return "".join(result)
+
+
+class PatternMatcher:
+    """
+    Pattern Matcher - Compiled set of glob patterns.
+
+    Tests paths against a fixed list of glob patterns with the same
+    result as calling PurePosixPath(path).match(pattern) for each one.
+
+    Attributes:
+        patterns (List[str]): Patterns in the order they were given.
+
+    Example:
+        >>> matcher = PatternMatcher(["*.log", "node_modules", "build/*"])
+        >>> matcher.match("/project/build/output.txt")  # "build/*"
+        >>> matcher.match("/project/README.md")  # None
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Initialize PatternMatcher instance.
+
+        Args:
+            patterns (Iterable[str]): Glob patterns to compile.
+                Each must be non-empty string.
+
+        Raises:
+            ValueError: If any pattern is empty
+            TypeError: If any pattern is not string
+        """
+        self.patterns = list(patterns)
+        self._names: Dict[str, str] = {}
+        self._extensions: Dict[str, str] = {}
+        self._group_patterns: Dict[str, str] = {}
+        self._regex: Optional[Pattern[str]] = None
+
+        alternatives: List[str] = []
+        for index, pattern in enumerate(self.patterns):
+            if not isinstance(pattern, str):
+                raise TypeError("pattern must be string")
+
+            parts = PurePosixPath(pattern).parts
+            if not parts:
+                raise ValueError("pattern cannot be empty")
+
+            if len(parts) == 1 and parts[0] != "/":
+                name = parts[0]
+                suffix = name[1:]
+                if not MAGIC_CHARACTERS.intersection(name):
+                    self._names.setdefault(name, pattern)
+                    continue
+                if (name[0] == "*" and suffix.startswith(".")
+                        and "." not in suffix[1:] and not MAGIC_CHARACTERS.intersection(suffix)):
+                    self._extensions.setdefault(suffix, pattern)
+                    continue
+
+            if parts[0] == "/":
+                source = "^/" + "/".join(_translate_part(part) for part in parts[1:]) + "$"
+            else:
+                source = "(?:^|/)" + "/".join(_translate_part(part) for part in parts) + "$"
+
+            group = f"p{index}"
+            self._group_patterns[group] = pattern
+            alternatives.append(f"(?P<{group}>{source})")
+
+        if alternatives:
+            self._regex = re.compile("|".join(alternatives))
+
+    def __len__(self) -> int:
+        """
+        Get number of patterns.
+
+        Returns:
+            int: Number of patterns in the matcher.
+        """
+        return len(self.patterns)
+
+    def match(self, path: str) -> Optional[str]:
+        """
+        Find a pattern matching the path.
+
+        Args:
+            path (str): Path to test. Components must be separated
+                by "/" without empty or trailing components.
+
+        Returns:
+            Optional[str]: A matching pattern, or None if no pattern
+                matches.
+        """
+        name = path[path.rfind("/") + 1:]
+
+        pattern = self._names.get(name)
+        if pattern is not None:
+            return pattern
+
+        if self._extensions:
+            dot = name.rfind(".")
+            if dot >= 0:
+                pattern = self._extensions.get(name[dot:])
+                if pattern is not None:
+                    return pattern
+
+        if self._regex is not None:
+            found = self._regex.search(path)
+            if found is not None:
+                return self._group_patterns[found.lastgroup]
+
+        return None
@@ -11,7 +11,7 @@ Author: DocAnalyzer Team
 Version: 1.0.0
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 from pathlib import Path
 import os
@@ -49,6 +49,14 @@ class FileInfo:
             None if file has never been processed.
         metadata (Dict[str, Any]): Additional file metadata.
             Can contain custom attributes specific to file type.
+        mtime_ns (int): Last modification time in nanoseconds.
+        stat_result (Optional[os.stat_result]): Stat data the instance was
+            created from by from_stat, or None.
+    
+    Instances use __slots__. Instances created by from_stat keep the stat
+    data and convert it to modification_time and metadata only when those
+    are first read, so discovering a file allocates little more than the
+    stat result itself.
     
     Example:
         >>> file_info = FileInfo("/path/to/document.txt", 1024, datetime.now())
@@ -60,6 +68,18 @@ class FileInfo:
         FileNotFoundError: If file_path doesn't exist on the system
     """
     
+    __slots__ = (
+        "file_path",
+        "file_size",
+        "is_directory",
+        "processing_status",
+        "last_processed",
+        "stat_result",
+        "_modification_time",
+        "_mtime_ns",
+        "_metadata",
+    )
+    
     def __init__(
         self,
         file_path: str,
@@ -116,14 +136,128 @@ class FileInfo:
         # Set instance attributes
         self.file_path = file_path
         self.file_size = file_size
-        self.modification_time = modification_time
         self.is_directory = is_directory
         self.processing_status = processing_status
         self.last_processed = last_processed
-        self.metadata = metadata or {}
+        self.stat_result = None
+        self._modification_time = modification_time
+        self._mtime_ns = None
+        self._metadata = metadata or {}
         
         logger.debug(f"Created FileInfo for: {file_path}")
     
+    @classmethod
+    def from_stat(cls, file_path: str, stat_result: os.stat_result) -> 'FileInfo':
+        """
+        Create FileInfo for a regular file from stat data already obtained.
+        
+        Trusted constructor for scanners: the arguments are not validated
+        and the file is not checked again. modification_time and metadata
+        are derived from stat_result on first access; metadata then holds
+        extension, permissions, owner_id, group_id, device, inode and
+        mtime_ns.
+        
+        Args:
+            file_path (str): Path to the file.
+            stat_result (os.stat_result): Stat data of the file.
+        
+        Returns:
+            FileInfo: File information with processing status "pending".
+        
+        Example:
+            >>> file_info = FileInfo.from_stat(entry.path, entry.stat())
+        """
+        file_info = cls.__new__(cls)
+        file_info.file_path = file_path
+        file_info.file_size = stat_result.st_size
+        file_info.is_directory = False
+        file_info.processing_status = "pending"
+        file_info.last_processed = None
+        file_info.stat_result = stat_result
+        file_info._modification_time = None
+        file_info._mtime_ns = stat_result.st_mtime_ns
+        file_info._metadata = None
+        return file_info
+    
+    @property
+    def modification_time(self) -> datetime:
+        """
+        Get last modification time.
+        
+        Returns:
+            datetime: Modification time in local time.
+        """
+        if self._modification_time is None:
+            self._modification_time = datetime.fromtimestamp(self._mtime_ns / 1_000_000_000)
+        return self._modification_time
+    
+    @modification_time.setter
+    def modification_time(self, value: datetime) -> None:
+        self._modification_time = value
+        self._mtime_ns = int(value.timestamp() * 1_000_000_000)
+        # mtime_ns in metadata would otherwise keep the previous time
+        if "mtime_ns" in self.metadata:
+            self.metadata["mtime_ns"] = self._mtime_ns
+    
+    @property
+    def mtime_ns(self) -> int:
+        """
+        Get last modification time in nanoseconds.
+        
+        Returns:
+            int: Modification time from stat data or metadata, else
+                converted from modification_time.
+        """
+        if self._mtime_ns is None:
+            mtime_ns = self.metadata.get("mtime_ns")
+            if mtime_ns is None:
+                mtime_ns = int(self._modification_time.timestamp() * 1_000_000_000)
+            self._mtime_ns = mtime_ns
+        return self._mtime_ns
+    
+    @property
+    def file_id(self) -> Optional[Tuple[int, int]]:
+        """
+        Get device and inode identifying the file across paths.
+        
+        Returns:
+            Optional[Tuple[int, int]]: Device and inode from stat data or
+                metadata, or None if unknown.
+        """
+        if self.stat_result is not None:
+            return self.stat_result.st_dev, self.stat_result.st_ino
+        device = self.metadata.get("device")
+        inode = self.metadata.get("inode")
+        if device is None or inode is None:
+            return None
+        return device, inode
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Get additional file metadata.
+        
+        Returns:
+            Dict[str, Any]: Metadata dictionary, built from stat data on
+                first access for instances created by from_stat.
+        """
+        if self._metadata is None:
+            stat_result = self.stat_result
+            self._metadata = {
+                "extension": os.path.splitext(self.file_path)[1].lower(),
+                "permissions": oct(stat_result.st_mode)[-3:],
+                "owner_id": stat_result.st_uid,
+                "group_id": stat_result.st_gid,
+                "device": stat_result.st_dev,
+                "inode": stat_result.st_ino,
+                "mtime_ns": stat_result.st_mtime_ns
+            }
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
+    
     @property
     def file_name(self) -> str:
         """
@@ -11,7 +11,7 @@ Author: DocAnalyzer Team
 Version: 1.0.0
 """
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Iterable, Union
 from datetime import datetime
 from enum import Enum
 import uuid
@@ -77,6 +77,10 @@ class ProcessingBlock:
             Used for tracking and debugging purposes.
         modified_at (datetime): Timestamp when block was last modified.
             Updated when block content or metadata changes.
+        source (Optional[Any]): Mapped source file the content is decoded
+            from, or None if the block stores its content.
+        start_byte (Optional[int]): Start offset of the content in source.
+        end_byte (Optional[int]): End offset of the content in source.
     
     Example:
         >>> block = ProcessingBlock("Hello world", "paragraph", 1, 1, 0, 11)
@@ -176,6 +180,107 @@ class ProcessingBlock:
         
         logger.debug(f"Created ProcessingBlock: {self.block_id}")
     
+    @property
+    def content(self) -> str:
+        """
+        Get text content of the block.
+        
+        Mapped blocks decode their content from the source on every
+        access instead of keeping a copy. The source is not checked for
+        changes here; see validate_sources().
+        
+        Returns:
+            str: Text content of the block.
+        
+        Raises:
+            ValueError: If the mapped source is closed
+        """
+        if self._content is None:
+            return self.source.decode(self.start_byte, self.end_byte)
+        return self._content
+    
+    @content.setter
+    def content(self, value: str) -> None:
+        """
+        Set text content of the block and detach it from its source.
+        
+        Args:
+            value (str): New text content.
+        """
+        self._content = value
+        self.source = None
+        self.start_byte = None
+        self.end_byte = None
+    
+    @property
+    def is_mapped(self) -> bool:
+        """
+        Check whether content is decoded from a mapped source.
+        
+        Returns:
+            bool: True if the block stores only byte offsets.
+        """
+        return self._content is None
+    
+    def map_to_source(self, source: Any, start_byte: int, end_byte: int) -> None:
+        """
+        Replace stored content by a byte range of a mapped source.
+        
+        The caller guarantees that source.decode(start_byte, end_byte)
+        equals the current content.
+        
+        Args:
+            source (Any): Object with decode(start_byte, end_byte) -> str,
+                usually a MappedFile. See __getstate__() for pickling.
+            start_byte (int): Start offset of the content in source.
+            end_byte (int): End offset of the content in source.
+        
+        Example:
+            >>> block.map_to_source(mapped_file, 120, 131)
+            >>> block.is_mapped  # True
+        """
+        self.source = source
+        self.start_byte = start_byte
+        self.end_byte = end_byte
+        self._content = None
+    
+    @staticmethod
+    def validate_sources(blocks: Iterable['ProcessingBlock']) -> None:
+        """
+        Validate each distinct mapped source of blocks once.
+        
+        Callers reading the content of a batch of blocks call this first,
+        so a changed source is detected once per batch instead of on
+        every content access. Sources without validate() are skipped.
+        
+        Args:
+            blocks (Iterable[ProcessingBlock]): Blocks about to be read.
+        
+        Raises:
+            ValueError: If a mapped source is closed or has changed
+        """
+        sources = {id(block.source): block.source for block in blocks if block.is_mapped}
+        for source in sources.values():
+            validate = getattr(source, "validate", None)
+            if validate is not None:
+                validate()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get picklable state of the block.
+        
+        Blocks mapped to a source with a true picklable attribute, such
+        as MappedFile, keep their byte offsets and the source is pickled
+        with them. Content of other mapped blocks is decoded.
+        
+        Returns:
+            Dict[str, Any]: Instance state.
+        """
+        state = self.__dict__.copy()
+        if self._content is None and getattr(self.source, "picklable", False) is not True:
+            state.update(_content=self.content, source=None, start_byte=None, end_byte=None)
+        return state
+    
     @property
     def content_length(self) -> int:
         """
@@ -101,6 +101,9 @@ class SemanticChunk:
             Optional reference to vector embedding in storage.
         processing_metadata (Optional[Dict[str, Any]]): Processing-specific metadata.
             Optional metadata related to chunk processing operations.
+        embedding (Optional[List[float]]): Precomputed embedding vector.
+            Sent to vector store with the chunk when present. Not included
+            in to_dict() output.
     
     Example:
         >>> chunk = SemanticChunk(
@@ -125,6 +128,7 @@ class SemanticChunk:
     language: Optional[str] = None
     embedding_id: Optional[str] = None
     processing_metadata: Optional[Dict[str, Any]] = None
+    embedding: Optional[List[float]] = None
     
     def __post_init__(self):
         """
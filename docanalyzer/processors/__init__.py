@@ -9,6 +9,9 @@ The package includes:
 - Base processor interface and abstract classes
 - Text file processor for .txt files
 - Markdown processor for .md files
+- Memory-mapped source files for offset-only blocks
+- Byte order mark and prefix based encoding detection
+- Process/thread pool executor for running processors off the event loop
 - Common processing utilities and helpers
 
 Author: DocAnalyzer Team
@@ -18,12 +21,18 @@ Version: 1.0.0
 from .base_processor import BaseProcessor, ProcessorResult
 from .text_processor import TextProcessor
 from .markdown_processor import MarkdownProcessor
+from .processor_executor import ProcessorExecutor
+from .mapped_file import MappedFile
+from .encoding_detector import EncodingDetector
 
 __all__ = [
     "BaseProcessor",
     "ProcessorResult", 
     "TextProcessor",
-    "MarkdownProcessor"
+    "MarkdownProcessor",
+    "ProcessorExecutor",
+    "MappedFile",
+    "EncodingDetector"
 ]
 
 __version__ = "1.0.0" 
\ No newline at end of file
@@ -15,13 +15,14 @@ Version: 1.0.0
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterator
 from pathlib import Path
 import logging
 import os
 from datetime import datetime
 
 from docanalyzer.models.processing import ProcessingBlock, FileProcessingResult, ProcessingStatus
+from .mapped_file import MappedFile
 
 logger = logging.getLogger(__name__)
 
@@ -420,13 +421,134 @@ class BaseProcessor(ABC):
         """
         pass
     
-    def validate_file_path(self, file_path: str) -> None:
+    def read_file(self, file_path: str) -> str:
+        """
+        Validate file and read its text content.
+        
+        Allows reading to be done separately from parsing, for example by
+        the read stage of the staged processing pipeline. The content is
+        then passed to process_content().
+        
+        Args:
+            file_path (str): Path to the file to read.
+                Must be existing file path that this processor can handle.
+        
+        Returns:
+            str: File content.
+        
+        Raises:
+            FileNotFoundError: If file does not exist
+            PermissionError: If file cannot be read
+            ValueError: If file_path is empty or file cannot be processed
+            UnicodeDecodeError: If file encoding cannot be decoded
+        """
+        self.validate_file_path(file_path)
+        return self._read_file_content(file_path)
+    
+    def process_content(self, content: str, file_path: str) -> ProcessorResult:
+        """
+        Extract text blocks from already read file content.
+        
+        Processors that separate reading from parsing override this
+        method and implement process_file() as read_file() followed by
+        process_content().
+        
+        Args:
+            content (str): File content returned by read_file().
+            file_path (str): Path to the source file.
+        
+        Returns:
+            ProcessorResult: Result of the processing operation.
+        
+        Raises:
+            NotImplementedError: If processor only supports process_file()
+        """
+        raise NotImplementedError(f"{self.processor_name} does not support content processing")
+    
+    @property
+    def supports_content_processing(self) -> bool:
+        """
+        Check whether processor overrides process_content().
+        
+        Returns:
+            bool: True if read_file() and process_content() can be used
+                instead of process_file().
+        """
+        return type(self).process_content is not BaseProcessor.process_content
+    
+    def iter_file_blocks(self, file_path: str) -> Iterator[ProcessingBlock]:
+        """
+        Extract processing blocks from a file with bounded memory.
+        
+        Processors that can stream override this method. Unlike
+        process_file(), it is not limited to max_file_size_bytes.
+        
+        Args:
+            file_path (str): Path to the file to process.
+        
+        Returns:
+            Iterator[ProcessingBlock]: Blocks in file order.
+        
+        Raises:
+            NotImplementedError: If processor only supports process_file()
+        """
+        raise NotImplementedError(f"{self.processor_name} does not support streaming")
+    
+    @property
+    def supports_streaming(self) -> bool:
+        """
+        Check whether processor overrides iter_file_blocks().
+        
+        Returns:
+            bool: True if iter_file_blocks() can be used instead of
+                process_file().
+        """
+        return type(self).iter_file_blocks is not BaseProcessor.iter_file_blocks
+    
+    def _map_blocks_to_file(self, result: ProcessorResult, mapped_file: MappedFile) -> None:
+        """
+        Map result blocks to the memory-mapped file they were parsed from.
+        
+        Blocks found verbatim in the file keep only byte offsets. The
+        mapping is closed when no block refers to it.
+        
+        Args:
+            result (ProcessorResult): Result of processing the file content.
+            mapped_file (MappedFile): Mapping the content was read from.
+        """
+        mapped_blocks = mapped_file.map_blocks(result.blocks) if result.success else 0
+        if not mapped_blocks:
+            mapped_file.close()
+        
+        result.processing_metadata["mapped_blocks"] = mapped_blocks
+    
+    def _read_file_content(self, file_path: str) -> str:
+        """
+        Read file content with UTF-8 encoding.
+        
+        Args:
+            file_path (str): Path to the file to read.
+        
+        Returns:
+            str: File content as string.
+        
+        Raises:
+            UnicodeDecodeError: If file encoding cannot be decoded
+            OSError: If file cannot be read
+        """
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return file.read()
+    
+    def validate_file_path(self, file_path: str, check_size: bool = True) -> None:
         """
         Validate file path and raise appropriate exceptions.
         
         Args:
             file_path (str): Path to validate.
                 Must be non-empty string.
+            check_size (bool, optional): Whether to enforce
+                max_file_size_bytes. Streaming readers pass False.
+                Defaults to True.
         
         Raises:
             ValueError: If file_path is empty
@@ -458,17 +580,22 @@ class BaseProcessor(ABC):
             raise PermissionError(f"Cannot access file {file_path}: {e}")
         
         # Check file size
-        try:
-            file_size = path.stat().st_size
-            if file_size > self.max_file_size_bytes:
-                raise ValueError(
-                    f"File too large: {file_size} bytes (max: {self.max_file_size_bytes})"
-                )
-        except OSError as e:
-            raise ValueError(f"Cannot get file size for {file_path}: {e}")
+        if check_size:
+            try:
+                file_size = path.stat().st_size
+                if file_size > self.max_file_size_bytes:
+                    raise ValueError(
+                        f"File too large: {file_size} bytes (max: {self.max_file_size_bytes})"
+                    )
+            except OSError as e:
+                raise ValueError(f"Cannot get file size for {file_path}: {e}")
         
         # Check if processor can handle this file type
-        if not self.can_process_file(file_path):
+        if check_size:
+            supported = self.can_process_file(file_path)
+        else:
+            supported = path.suffix.lower().lstrip('.') in self.supported_extensions
+        if not supported:
             raise ValueError(f"File type not supported by {self.processor_name}: {file_path}")
     
     def __repr__(self) -> str:
@@ -0,0 +1,231 @@
+"""
+Encoding Detector - Single-Pass Text Decoding
+
+Chooses the encoding of a file from its bytes without re-reading the
+file per candidate encoding. The byte order mark is sniffed first, then
+the preferred encoding is tried incrementally on a prefix, and the
+whole buffer is decoded once with the chosen codec.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import codecs
+import logging
+from typing import List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFIX_SIZE = 64 * 1024
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16")
+]
+
+# Codecs that decode every byte sequence
+_TOTAL_CODECS = {"iso8859-1"}
+
+
+class EncodingDetector:
+    """
+    Encoding Detector - Byte Order Mark and Prefix Based Detection
+    
+    Detects the encoding of file content from a list of candidate
+    encodings in order of preference. The encoding announced by a byte
+    order mark is tried before the candidates. A candidate whose incremental decoder fails on
+    the prefix is rejected without decoding the rest of the content.
+    
+    Attributes:
+        encodings (List[str]): Candidate encodings in order of preference.
+        prefix_size (int): Number of bytes checked before decoding fully.
+    
+    Example:
+        >>> detector = EncodingDetector(["utf-8", "latin-1"])
+        >>> text, encoding = detector.decode(b"Caf\\xe9")
+        >>> print(encoding)  # "latin-1"
+    
+    Raises:
+        ValueError: If encodings is empty or prefix_size is not positive
+        LookupError: If an encoding is unknown
+    """
+    
+    def __init__(self, encodings: List[str], prefix_size: int = DEFAULT_PREFIX_SIZE):
+        """
+        Initialize EncodingDetector instance.
+        
+        Args:
+            encodings (List[str]): Candidate encodings in order of preference.
+                Must be non-empty list of known encodings.
+            prefix_size (int, optional): Number of bytes checked before
+                decoding fully. Defaults to 64KB. Must be positive integer.
+        
+        Raises:
+            ValueError: If encodings is empty or prefix_size is not positive
+            LookupError: If an encoding is unknown
+        """
+        if not encodings:
+            raise ValueError("encodings cannot be empty")
+        if not isinstance(prefix_size, int) or prefix_size <= 0:
+            raise ValueError("prefix_size must be positive integer")
+        
+        for encoding in encodings:
+            codecs.lookup(encoding)
+        
+        self.encodings = list(encodings)
+        self.prefix_size = prefix_size
+    
+    def sniff_bom(self, data: BytesLike) -> Optional[str]:
+        """
+        Get encoding announced by a byte order mark.
+        
+        Args:
+            data (BytesLike): Start of the content.
+        
+        Returns:
+            Optional[str]: Encoding that consumes the mark, or None
+                if the content has no byte order mark.
+        """
+        head = bytes(data[:4])
+        for bom, encoding in _BOMS:
+            if head.startswith(bom):
+                return encoding
+        return None
+    
+    def candidates(self, prefix: BytesLike, final: bool = False) -> List[str]:
+        """
+        Get encodings that may decode content starting with prefix.
+        
+        Args:
+            prefix (BytesLike): First bytes of the content.
+            final (bool, optional): Whether prefix is the whole content.
+                Defaults to False.
+        
+        Returns:
+            List[str]: Encodings to try in order. A byte order mark
+                encoding comes first, followed by the configured encodings
+                that decode the prefix, for content that only looks like
+                it starts with a byte order mark.
+        """
+        candidates = [
+            encoding for encoding in self.encodings
+            if self._decodes_prefix(encoding, prefix, final)
+        ]
+        
+        bom_encoding = self.sniff_bom(prefix)
+        if bom_encoding is not None:
+            bom_codec = codecs.lookup(bom_encoding).name
+            candidates = [bom_encoding] + [
+                encoding for encoding in candidates
+                if codecs.lookup(encoding).name != bom_codec
+            ]
+        return candidates
+    
+    def decode(self, data: BytesLike) -> Tuple[str, str]:
+        """
+        Decode content with the first encoding that decodes it.
+        
+        Candidates rejected on the prefix are never applied to the whole
+        content, so the content is decoded fully once unless an error
+        occurs after the prefix. Newlines are translated as in text mode.
+        
+        Args:
+            data (BytesLike): Whole content, for example a file read in
+                binary mode or a memory mapping.
+        
+        Returns:
+            Tuple[str, str]: Decoded text and encoding used.
+        
+        Raises:
+            UnicodeDecodeError: If no candidate encoding decodes the content
+        
+        Example:
+            >>> detector = EncodingDetector(["utf-8", "latin-1"])
+            >>> detector.decode(b"a\\r\\nb")
+            ('a\\nb', 'utf-8')
+        """
+        final = len(data) <= self.prefix_size
+        
+        for encoding in self.candidates(data[:self.prefix_size], final):
+            try:
+                text = str(data, encoding)
+            except UnicodeDecodeError:
+                continue
+            
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text, encoding
+        
+        raise UnicodeDecodeError(
+            self.encodings[0], b"", 0, 1, "Cannot decode content with any supported encoding"
+        )
+    
+    def detect_file(self, file_path: str, chunk_size: int = DEFAULT_PREFIX_SIZE) -> str:
+        """
+        Find an encoding that decodes a file without decoding it to memory.
+        
+        Reads the prefix once to select candidates. A candidate that
+        decodes every byte sequence is returned directly; any other is
+        validated with an incremental decoder over the file, read in
+        chunks of chunk_size bytes.
+        
+        Args:
+            file_path (str): Path to the file.
+            chunk_size (int, optional): Bytes read per validation step.
+                Defaults to 64KB.
+        
+        Returns:
+            str: Encoding that decodes the whole file.
+        
+        Raises:
+            UnicodeDecodeError: If no candidate encoding decodes the file
+            OSError: If file cannot be read
+        """
+        with open(file_path, 'rb') as file:
+            prefix = file.read(self.prefix_size)
+        
+        for encoding in self.candidates(prefix, final=len(prefix) < self.prefix_size):
+            if codecs.lookup(encoding).name in _TOTAL_CODECS:
+                return encoding
+            
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                with open(file_path, 'rb') as file:
+                    for data in iter(lambda: file.read(chunk_size), b''):
+                        decoder.decode(data)
+                decoder.decode(b'', final=True)
+            except UnicodeDecodeError:
+                continue
+            return encoding
+        
+        raise UnicodeDecodeError(
+            self.encodings[0], b"", 0, 1, f"Cannot decode {file_path} with any supported encoding"
+        )
+    
+    def _decodes_prefix(self, encoding: str, prefix: BytesLike, final: bool) -> bool:
+        """
+        Check whether encoding decodes prefix incrementally.
+        
+        Args:
+            encoding (str): Encoding to check.
+            prefix (BytesLike): First bytes of the content.
+            final (bool): Whether prefix is the whole content.
+        
+        Returns:
+            bool: False if the prefix contains an invalid sequence.
+                A sequence cut at the end of a partial prefix is valid.
+        """
+        if codecs.lookup(encoding).name in _TOTAL_CODECS:
+            return True
+        
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(prefix, final=final)
+        except UnicodeDecodeError:
+            return False
+        return True
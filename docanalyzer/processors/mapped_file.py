@@ -0,0 +1,283 @@
+"""
+Mapped File - Memory-Mapped Source Text
+
+Provides read-only memory mapping of processed files. Blocks whose content
+occurs verbatim in the file are reduced to byte offsets into the mapping
+and decoded again only when their content is accessed, so a processed
+file is no longer held both as one string and as copied block strings.
+
+A MappedFile is pickled as its path, encoding, size and modification
+time and maps the file again when unpickled, so mapped blocks returned
+from worker processes still hold only byte offsets.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import codecs
+import logging
+import mmap
+import os
+from typing import Any, Dict, List, Optional
+
+from docanalyzer.models.processing import ProcessingBlock
+from .encoding_detector import EncodingDetector
+
+logger = logging.getLogger(__name__)
+
+SEARCH_WINDOW_BYTES = 4096
+
+# Encodings where a byte match of encoded text is always a match of
+# the text itself (single byte or self-synchronizing)
+_OFFSET_SAFE_ENCODINGS = {"utf-8", "ascii", "iso8859-1", "cp1252"}
+
+
+class MappedFile:
+    """
+    Mapped File - Read-Only Memory Mapping of a Source File
+    
+    Maps a file, decodes it with the encoding chosen by an encoding
+    detector, and maps processing blocks back to byte ranges of the
+    file. Mapped blocks keep the MappedFile alive; the mapping is released
+    when the last of them is gone or close() is called. Size and
+    modification time of the file are recorded when it is mapped;
+    validate() checks them once before a batch of blocks is decoded.
+    
+    Attributes:
+        file_path (str): Path to the mapped file.
+        encoding (Optional[str]): Encoding the file was decoded with.
+            None until read_text() succeeds.
+        picklable (bool): Always True. Tells ProcessingBlock to pickle
+            mapped blocks with their offsets instead of their content.
+    
+    Example:
+        >>> detector = EncodingDetector(["utf-8", "latin-1"])
+        >>> mapped_file = MappedFile("/path/file.txt", detector)
+        >>> text = mapped_file.read_text()
+        >>> mapped_file.map_blocks(blocks)  # Number of blocks mapped
+    
+    Raises:
+        OSError: If file cannot be opened or mapped
+    """
+    
+    picklable = True
+    
+    def __init__(self, file_path: str, encoding_detector: EncodingDetector):
+        """
+        Initialize MappedFile instance.
+        
+        Args:
+            file_path (str): Path to the file to map.
+            encoding_detector (EncodingDetector): Detector choosing the
+                encoding of the file.
+        
+        Raises:
+            OSError: If file cannot be opened or mapped
+        """
+        self.file_path = file_path
+        self.encoding: Optional[str] = None
+        self._encoding_detector = encoding_detector
+        self._codec: Optional[str] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._size = 0
+        self._mtime_ns = 0
+        
+        self._open()
+    
+    def _open(self) -> None:
+        """
+        Map the file and record its size and modification time.
+        
+        Raises:
+            OSError: If file cannot be opened or mapped
+        """
+        with open(self.file_path, 'rb') as file:
+            stat_result = os.fstat(file.fileno())
+            self._size = stat_result.st_size
+            self._mtime_ns = stat_result.st_mtime_ns
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                self._mmap = None
+    
+    def read_text(self) -> str:
+        """
+        Decode the whole file with universal newline translation.
+        
+        Returns:
+            str: File content, equal to reading the file in text mode
+                with the chosen encoding.
+        
+        Raises:
+            UnicodeDecodeError: If no encoding can decode the file
+        """
+        data = self._mmap if self._mmap is not None else b""
+        
+        text, encoding = self._encoding_detector.decode(data)
+        if encoding != self._encoding_detector.encodings[0]:
+            logger.info(f"Successfully read {self.file_path} with {encoding} encoding")
+        self.encoding = encoding
+        
+        # Byte ranges never include the byte order mark, so blocks
+        # are encoded and decoded without it
+        self._codec = "utf-8" if codecs.lookup(encoding).name == "utf-8-sig" else encoding
+        return text
+    
+    def validate(self) -> None:
+        """
+        Check that the file is unchanged since it was mapped.
+        
+        Raises:
+            ValueError: If the mapping is closed or the file was modified
+                since it was mapped
+        """
+        # Shared mappings show later writes, and reading pages past the
+        # end of a truncated file raises SIGBUS
+        try:
+            stat_result = os.stat(self.file_path)
+        except OSError:
+            stat_result = None
+        if (
+            stat_result is None
+            or stat_result.st_size != self._size
+            or stat_result.st_mtime_ns != self._mtime_ns
+        ):
+            raise ValueError(f"File changed since it was mapped: {self.file_path}")
+        
+        if self._mmap is None or self._mmap.closed:
+            raise ValueError(f"Mapping of {self.file_path} is closed")
+        if self._mmap.size() != self._size:
+            raise ValueError(f"File changed since it was mapped: {self.file_path}")
+    
+    def decode(self, start_byte: int, end_byte: int) -> str:
+        """
+        Decode a byte range of the mapped file.
+        
+        The file is not checked for changes; call validate() before
+        decoding a batch of blocks.
+        
+        Args:
+            start_byte (int): Start offset of the range.
+            end_byte (int): End offset of the range (exclusive).
+        
+        Returns:
+            str: Decoded text of the range.
+        
+        Raises:
+            ValueError: If the mapping is closed
+        """
+        if self._mmap is None or self._mmap.closed:
+            raise ValueError(f"Mapping of {self.file_path} is closed")
+        
+        return str(self._mmap[start_byte:end_byte], self._codec)
+    
+    def map_blocks(self, blocks: List[ProcessingBlock]) -> int:
+        """
+        Replace block contents found verbatim in the file by byte offsets.
+        
+        Blocks are searched in order, each within SEARCH_WINDOW_BYTES of
+        the end of the previous match. Blocks whose content was changed
+        during extraction (normalized whitespace, removed markup, joined
+        lines) are not found and keep their content. Extraction never
+        makes a block longer than its source, so the search start skips
+        the length of every block not found.
+        
+        Args:
+            blocks (List[ProcessingBlock]): Blocks extracted from the
+                text returned by read_text(), in file order.
+        
+        Returns:
+            int: Number of blocks mapped to the file.
+        """
+        if self._mmap is None or self._codec is None:
+            return 0
+        if codecs.lookup(self._codec).name not in _OFFSET_SAFE_ENCODINGS:
+            return 0
+        
+        mapped_count = 0
+        cursor = 0
+        
+        for block in blocks:
+            try:
+                data = block.content.encode(self._codec)
+            except UnicodeEncodeError:
+                continue
+            
+            position = self._mmap.find(data, cursor, cursor + len(data) + SEARCH_WINDOW_BYTES)
+            if position < 0:
+                cursor += len(data)
+                continue
+            
+            cursor = position + len(data)
+            block.map_to_source(self, position, cursor)
+            mapped_count += 1
+        
+        return mapped_count
+    
+    def close(self) -> None:
+        """
+        Release the mapping.
+        
+        Mapped blocks can no longer decode their content afterwards.
+        """
+        if self._mmap is not None and not self._mmap.closed:
+            self._mmap.close()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get picklable state without the mapping.
+        
+        Returns:
+            Dict[str, Any]: Path, encoding, size and modification time.
+        """
+        state = self.__dict__.copy()
+        state["_mmap"] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore state and map the file again.
+        
+        A file that was modified or removed since it was first mapped is
+        not mapped, so blocks referring to it fail to decode.
+        
+        Args:
+            state (Dict[str, Any]): State from __getstate__().
+        """
+        self.__dict__.update(state)
+        size, mtime_ns = self._size, self._mtime_ns
+        try:
+            self._open()
+        except OSError as e:
+            logger.warning(f"Failed to map {self.file_path} again: {e}")
+            return
+        
+        if (self._size, self._mtime_ns) != (size, mtime_ns):
+            self.close()
+            self._mmap = None
+            self._size, self._mtime_ns = size, mtime_ns
+    
+    def __enter__(self) -> 'MappedFile':
+        """
+        Enter context manager.
+        
+        Returns:
+            MappedFile: This instance.
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exit context manager and release the mapping.
+        """
+        self.close()
+    
+    def __repr__(self) -> str:
+        """
+        String representation of MappedFile.
+        
+        Returns:
+            str: Human-readable representation.
+        """
+        return f"MappedFile(file_path='{self.file_path}', encoding={self.encoding!r})"
@@ -21,12 +21,46 @@ import logging
 from datetime import datetime
 import time
 import re
+import operator
 
 from .base_processor import BaseProcessor, ProcessorResult
+from .mapped_file import MappedFile
+from .encoding_detector import EncodingDetector
 from docanalyzer.models.processing import ProcessingBlock, ProcessingStatus
 
 logger = logging.getLogger(__name__)
 
+# Line patterns; element patterns are matched on right-stripped lines,
+# paragraph breaks on the lines as written
+_HEADER_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_HEADER_START_RE = re.compile(r'^(#{1,6})\s+')
+_LIST_ITEM_RE = re.compile(r'^(\s*)([-*+]|\d+\.)\s+(.+)$')
+_LIST_ITEM_START_RE = re.compile(r'^(\s*)([-*+]|\d+\.)\s+')
+
+# Inline patterns, applied in this order by MarkdownParser._clean_content
+_BOLD_STAR_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_STAR_RE = re.compile(r'\*(.*?)\*')
+_BOLD_UNDERSCORE_RE = re.compile(r'__(.*?)__')
+_ITALIC_UNDERSCORE_RE = re.compile(r'_(.*?)_')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\([^)]+\)')
+_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+_STRIKETHROUGH_RE = re.compile(r'~~(.*?)~~')
+# Characters without which no inline pattern can match
+_INLINE_MARKUP_RE = re.compile(r'[*_`~]|\]\(')
+# Replacement keeping the first group; avoids expanding r'\1' per match
+_FIRST_GROUP = operator.itemgetter(1)
+
+# Line kinds assigned by MarkdownParser._classify_line
+_BLANK = 0
+_TEXT = 1
+_HEADER = 2
+_FENCE = 3
+_QUOTE = 4
+_LIST_ITEM = 5
+# Lines that end a paragraph without starting an element, such as "- "
+_MARKER = 6
+
 
 class MarkdownElement:
     """
@@ -224,80 +258,85 @@ class MarkdownParser:
         if not markdown_text:
             raise ValueError("markdown_text cannot be empty")
         
-        elements = []
         lines = markdown_text.split('\n')
-        current_line = 1
+        kinds = [self._classify_line(line) for line in lines]
+        elements = []
+        # Index of the first code fence without a closing fence after it
+        unclosed_fence = len(lines)
         
         i = 0
         while i < len(lines):
-            line = lines[i].rstrip()
+            kind = kinds[i]
+            element = None
             
-            if not line.strip():
-                # Empty line - skip
+            if kind == _BLANK:
                 i += 1
-                current_line += 1
                 continue
             
-            # Check for headers
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if header_match:
-                level = len(header_match.group(1))
-                content = header_match.group(2).strip()
-                content = self._clean_content(content)
-                
-                element = MarkdownElement(
+            if kind == _HEADER:
+                header_match = _HEADER_RE.match(lines[i].rstrip())
+                elements.append(MarkdownElement(
                     element_type="header",
-                    content=content,
-                    level=level,
-                    line_number=current_line
-                )
-                elements.append(element)
+                    content=self._clean_content(header_match.group(2).strip()),
+                    level=len(header_match.group(1)),
+                    line_number=i + 1
+                ))
                 i += 1
-                current_line += 1
                 continue
             
-            # Check for code blocks
-            if line.startswith('```'):
-                code_block = self._extract_code_block(lines, i, current_line)
-                if code_block:
-                    elements.append(code_block)
-                    i = code_block.metadata.get('end_line_index', i + 1)
-                    current_line = code_block.metadata.get('end_line_number', current_line + 1)
-                    continue
-            
-            # Check for blockquotes
-            if line.startswith('>'):
-                blockquote = self._extract_blockquote(lines, i, current_line)
-                if blockquote:
-                    elements.append(blockquote)
-                    i = blockquote.metadata.get('end_line_index', i + 1)
-                    current_line = blockquote.metadata.get('end_line_number', current_line + 1)
-                    continue
+            if kind == _FENCE and i < unclosed_fence:
+                element = self._extract_code_block(lines, i, i + 1)
+                if element is None:
+                    unclosed_fence = i
+            elif kind == _QUOTE:
+                element = self._extract_blockquote(lines, i, i + 1)
+            elif kind == _LIST_ITEM:
+                element = self._extract_list_item(lines, i, i + 1)
+            elif kind == _TEXT:
+                element = self._extract_paragraph(lines, i, i + 1, kinds)
             
-            # Check for list items
-            list_match = re.match(r'^(\s*)([-*+]|\d+\.)\s+(.+)$', line)
-            if list_match:
-                list_item = self._extract_list_item(lines, i, current_line)
-                if list_item:
-                    elements.append(list_item)
-                    i = list_item.metadata.get('end_line_index', i + 1)
-                    current_line = list_item.metadata.get('end_line_number', current_line + 1)
-                    continue
-            
-            # Regular paragraph
-            paragraph = self._extract_paragraph(lines, i, current_line)
-            if paragraph:
-                elements.append(paragraph)
-                i = paragraph.metadata.get('end_line_index', i + 1)
-                current_line = paragraph.metadata.get('end_line_number', current_line + 1)
+            if element is None:
+                # Unclosed fences, empty quotes and bare markers
+                i += 1
                 continue
             
-            # Skip unrecognized line
-            i += 1
-            current_line += 1
+            elements.append(element)
+            i = element.metadata["end_line_index"]
         
         return elements
     
+    def _classify_line(self, line: str) -> int:
+        """
+        Classify one line for parse_markdown.
+        
+        Args:
+            line (str): Line without its line break.
+        
+        Returns:
+            int: Line kind. _MARKER lines look like the start of a header
+                or list item but have no content; they end a paragraph and
+                are otherwise skipped.
+        """
+        stripped = line.rstrip()
+        if not stripped:
+            return _BLANK
+        
+        first = stripped[0]
+        if first == '#':
+            if _HEADER_RE.match(stripped):
+                return _HEADER
+            return _MARKER if _HEADER_START_RE.match(line) else _TEXT
+        if first == '`' and line.startswith('```'):
+            return _FENCE
+        if first == '>':
+            return _QUOTE
+        if first in '-*+' or first.isdigit() or first.isspace():
+            if _LIST_ITEM_RE.match(stripped):
+                return _LIST_ITEM
+            if _LIST_ITEM_START_RE.match(line):
+                return _MARKER
+        return _TEXT
+    
     def _clean_content(self, content: str) -> str:
         """
         Clean Markdown content by removing syntax.
@@ -311,29 +350,33 @@ class MarkdownParser:
         if not self.clean_markdown:
             return content
         
-        # Remove bold/italic
-        content = re.sub(r'\*\*(.*?)\*\*', r'\1', content)
-        content = re.sub(r'\*(.*?)\*', r'\1', content)
-        content = re.sub(r'__(.*?)__', r'\1', content)
-        content = re.sub(r'_(.*?)_', r'\1', content)
-        
-        # Handle links
-        if self.extract_links:
-            content = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', content)
-        else:
-            content = re.sub(r'\[([^\]]+)\]\([^)]+\)', '', content)
-        
-        # Handle images
-        if self.extract_images:
-            content = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'\1', content)
-        else:
-            content = re.sub(r'!\[([^\]]*)\]\([^)]+\)', '', content)
+        if not _INLINE_MARKUP_RE.search(content):
+            return content.strip()
+        
+        # Each pass runs on the output of the previous one, so a pass is
+        # skipped only when its marker is absent from the current text
+        if '**' in content:
+            content = _BOLD_STAR_RE.sub(_FIRST_GROUP, content)
+        if '*' in content:
+            content = _ITALIC_STAR_RE.sub(_FIRST_GROUP, content)
+        if '__' in content:
+            content = _BOLD_UNDERSCORE_RE.sub(_FIRST_GROUP, content)
+        if '_' in content:
+            content = _ITALIC_UNDERSCORE_RE.sub(_FIRST_GROUP, content)
+        
+        # Handle links and images
+        if '](' in content:
+            content = _LINK_RE.sub(_FIRST_GROUP if self.extract_links else '', content)
+        if '](' in content:
+            content = _IMAGE_RE.sub(_FIRST_GROUP if self.extract_images else '', content)
         
         # Remove inline code
-        content = re.sub(r'`([^`]+)`', r'\1', content)
+        if '`' in content:
+            content = _INLINE_CODE_RE.sub(_FIRST_GROUP, content)
         
         # Remove strikethrough
-        content = re.sub(r'~~(.*?)~~', r'\1', content)
+        if '~~' in content:
+            content = _STRIKETHROUGH_RE.sub(_FIRST_GROUP, content)
         
         return content.strip()
     
@@ -449,7 +492,7 @@ class MarkdownParser:
             Optional[MarkdownElement]: List item element or None.
         """
         line = lines[start_index]
-        list_match = re.match(r'^(\s*)([-*+]|\d+\.)\s+(.+)$', line)
+        list_match = _LIST_ITEM_RE.match(line)
         if not list_match:
             return None
         
@@ -470,7 +513,7 @@ class MarkdownParser:
                 break
             
             # Check if it's a continuation (indented content)
-            if re.match(r'^\s+\S', next_line):
+            if next_line[0].isspace():
                 content += ' ' + next_line.strip()
                 end_index += 1
                 end_line += 1
@@ -492,7 +535,13 @@ class MarkdownParser:
             }
         )
     
-    def _extract_paragraph(self, lines: List[str], start_index: int, start_line: int) -> Optional[MarkdownElement]:
+    def _extract_paragraph(
+        self,
+        lines: List[str],
+        start_index: int,
+        start_line: int,
+        kinds: Optional[List[int]] = None
+    ) -> Optional[MarkdownElement]:
         """
         Extract paragraph from lines.
         
@@ -500,6 +549,8 @@ class MarkdownParser:
             lines (List[str]): All lines of the document.
             start_index (int): Index of the starting line.
             start_line (int): Line number of the starting line.
+            kinds (Optional[List[int]], optional): Line kinds from
+                _classify_line, if already known. Defaults to None.
         
         Returns:
             Optional[MarkdownElement]: Paragraph element or None.
@@ -510,14 +561,10 @@ class MarkdownParser:
         
         while end_index < len(lines):
             line = lines[end_index]
-            if not line.strip():
-                break
+            kind = kinds[end_index] if kinds is not None else self._classify_line(line)
             
-            # Check if it's a special Markdown element
-            if (re.match(r'^(#{1,6})\s+', line) or
-                line.startswith('```') or
-                line.startswith('>') or
-                re.match(r'^(\s*)([-*+]|\d+\.)\s+', line)):
+            # Blank lines and other Markdown elements end the paragraph
+            if kind != _TEXT:
                 break
             
             content_lines.append(line.strip())
@@ -565,6 +612,10 @@ class MarkdownProcessor(BaseProcessor):
             True to include code blocks as separate elements, False to skip.
         clean_markdown (bool): Whether to clean Markdown syntax.
             True to remove syntax, False to preserve some formatting.
+        use_mmap (bool): Whether process_file() reads through a memory
+            mapping and keeps blocks found verbatim as byte offsets.
+        encoding_detector (EncodingDetector): Detector trying UTF-8 first
+            and latin-1, cp1252 and iso-8859-1 as fallbacks.
     
     Example:
         >>> processor = MarkdownProcessor()
@@ -583,7 +634,8 @@ class MarkdownProcessor(BaseProcessor):
         preserve_structure: bool = True,
         extract_code_blocks: bool = True,
         clean_markdown: bool = True,
-        max_file_size_bytes: int = 10 * 1024 * 1024  # 10MB
+        max_file_size_bytes: int = 10 * 1024 * 1024,  # 10MB
+        use_mmap: bool = False
     ):
         """
         Initialize MarkdownProcessor instance.
@@ -599,6 +651,9 @@ class MarkdownProcessor(BaseProcessor):
                 Defaults to True.
             max_file_size_bytes (int, optional): Maximum file size in bytes.
                 Defaults to 10MB. Must be positive integer.
+            use_mmap (bool, optional): Whether to read files through a
+                memory mapping and decode verbatim blocks lazily.
+                Defaults to False.
         
         Raises:
             ValueError: If parser configuration is invalid
@@ -626,6 +681,8 @@ class MarkdownProcessor(BaseProcessor):
         self.preserve_structure = preserve_structure
         self.extract_code_blocks = extract_code_blocks
         self.clean_markdown = clean_markdown
+        self.use_mmap = use_mmap
+        self.encoding_detector = EncodingDetector(['utf-8', 'latin-1', 'cp1252', 'iso-8859-1'])
         
         logger.debug("Initialized MarkdownProcessor")
     
@@ -662,15 +719,63 @@ class MarkdownProcessor(BaseProcessor):
         self.validate_file_path(file_path)
         
         start_time = time.time()
+        mapped_file = None
         
         try:
+            # Read file content
+            if self.use_mmap:
+                mapped_file = MappedFile(file_path, self.encoding_detector)
+                markdown_content = mapped_file.read_text()
+            else:
+                markdown_content = self._read_file_content(file_path)
+        except Exception as e:
+            logger.error(f"Error processing Markdown file {file_path}: {e}")
+            if mapped_file is not None:
+                mapped_file.close()
+            
+            return ProcessorResult(
+                success=False,
+                error_message=str(e),
+                processing_time_seconds=time.time() - start_time,
+                file_size_bytes=0,
+                supported_file_type=True
+            )
+        
+        result = self.process_content(markdown_content, file_path, start_time)
+        if mapped_file is not None:
+            del markdown_content
+            self._map_blocks_to_file(result, mapped_file)
+        
+        return result
+    
+    def process_content(self, content: str, file_path: str, start_time: Optional[float] = None) -> ProcessorResult:
+        """
+        Extract text blocks from already read Markdown content.
+        
+        Parses the content into structured elements, converts elements
+        to ProcessingBlock instances, and returns a ProcessorResult with
+        extracted blocks and metadata.
+        
+        Args:
+            content (str): Markdown content of the file.
+            file_path (str): Path to the source Markdown file.
+            start_time (Optional[float]): Processing start time from
+                time.time(). If None, current time is used. Defaults to None.
+        
+        Returns:
+            ProcessorResult: Result of the processing operation.
+                Contains extracted ProcessingBlock instances and processing metadata.
+        """
+        if start_time is None:
+            start_time = time.time()
+        
+        try:
+            markdown_content = content
+            
             # Get file metadata
             metadata = self.get_file_metadata(file_path)
             file_size = metadata.get("size_bytes", 0)
             
-            # Read file content
-            markdown_content = self._read_file_content(file_path)
-            
             # Parse Markdown content
             markdown_elements = self.parser.parse_markdown(markdown_content)
             
@@ -726,21 +831,14 @@ class MarkdownProcessor(BaseProcessor):
             UnicodeDecodeError: If file encoding cannot be decoded
             OSError: If file cannot be read
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except UnicodeDecodeError:
-            # Try alternative encodings for Markdown files
-            for alt_encoding in ['latin-1', 'cp1252', 'iso-8859-1']:
-                try:
-                    with open(file_path, 'r', encoding=alt_encoding) as file:
-                        content = file.read()
-                        logger.info(f"Successfully read {file_path} with {alt_encoding} encoding")
-                        return content
-                except UnicodeDecodeError:
-                    continue
-            
-            raise UnicodeDecodeError(f"Cannot decode {file_path} with any supported encoding")
+        # Read bytes once and decode them with the detected encoding
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        
+        content, encoding = self.encoding_detector.decode(data)
+        if encoding != 'utf-8':
+            logger.info(f"Successfully read {file_path} with {encoding} encoding")
+        return content
     
     def _create_processing_blocks(self, markdown_elements: List[MarkdownElement], file_path: str) -> List[ProcessingBlock]:
         """
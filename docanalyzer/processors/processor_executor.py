@@ -0,0 +1,207 @@
+"""
+Processor Executor - Off-Loop Execution of File Processors
+
+Runs the synchronous process_file/process_content methods of file
+processors in a process pool or thread pool and returns their
+ProcessorResult objects to the event loop.
+
+Parsing large files with regular expressions is CPU-bound and blocks
+the event loop when called directly from async code. A process pool
+spreads parsing across cores; a thread pool is cheaper for file types
+where reading dominates parsing.
+
+Processors are sent to worker processes by pickling, so statistics
+kept on processor instances are not updated in process mode. Worker
+processes are started with 'forkserver' where available: forking the
+threaded service can copy locks held by other threads, such as the
+logging lock, into a child that then deadlocks.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from .base_processor import BaseProcessor, ProcessorResult
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_MODES = ["process", "thread"]
+START_METHODS = multiprocessing.get_all_start_methods()
+DEFAULT_START_METHOD = "forkserver" if "forkserver" in START_METHODS else "spawn"
+
+
+class ProcessorExecutor:
+    """
+    Processor Executor - Process or thread pool for file processors.
+
+    Executes processor calls in a pool chosen by mode. File extensions
+    listed in thread_extensions always use the thread pool, so I/O-heavy
+    types avoid pickling overhead while parse-heavy types use processes.
+    Pools are created on first use.
+
+    Attributes:
+        mode (str): Default pool type, 'process' or 'thread'.
+        max_workers (int): Number of workers of each pool.
+        thread_extensions (List[str]): Lowercase extensions processed
+            in the thread pool regardless of mode.
+        start_method (str): multiprocessing start method of the process pool.
+
+    Example:
+        >>> executor = ProcessorExecutor(mode="process", max_workers=4)
+        >>> result = await executor.process_file(MarkdownProcessor(), "/docs/readme.md")
+        >>> executor.shutdown()
+    """
+
+    def __init__(
+        self,
+        mode: str = "process",
+        max_workers: Optional[int] = None,
+        thread_extensions: Optional[Iterable[str]] = None,
+        start_method: str = DEFAULT_START_METHOD
+    ):
+        """
+        Initialize ProcessorExecutor instance.
+
+        Args:
+            mode (str): Default pool type. Must be one of: 'process', 'thread'.
+                Defaults to 'process'.
+            max_workers (Optional[int]): Number of workers of each pool.
+                Must be positive. If None, uses CPU count. Defaults to None.
+            thread_extensions (Optional[Iterable[str]]): Extensions such as
+                '.txt' processed in the thread pool. Defaults to None.
+            start_method (str): Start method of worker processes. Must be one
+                of START_METHODS. Defaults to 'forkserver', or 'spawn' where
+                forkserver is unavailable.
+
+        Raises:
+            ValueError: If mode or start_method is invalid or max_workers
+                is not positive
+        """
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"mode must be one of {EXECUTOR_MODES}")
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        if start_method not in START_METHODS:
+            raise ValueError(f"start_method must be one of {START_METHODS}")
+
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.thread_extensions = [ext.lower() for ext in (thread_extensions or [])]
+        self.start_method = start_method
+
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
+        logger.debug(
+            f"Initialized ProcessorExecutor with mode={mode}, max_workers={self.max_workers}, "
+            f"thread_extensions={self.thread_extensions}, start_method={start_method}"
+        )
+
+    async def process_file(self, processor: BaseProcessor, file_path: str) -> ProcessorResult:
+        """
+        Run processor.process_file in a worker.
+
+        Args:
+            processor (BaseProcessor): Processor to run.
+            file_path (str): Path to file to process.
+
+        Returns:
+            ProcessorResult: Result of processing. Failures of the worker
+                itself are returned as unsuccessful results.
+        """
+        return await self._run(file_path, processor.process_file, file_path)
+
+    async def process_content(
+        self,
+        processor: BaseProcessor,
+        content: str,
+        file_path: str
+    ) -> ProcessorResult:
+        """
+        Run processor.process_content in a worker.
+
+        Args:
+            processor (BaseProcessor): Processor supporting content processing.
+            content (str): File content already read.
+            file_path (str): Path the content was read from.
+
+        Returns:
+            ProcessorResult: Result of processing. Failures of the worker
+                itself are returned as unsuccessful results.
+        """
+        return await self._run(file_path, processor.process_content, content, file_path)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down worker pools. Pools are recreated on next use.
+
+        Args:
+            wait (bool): Whether to wait for running calls to finish.
+                Defaults to True.
+        """
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait)
+            self._thread_pool = None
+
+    def _get_pool(self, file_path: str) -> Executor:
+        """
+        Get pool for file, creating it on first use.
+
+        Args:
+            file_path (str): Path of file to process.
+
+        Returns:
+            Executor: Process or thread pool.
+        """
+        if self.mode == "thread" or Path(file_path).suffix.lower() in self.thread_extensions:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="processor"
+                )
+            return self._thread_pool
+
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.start_method)
+            )
+        return self._process_pool
+
+    async def _run(self, file_path: str, func: Callable[..., ProcessorResult], *args) -> ProcessorResult:
+        """
+        Run processor method in pool and convert worker failures.
+
+        Args:
+            file_path (str): Path of file being processed.
+            func (Callable[..., ProcessorResult]): Bound processor method.
+            *args: Arguments for func.
+
+        Returns:
+            ProcessorResult: Result of func or unsuccessful result.
+        """
+        pool = self._get_pool(file_path)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool as e:
+            # A crashed worker breaks the whole pool; start a new one next time
+            logger.error(f"Processor worker crashed while processing {file_path}: {e}")
+            if pool is self._process_pool:
+                self._process_pool.shutdown(wait=False)
+                self._process_pool = None
+            return ProcessorResult(success=False, error_message=f"Processor worker crashed: {e}")
+        except Exception as e:
+            logger.error(f"Processor execution failed for {file_path}: {e}")
+            return ProcessorResult(success=False, error_message=f"Processor execution failed: {e}")
@@ -10,22 +10,82 @@ This processor handles:
 - Text block extraction by paragraphs, lines, or custom delimiters
 - Encoding detection and handling
 - Text normalization and cleaning
+- Streaming extraction of files larger than memory
 
 Author: DocAnalyzer Team
 Version: 1.0.0
 """
 
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Pattern
 from pathlib import Path
 import logging
+import re
 from datetime import datetime
 import time
 
 from .base_processor import BaseProcessor, ProcessorResult
+from .mapped_file import MappedFile
+from .encoding_detector import EncodingDetector
 from docanalyzer.models.processing import ProcessingBlock, ProcessingStatus
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_STREAM_BUFFER_SIZE = 1024 * 1024
+
+_FALLBACK_ENCODINGS = ['latin-1', 'cp1252', 'iso-8859-1']
+
+_SPACE_RUN_RE = re.compile(r' +')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+_SEGMENT_SEPARATORS = {
+    "paragraph": "\n\n",
+    "line": "\n"
+}
+
+
+def _compile_delimiters(delimiters: List[str]) -> Optional[Pattern[str]]:
+    """
+    Compile delimiters into one alternation splitting like sequential passes.
+    
+    Splitting by each delimiter in turn and stripping the parts in between
+    gives the parts of a single split by the alternation, unless matches of
+    two delimiters can overlap or a delimiter has whitespace at an edge
+    that stripping could cut off.
+    
+    Args:
+        delimiters (List[str]): Delimiters in the order they are applied.
+    
+    Returns:
+        Optional[Pattern[str]]: Alternation of the delimiters, or None if
+            delimiters is empty or must be applied one by one.
+    """
+    if not delimiters:
+        return None
+    for delimiter in delimiters:
+        if not isinstance(delimiter, str) or not delimiter or delimiter != delimiter.strip():
+            return None
+    
+    unique = list(dict.fromkeys(delimiters))
+    known = set(unique)
+    prefix_owners: Dict[str, set] = {}
+    for delimiter in unique:
+        for size in range(1, len(delimiter)):
+            prefix_owners.setdefault(delimiter[:size], set()).add(delimiter)
+    
+    for delimiter in unique:
+        # A suffix equal to a prefix of another delimiter
+        for start in range(1, len(delimiter)):
+            owners = prefix_owners.get(delimiter[start:])
+            if owners and owners != {delimiter}:
+                return None
+        # Another delimiter inside this one
+        for start in range(len(delimiter)):
+            for end in range(start + 1, len(delimiter) + 1 - (start == 0)):
+                if delimiter[start:end] in known:
+                    return None
+    
+    return re.compile("|".join(re.escape(delimiter) for delimiter in unique))
+
 
 class TextBlockExtractor:
     """
@@ -106,6 +166,8 @@ class TextBlockExtractor:
         self.min_block_size = min_block_size
         self.max_block_size = max_block_size
         self.custom_delimiters = custom_delimiters or []
+        self._delimiter_re = _compile_delimiters(self.custom_delimiters)
+        self._segment_delimiter_re = _compile_delimiters(self.custom_delimiters[1:])
         
         logger.debug(f"Initialized TextBlockExtractor with strategy: {strategy}")
     
@@ -144,6 +206,147 @@ class TextBlockExtractor:
         else:
             raise ValueError(f"Unknown strategy: {self.strategy}")
     
+    def iter_blocks(self, chunks: Iterable[str], max_segment_size: Optional[int] = None) -> Iterator[str]:
+        """
+        Extract text blocks from text delivered in consecutive chunks.
+        
+        Splits the stream on the strategy separator (blank line, newline
+        or the first custom delimiter) as chunks arrive, so a separator
+        may span chunk edges. Only the unfinished segment and the block
+        being assembled are kept in memory. For the same text the blocks
+        equal those of extract_blocks(), except for segments longer than
+        max_segment_size, which are cut at the last space or newline
+        before the limit.
+        
+        Args:
+            chunks (Iterable[str]): Consecutive pieces of the text.
+            max_segment_size (Optional[int], optional): Longest segment
+                held in memory while waiting for a separator. Defaults to
+                None, which uses DEFAULT_STREAM_BUFFER_SIZE or
+                max_block_size, whichever is larger.
+        
+        Returns:
+            Iterator[str]: Extracted text blocks in text order.
+        
+        Raises:
+            ValueError: If max_segment_size is not positive
+        
+        Example:
+            >>> extractor = TextBlockExtractor('paragraph', min_block_size=5)
+            >>> list(extractor.iter_blocks(["Paragraph 1.\n", "\nParagraph 2."]))
+            ['Paragraph 1.', 'Paragraph 2.']
+        """
+        if max_segment_size is None:
+            max_segment_size = max(DEFAULT_STREAM_BUFFER_SIZE, self.max_block_size)
+        if not isinstance(max_segment_size, int) or max_segment_size <= 0:
+            raise ValueError("max_segment_size must be positive integer")
+        
+        parts = self._iter_stream_parts(chunks, max_segment_size)
+        
+        if self.strategy == "paragraph":
+            return self._iter_paragraph_blocks(parts)
+        elif self.strategy == "line":
+            return self._iter_line_blocks(parts)
+        else:
+            return self._iter_custom_blocks(parts)
+    
+    def _iter_stream_parts(self, chunks: Iterable[str], max_segment_size: int) -> Iterator[str]:
+        """
+        Split streamed text into stripped, non-empty parts.
+        
+        Args:
+            chunks (Iterable[str]): Consecutive pieces of the text.
+            max_segment_size (int): Longest segment kept while waiting
+                for a separator.
+        
+        Returns:
+            Iterator[str]: Parts as split by the batch strategy.
+        """
+        separator = _SEGMENT_SEPARATORS.get(self.strategy) or self.custom_delimiters[0]
+        overlap = len(separator) - 1
+        
+        # Chunks without separator wait unjoined, so text is copied only
+        # when a separator arrives or the segment has to be cut
+        pending: List[str] = []
+        pending_size = 0
+        tail = ""
+        
+        for chunk in chunks:
+            edge = tail + chunk[:overlap]
+            if separator not in chunk and separator not in edge and pending_size + len(chunk) <= max_segment_size:
+                pending.append(chunk)
+                pending_size += len(chunk)
+                tail = (tail + chunk)[-overlap:] if overlap else ""
+                continue
+            
+            pending.append(chunk)
+            text = "".join(pending)
+            segments = text.split(separator)
+            text = segments.pop()
+            for segment in segments:
+                yield from self._split_segment(segment)
+            
+            # A segment without separator would grow with the file, cut it
+            start = 0
+            while len(text) - start > max_segment_size:
+                limit = start + max_segment_size
+                cut = max(text.rfind(" ", start, limit), text.rfind("\n", start, limit))
+                if cut <= start:
+                    cut = limit
+                yield from self._split_segment(text[start:cut])
+                start = cut
+            
+            text = text[start:]
+            pending = [text]
+            pending_size = len(text)
+            tail = text[-overlap:] if overlap else ""
+        
+        yield from self._split_segment("".join(pending))
+    
+    def _split_segment(self, segment: str) -> List[str]:
+        """
+        Strip a separator-delimited segment and apply remaining delimiters.
+        
+        Args:
+            segment (str): Text between two strategy separators.
+        
+        Returns:
+            List[str]: Stripped, non-empty parts of the segment.
+        """
+        segment = segment.strip()
+        if not segment:
+            return []
+        
+        if self.strategy == "custom":
+            return self._split_delimited(segment, self.custom_delimiters[1:], self._segment_delimiter_re)
+        return [segment]
+    
+    def _split_delimited(self, text: str, delimiters: List[str], pattern: Optional[Pattern[str]]) -> List[str]:
+        """
+        Split text by delimiters applied in order.
+        
+        Args:
+            text (str): Text to split.
+            delimiters (List[str]): Delimiters in the order they are applied.
+            pattern (Optional[Pattern[str]]): Compiled alternation of
+                delimiters, or None to split by each delimiter in turn.
+        
+        Returns:
+            List[str]: Stripped, non-empty parts of the text.
+        """
+        if pattern is not None:
+            parts = [part.strip() for part in pattern.split(text)]
+            return [part for part in parts if part]
+        
+        parts = [text]
+        for delimiter in delimiters:
+            new_parts = []
+            for part in parts:
+                new_parts.extend(part.split(delimiter))
+            parts = [p.strip() for p in new_parts if p.strip()]
+        
+        return parts
+    
     def _extract_paragraph_blocks(self, text: str) -> List[str]:
         """
         Extract blocks by paragraphs (double newlines).
@@ -157,37 +360,48 @@ class TextBlockExtractor:
         # Split by double newlines and filter empty blocks
         paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
         
-        # Apply size constraints
-        blocks = []
-        current_block = ""
+        return list(self._iter_paragraph_blocks(paragraphs))
+    
+    def _iter_paragraph_blocks(self, paragraphs: Iterable[str]) -> Iterator[str]:
+        """
+        Merge and split paragraphs into blocks within size limits.
+        
+        Args:
+            paragraphs (Iterable[str]): Stripped, non-empty paragraphs.
+        
+        Returns:
+            Iterator[str]: Paragraph blocks.
+        """
+        # Apply size constraints, joining each block once from its parts
+        current_parts: List[str] = []
+        current_size = 0
         
         for paragraph in paragraphs:
             # If current paragraph is already large enough, add it as separate block
             if len(paragraph) >= self.min_block_size and len(paragraph) <= self.max_block_size:
-                if current_block:
-                    if len(current_block) >= self.min_block_size:
-                        blocks.append(current_block)
-                    current_block = ""
-                blocks.append(paragraph)
-            elif len(current_block) + len(paragraph) + 2 <= self.max_block_size:  # +2 for \n\n
-                if current_block:
-                    current_block += "\n\n" + paragraph
+                if current_size:
+                    if current_size >= self.min_block_size:
+                        yield "\n\n".join(current_parts)
+                    current_parts, current_size = [], 0
+                yield paragraph
+            elif current_size + len(paragraph) + 2 <= self.max_block_size:  # +2 for \n\n
+                if current_size:
+                    current_parts.append(paragraph)
+                    current_size += len(paragraph) + 2
                 else:
-                    current_block = paragraph
+                    current_parts, current_size = [paragraph], len(paragraph)
             else:
-                if current_block:
-                    if len(current_block) >= self.min_block_size:
-                        blocks.append(current_block)
-                    current_block = paragraph
+                if current_size:
+                    if current_size >= self.min_block_size:
+                        yield "\n\n".join(current_parts)
+                    current_parts, current_size = [paragraph], len(paragraph)
                 else:
                     # Single paragraph is too large, split it
-                    blocks.extend(self._split_large_block(paragraph))
+                    yield from self._split_large_block(paragraph)
         
         # Add remaining block
-        if current_block and len(current_block) >= self.min_block_size:
-            blocks.append(current_block)
-        
-        return blocks
+        if current_size and current_size >= self.min_block_size:
+            yield "\n\n".join(current_parts)
     
     def _extract_line_blocks(self, text: str) -> List[str]:
         """
@@ -201,29 +415,40 @@ class TextBlockExtractor:
         """
         lines = [line.strip() for line in text.split('\n') if line.strip()]
         
-        blocks = []
-        current_block = ""
+        return list(self._iter_line_blocks(lines))
+    
+    def _iter_line_blocks(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Join lines into blocks within size limits.
+        
+        Args:
+            lines (Iterable[str]): Stripped, non-empty lines.
+        
+        Returns:
+            Iterator[str]: Line-based blocks.
+        """
+        current_parts: List[str] = []
+        current_size = 0
         
         for line in lines:
-            if len(current_block) + len(line) + 1 <= self.max_block_size:
-                if current_block:
-                    current_block += "\n" + line
+            if current_size + len(line) + 1 <= self.max_block_size:
+                if current_size:
+                    current_parts.append(line)
+                    current_size += len(line) + 1
                 else:
-                    current_block = line
+                    current_parts, current_size = [line], len(line)
             else:
-                if current_block:
-                    if len(current_block) >= self.min_block_size:
-                        blocks.append(current_block)
-                    current_block = line
+                if current_size:
+                    if current_size >= self.min_block_size:
+                        yield "\n".join(current_parts)
+                    current_parts, current_size = [line], len(line)
                 else:
                     # Single line is too large, split it
-                    blocks.extend(self._split_large_block(line))
+                    yield from self._split_large_block(line)
         
         # Add remaining block
-        if current_block and len(current_block) >= self.min_block_size:
-            blocks.append(current_block)
-        
-        return blocks
+        if current_size and current_size >= self.min_block_size:
+            yield "\n".join(current_parts)
     
     def _extract_custom_blocks(self, text: str) -> List[str]:
         """
@@ -235,45 +460,50 @@ class TextBlockExtractor:
         Returns:
             List[str]: List of custom-delimited blocks.
         """
-        # Split by first delimiter, then by others
-        blocks = [text]
+        # Split by all delimiters in one pass when they cannot interact
+        blocks = self._split_delimited(text, self.custom_delimiters, self._delimiter_re)
+        
+        return list(self._iter_custom_blocks(blocks))
+    
+    def _iter_custom_blocks(self, blocks: Iterable[str]) -> Iterator[str]:
+        """
+        Merge and split delimited parts into blocks within size limits.
         
-        for delimiter in self.custom_delimiters:
-            new_blocks = []
-            for block in blocks:
-                new_blocks.extend(block.split(delimiter))
-            blocks = [b.strip() for b in new_blocks if b.strip()]
+        Args:
+            blocks (Iterable[str]): Stripped, non-empty delimited parts.
         
-        # Apply size constraints
-        result_blocks = []
-        current_block = ""
+        Returns:
+            Iterator[str]: Custom-delimited blocks.
+        """
+        # Apply size constraints, joining each block once from its parts
+        current_parts: List[str] = []
+        current_size = 0
         
         for block in blocks:
             # If current block is already large enough, add it as separate block
             if len(block) >= self.min_block_size and len(block) <= self.max_block_size:
-                if current_block:
-                    if len(current_block) >= self.min_block_size:
-                        result_blocks.append(current_block)
-                    current_block = ""
-                result_blocks.append(block)
-            elif len(current_block) + len(block) + 1 <= self.max_block_size:  # +1 for space
-                if current_block:
-                    current_block += " " + block
+                if current_size:
+                    if current_size >= self.min_block_size:
+                        yield " ".join(current_parts)
+                    current_parts, current_size = [], 0
+                yield block
+            elif current_size + len(block) + 1 <= self.max_block_size:  # +1 for space
+                if current_size:
+                    current_parts.append(block)
+                    current_size += len(block) + 1
                 else:
-                    current_block = block
+                    current_parts, current_size = [block], len(block)
             else:
-                if current_block:
-                    if len(current_block) >= self.min_block_size:
-                        result_blocks.append(current_block)
-                    current_block = block
+                if current_size:
+                    if current_size >= self.min_block_size:
+                        yield " ".join(current_parts)
+                    current_parts, current_size = [block], len(block)
                 else:
-                    result_blocks.extend(self._split_large_block(block))
+                    yield from self._split_large_block(block)
         
         # Add remaining block
-        if current_block and len(current_block) >= self.min_block_size:
-            result_blocks.append(current_block)
-        
-        return result_blocks
+        if current_size and current_size >= self.min_block_size:
+            yield " ".join(current_parts)
     
     def _split_large_block(self, block: str) -> List[str]:
         """
@@ -293,22 +523,24 @@ class TextBlockExtractor:
         if len(parts) == 1:
             parts = block.split(' ')
         
+        # Find block boundaries by part index and join each block once
         result = []
-        current_part = ""
+        start = 0
+        size = 0
         
-        for part in parts:
-            if len(current_part) + len(part) + 1 <= self.max_block_size:
-                if current_part:
-                    current_part += " " + part
+        for index, part in enumerate(parts):
+            if size + len(part) + 1 <= self.max_block_size:
+                if size:
+                    size += len(part) + 1
                 else:
-                    current_part = part
+                    start, size = index, len(part)
             else:
-                if current_part and len(current_part) >= self.min_block_size:
-                    result.append(current_part)
-                current_part = part
+                if size and size >= self.min_block_size:
+                    result.append(" ".join(parts[start:index]))
+                start, size = index, len(part)
         
-        if current_part and len(current_part) >= self.min_block_size:
-            result.append(current_part)
+        if size and size >= self.min_block_size:
+            result.append(" ".join(parts[start:]))
         
         return result
 
@@ -332,16 +564,24 @@ class TextProcessor(BaseProcessor):
             Configurable extractor for different text segmentation methods.
         encoding (str): Text encoding to use for file reading.
             Defaults to 'utf-8'. Can be 'utf-8', 'latin-1', 'cp1252', etc.
+        encoding_detector (EncodingDetector): Detector trying encoding
+            first and latin-1, cp1252 and iso-8859-1 as fallbacks.
         normalize_whitespace (bool): Whether to normalize whitespace.
             True to clean up extra spaces, newlines, etc.
         remove_empty_blocks (bool): Whether to remove empty blocks.
             True to filter out blocks with no content.
+        stream_buffer_size (int): Characters read per buffer by
+            iter_file_blocks(). Bounds memory used when streaming.
+        use_mmap (bool): Whether process_file() reads through a memory
+            mapping and keeps blocks found verbatim as byte offsets.
     
     Example:
         >>> processor = TextProcessor()
         >>> result = processor.process_file("/path/file.txt")
         >>> print(result.success)  # True if processing succeeded
         >>> print(len(result.blocks))  # Number of extracted blocks
+        >>> for block in processor.iter_file_blocks("/path/export.txt"):
+        ...     print(block.content)  # Blocks of a file of any size
     
     Raises:
         ValueError: If encoding is not supported or extraction strategy is invalid
@@ -354,7 +594,9 @@ class TextProcessor(BaseProcessor):
         encoding: str = "utf-8",
         normalize_whitespace: bool = True,
         remove_empty_blocks: bool = True,
-        max_file_size_bytes: int = 10 * 1024 * 1024  # 10MB
+        max_file_size_bytes: int = 10 * 1024 * 1024,  # 10MB
+        stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        use_mmap: bool = False
     ):
         """
         Initialize TextProcessor instance.
@@ -369,10 +611,17 @@ class TextProcessor(BaseProcessor):
             remove_empty_blocks (bool, optional): Whether to remove empty blocks.
                 Defaults to True.
             max_file_size_bytes (int, optional): Maximum file size in bytes.
-                Defaults to 10MB. Must be positive integer.
+                Defaults to 10MB. Must be positive integer. Not applied by
+                iter_file_blocks().
+            stream_buffer_size (int, optional): Characters read per buffer
+                by iter_file_blocks(). Defaults to 1M. Must be positive integer.
+            use_mmap (bool, optional): Whether to read files through a
+                memory mapping and decode verbatim blocks lazily.
+                Defaults to False.
         
         Raises:
-            ValueError: If encoding is not supported or extraction strategy is invalid
+            ValueError: If encoding is not supported, extraction strategy
+                or stream_buffer_size is invalid
             TypeError: If block_extractor is not TextBlockExtractor instance
         """
         # Initialize base processor
@@ -395,11 +644,20 @@ class TextProcessor(BaseProcessor):
             raise TypeError("encoding must be string")
         if not encoding:
             raise ValueError("encoding cannot be empty")
+        try:
+            self.encoding_detector = EncodingDetector([encoding] + _FALLBACK_ENCODINGS)
+        except LookupError:
+            raise ValueError(f"encoding is not supported: {encoding}")
+        
+        if not isinstance(stream_buffer_size, int) or stream_buffer_size <= 0:
+            raise ValueError("stream_buffer_size must be positive integer")
         
         # Set attributes
         self.encoding = encoding
         self.normalize_whitespace = normalize_whitespace
         self.remove_empty_blocks = remove_empty_blocks
+        self.stream_buffer_size = stream_buffer_size
+        self.use_mmap = use_mmap
         
         logger.debug(f"Initialized TextProcessor with encoding: {encoding}")
     
@@ -436,15 +694,63 @@ class TextProcessor(BaseProcessor):
         self.validate_file_path(file_path)
         
         start_time = time.time()
+        mapped_file = None
         
         try:
+            # Read file content
+            if self.use_mmap:
+                mapped_file = MappedFile(file_path, self.encoding_detector)
+                text_content = mapped_file.read_text()
+            else:
+                text_content = self._read_file_content(file_path)
+        except Exception as e:
+            logger.error(f"Error processing text file {file_path}: {e}")
+            if mapped_file is not None:
+                mapped_file.close()
+            
+            return ProcessorResult(
+                success=False,
+                error_message=str(e),
+                processing_time_seconds=time.time() - start_time,
+                file_size_bytes=0,
+                supported_file_type=True
+            )
+        
+        result = self.process_content(text_content, file_path, start_time)
+        if mapped_file is not None:
+            del text_content
+            self._map_blocks_to_file(result, mapped_file)
+        
+        return result
+    
+    def process_content(self, content: str, file_path: str, start_time: Optional[float] = None) -> ProcessorResult:
+        """
+        Extract text blocks from already read text content.
+        
+        Applies text processing (normalization, cleaning), extracts text
+        blocks using the configured strategy, and returns a ProcessorResult
+        with extracted ProcessingBlock instances.
+        
+        Args:
+            content (str): Text content of the file.
+            file_path (str): Path to the source text file.
+            start_time (Optional[float]): Processing start time from
+                time.time(). If None, current time is used. Defaults to None.
+        
+        Returns:
+            ProcessorResult: Result of the processing operation.
+                Contains extracted ProcessingBlock instances and processing metadata.
+        """
+        if start_time is None:
+            start_time = time.time()
+        
+        try:
+            text_content = content
+            
             # Get file metadata
             metadata = self.get_file_metadata(file_path)
             file_size = metadata.get("size_bytes", 0)
             
-            # Read file content
-            text_content = self._read_file_content(file_path)
-            
             # Process text content
             processed_text = self._process_text_content(text_content)
             
@@ -491,9 +797,67 @@ class TextProcessor(BaseProcessor):
                 supported_file_type=True
             )
     
+    def iter_file_blocks(self, file_path: str) -> Iterator[ProcessingBlock]:
+        """
+        Extract processing blocks from a text file in bounded memory.
+        
+        Reads the file in buffers of stream_buffer_size characters,
+        normalizes whitespace and splits blocks across buffer edges, and
+        yields each ProcessingBlock as soon as it is complete. Memory use
+        depends on the buffer and block sizes rather than the file size,
+        so max_file_size_bytes is not applied. Blocks equal those of
+        process_file() for the same file, except that paragraphs or lines
+        longer than 1M characters are cut (see TextBlockExtractor.iter_blocks).
+        
+        Args:
+            file_path (str): Path to the text file to process.
+                Must be existing .txt file.
+        
+        Returns:
+            Iterator[ProcessingBlock]: Blocks in file order. Empty for a
+                file without text.
+        
+        Raises:
+            FileNotFoundError: If file does not exist
+            PermissionError: If file cannot be read
+            UnicodeDecodeError: If file cannot be decoded with any supported encoding
+            ValueError: If file_path is empty or file type is not supported
+            TypeError: If file_path is not string
+        
+        Example:
+            >>> processor = TextProcessor()
+            >>> for block in processor.iter_file_blocks("/path/export.txt"):
+            ...     print(block.block_type)  # "text_paragraph"
+        """
+        self.validate_file_path(file_path, check_size=False)
+        encoding = self.encoding_detector.detect_file(file_path, self.stream_buffer_size)
+        if encoding != self.encoding:
+            logger.info(f"Streaming {file_path} with {encoding} encoding")
+        
+        return self._iter_stream_blocks(file_path, encoding)
+    
+    def _iter_stream_blocks(self, file_path: str, encoding: str) -> Iterator[ProcessingBlock]:
+        """
+        Read, normalize and split a file buffer by buffer.
+        
+        Args:
+            file_path (str): Path to the validated text file.
+            encoding (str): Encoding that decodes the whole file.
+        
+        Returns:
+            Iterator[ProcessingBlock]: Blocks in file order.
+        """
+        with open(file_path, 'r', encoding=encoding) as file:
+            chunks = iter(lambda: file.read(self.stream_buffer_size), '')
+            if self.normalize_whitespace:
+                chunks = self._iter_normalized_text(chunks)
+            
+            text_blocks = self.block_extractor.iter_blocks(chunks)
+            yield from self._iter_processing_blocks(text_blocks, file_path)
+    
     def _read_file_content(self, file_path: str) -> str:
         """
-        Read file content with encoding handling.
+        Read file content with encoding detection.
         
         Args:
             file_path (str): Path to the file to read.
@@ -505,21 +869,14 @@ class TextProcessor(BaseProcessor):
             UnicodeDecodeError: If file encoding cannot be decoded
             OSError: If file cannot be read
         """
-        try:
-            with open(file_path, 'r', encoding=self.encoding) as file:
-                return file.read()
-        except UnicodeDecodeError:
-            # Try alternative encodings
-            for alt_encoding in ['latin-1', 'cp1252', 'iso-8859-1']:
-                try:
-                    with open(file_path, 'r', encoding=alt_encoding) as file:
-                        content = file.read()
-                        logger.info(f"Successfully read {file_path} with {alt_encoding} encoding")
-                        return content
-                except UnicodeDecodeError:
-                    continue
-            
-            raise UnicodeDecodeError("utf-8", b"", 0, 1, f"Cannot decode {file_path} with any supported encoding")
+        # Read bytes once and decode them with the detected encoding
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        
+        content, encoding = self.encoding_detector.decode(data)
+        if encoding != self.encoding:
+            logger.info(f"Successfully read {file_path} with {encoding} encoding")
+        return content
     
     def _process_text_content(self, text: str) -> str:
         """
@@ -534,19 +891,60 @@ class TextProcessor(BaseProcessor):
         if not self.normalize_whitespace:
             return text
         
-        # Normalize whitespace
-        import re
+        # Normalize whitespace and remove leading/trailing whitespace
+        return self._normalize_whitespace_runs(text).strip()
+    
+    def _normalize_whitespace_runs(self, text: str) -> str:
+        """
+        Collapse space runs and runs of three or more newlines.
         
+        Both replacements only touch whitespace, so text cut after a
+        non-whitespace character can be normalized piece by piece.
+        
+        Args:
+            text (str): Text to normalize.
+        
+        Returns:
+            str: Text with normalized whitespace runs.
+        """
         # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
+        text = _SPACE_RUN_RE.sub(' ', text)
         
         # Replace multiple newlines with double newline
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        return _BLANK_LINES_RE.sub('\n\n', text)
+    
+    def _iter_normalized_text(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Normalize streamed text as _process_text_content() does.
         
-        # Remove leading/trailing whitespace
-        text = text.strip()
+        Each chunk is cut after its last non-whitespace character and the
+        trailing whitespace is carried into the next chunk, so whitespace
+        runs are never split between pieces.
         
-        return text
+        Args:
+            chunks (Iterable[str]): Consecutive pieces of raw text.
+        
+        Returns:
+            Iterator[str]: Pieces whose concatenation equals the
+                normalized text.
+        """
+        pending = ""
+        started = False
+        
+        for chunk in chunks:
+            text = pending + chunk
+            end = len(text.rstrip())
+            if not end:
+                # Leading whitespace is dropped, inner runs are carried on
+                pending = self._normalize_whitespace_runs(text) if started else ""
+                continue
+            
+            piece = self._normalize_whitespace_runs(text[:end])
+            if not started:
+                piece = piece.lstrip()
+                started = True
+            pending = text[end:]
+            yield piece
     
     def _create_processing_blocks(self, text_blocks: List[str], file_path: str) -> List[ProcessingBlock]:
         """
@@ -559,7 +957,19 @@ class TextProcessor(BaseProcessor):
         Returns:
             List[ProcessingBlock]: List of ProcessingBlock instances.
         """
-        processing_blocks = []
+        return list(self._iter_processing_blocks(text_blocks, file_path))
+    
+    def _iter_processing_blocks(self, text_blocks: Iterable[str], file_path: str) -> Iterator[ProcessingBlock]:
+        """
+        Convert text blocks to ProcessingBlock instances one at a time.
+        
+        Args:
+            text_blocks (Iterable[str]): Text blocks to convert.
+            file_path (str): Path to the source file.
+        
+        Returns:
+            Iterator[ProcessingBlock]: ProcessingBlock instances.
+        """
         char_position = 0
         
         for i, text_block in enumerate(text_blocks):
@@ -588,7 +998,5 @@ class TextProcessor(BaseProcessor):
                 }
             )
             
-            processing_blocks.append(block)
-            char_position += len(text_block) + 1  # +1 for newline
-        
-        return processing_blocks 
\ No newline at end of file
+            yield block
+            char_position += len(text_block) + 1  # +1 for newline 
\ No newline at end of file
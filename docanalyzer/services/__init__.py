@@ -11,10 +11,17 @@ Version: 1.0.0
 
 from .lock_manager import LockManager
 from .directory_scanner import DirectoryScanner
+from .directory_walker import DirectoryWalker
+from .directory_watcher import DirectoryWatcher, WatchEvent
+from .scan_manifest import ScanManifest, ScanChanges
 from .vector_store_wrapper import VectorStoreWrapper
 from .database_manager import DatabaseManager, FileRepository
 from .file_processor import FileProcessor
+from .embedding_client import EmbeddingClient
+from .embedding_batcher import EmbeddingBatcher
+from .embedding_cache import EmbeddingCache
 from .chunking_manager import ChunkingManager
+from .processing_pipeline import ProcessingPipeline, PipelineConfig
 from .main_process_manager import MainProcessManager
 from .child_process_manager import ChildProcessManager, ChildProcessConfig
 from .process_communication import ProcessCommunication, ProcessCommunicationConfig
@@ -32,11 +39,21 @@ __all__ = [
     '__author__',
     'LockManager',
     'DirectoryScanner', 
+    'DirectoryWalker',
+    'DirectoryWatcher',
+    'WatchEvent',
+    'ScanManifest',
+    'ScanChanges',
     'VectorStoreWrapper',
     'DatabaseManager',
     'FileRepository',
     'FileProcessor',
+    'EmbeddingClient',
+    'EmbeddingBatcher',
+    'EmbeddingCache',
     'ChunkingManager',
+    'ProcessingPipeline',
+    'PipelineConfig',
     'MainProcessManager',
     'ChildProcessManager',
     'ChildProcessConfig',
@@ -16,13 +16,16 @@ Version: 1.0.0
 import asyncio
 import logging
 import uuid
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 from uuid import uuid4
 
 from docanalyzer.models.processing import ProcessingBlock, FileProcessingResult
 from docanalyzer.models.semantic_chunk import SemanticChunk, ChunkStatus, METADATA_KEYS
 from docanalyzer.services.vector_store_wrapper import VectorStoreWrapper
+from docanalyzer.services.embedding_client import EmbeddingClient
+from docanalyzer.services.embedding_batcher import EmbeddingBatcher
+from docanalyzer.services.embedding_cache import EmbeddingCache
 from docanalyzer.models.database import DatabaseFileRecord
 
 logger = logging.getLogger(__name__)
@@ -215,6 +218,11 @@ class ChunkingManager:
             Defaults to 1000.
         max_retry_attempts (int): Maximum number of retry attempts.
             Defaults to 3.
+        embedding_client (Optional[Union[EmbeddingClient, EmbeddingBatcher]]):
+            Pooled client or shared micro-batcher used to generate embeddings.
+            Created on first use if not provided.
+        embedding_cache (Optional[EmbeddingCache]): Persistent embedding cache
+            consulted before the embedding service. None disables caching.
     
     Example:
         >>> manager = ChunkingManager(vector_store_wrapper)
@@ -225,7 +233,9 @@ class ChunkingManager:
         self,
         vector_store_wrapper: VectorStoreWrapper,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
-        batch_size: int = DEFAULT_BATCH_SIZE
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        embedding_client: Optional[Union[EmbeddingClient, EmbeddingBatcher]] = None,
+        embedding_cache: Optional[EmbeddingCache] = None
     ):
         """
         Initialize ChunkingManager instance.
@@ -237,6 +247,14 @@ class ChunkingManager:
                 Must be positive integer. Defaults to 1000.
             batch_size (int): Number of chunks to process in each batch.
                 Must be positive integer. Defaults to 100.
+            embedding_client (Optional[Union[EmbeddingClient, EmbeddingBatcher]]):
+                Shared embedding client or micro-batcher. Pass an EmbeddingBatcher
+                shared between managers to merge texts from many files into
+                common batches. If None, a client is created from unified config
+                on first use and closed by cleanup(). Defaults to None.
+            embedding_cache (Optional[EmbeddingCache]): Persistent embedding
+                cache. Texts found in it are not sent to the embedding service.
+                Defaults to None.
         
         Raises:
             ValueError: If chunk_size or batch_size are not positive
@@ -255,6 +273,9 @@ class ChunkingManager:
         self.batch_processor = BatchProcessor(batch_size)
         self.chunk_size = chunk_size
         self.max_retry_attempts = MAX_RETRY_ATTEMPTS
+        self.embedding_client = embedding_client
+        self._owns_embedding_client = embedding_client is None
+        self.embedding_cache = embedding_cache
     
     async def create_chunks(
         self,
@@ -340,7 +361,8 @@ class ChunkingManager:
             List[SemanticChunk]: List of created semantic chunks.
         
         Raises:
-            ValueError: If blocks list is empty or parameters are invalid
+            ValueError: If blocks list is empty, parameters are invalid or
+                a mapped source changed since it was mapped
         """
         if not blocks:
             raise ValueError("Blocks list cannot be empty")
@@ -348,6 +370,8 @@ class ChunkingManager:
         if not source_path or not source_id:
             raise ValueError("source_path and source_id cannot be empty")
         
+        ProcessingBlock.validate_sources(blocks)
+        
         chunks = []
         
         for i, block in enumerate(blocks):
@@ -393,6 +417,9 @@ class ChunkingManager:
         
         Saves all chunks to vector store in a single transaction.
         If any chunk fails to save, all changes are rolled back.
+        Embeddings for all valid chunks are requested together through
+        the pooled embedding client. Texts already present in the
+        embedding cache are not sent to the service.
         
         Args:
             chunks (List[SemanticChunk]): List of chunks to save.
@@ -413,22 +440,37 @@ class ChunkingManager:
         saved_count = 0
         
         try:
-            # Convert our SemanticChunk to vector_store_client SemanticChunk
-            vector_chunks = []
-            
+            # Validate chunks before conversion
+            valid_chunks = []
             for chunk in chunks:
                 try:
-                    # Validate chunk before conversion
                     if not await self.validate_chunk(chunk):
                         errors.append(f"Invalid chunk {chunk.uuid}")
                         continue
-                    
-                    # Generate embedding for the chunk
-                    embedding = await self._generate_embedding(chunk.content)
-                    
-                    # Create vector store chunk
-                    from vector_store_client import SemanticChunk as VectorSemanticChunk
-                    
+                    valid_chunks.append(chunk)
+                except Exception as e:
+                    errors.append(f"Error converting chunk {chunk.uuid}: {str(e)}")
+            
+            if not valid_chunks:
+                return 0, errors
+            
+            # Generate embeddings for all valid chunks in batched requests
+            try:
+                embeddings = await self._generate_embeddings(
+                    [chunk.content for chunk in valid_chunks]
+                )
+            except Exception as e:
+                for chunk in valid_chunks:
+                    errors.append(f"Error converting chunk {chunk.uuid}: {str(e)}")
+                return 0, errors
+            
+            # Convert our SemanticChunk to vector_store_client SemanticChunk
+            from vector_store_client import SemanticChunk as VectorSemanticChunk
+            
+            vector_chunks = []
+            
+            for chunk, embedding in zip(valid_chunks, embeddings):
+                try:
                     vector_chunk = VectorSemanticChunk(
                         body=chunk.content,
                         source_id=chunk.source_id,
@@ -503,45 +545,56 @@ class ChunkingManager:
         Returns:
             List[float]: 384-dimensional embedding vector.
         
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        embeddings = await self._generate_embeddings([text])
+        return embeddings[0]
+    
+    async def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for many texts using embedding service.
+        
+        Texts are sent in batches over the pooled embedding client
+        connection instead of one request per text. If an embedding cache
+        is configured, cached texts are served from it, duplicate texts
+        are embedded once, and new embeddings are added to the cache.
+        
+        Args:
+            texts (List[str]): Texts to generate embeddings for.
+        
+        Returns:
+            List[List[float]]: 384-dimensional embedding vectors in input order.
+        
         Raises:
             EmbeddingError: If embedding generation fails
         """
         try:
-            import httpx
+            if self.embedding_client is None:
+                self.embedding_client = EmbeddingClient()
+            
+            if self.embedding_cache is None:
+                return await self.embedding_client.embed_texts(texts)
+            
+            return await self.embedding_cache.get_or_embed(texts, self.embedding_client.embed_texts)
             
-            # Call embedding service directly
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "http://localhost:8001/cmd",
-                    json={
-                        "jsonrpc": "2.0",
-                        "method": "embed",
-                        "params": {"texts": [text]},
-                        "id": 1
-                    }
-                )
-                
-                data = await response.json()
-                
-                if not data.get("result", {}).get("success"):
-                    raise Exception("Failed to generate embedding")
-                
-                embeddings = data.get("result", {}).get("data", {}).get("embeddings", [])
-                if not embeddings or not embeddings[0]:
-                    raise Exception("No embedding returned")
-                
-                embedding = embeddings[0]
-                
-                # Validate embedding dimensions
-                if len(embedding) != 384:
-                    raise Exception(f"Invalid embedding dimensions: {len(embedding)}")
-                
-                return embedding
-                
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             raise Exception(f"Embedding generation failed: {str(e)}")
     
+    async def cleanup(self) -> None:
+        """
+        Release resources held by the chunking manager.
+        
+        Closes the embedding client connection pool if the client
+        was created by this manager, and closes the embedding cache.
+        """
+        if self.embedding_client is not None and self._owns_embedding_client:
+            await self.embedding_client.cleanup()
+        
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
+    
     async def cleanup_failed_chunks(
         self,
         failed_chunks: List[SemanticChunk]
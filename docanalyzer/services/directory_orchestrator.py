@@ -14,30 +14,47 @@ Version: 1.0.0
 
 import asyncio
 import os
-from typing import Dict, List, Optional, Any, Union
+import stat
+from typing import Dict, List, Optional, Any, Set, Tuple, Union, AsyncIterator
 from pathlib import Path
 import logging
 from datetime import datetime
 import json
 
+from docanalyzer.config import get_unified_config
 from docanalyzer.models.file_system import Directory, FileInfo
 from docanalyzer.models.processing import ProcessingResult, ProcessingStatus
 from docanalyzer.models.errors import ProcessingError, ErrorCategory
 from docanalyzer.services.directory_scanner import DirectoryScanner
+from docanalyzer.services.directory_watcher import (
+    DirectoryWatcher, WatchEvent, inotify_available, EVENT_CHANGED, EVENT_DELETED, EVENT_OVERFLOW
+)
+from docanalyzer.services.scan_manifest import ScanChanges, ManifestEntry, digest_file, match_moves
 from docanalyzer.services.file_processor import FileProcessor
 from docanalyzer.services.chunking_manager import ChunkingManager
+from docanalyzer.services.embedding_batcher import EmbeddingBatcher
+from docanalyzer.services.embedding_cache import EmbeddingCache
+from docanalyzer.services.processing_pipeline import ProcessingPipeline, PipelineConfig
+from docanalyzer.processors.processor_executor import (
+    ProcessorExecutor, EXECUTOR_MODES, START_METHODS, DEFAULT_START_METHOD
+)
 from docanalyzer.services.lock_manager import LockManager
 from docanalyzer.services.main_process_manager import MainProcessManager
 from docanalyzer.services.child_process_manager import ChildProcessManager, ChildProcessConfig
 from docanalyzer.services.database_manager import DatabaseManager
 from docanalyzer.services.vector_store_wrapper import VectorStoreWrapper
 from docanalyzer.utils.file_processing_logger import file_processing_logger
+from docanalyzer.utils.file_utils import collapse_nested_paths
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_CONCURRENT_DIRECTORIES = 5
 DEFAULT_PROCESSING_TIMEOUT = 3600
 DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_MAX_CONCURRENT_FILES = 8
+DEFAULT_SCAN_INTERVAL = 300
+DEFAULT_WATCH_DEBOUNCE = 0.2
+WATCH_MODES = ("inotify", "poll")
 
 
 class OrchestratorConfig:
@@ -61,6 +78,38 @@ class OrchestratorConfig:
             Defaults to True.
         enable_cleanup_on_failure (bool): Whether to cleanup resources on failure.
             Defaults to True.
+        max_concurrent_files (int): Maximum number of files of one directory
+            processed at the same time when parallel processing is enabled.
+            1 processes files sequentially. Must be positive integer. Defaults to 8.
+        pipeline_config (Optional[PipelineConfig]): Stage settings of the staged
+            processing pipeline. If set, files are processed by ProcessingPipeline
+            instead of per-file coroutines. Defaults to None.
+        processor_executor_mode (Optional[str]): Runs file parsing in a
+            'process' or 'thread' pool instead of on the event loop.
+            None parses inline. Defaults to None.
+        processor_workers (Optional[int]): Number of parsing workers.
+            None uses CPU count. Defaults to None.
+        processor_start_method (str): multiprocessing start method of
+            parsing worker processes. Defaults to 'forkserver', or 'spawn'
+            where forkserver is unavailable.
+        streaming_scan (bool): Whether files are processed while the
+            directory is still being scanned, using
+            DirectoryScanner.scan_directory_iter. Defaults to False.
+        incremental_scan (bool): Whether only files created or modified
+            since the previous scan are processed, using the scanner's
+            persistent scan manifest. Takes precedence over streaming_scan.
+            Defaults to False.
+        watch_mode (str): How watch_directory detects changes.
+            'inotify' processes files as soon as the kernel reports them
+            and falls back to 'poll' where inotify is unavailable,
+            'poll' rescans every scan_interval seconds. Defaults to 'inotify'.
+        scan_interval (int): Seconds between rescans in poll mode.
+            Must be positive integer. Defaults to 300.
+        watch_debounce (float): Seconds inotify events are coalesced
+            before processing. Must be non-negative. Defaults to 0.2.
+        use_mmap (bool): Whether text and Markdown files are read through
+            a memory mapping and verbatim blocks keep only byte offsets
+            into it. Defaults to False.
     """
     
     def __init__(
@@ -71,7 +120,18 @@ class OrchestratorConfig:
         enable_parallel_processing: bool = True,
         enable_progress_tracking: bool = True,
         enable_error_recovery: bool = True,
-        enable_cleanup_on_failure: bool = True
+        enable_cleanup_on_failure: bool = True,
+        max_concurrent_files: int = DEFAULT_MAX_CONCURRENT_FILES,
+        pipeline_config: Optional[PipelineConfig] = None,
+        processor_executor_mode: Optional[str] = None,
+        processor_workers: Optional[int] = None,
+        processor_start_method: str = DEFAULT_START_METHOD,
+        streaming_scan: bool = False,
+        incremental_scan: bool = False,
+        watch_mode: str = "inotify",
+        scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        watch_debounce: float = DEFAULT_WATCH_DEBOUNCE,
+        use_mmap: bool = False
     ):
         """
         Initialize OrchestratorConfig instance.
@@ -91,6 +151,28 @@ class OrchestratorConfig:
                 Defaults to True.
             enable_cleanup_on_failure (bool): Whether to cleanup resources on failure.
                 Defaults to True.
+            max_concurrent_files (int): Maximum number of files processed at
+                the same time. Must be positive integer. Defaults to 8.
+            pipeline_config (Optional[PipelineConfig]): Enables the staged
+                processing pipeline with the given stage settings. Defaults to None.
+            processor_executor_mode (Optional[str]): Pool type for file parsing.
+                Must be 'process', 'thread' or None. Defaults to None.
+            processor_workers (Optional[int]): Number of parsing workers.
+                Must be positive if set. Defaults to None.
+            processor_start_method (str): Start method of parsing worker
+                processes. Must be one of START_METHODS.
+            streaming_scan (bool): Whether to start processing files as
+                they are discovered. Defaults to False.
+            incremental_scan (bool): Whether to process only files changed
+                since the previous scan. Defaults to False.
+            watch_mode (str): Change detection of watch_directory.
+                Must be one of: 'inotify', 'poll'. Defaults to 'inotify'.
+            scan_interval (int): Seconds between rescans in poll mode.
+                Must be positive integer. Defaults to 300.
+            watch_debounce (float): Event coalescing window in seconds.
+                Must be non-negative. Defaults to 0.2.
+            use_mmap (bool): Whether files are read through a memory
+                mapping. Defaults to False.
         
         Raises:
             ValueError: If any parameter has invalid value
@@ -101,6 +183,20 @@ class OrchestratorConfig:
             raise ValueError("processing_timeout must be positive")
         if retry_attempts < 0:
             raise ValueError("retry_attempts must be non-negative")
+        if max_concurrent_files <= 0:
+            raise ValueError("max_concurrent_files must be positive")
+        if processor_executor_mode is not None and processor_executor_mode not in EXECUTOR_MODES:
+            raise ValueError(f"processor_executor_mode must be one of {EXECUTOR_MODES}")
+        if processor_workers is not None and processor_workers <= 0:
+            raise ValueError("processor_workers must be positive")
+        if processor_start_method not in START_METHODS:
+            raise ValueError(f"processor_start_method must be one of {START_METHODS}")
+        if watch_mode not in WATCH_MODES:
+            raise ValueError(f"watch_mode must be one of {WATCH_MODES}")
+        if scan_interval <= 0:
+            raise ValueError("scan_interval must be positive")
+        if watch_debounce < 0:
+            raise ValueError("watch_debounce must be non-negative")
         
         self.max_concurrent_directories = max_concurrent_directories
         self.processing_timeout = processing_timeout
@@ -109,6 +205,17 @@ class OrchestratorConfig:
         self.enable_progress_tracking = enable_progress_tracking
         self.enable_error_recovery = enable_error_recovery
         self.enable_cleanup_on_failure = enable_cleanup_on_failure
+        self.max_concurrent_files = max_concurrent_files
+        self.pipeline_config = pipeline_config
+        self.processor_executor_mode = processor_executor_mode
+        self.processor_workers = processor_workers
+        self.processor_start_method = processor_start_method
+        self.streaming_scan = streaming_scan
+        self.incremental_scan = incremental_scan
+        self.watch_mode = watch_mode
+        self.scan_interval = scan_interval
+        self.watch_debounce = watch_debounce
+        self.use_mmap = use_mmap
 
 
 class DirectoryProcessingStatus:
@@ -338,6 +445,10 @@ class DirectoryOrchestrator:
         directory_scanner (DirectoryScanner): Directory scanner instance.
         file_processor (FileProcessor): File processor instance.
         chunking_manager (ChunkingManager): Chunking manager instance.
+        embedding_batcher (EmbeddingBatcher): Embedding micro-batcher shared
+            by file processor and chunking manager.
+        embedding_cache (Optional[EmbeddingCache]): Persistent embedding cache
+            in front of the batcher, or None if no cache path is configured.
         lock_manager (LockManager): Lock manager instance.
         main_process_manager (MainProcessManager): Main process manager instance.
         child_process_manager (ChildProcessManager): Child process manager instance.
@@ -380,8 +491,30 @@ class DirectoryOrchestrator:
         # Initialize services
         self.vector_store_wrapper = VectorStoreWrapper()
         self.database_manager = DatabaseManager()
-        self.file_processor = FileProcessor(self.vector_store_wrapper, self.database_manager)
-        self.chunking_manager = ChunkingManager(self.vector_store_wrapper)
+        # Cache in front of the shared batcher serves file processor and
+        # chunking manager alike
+        embedding_config = get_unified_config().embedding
+        self.embedding_cache = EmbeddingCache(config=embedding_config) if embedding_config.cache_path else None
+        self.embedding_batcher = EmbeddingBatcher(config=embedding_config, embedding_cache=self.embedding_cache)
+        self.processor_executor = None
+        if self.config.processor_executor_mode is not None:
+            self.processor_executor = ProcessorExecutor(
+                mode=self.config.processor_executor_mode,
+                max_workers=self.config.processor_workers,
+                start_method=self.config.processor_start_method
+            )
+        self.file_processor = FileProcessor(
+            self.vector_store_wrapper,
+            self.database_manager,
+            bulk_storage=True,
+            embedding_client=self.embedding_batcher,
+            processor_executor=self.processor_executor,
+            use_mmap=self.config.use_mmap
+        )
+        self.chunking_manager = ChunkingManager(
+            self.vector_store_wrapper,
+            embedding_client=self.embedding_batcher
+        )
         
         # Process managers
         self.main_process_manager = MainProcessManager()
@@ -398,7 +531,11 @@ class DirectoryOrchestrator:
         
         logger.info(f"DirectoryOrchestrator initialized with max_concurrent_directories={config.max_concurrent_directories}")
     
-    async def process_directory(self, directory_path: str) -> OrchestrationResult:
+    async def process_directory(
+        self,
+        directory_path: str,
+        seen_files: Optional[Set[Tuple[int, int]]] = None
+    ) -> OrchestrationResult:
         """
         Process a directory completely.
         
@@ -408,6 +545,10 @@ class DirectoryOrchestrator:
         Args:
             directory_path (str): Path to directory to process.
                 Must be existing directory path.
+            seen_files (Optional[Set[Tuple[int, int]]]): Device and inode
+                of files already found under other directories of the same
+                pass. Those files are skipped and files found here are
+                added. Defaults to None.
         
         Returns:
             OrchestrationResult: Result of the processing operation.
@@ -445,12 +586,25 @@ class DirectoryOrchestrator:
             status_updates.append(self.active_directories[directory_path])
             
             # Scan directory
-            files = await self._scan_directory(directory_path)
-            status.files_found = len(files)
+            scan_changes = None
+            if self.config.incremental_scan:
+                scan_changes = await self._scan_directory_changes(directory_path, seen_files)
+                await self._move_renamed_chunks(scan_changes)
+                await self._remove_stale_chunks(scan_changes)
+                files = scan_changes.changed_files
+                status.files_found = len(files)
+            elif self.config.streaming_scan:
+                # Files are counted into files_found as they are discovered
+                files = self._scan_directory_iter(directory_path, seen_files)
+            else:
+                files = await self._scan_directory(directory_path, seen_files)
+                status.files_found = len(files)
             status_updates.append(self.active_directories[directory_path])
             
-            if not files:
+            if isinstance(files, list) and not files:
                 logger.info(f"No files found in directory: {directory_path}")
+                if scan_changes is not None:
+                    await self.directory_scanner.commit_scan_changes(scan_changes)
                 await self._update_status(directory_path, "completed")
                 status_updates.append(self.active_directories[directory_path])
                 
@@ -472,6 +626,11 @@ class DirectoryOrchestrator:
             if not processing_result.success:
                 raise ProcessingError("FileProcessingError", f"File processing failed: {processing_result.message}", ErrorCategory.PROCESSING)
             
+            if scan_changes is not None:
+                # Failed files stay out of the manifest and are reported again next scan
+                failed_paths = set(processing_result.data.get("failed_paths", []))
+                await self.directory_scanner.commit_scan_changes(scan_changes, exclude_paths=failed_paths)
+            
             # Create chunks
             chunking_result = await self._create_chunks(processing_result)
             
@@ -537,7 +696,11 @@ class DirectoryOrchestrator:
         Process multiple directories concurrently.
         
         Processes multiple directories in parallel, respecting the maximum
-        concurrent directory limit.
+        concurrent directory limit. Directories inside another listed
+        directory, or listed twice, are covered by that directory and
+        get a successful result without being processed again. A file
+        linked into several directories is processed under the first
+        path found, so each file is processed at most once per call.
         
         Args:
             directory_paths (List[str]): List of directory paths to process.
@@ -559,9 +722,19 @@ class DirectoryOrchestrator:
         # Process directories with semaphore to limit concurrency
         semaphore = asyncio.Semaphore(self.config.max_concurrent_directories)
         
+        scan_paths = set(collapse_nested_paths(directory_paths))
+        seen_files: Set[Tuple[int, int]] = set()
+        
         async def process_with_semaphore(directory_path: str) -> OrchestrationResult:
+            if directory_path not in scan_paths:
+                logger.info(f"Skipping {directory_path}: covered by another processed directory")
+                return OrchestrationResult(
+                    success=True,
+                    directory_path=directory_path,
+                    metadata={"skipped": "nested"}
+                )
             async with semaphore:
-                return await self.process_directory(directory_path)
+                return await self.process_directory(directory_path, seen_files)
         
         # Create tasks for all directories
         tasks = [process_with_semaphore(path) for path in directory_paths]
@@ -583,6 +756,74 @@ class DirectoryOrchestrator:
         
         return processed_results
     
+    async def watch_directory(self, directory_path: str) -> None:
+        """
+        Process a directory and keep it processed until stopped.
+        
+        After an initial process_directory pass, changes are picked up
+        according to watch_mode. In 'inotify' mode files written, moved in
+        or deleted are handled as soon as the kernel reports them: stale
+        chunks are removed and changed files are processed directly. A
+        kernel queue overflow falls back to process_directory, as does
+        removal of a subdirectory when incremental_scan is enabled. In
+        'poll' mode, or where inotify cannot be used, process_directory
+        runs every scan_interval seconds.
+        
+        Returns when stop_all_processing is called.
+        
+        Args:
+            directory_path (str): Path to directory to watch.
+                Must be existing directory path.
+        
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+        """
+        if not os.path.isdir(directory_path):
+            raise FileNotFoundError(f"Directory not found: {directory_path}")
+        
+        watcher = None
+        if self.config.watch_mode == "inotify":
+            if inotify_available():
+                watcher = DirectoryWatcher(
+                    directory_path,
+                    max_depth=self.directory_scanner.max_depth,
+                    debounce=self.config.watch_debounce
+                )
+                try:
+                    # Started before the initial pass so changes made during it are not missed
+                    await watcher.start()
+                except OSError as e:
+                    logger.warning(f"Cannot watch {directory_path} with inotify, polling instead: {e}")
+                    watcher = None
+            else:
+                logger.warning(f"inotify is not available, polling {directory_path} every {self.config.scan_interval}s")
+        
+        try:
+            await self.process_directory(directory_path)
+            
+            if watcher is None:
+                while not self._shutdown_event.is_set():
+                    try:
+                        await asyncio.wait_for(self._shutdown_event.wait(), timeout=self.config.scan_interval)
+                    except asyncio.TimeoutError:
+                        await self.process_directory(directory_path)
+                return
+            
+            async def close_on_shutdown() -> None:
+                await self._shutdown_event.wait()
+                await watcher.close()
+            
+            closer = asyncio.create_task(close_on_shutdown())
+            try:
+                async for events in watcher.batches():
+                    await self._process_watch_events(directory_path, events)
+            finally:
+                closer.cancel()
+        finally:
+            if watcher is not None:
+                await watcher.close()
+                logger.info(f"Stopped watching {directory_path}: {watcher.get_statistics()}")
+    
     async def get_processing_status(self, directory_path: str) -> Optional[DirectoryProcessingStatus]:
         """
         Get processing status for a directory.
@@ -668,6 +909,9 @@ class DirectoryOrchestrator:
             bool: True if all operations were stopped successfully, False otherwise.
         """
         try:
+            # Ends watch_directory loops
+            self._shutdown_event.set()
+            
             # Cancel all active directories
             directory_paths = list(self.active_directories.keys())
             cancelled_count = 0
@@ -676,6 +920,14 @@ class DirectoryOrchestrator:
                 if await self.cancel_processing(directory_path):
                     cancelled_count += 1
             
+            # Flush texts still queued for embedding
+            await self.embedding_batcher.stop()
+            if self.embedding_cache is not None:
+                self.embedding_cache.close()
+            
+            if self.processor_executor is not None:
+                self.processor_executor.shutdown(wait=False)
+            
             logger.info(f"Stopped {cancelled_count}/{len(directory_paths)} processing operations")
             return cancelled_count == len(directory_paths)
             
@@ -749,7 +1001,11 @@ class DirectoryOrchestrator:
             logger.error(f"Error cleaning up directory {directory_path}: {e}")
             return False
     
-    async def _scan_directory(self, directory_path: str) -> List[FileInfo]:
+    async def _scan_directory(
+        self,
+        directory_path: str,
+        seen_files: Optional[Set[Tuple[int, int]]] = None
+    ) -> List[FileInfo]:
         """
         Scan directory for files.
         
@@ -757,6 +1013,8 @@ class DirectoryOrchestrator:
         
         Args:
             directory_path (str): Path to directory to scan.
+            seen_files (Optional[Set[Tuple[int, int]]]): Files found under
+                other directories, skipped here. Defaults to None.
         
         Returns:
             List[FileInfo]: List of discovered files.
@@ -766,19 +1024,311 @@ class DirectoryOrchestrator:
             ProcessingError: If scanning fails
         """
         try:
-            files = await self.directory_scanner.scan_directory(directory_path)
+            files = await self.directory_scanner.scan_directory(directory_path, seen_files=seen_files)
             return files
         except Exception as e:
             raise ProcessingError("DirectoryScanningError", f"Directory scanning failed: {str(e)}", ErrorCategory.FILE_SYSTEM)
     
-    async def _process_files(self, files: List[FileInfo], directory_path: str) -> ProcessingResult:
+    async def _scan_directory_changes(
+        self,
+        directory_path: str,
+        seen_files: Optional[Set[Tuple[int, int]]] = None
+    ) -> ScanChanges:
+        """
+        Scan directory incrementally against the scan manifest.
+        
+        The manifest is not updated here; it is committed after the
+        changed files have been processed.
+        
+        Args:
+            directory_path (str): Path to directory to scan.
+            seen_files (Optional[Set[Tuple[int, int]]]): Files found under
+                other directories, skipped here. Defaults to None.
+        
+        Returns:
+            ScanChanges: Created, modified, deleted and moved files.
+        
+        Raises:
+            ProcessingError: If scanning fails
+        """
+        try:
+            return await self.directory_scanner.scan_directory_incremental(
+                directory_path, commit=False, seen_files=seen_files
+            )
+        except Exception as e:
+            raise ProcessingError("DirectoryScanningError", f"Directory scanning failed: {str(e)}", ErrorCategory.FILE_SYSTEM)
+    
+    async def _move_renamed_chunks(self, scan_changes: ScanChanges) -> None:
+        """
+        Point vector store chunks of moved files to their new paths.
+        
+        Moved files keep their chunks and embeddings instead of being
+        parsed and embedded again. A move whose chunks cannot be moved,
+        or that has no stored chunks, is turned into a deleted and a
+        created file, so the file is processed as usual.
+        
+        A successful move is recorded in the manifest at once, so a later
+        processing failure or restart does not report the same move again.
+        Before a file falling back to processing is processed, chunks
+        already stored under its new path are deleted. They remain from a
+        move that was not recorded, and would otherwise be stored twice.
+        
+        Args:
+            scan_changes (ScanChanges): Result of an incremental scan.
+                Updated in place.
+        """
+        for old_path, file_info in list(scan_changes.moved.items()):
+            new_path = file_info.file_path
+            try:
+                moved_count = await self.vector_store_wrapper.move_file_chunks(old_path, new_path)
+            except Exception as e:
+                logger.warning(f"Failed to move chunks of {old_path} to {new_path}: {e}")
+                moved_count = 0
+            
+            if moved_count:
+                entry = scan_changes.entries.get(new_path)
+                move = ScanChanges(
+                    directory_path=scan_changes.directory_path,
+                    moved={old_path: file_info},
+                    entries={new_path: entry} if entry is not None else {}
+                )
+                try:
+                    await self.directory_scanner.commit_scan_changes(move)
+                except Exception as e:
+                    logger.warning(f"Failed to record move of {old_path} to {new_path}: {e}")
+                continue
+            
+            del scan_changes.moved[old_path]
+            scan_changes.deleted.append(old_path)
+            scan_changes.created.append(file_info)
+            try:
+                await self.vector_store_wrapper.delete_file_chunks(new_path)
+            except Exception as e:
+                logger.warning(f"Failed to delete chunks of {new_path}: {e}")
+    
+    async def _remove_stale_chunks(self, scan_changes: ScanChanges) -> None:
+        """
+        Delete vector store chunks of deleted and modified files.
+        
+        Modified files are reprocessed afterwards, so their old chunks
+        would otherwise remain next to the new ones. Failures are logged
+        and do not stop processing.
+        
+        Args:
+            scan_changes (ScanChanges): Result of an incremental scan.
+        """
+        stale_paths = scan_changes.deleted + [f.file_path for f in scan_changes.modified]
+        for file_path in stale_paths:
+            try:
+                await self.vector_store_wrapper.delete_file_chunks(file_path)
+            except Exception as e:
+                logger.warning(f"Failed to delete chunks of {file_path}: {e}")
+    
+    async def _process_watch_events(self, directory_path: str, events: List[WatchEvent]) -> None:
+        """
+        Handle one batch of watch events.
+        
+        Errors are logged so a failing batch does not end the watch.
+        
+        Args:
+            directory_path (str): Watched directory.
+            events (List[WatchEvent]): Coalesced events from DirectoryWatcher.
+        """
+        try:
+            overflow = any(event.event_type == EVENT_OVERFLOW for event in events)
+            removed_directory = any(
+                event.is_directory and event.event_type == EVENT_DELETED for event in events
+            )
+            if overflow or (removed_directory and self.config.incremental_scan):
+                # Events were lost or a whole subtree went away; reconcile with a scan
+                logger.info(f"Rescanning {directory_path} after {'overflow' if overflow else 'directory removal'}")
+                await self.process_directory(directory_path)
+                return
+            
+            loop = asyncio.get_running_loop()
+            changes = await loop.run_in_executor(None, self._collect_watch_changes, directory_path, events)
+            if not changes.has_changes:
+                if changes.entries:
+                    # Content unchanged; only the recorded stat data is refreshed
+                    await self.directory_scanner.commit_scan_changes(changes)
+                return
+            
+            await self._move_renamed_chunks(changes)
+            await self._remove_stale_chunks(changes)
+            
+            failed_paths = set()
+            if changes.changed_files:
+                processing_result = await self._process_files(changes.changed_files, directory_path)
+                failed_paths = set(processing_result.data.get("failed_paths", []))
+            
+            if self.config.incremental_scan:
+                await self.directory_scanner.commit_scan_changes(changes, exclude_paths=failed_paths)
+            
+            logger.info(f"Handled changes in {directory_path}: {changes.to_dict()}")
+            
+        except Exception as e:
+            logger.error(f"Failed to handle changes in {directory_path}: {e}")
+    
+    def _collect_watch_changes(self, directory_path: str, events: List[WatchEvent]) -> ScanChanges:
+        """
+        Turn file watch events into scan changes.
+        
+        Blocking; runs in a worker thread. Changed files are reported as
+        modified so their previous chunks are removed before processing.
+        Files that no longer exist, lie in an excluded directory or do not
+        pass the scanner's file filter are skipped. Manifest entries are built when
+        incremental_scan is enabled; files whose content digest equals the
+        recorded one, such as touched or restored files, then only get
+        their entry refreshed and are not reprocessed, and new files that
+        replace a deleted file of the same content are reported as moved.
+        
+        Args:
+            directory_path (str): Watched directory.
+            events (List[WatchEvent]): File events.
+        
+        Returns:
+            ScanChanges: Modified, deleted and moved files.
+        """
+        changes = ScanChanges(directory_path=str(Path(directory_path).resolve()))
+        file_filter = self.directory_scanner.file_filter
+        candidates: List[Tuple[FileInfo, os.stat_result]] = []
+        
+        for event in events:
+            if event.is_directory:
+                continue
+            if event.event_type == EVENT_DELETED:
+                changes.deleted.append(event.path)
+                continue
+            if event.event_type != EVENT_CHANGED:
+                continue
+            
+            try:
+                stat_result = os.stat(event.path, follow_symlinks=False)
+            except OSError:
+                # Removed again before it could be handled
+                continue
+            if not stat.S_ISREG(stat_result.st_mode):
+                continue
+            
+            if self._in_excluded_directory(changes.directory_path, event.path):
+                continue
+            
+            file_info = FileInfo.from_stat(event.path, stat_result)
+            if not file_filter.filter_file(file_info).should_process:
+                continue
+            candidates.append((file_info, stat_result))
+        
+        if not self.config.incremental_scan:
+            changes.modified = [file_info for file_info, _ in candidates]
+            return changes
+        
+        manifest = self.directory_scanner.manifest
+        recorded: Dict[str, ManifestEntry] = {}
+        if manifest is not None and (candidates or changes.deleted):
+            recorded = manifest.load_paths(
+                changes.directory_path,
+                [file_info.file_path for file_info, _ in candidates] + changes.deleted
+            )
+        
+        created: Dict[str, ManifestEntry] = {}
+        for file_info, stat_result in candidates:
+            current = ManifestEntry.from_stat(file_info.file_path, stat_result)
+            entry = recorded.get(file_info.file_path)
+            if entry is not None and entry.matches(current):
+                changes.unchanged_count += 1
+                continue
+            try:
+                current.digest = digest_file(file_info.file_path)
+            except OSError as e:
+                logger.warning(f"Failed to digest {file_info.file_path}: {e}")
+                continue
+            changes.entries[file_info.file_path] = current
+            if entry is not None and entry.digest == current.digest:
+                changes.unchanged_count += 1
+            else:
+                changes.modified.append(file_info)
+                if entry is None:
+                    created[file_info.file_path] = current
+        
+        deleted = {path: recorded[path] for path in changes.deleted if path in recorded}
+        changes.record_moves(match_moves(created, deleted))
+        
+        return changes
+    
+    def _in_excluded_directory(self, root_path: str, file_path: str) -> bool:
+        """
+        Check if a file lies in a directory excluded from scanning.
+        
+        Only directories below root_path are checked, as in a scan.
+        
+        Args:
+            root_path (str): Scanned root directory.
+            file_path (str): Path to a file below root_path.
+        
+        Returns:
+            bool: True if any directory between root_path and the file
+                is excluded by the scanner's file filter.
+        """
+        file_filter = self.directory_scanner.file_filter
+        parent = os.path.dirname(file_path)
+        while len(parent) > len(root_path) and parent.startswith(root_path):
+            if file_filter.is_directory_excluded(parent):
+                return True
+            parent = os.path.dirname(parent)
+        return False
+    
+    async def _scan_directory_iter(
+        self,
+        directory_path: str,
+        seen_files: Optional[Set[Tuple[int, int]]] = None
+    ) -> AsyncIterator[FileInfo]:
+        """
+        Scan directory and yield files as they are discovered.
+        
+        Args:
+            directory_path (str): Path to directory to scan.
+            seen_files (Optional[Set[Tuple[int, int]]]): Files found under
+                other directories, skipped here. Defaults to None.
+        
+        Yields:
+            FileInfo: Discovered files that pass filters.
+        
+        Raises:
+            ProcessingError: If scanning fails
+        """
+        try:
+            async for file_info in self.directory_scanner.scan_directory_iter(
+                directory_path, seen_files=seen_files
+            ):
+                if directory_path in self.active_directories:
+                    self.active_directories[directory_path].files_found += 1
+                yield file_info
+        except Exception as e:
+            raise ProcessingError("DirectoryScanningError", f"Directory scanning failed: {str(e)}", ErrorCategory.FILE_SYSTEM)
+    
+    async def _process_files(
+        self,
+        files: Union[List[FileInfo], AsyncIterator[FileInfo]],
+        directory_path: str
+    ) -> ProcessingResult:
         """
         Process list of files.
         
         Processes the list of files and returns processing results.
+        When parallel processing is enabled, up to max_concurrent_files
+        files are in flight at once so network round trips to the
+        embedding and vector store services overlap. A failing file never
+        stops the others, and files_processed/progress_percentage are
+        updated as each file finishes. If pipeline_config is set, files
+        go through the staged ProcessingPipeline instead.
+        
+        files may also be an async iterator such as the one returned by
+        DirectoryScanner.scan_directory_iter. Processing then starts with
+        the first discovered file and only a bounded number of files is
+        held in memory; progress is relative to files found so far.
         
         Args:
-            files (List[FileInfo]): List of files to process.
+            files (Union[List[FileInfo], AsyncIterator[FileInfo]]): Files to process.
             directory_path (str): Path to directory being processed.
         
         Returns:
@@ -788,39 +1338,109 @@ class DirectoryOrchestrator:
             ProcessingError: If processing fails
         """
         try:
-            total_files = len(files)
+            streaming = not isinstance(files, list)
+            total_files = 0 if streaming else len(files)
             processed_count = 0
             failed_count = 0
+            submitted_count = 0
+            failed_paths = []
             
-            # Filter out lock files and other system files
-            files_to_process = [f for f in files if not f.file_name.startswith('.') and f.file_name != '.processing.lock']
+            def should_process(file_info: FileInfo) -> bool:
+                # Filter out lock files and other system files
+                return not file_info.file_name.startswith('.') and file_info.file_name != '.processing.lock'
+            
+            if streaming:
+                files_to_process = None
+                file_count = 0
+                total_size = 0
+                in_flight_limit = self.config.max_concurrent_files
+            else:
+                files_to_process = [f for f in files if should_process(f)]
+                file_count = len(files_to_process)
+                total_size = sum(f.file_size for f in files_to_process)
+                in_flight_limit = min(self.config.max_concurrent_files, max(file_count, 1))
+            if not self.config.enable_parallel_processing:
+                in_flight_limit = 1
+            
+            async def pending_files() -> AsyncIterator[FileInfo]:
+                nonlocal total_files, submitted_count
+                if not streaming:
+                    for file_info in files_to_process:
+                        submitted_count += 1
+                        yield file_info
+                    return
+                async for file_info in files:
+                    total_files += 1
+                    if should_process(file_info):
+                        submitted_count += 1
+                        yield file_info
             
             # Log directory processing start
             batch_id = f"dir_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-            total_size = sum(f.file_size for f in files_to_process)
             file_processing_logger.log_batch_processing_start(
                 batch_id=batch_id,
-                file_count=len(files_to_process),
+                file_count=file_count,
                 total_size=total_size
             )
             
             start_time = datetime.now()
-            logger.info(f"Starting processing of {len(files_to_process)} files in directory: {directory_path}")
+            if streaming:
+                logger.info(f"Starting streaming processing of files in directory: {directory_path}")
+            else:
+                logger.info(f"Starting processing of {file_count} files in directory: {directory_path}")
             
-            for file_info in files_to_process:
-                try:
-                    # Process file
-                    result = await self.file_processor.process_file(file_info.file_path)
-                    
+            if self.config.pipeline_config is not None:
+                # Staged pipeline: each step has its own workers and bounded queue
+                def on_result(result) -> None:
+                    nonlocal processed_count, failed_count
                     if result.processing_status == ProcessingStatus.COMPLETED:
                         processed_count += 1
                     else:
                         failed_count += 1
-                        logger.warning(f"Failed to process file {file_info.file_path}: {result.error_message or 'Unknown error'}")
-                        
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"Error processing file {file_info.file_path}: {e}")
+                        failed_paths.append(result.file_path)
+                        logger.warning(f"Failed to process file {result.file_path}: {result.error_message or 'Unknown error'}")
+                    self._update_file_progress(directory_path, processed_count, failed_count, total_files)
+                
+                async def pending_paths() -> AsyncIterator[str]:
+                    async for file_info in pending_files():
+                        yield file_info.file_path
+                
+                pipeline = ProcessingPipeline(self.file_processor, self.config.pipeline_config)
+                await pipeline.run(pending_paths(), on_result)
+                logger.debug(f"Pipeline statistics for {directory_path}: {pipeline.get_statistics()}")
+            else:
+                # Bounded hand-off queue: at most in_flight_limit files wait while
+                # in_flight_limit more are being processed
+                file_queue: asyncio.Queue = asyncio.Queue(maxsize=in_flight_limit)
+                
+                async def feed_files() -> None:
+                    async for file_info in pending_files():
+                        await file_queue.put(file_info)
+                    for _ in range(in_flight_limit):
+                        await file_queue.put(None)
+                
+                async def process_worker() -> None:
+                    nonlocal processed_count, failed_count
+                    while True:
+                        file_info = await file_queue.get()
+                        if file_info is None:
+                            return
+                        if await self._process_single_file(file_info):
+                            processed_count += 1
+                        else:
+                            failed_count += 1
+                            failed_paths.append(file_info.file_path)
+                        self._update_file_progress(directory_path, processed_count, failed_count, total_files)
+                
+                tasks = [asyncio.create_task(feed_files())]
+                tasks.extend(asyncio.create_task(process_worker()) for _ in range(in_flight_limit))
+                try:
+                    await asyncio.gather(*tasks)
+                finally:
+                    # A failed feeder or worker must not leave the others running
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
             
             # Calculate processing statistics
             total_processing_time = (datetime.now() - start_time).total_seconds()
@@ -828,7 +1448,7 @@ class DirectoryOrchestrator:
             # Log directory processing end
             file_processing_logger.log_batch_processing_end(
                 batch_id=batch_id,
-                processed_count=len(files_to_process),
+                processed_count=submitted_count,
                 success_count=processed_count,
                 failed_count=failed_count,
                 total_processing_time=total_processing_time
@@ -843,15 +1463,17 @@ class DirectoryOrchestrator:
                 if total_files > 0:
                     status.progress_percentage = (processed_count / total_files) * 100.0
             
-            logger.info(f"Directory processing completed: {processed_count}/{len(files_to_process)} files successful in {total_processing_time:.2f}s")
+            logger.info(f"Directory processing completed: {processed_count}/{submitted_count} files successful in {total_processing_time:.2f}s")
             
             return ProcessingResult(
-                success=processed_count > 0,
+                # An empty streamed directory is not a failure
+                success=processed_count > 0 or (streaming and total_files == 0),
                 message=f"Processed {processed_count}/{total_files} files successfully",
                 data={
                     "total_files": total_files,
                     "processed_files": processed_count,
                     "failed_files": failed_count,
+                    "failed_paths": failed_paths,
                     "processing_time_seconds": total_processing_time
                 }
             )
@@ -859,6 +1481,59 @@ class DirectoryOrchestrator:
         except Exception as e:
             raise ProcessingError("FileProcessingError", f"File processing failed: {str(e)}", ErrorCategory.PROCESSING)
     
+    async def _process_single_file(self, file_info: FileInfo) -> bool:
+        """
+        Process one file with failure isolation.
+        
+        Errors are logged and reported as failure instead of being raised,
+        so one broken file does not affect other files in flight.
+        
+        Args:
+            file_info (FileInfo): File to process.
+        
+        Returns:
+            bool: True if file was processed successfully, False otherwise.
+        """
+        try:
+            result = await self.file_processor.process_file(file_info.file_path)
+            
+            if result.processing_status == ProcessingStatus.COMPLETED:
+                return True
+            
+            logger.warning(f"Failed to process file {file_info.file_path}: {result.error_message or 'Unknown error'}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"Error processing file {file_info.file_path}: {e}")
+            return False
+    
+    def _update_file_progress(
+        self,
+        directory_path: str,
+        processed_count: int,
+        failed_count: int,
+        total_files: int
+    ) -> None:
+        """
+        Update file counters and progress of a directory being processed.
+        
+        Args:
+            directory_path (str): Path to directory being processed.
+            processed_count (int): Files processed successfully so far.
+            failed_count (int): Files failed so far.
+            total_files (int): Total number of files found in directory.
+        """
+        if not self.config.enable_progress_tracking or directory_path not in self.active_directories:
+            return
+        
+        status = self.active_directories[directory_path]
+        status.files_processed = processed_count
+        status.files_failed = failed_count
+        status.last_activity = datetime.now()
+        
+        if total_files > 0:
+            status.progress_percentage = (processed_count / total_files) * 100.0
+    
     async def _create_chunks(self, processing_result: ProcessingResult) -> ProcessingResult:
         """
         Create chunks from processing results.
@@ -15,21 +15,31 @@ Author: DocAnalyzer Team
 Version: 1.0.0
 """
 
-from typing import List, Dict, Optional, Set, Callable, Any
+from typing import List, Dict, Optional, Set, Callable, Any, AsyncIterator, Tuple
 from pathlib import Path
 import asyncio
 import logging
+import os
+import threading
+import time
 from datetime import datetime, timedelta
 
 from docanalyzer.models.file_system import FileInfo, Directory
 from docanalyzer.filters.file_filter import FileFilter, FileFilterResult
 from docanalyzer.services.lock_manager import LockManager
+from docanalyzer.services.directory_walker import DirectoryWalker, RELIST_MTIME_NS, claim_linked_directory
+from docanalyzer.services.scan_manifest import ScanManifest, ManifestEntry, ScanChanges, digest_file, match_moves
+from docanalyzer.utils.file_utils import collapse_nested_paths
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_SCAN_DEPTH = 10
 DEFAULT_BATCH_SIZE = 100
 DEFAULT_TIMEOUT = 300  # 5 minutes
+SCAN_ENGINES = ["scandir", "pathlib"]
+# Directories changed this recently may still change within the same
+# timestamp tick, so their modification time is not trusted for pruning
+DIRECTORY_MTIME_GRACE_NS = 2 * 10 ** 9
 
 
 class ScanProgress:
@@ -239,6 +249,18 @@ class DirectoryScanner:
             Optimizes memory usage for large scans.
         timeout (int): Maximum scan duration in seconds.
             Prevents scans from running indefinitely.
+        scan_engine (str): Directory traversal engine.
+            'scandir' walks with os.scandir in a worker thread,
+            'pathlib' uses the recursive pathlib traversal on the event loop.
+        manifest (Optional[ScanManifest]): Persistent record of scanned
+            files used by incremental scans. Created with the default
+            path on first incremental scan if None.
+        directory_pruning (bool): Whether incremental scans skip listing
+            directories whose modification time is unchanged.
+        walk_threads (int): Number of directories the scandir engine lists
+            at once for roots without their own setting.
+        root_walk_threads (Dict[str, int]): Number of directories listed at
+            once for specific scan roots, by resolved root path.
     
     Example:
         >>> scanner = DirectoryScanner(
@@ -255,7 +277,12 @@ class DirectoryScanner:
         lock_manager: LockManager,
         max_depth: int = DEFAULT_SCAN_DEPTH,
         batch_size: int = DEFAULT_BATCH_SIZE,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = DEFAULT_TIMEOUT,
+        scan_engine: str = "scandir",
+        manifest: Optional[ScanManifest] = None,
+        directory_pruning: bool = True,
+        walk_threads: int = 1,
+        root_walk_threads: Optional[Dict[str, int]] = None
     ):
         """
         Initialize DirectoryScanner instance.
@@ -271,6 +298,18 @@ class DirectoryScanner:
                 Must be positive integer. Defaults to 100.
             timeout (int): Maximum scan duration in seconds.
                 Must be positive integer. Defaults to 300.
+            scan_engine (str): Directory traversal engine.
+                Must be one of: 'scandir', 'pathlib'. Defaults to 'scandir'.
+            manifest (Optional[ScanManifest]): Manifest for incremental scans.
+                Defaults to None.
+            directory_pruning (bool): Whether incremental scans skip listing
+                unchanged directories. Defaults to True.
+            walk_threads (int): Number of directories listed at once by full
+                and streaming scans with the scandir engine. Values above 1
+                help on network filesystems, where listing latency
+                dominates. Must be positive integer. Defaults to 1.
+            root_walk_threads (Optional[Dict[str, int]]): Per-root overrides
+                of walk_threads, by root directory path. Defaults to None.
         
         Raises:
             ValueError: If parameters are not positive
@@ -291,11 +330,31 @@ class DirectoryScanner:
         if timeout <= 0:
             raise ValueError("timeout must be positive")
         
+        if scan_engine not in SCAN_ENGINES:
+            raise ValueError(f"scan_engine must be one of {SCAN_ENGINES}")
+        
+        root_walk_threads = root_walk_threads or {}
+        if walk_threads <= 0 or any(threads <= 0 for threads in root_walk_threads.values()):
+            raise ValueError("walk_threads must be positive")
+        
         self.file_filter = file_filter
         self.lock_manager = lock_manager
         self.max_depth = max_depth
         self.batch_size = batch_size
         self.timeout = timeout
+        self.scan_engine = scan_engine
+        self.manifest = manifest
+        self.directory_pruning = directory_pruning
+        self.walk_threads = walk_threads
+        self.root_walk_threads = {
+            str(Path(root).resolve()): threads for root, threads in root_walk_threads.items()
+        }
+        self._walker = DirectoryWalker(
+            max_depth=max_depth,
+            exclude_directory=self._is_directory_excluded,
+            accept_file_name=self._accepts_file_name,
+            accept_file_size=self._accepts_file_size
+        )
         
         # Statistics tracking
         self._total_directories_scanned = 0
@@ -307,7 +366,8 @@ class DirectoryScanner:
     async def scan_directory(
         self,
         directory_path: str,
-        progress_callback: Optional[Callable[[ScanProgress], None]] = None
+        progress_callback: Optional[Callable[[ScanProgress], None]] = None,
+        seen_files: Optional[Set[Tuple[int, int]]] = None
     ) -> List[FileInfo]:
         """
         Scan a directory for files.
@@ -321,6 +381,10 @@ class DirectoryScanner:
                 Must be existing directory path.
             progress_callback (Optional[Callable[[ScanProgress], None]]): Progress callback.
                 Called periodically with current progress. Defaults to None.
+            seen_files (Optional[Set[Tuple[int, int]]]): Device and inode of
+                files already found under other roots. Files in it are
+                skipped and files kept are added, so a caller scanning
+                several roots finds each file once. Defaults to None.
         
         Returns:
             List[FileInfo]: List of discovered files that pass filters.
@@ -366,17 +430,18 @@ class DirectoryScanner:
             start_time = datetime.now()
             
             # Perform recursive scan
-            all_files = await self._scan_directory_recursive(
-                str(directory_path), 0, progress
-            )
+            all_files = await self._scan_tree(str(directory_path), progress)
             
             # Update progress for filtering
             progress.update(status="filtering")
             if progress_callback:
                 progress_callback(progress)
             
-            # Filter files
+            # Filter files; a file linked under several paths is kept once
             filtered_files = await self._filter_files(all_files, progress)
+            filtered_files = self._drop_duplicate_files(
+                filtered_files, set() if seen_files is None else seen_files
+            )
             
             # Update statistics
             scan_time = (datetime.now() - start_time).total_seconds()
@@ -415,6 +480,364 @@ class DirectoryScanner:
             except Exception as e:
                 logger.error(f"Failed to remove lock for directory {directory_path}: {e}")
     
+    async def scan_directory_iter(
+        self,
+        directory_path: str,
+        progress_callback: Optional[Callable[[ScanProgress], None]] = None,
+        resume_after: Optional[str] = None,
+        walk_threads: Optional[int] = None,
+        seen_files: Optional[Set[Tuple[int, int]]] = None
+    ) -> AsyncIterator[FileInfo]:
+        """
+        Scan a directory and yield files as they are discovered.
+        
+        Streaming counterpart of scan_directory. The tree is walked in a
+        worker thread; discovered files are filtered in batches of
+        batch_size and yielded without collecting or sorting the whole
+        listing, so the first files are available before the walk ends
+        and memory use does not grow with tree size. At most two batches
+        wait between the walker and the consumer.
+        
+        The directory lock is held until the generator is exhausted or
+        closed. Closing the generator early stops the walk.
+        
+        Long scans can be resumed: consumers record the last file they
+        have handled with save_scan_checkpoint, and a later scan started
+        with the path returned by load_scan_checkpoint continues after
+        that file instead of walking the tree from the start. This relies
+        on the walk order of a single-threaded walk, so scans that record
+        checkpoints pass walk_threads=1.
+        
+        Args:
+            directory_path (str): Path to directory to scan.
+                Must be existing directory path.
+            progress_callback (Optional[Callable[[ScanProgress], None]]): Progress callback.
+                Called after each filtered batch. Defaults to None.
+            resume_after (Optional[str]): Path of the last file handled by
+                an interrupted scan of the directory. Defaults to None.
+            walk_threads (Optional[int]): Number of directories listed at
+                once; overrides the scanner setting for the root. With more
+                than one, files of different directories arrive in no
+                fixed order. Defaults to None.
+            seen_files (Optional[Set[Tuple[int, int]]]): Device and inode of
+                files already found under other roots. Files in it are
+                skipped and files kept are added, so a caller scanning
+                several roots finds each file once. Defaults to None.
+        
+        Yields:
+            FileInfo: Discovered files that pass filters, in walk order.
+        
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+            ValueError: If path is not a directory
+            LockError: If directory is already locked by another process
+        
+        Example:
+            >>> async for file_info in scanner.scan_directory_iter("/path/to/directory"):
+            ...     await file_processor.process_file(file_info.file_path)
+        """
+        if not directory_path or not isinstance(directory_path, str):
+            raise ValueError("directory_path must be non-empty string")
+        
+        directory_path = Path(directory_path).resolve()
+        if not directory_path.exists():
+            raise FileNotFoundError(f"Directory not found: {directory_path}")
+        
+        if not directory_path.is_dir():
+            raise ValueError(f"Path is not a directory: {directory_path}")
+        
+        if walk_threads is None:
+            walk_threads = self._walk_threads(str(directory_path))
+        if walk_threads <= 0:
+            raise ValueError("walk_threads must be positive")
+        if resume_after is not None and walk_threads > 1:
+            raise ValueError("resume_after requires walk_threads=1")
+        
+        lock_file = await self.lock_manager.create_lock(str(directory_path))
+        logger.info(f"Created lock for directory: {directory_path}")
+        
+        progress = ScanProgress()
+        progress.update(current_directory=str(directory_path), status="scanning")
+        start_time = datetime.now()
+        discovered_count = 0
+        passed_count = 0
+        if seen_files is None:
+            seen_files = set()
+        
+        try:
+            async for batch in self._iter_file_batches(
+                str(directory_path), progress, resume_after, walk_threads
+            ):
+                discovered_count += len(batch)
+                filter_results = self.file_filter.filter_files(batch)
+                passed = self._drop_duplicate_files([
+                    file_info
+                    for file_info, filter_result in zip(batch, filter_results)
+                    if filter_result.should_process
+                ], seen_files)
+                passed_count += len(passed)
+                
+                progress.update(processed_files=discovered_count, total_files=discovered_count)
+                if progress_callback:
+                    progress_callback(progress)
+                
+                for file_info in passed:
+                    yield file_info
+            
+            scan_time = (datetime.now() - start_time).total_seconds()
+            self._scan_times.append(scan_time)
+            self._last_scan_time = datetime.now()
+            self._total_directories_scanned += 1
+            self._total_files_discovered += discovered_count
+            self._total_files_filtered += passed_count
+            
+            progress.update(status="completed")
+            if progress_callback:
+                progress_callback(progress)
+            
+            logger.info(f"Streaming scan completed: {passed_count} files found in {directory_path}")
+            
+        except Exception as e:
+            logger.error(f"Scan error for directory {directory_path}: {e}")
+            progress.update(status="error")
+            if progress_callback:
+                progress_callback(progress)
+            raise
+        finally:
+            try:
+                await self.lock_manager.remove_lock(lock_file)
+                logger.info(f"Removed lock for directory: {directory_path}")
+            except Exception as e:
+                logger.error(f"Failed to remove lock for directory {directory_path}: {e}")
+    
+    async def scan_directory_incremental(
+        self,
+        directory_path: str,
+        progress_callback: Optional[Callable[[ScanProgress], None]] = None,
+        commit: bool = True,
+        seen_files: Optional[Set[Tuple[int, int]]] = None
+    ) -> ScanChanges:
+        """
+        Scan a directory and report changes since the previous scan.
+        
+        Walks the tree with os.scandir and compares each file that passes
+        filters with the scan manifest. Files whose inode, size and
+        modification time are unchanged are skipped without being read.
+        Files with changed stat data are digested; if the digest matches
+        the manifest, the file only counts as unchanged. Manifest entries
+        that were not seen are reported as deleted, unless a new file with
+        the same content took their place (see match_moves); those are
+        reported as moved.
+        
+        With directory_pruning, directories whose modification time
+        matches the manifest are not listed again; their recorded files
+        are only stat'ed, so in-place modifications are still found.
+        
+        Args:
+            directory_path (str): Path to directory to scan.
+                Must be existing directory path.
+            progress_callback (Optional[Callable[[ScanProgress], None]]): Progress callback.
+                Called when filtering starts and when the scan completes. Defaults to None.
+            commit (bool): Whether to write the changes to the manifest
+                immediately. Pass False and call commit_scan_changes after
+                processing so files that fail are reported again.
+                Defaults to True.
+            seen_files (Optional[Set[Tuple[int, int]]]): Device and inode of
+                files already found under other roots. Files in it are
+                skipped and files kept are added, so a caller scanning
+                several roots finds each file once. Defaults to None.
+        
+        Returns:
+            ScanChanges: Created, modified, deleted and moved files.
+        
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+            ValueError: If path is not a directory
+            LockError: If directory is already locked by another process
+        
+        Example:
+            >>> changes = await scanner.scan_directory_incremental("/path/to/directory")
+            >>> for file_info in changes.changed_files:
+            ...     await file_processor.process_file(file_info.file_path)
+        """
+        if not directory_path or not isinstance(directory_path, str):
+            raise ValueError("directory_path must be non-empty string")
+        
+        directory_path = Path(directory_path).resolve()
+        if not directory_path.exists():
+            raise FileNotFoundError(f"Directory not found: {directory_path}")
+        
+        if not directory_path.is_dir():
+            raise ValueError(f"Path is not a directory: {directory_path}")
+        
+        if self.manifest is None:
+            self.manifest = ScanManifest()
+        
+        lock_file = await self.lock_manager.create_lock(str(directory_path))
+        logger.info(f"Created lock for directory: {directory_path}")
+        
+        progress = ScanProgress()
+        progress.update(current_directory=str(directory_path), status="scanning")
+        
+        try:
+            start_time = datetime.now()
+            loop = asyncio.get_running_loop()
+            
+            previous_entries = await loop.run_in_executor(None, self.manifest.load, str(directory_path))
+            
+            # Stat data for the diff comes from the scandir walk
+            directories = None
+            if self.directory_pruning:
+                all_files, directories = await self._scan_directory_pruned(
+                    str(directory_path), progress, previous_entries
+                )
+            else:
+                all_files = await self._scan_directory_scandir(str(directory_path), progress)
+            
+            progress.update(status="filtering")
+            if progress_callback:
+                progress_callback(progress)
+            filtered_files = await self._filter_files(all_files, progress)
+            filtered_files = self._drop_duplicate_files(
+                filtered_files, set() if seen_files is None else seen_files, directories
+            )
+            
+            changes = await loop.run_in_executor(
+                None, self._diff_with_manifest, str(directory_path), filtered_files,
+                previous_entries, directories
+            )
+            if commit:
+                await self.commit_scan_changes(changes)
+            
+            scan_time = (datetime.now() - start_time).total_seconds()
+            self._scan_times.append(scan_time)
+            self._last_scan_time = datetime.now()
+            self._total_directories_scanned += 1
+            self._total_files_discovered += len(all_files)
+            self._total_files_filtered += len(filtered_files)
+            
+            progress.update(status="completed")
+            if progress_callback:
+                progress_callback(progress)
+            
+            logger.info(f"Incremental scan of {directory_path}: {changes.to_dict()}")
+            return changes
+            
+        except Exception as e:
+            logger.error(f"Scan error for directory {directory_path}: {e}")
+            progress.update(status="error")
+            if progress_callback:
+                progress_callback(progress)
+            raise
+        finally:
+            try:
+                await self.lock_manager.remove_lock(lock_file)
+                logger.info(f"Removed lock for directory: {directory_path}")
+            except Exception as e:
+                logger.error(f"Failed to remove lock for directory {directory_path}: {e}")
+    
+    async def commit_scan_changes(
+        self,
+        changes: ScanChanges,
+        exclude_paths: Optional[Set[str]] = None
+    ) -> None:
+        """
+        Record scan changes in the manifest.
+        
+        Args:
+            changes (ScanChanges): Changes returned by scan_directory_incremental.
+            exclude_paths (Optional[Set[str]]): Paths not to record, such as
+                files that failed processing, so the next incremental scan
+                reports them again. Their directories are not recorded
+                either, so they are listed again. Defaults to None.
+        
+        Raises:
+            ValueError: If scanner has no manifest
+        """
+        if self.manifest is None:
+            raise ValueError("Scanner has no manifest")
+        
+        exclude_paths = exclude_paths or set()
+        entries = [
+            entry for path, entry in changes.entries.items()
+            if path not in exclude_paths
+        ]
+        directories = None
+        if changes.directories is not None:
+            excluded_parents = {os.path.dirname(path) for path in exclude_paths}
+            directories = {
+                path: RELIST_MTIME_NS if path in excluded_parents else mtime_ns
+                for path, mtime_ns in changes.directories.items()
+            }
+        
+        def commit() -> None:
+            self.manifest.upsert(changes.directory_path, entries)
+            self.manifest.delete(changes.directory_path, changes.deleted + list(changes.moved))
+            if directories is not None:
+                self.manifest.replace_directories(changes.directory_path, directories)
+        
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, commit)
+    
+    async def load_scan_checkpoint(self, directory_path: str) -> Optional[str]:
+        """
+        Load the checkpoint of an interrupted streaming scan.
+        
+        Args:
+            directory_path (str): Scanned directory.
+        
+        Returns:
+            Optional[str]: Path of the last file handled, to pass to
+                scan_directory_iter as resume_after, or None if the last
+                scan of the directory finished.
+        """
+        manifest = self._checkpoint_manifest()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, manifest.load_checkpoint, str(Path(directory_path).resolve())
+        )
+    
+    async def save_scan_checkpoint(self, directory_path: str, file_path: str) -> None:
+        """
+        Record the last file handled by a streaming scan.
+        
+        Call once the file and every file yielded before it have been
+        handled, so a resumed scan does not skip unfinished work.
+        
+        Args:
+            directory_path (str): Scanned directory.
+            file_path (str): Path of the last file handled.
+        """
+        manifest = self._checkpoint_manifest()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, manifest.save_checkpoint, str(Path(directory_path).resolve()), file_path
+        )
+    
+    async def clear_scan_checkpoint(self, directory_path: str) -> None:
+        """
+        Remove the checkpoint of a finished streaming scan.
+        
+        Args:
+            directory_path (str): Scanned directory.
+        """
+        manifest = self._checkpoint_manifest()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, manifest.clear_checkpoint, str(Path(directory_path).resolve())
+        )
+    
+    def _checkpoint_manifest(self) -> ScanManifest:
+        """
+        Get the manifest that stores scan checkpoints.
+        
+        Returns:
+            ScanManifest: Scanner manifest, created on first use.
+        """
+        if self.manifest is None:
+            self.manifest = ScanManifest()
+        return self.manifest
+    
     async def scan_directories(
         self,
         directory_paths: List[str],
@@ -426,6 +849,11 @@ class DirectoryScanner:
         Scans multiple directories concurrently, applying filters
         and extracting metadata. Results are grouped by directory.
         
+        Each file is reported once per call: directories inside another
+        listed directory, or listed twice, are not scanned separately and
+        map to an empty list, and a file reachable under several paths
+        through hard or symbolic links is reported under the first one.
+        
         Args:
             directory_paths (List[str]): List of directory paths to scan.
                 Must be list of existing directory paths.
@@ -463,25 +891,30 @@ class DirectoryScanner:
             if not dir_path.is_dir():
                 raise ValueError(f"Path is not a directory: {dir_path}")
         
+        # Nested roots are covered by the scan of their enclosing root
+        scan_paths = collapse_nested_paths(directory_paths)
+        final_results: Dict[str, List[FileInfo]] = {path: [] for path in directory_paths}
+        for path in directory_paths:
+            if path not in scan_paths:
+                logger.info(f"Skipping {path}: covered by another scanned directory")
+        
         # Scan directories concurrently
         tasks = [
             self.scan_directory(path, progress_callback)
-            for path in directory_paths
+            for path in scan_paths
         ]
         
         try:
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # Process results and handle exceptions
-            final_results = {}
-            for i, result in enumerate(results):
-                directory_path = directory_paths[i]
-                
+            # Process results and handle exceptions; a file linked into
+            # several roots is reported for the first root only
+            seen_files: Set[Tuple[int, int]] = set()
+            for directory_path, result in zip(scan_paths, results):
                 if isinstance(result, Exception):
                     logger.error(f"Failed to scan directory {directory_path}: {result}")
-                    final_results[directory_path] = []
                 else:
-                    final_results[directory_path] = result
+                    final_results[directory_path] = self._drop_duplicate_files(result, seen_files)
             
             return final_results
             
@@ -489,17 +922,268 @@ class DirectoryScanner:
             logger.error(f"Error scanning multiple directories: {e}")
             raise
     
+    async def _scan_tree(self, directory_path: str, progress: ScanProgress) -> List[FileInfo]:
+        """
+        Scan directory tree with the configured scan engine.
+        
+        Args:
+            directory_path (str): Path to directory to scan.
+                Must be existing directory path.
+            progress (ScanProgress): Progress tracking object.
+                Updated as scanning progresses.
+        
+        Returns:
+            List[FileInfo]: List of all discovered files.
+        """
+        if self.scan_engine == "scandir":
+            return await self._scan_directory_scandir(directory_path, progress)
+        return await self._scan_directory_recursive(directory_path, 0, progress)
+    
+    async def _scan_directory_scandir(self, directory_path: str, progress: ScanProgress) -> List[FileInfo]:
+        """
+        Scan directory tree with os.scandir in a worker thread.
+        
+        Uses DirectoryWalker, which needs about one stat call per file
+        and keeps the event loop free while large trees are walked.
+        
+        Args:
+            directory_path (str): Path to directory to scan.
+                Must be existing directory path.
+            progress (ScanProgress): Progress tracking object.
+                Updated with the directory being listed.
+        
+        Returns:
+            List[FileInfo]: List of all discovered files.
+        """
+        def on_directory(path: str) -> None:
+            progress.current_directory = path
+        
+        threads = self._walk_threads(directory_path)
+        
+        def walk() -> List[FileInfo]:
+            return list(self._walker.walk_parallel(directory_path, threads, on_directory))
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, walk)
+    
+    async def _scan_directory_pruned(
+        self,
+        directory_path: str,
+        progress: ScanProgress,
+        previous_entries: Dict[str, ManifestEntry]
+    ) -> Tuple[List[FileInfo], Dict[str, int]]:
+        """
+        Scan directory tree, listing only directories that changed.
+        
+        Uses DirectoryWalker.walk_pruned with the directory modification
+        times and file paths recorded in the manifest.
+        
+        Args:
+            directory_path (str): Path to directory to scan.
+            progress (ScanProgress): Progress tracking object.
+                Updated with the directory being walked.
+            previous_entries (Dict[str, ManifestEntry]): Manifest entries
+                of the directory.
+        
+        Returns:
+            Tuple[List[FileInfo], Dict[str, int]]: Discovered files and the
+                modification times of walked directories, with
+                RELIST_MTIME_NS for directories to list again.
+        """
+        def on_directory(path: str) -> None:
+            progress.current_directory = path
+        
+        def walk() -> Tuple[List[FileInfo], Dict[str, int]]:
+            scan_start_ns = time.time_ns()
+            known_directories = self.manifest.load_directories(directory_path)
+            known_files: Dict[str, List[str]] = {}
+            for path in previous_entries:
+                known_files.setdefault(os.path.dirname(path), []).append(path)
+            
+            directory_mtimes: Dict[str, int] = {}
+            files = list(self._walker.walk_pruned(
+                directory_path, known_directories, known_files, directory_mtimes, on_directory
+            ))
+            
+            pruned = sum(
+                1 for path, mtime_ns in directory_mtimes.items()
+                if known_directories.get(path) == mtime_ns
+            )
+            logger.debug(f"Listed {len(directory_mtimes) - pruned} of {len(directory_mtimes)} directories in {directory_path}")
+            
+            # Recently changed directories may change again within the
+            # timestamp granularity, so they are listed again next scan
+            recent = scan_start_ns - DIRECTORY_MTIME_GRACE_NS
+            return files, {
+                path: mtime_ns if mtime_ns < recent else RELIST_MTIME_NS
+                for path, mtime_ns in directory_mtimes.items()
+            }
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, walk)
+    
+    def _diff_with_manifest(
+        self,
+        directory_path: str,
+        file_infos: List[FileInfo],
+        previous: Dict[str, ManifestEntry],
+        directories: Optional[Dict[str, int]] = None
+    ) -> ScanChanges:
+        """
+        Compare scanned files with manifest entries of the directory.
+        
+        Blocking; runs in a worker thread.
+        
+        Args:
+            directory_path (str): Scan root directory.
+            file_infos (List[FileInfo]): Files that passed filters, with
+                known file_id.
+            previous (Dict[str, ManifestEntry]): Manifest entries of the
+                directory. Consumed by the comparison.
+            directories (Optional[Dict[str, int]]): Directory modification
+                times to record. Defaults to None.
+        
+        Returns:
+            ScanChanges: Created, modified, deleted and moved files.
+        """
+        changes = ScanChanges(directory_path=directory_path, directories=directories)
+        
+        for file_info in file_infos:
+            device, inode = file_info.file_id
+            current = ManifestEntry(
+                path=file_info.file_path,
+                device=device,
+                inode=inode,
+                size=file_info.file_size,
+                mtime_ns=file_info.mtime_ns
+            )
+            entry = previous.pop(file_info.file_path, None)
+            
+            if entry is not None and entry.matches(current):
+                changes.unchanged_count += 1
+                continue
+            
+            try:
+                current.digest = digest_file(file_info.file_path)
+            except OSError as e:
+                logger.warning(f"Failed to digest {file_info.file_path}: {e}")
+                if directories is not None:
+                    # Listed again next scan so the file is not missed
+                    directories[os.path.dirname(file_info.file_path)] = RELIST_MTIME_NS
+                continue
+            
+            changes.entries[file_info.file_path] = current
+            if entry is None:
+                changes.created.append(file_info)
+            elif entry.digest == current.digest:
+                # Touched or copied back unchanged; only the stat data is refreshed
+                changes.unchanged_count += 1
+            else:
+                changes.modified.append(file_info)
+        
+        changes.deleted = sorted(previous)
+        created = {f.file_path: changes.entries[f.file_path] for f in changes.created}
+        changes.record_moves(match_moves(created, previous))
+        return changes
+    
+    async def _iter_file_batches(
+        self,
+        directory_path: str,
+        progress: ScanProgress,
+        resume_after: Optional[str] = None,
+        walk_threads: int = 1
+    ) -> AsyncIterator[List[FileInfo]]:
+        """
+        Yield discovered files in batches of batch_size.
+        
+        With the scandir engine, the walker runs in a worker thread and
+        hands batches over through a bounded queue, so the walk pauses
+        while the consumer is busy. The pathlib engine scans the whole
+        tree first and then yields it in batches.
+        
+        Args:
+            directory_path (str): Path to directory to scan.
+            progress (ScanProgress): Progress tracking object.
+            resume_after (Optional[str]): Path of the last file handled by
+                an interrupted scan; only files found after it are
+                yielded. Defaults to None.
+            walk_threads (int): Number of directories listed at once.
+                Defaults to 1.
+        
+        Yields:
+            List[FileInfo]: Batches of discovered, unfiltered files.
+        """
+        if self.scan_engine != "scandir":
+            all_files = await self._scan_directory_recursive(directory_path, 0, progress)
+            if resume_after is not None:
+                paths = [file_info.file_path for file_info in all_files]
+                if resume_after in paths:
+                    all_files = all_files[paths.index(resume_after) + 1:]
+                else:
+                    logger.warning(f"{resume_after} not found; scanning {directory_path} in full")
+            for start in range(0, len(all_files), self.batch_size):
+                yield all_files[start:start + self.batch_size]
+            return
+        
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        stop_event = threading.Event()
+        
+        def on_directory(path: str) -> None:
+            progress.current_directory = path
+        
+        def put(item: Any) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        
+        def walk() -> None:
+            batch = []
+            if resume_after is not None:
+                files = self._walker.walk(directory_path, on_directory, resume_after)
+            else:
+                files = self._walker.walk_parallel(directory_path, walk_threads, on_directory)
+            try:
+                for file_info in files:
+                    if stop_event.is_set():
+                        return
+                    batch.append(file_info)
+                    if len(batch) >= self.batch_size:
+                        put(batch)
+                        batch = []
+                if batch and not stop_event.is_set():
+                    put(batch)
+            finally:
+                # Stops the threads of a parallel walk left early
+                files.close()
+                if not stop_event.is_set():
+                    put(None)
+        
+        walker_future = loop.run_in_executor(None, walk)
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                yield batch
+        finally:
+            stop_event.set()
+            # Free a slot so a walker blocked on put() can see the stop flag
+            while not queue.empty():
+                queue.get_nowait()
+            await walker_future
+    
     async def _scan_directory_recursive(
         self,
         directory_path: str,
         current_depth: int,
-        progress: ScanProgress
+        progress: ScanProgress,
+        walked_trees: Optional[List[str]] = None
     ) -> List[FileInfo]:
         """
         Recursively scan a directory.
         
         Internal method that performs the actual recursive scanning.
-        Respects max_depth limit and applies file filtering.
+        Respects max_depth limit and applies file filtering. Symbolic
+        links to directories are followed as in DirectoryWalker.
         
         Args:
             directory_path (str): Path to directory to scan.
@@ -508,6 +1192,9 @@ class DirectoryScanner:
                 Must be non-negative integer.
             progress (ScanProgress): Progress tracking object.
                 Updated as scanning progresses.
+            walked_trees (Optional[List[str]]): Real paths of trees walked
+                so far, see claim_linked_directory. None starts a new walk
+                at directory_path. Defaults to None.
         
         Returns:
             List[FileInfo]: List of discovered files that pass filters.
@@ -534,22 +1221,29 @@ class DirectoryScanner:
             # Update progress
             progress.update(current_directory=str(directory))
             
+            if walked_trees is None:
+                walked_trees = [os.path.realpath(directory_path)]
+            
             all_files = []
             
             # Scan current directory
             try:
                 for item in directory.iterdir():
                     if item.is_file():
+                        if not self._accepts_file_name(item.name):
+                            continue
                         try:
                             file_info = await self._extract_file_metadata(item)
                             all_files.append(file_info)
                         except Exception as e:
                             logger.warning(f"Failed to extract metadata for {item}: {e}")
                             continue
-                    elif item.is_dir() and current_depth < self.max_depth:
+                    elif (item.is_dir() and current_depth < self.max_depth
+                          and not self._is_directory_excluded(str(item))
+                          and (not item.is_symlink() or claim_linked_directory(str(item), walked_trees))):
                         # Recursively scan subdirectories
                         sub_files = await self._scan_directory_recursive(
-                            str(item), current_depth + 1, progress
+                            str(item), current_depth + 1, progress, walked_trees
                         )
                         all_files.extend(sub_files)
                         
@@ -566,6 +1260,102 @@ class DirectoryScanner:
             logger.error(f"Unexpected error in recursive scan at {directory_path}: {e}")
             return []
     
+    def _drop_duplicate_files(
+        self,
+        file_infos: List[FileInfo],
+        seen_files: Set[Tuple[int, int]],
+        directories: Optional[Dict[str, int]] = None
+    ) -> List[FileInfo]:
+        """
+        Drop files already found under another path.
+        
+        Hard links and symbolic links make one file reachable under
+        several paths. Files are keyed by device and inode, and only the
+        first path found is kept, so the file is processed once.
+        
+        Args:
+            file_infos (List[FileInfo]): Discovered files. Files whose
+                file_id is unknown are kept.
+            seen_files (Set[Tuple[int, int]]): Device and inode of files
+                kept so far. Updated in place.
+            directories (Optional[Dict[str, int]]): Directory modification
+                times to record. Parents of dropped files are set to
+                RELIST_MTIME_NS, so the files are found again if the path
+                kept now disappears. Defaults to None.
+        
+        Returns:
+            List[FileInfo]: Files not seen before, in the given order.
+        """
+        unique_files = []
+        for file_info in file_infos:
+            key = file_info.file_id
+            if key is None:
+                unique_files.append(file_info)
+                continue
+            
+            if key in seen_files:
+                logger.debug(f"Skipping {file_info.file_path}: same file already found under another path")
+                if directories is not None:
+                    directories[os.path.dirname(file_info.file_path)] = RELIST_MTIME_NS
+                continue
+            seen_files.add(key)
+            unique_files.append(file_info)
+        return unique_files
+    
+    def _walk_threads(self, directory_path: str) -> int:
+        """
+        Get the number of directories listed at once for a scan root.
+        
+        Args:
+            directory_path (str): Resolved scan root.
+        
+        Returns:
+            int: Root setting from root_walk_threads, else walk_threads.
+        """
+        return self.root_walk_threads.get(directory_path, self.walk_threads)
+    
+    def _is_directory_excluded(self, directory_path: str) -> bool:
+        """
+        Check if a subdirectory is excluded from traversal.
+        
+        Delegates to the current file filter, so excluded subtrees are
+        skipped without being listed.
+        
+        Args:
+            directory_path (str): Path to the subdirectory.
+        
+        Returns:
+            bool: True if the subdirectory must not be walked.
+        """
+        return self.file_filter.is_directory_excluded(directory_path)
+    
+    def _accepts_file_name(self, file_name: str) -> bool:
+        """
+        Check a file name against the file filter's extension check.
+        
+        Applied during traversal so unsupported files are skipped before
+        they are stat'ed and before FileInfo is built.
+        
+        Args:
+            file_name (str): Name of the file.
+        
+        Returns:
+            bool: True if the file may pass the file filter.
+        """
+        return self.file_filter.accepts_file_name(file_name)
+    
+    def _accepts_file_size(self, file_size: int) -> bool:
+        """
+        Check a file size against the file filter's size limits.
+        
+        Args:
+            file_size (int): File size in bytes from the traversal's stat data.
+        
+        Returns:
+            bool: True if the file may pass the file filter.
+        """
+        return self.file_filter.accepts_file_size(file_size)
+    
     async def _extract_file_metadata(self, file_path: Path) -> FileInfo:
         """
         Extract metadata for a single file.
@@ -592,27 +1382,8 @@ class DirectoryScanner:
             raise ValueError(f"Path is not a file: {file_path}")
         
         try:
-            stat = file_path.stat()
-            
-            # Extract file extension
-            extension = file_path.suffix.lower()
-            
-            # Create FileInfo object
-            file_info = FileInfo(
-                file_path=str(file_path),
-                file_size=stat.st_size,
-                modification_time=datetime.fromtimestamp(stat.st_mtime),
-                is_directory=False,
-                processing_status="pending",
-                metadata={
-                    "extension": extension,
-                    "permissions": oct(stat.st_mode)[-3:],
-                    "owner_id": stat.st_uid,
-                    "group_id": stat.st_gid
-                }
-            )
-            
-            return file_info
+            # Existence and type were checked above
+            return FileInfo.from_stat(str(file_path), file_path.stat())
             
         except PermissionError:
             raise PermissionError(f"Permission denied accessing file: {file_path}")
@@ -0,0 +1,599 @@
+"""
+Directory Walker - os.scandir Based Directory Traversal
+
+Provides a blocking, iterative directory walker built on os.scandir.
+The walker reuses the file type information returned with directory
+entries and the stat data cached on each DirEntry, so discovering a
+file costs about one stat call instead of the several existence, type
+and stat checks made by pathlib-based traversal.
+
+The walker is synchronous by design and is meant to be run in a worker
+thread by async callers such as DirectoryScanner. On high-latency
+filesystems such as NFS, where the time per directory listing dominates,
+walk_parallel lists several directories at once from a pool of threads.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import logging
+import os
+import queue
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Generator, Iterator, List, Optional, Tuple
+
+from docanalyzer.models.file_system import FileInfo
+from docanalyzer.utils.file_utils import is_path_within
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DEPTH = 10
+
+# Recorded for directories that must be listed again; never equals a real mtime
+RELIST_MTIME_NS = -1
+
+# Files handed from a walk_parallel thread to the consumer at once
+PARALLEL_CHUNK_SIZE = 512
+
+# Guards walked_trees when several threads claim symlinked directories
+_claim_lock = threading.Lock()
+
+
+def claim_linked_directory(directory_path: str, walked_trees: List[str]) -> bool:
+    """
+    Decide whether a symlinked directory is followed during a walk.
+
+    The link is followed only if its target neither lies inside nor
+    contains a tree already walked, which rules out symlink loops and
+    walking the same directories twice. A followed target is added to
+    walked_trees.
+
+    Args:
+        directory_path (str): Path of the symbolic link.
+        walked_trees (List[str]): Real paths of the walk root and of the
+            link targets followed so far. Updated in place.
+
+    Returns:
+        bool: True if the link should be followed.
+    """
+    real_path = os.path.realpath(directory_path)
+    with _claim_lock:
+        for tree in walked_trees:
+            if is_path_within(real_path, tree) or is_path_within(tree, real_path):
+                logger.debug(f"Not following {directory_path}: {real_path} overlaps walked tree {tree}")
+                return False
+        walked_trees.append(real_path)
+    return True
+
+
+class DirectoryWalker:
+    """
+    Directory Walker - Iterative os.scandir traversal.
+
+    Walks a directory tree depth-first with an explicit stack instead of
+    recursion. Entry types come from os.scandir without extra system
+    calls; file size and times come from DirEntry.stat(), which is the
+    only per-file system call. Unreadable directories and files that
+    disappear during the walk are logged and skipped.
+
+    Depth semantics match DirectoryScanner: files directly in the root
+    have depth 0, and directories are entered while their depth does not
+    exceed max_depth.
+
+    Optional file name and size checks reject files before any FileInfo
+    is built: the name check runs before the file is stat'ed, the size
+    check on the stat data of the entry.
+
+    Symbolic links to directories are followed only when their target
+    lies outside everything walked so far (see claim_linked_directory),
+    so link cycles end and no directory is walked twice.
+
+    Attributes:
+        max_depth (int): Maximum depth of directories to enter.
+        exclude_directory (Optional[Callable[[str], bool]]): Returns True
+            for subdirectories that must not be entered.
+        accept_file_name (Optional[Callable[[str], bool]]): Returns False
+            for file names that must not be yielded.
+        accept_file_size (Optional[Callable[[int], bool]]): Returns False
+            for file sizes that must not be yielded.
+
+    Example:
+        >>> walker = DirectoryWalker(max_depth=10)
+        >>> for file_info in walker.walk("/path/to/directory"):
+        ...     print(file_info.file_path)
+    """
+
+    def __init__(
+        self,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        exclude_directory: Optional[Callable[[str], bool]] = None,
+        accept_file_name: Optional[Callable[[str], bool]] = None,
+        accept_file_size: Optional[Callable[[int], bool]] = None
+    ):
+        """
+        Initialize DirectoryWalker instance.
+
+        Args:
+            max_depth (int): Maximum depth of directories to enter.
+                Must be non-negative integer. Defaults to 10.
+            exclude_directory (Optional[Callable[[str], bool]]): Called with
+                each subdirectory path; subdirectories for which it returns
+                True are neither listed nor walked. The root is never
+                excluded. Defaults to None.
+            accept_file_name (Optional[Callable[[str], bool]]): Called with
+                each file name before the file is stat'ed; files for which
+                it returns False are skipped. Defaults to None.
+            accept_file_size (Optional[Callable[[int], bool]]): Called with
+                each file size; files for which it returns False are
+                skipped. Defaults to None.
+
+        Raises:
+            ValueError: If max_depth is negative
+        """
+        if max_depth < 0:
+            raise ValueError("max_depth must be non-negative")
+
+        self.max_depth = max_depth
+        self.exclude_directory = exclude_directory
+        self.accept_file_name = accept_file_name
+        self.accept_file_size = accept_file_size
+
+    def walk(
+        self,
+        root_path: str,
+        directory_callback: Optional[Callable[[str], None]] = None,
+        resume_after: Optional[str] = None
+    ) -> Iterator[FileInfo]:
+        """
+        Walk directory tree and yield discovered files.
+
+        Walk order depends only on the order in which os.scandir lists
+        each directory: the files of a directory are yielded while it is
+        listed, then its subdirectories are walked in listing order. An
+        interrupted walk can therefore be resumed from the last file
+        handled. The directories on the path to that file are listed
+        again to rebuild the walk frontier, and only entries listed after
+        it are walked. Listing order is stable while a directory is
+        unchanged; if an entry on the path has disappeared, the directory
+        concerned is walked in full instead, so no file is missed.
+
+        Args:
+            root_path (str): Directory to walk.
+            directory_callback (Optional[Callable[[str], None]]): Called with
+                each directory path before it is listed. Defaults to None.
+            resume_after (Optional[str]): Path of the last file handled by
+                an interrupted walk of root_path with the same settings.
+                Defaults to None.
+
+        Yields:
+            FileInfo: Information about each regular file found.
+        """
+        walked_trees = [os.path.realpath(root_path)]
+        stack: List[Tuple[str, int]] = [(root_path, 0)]
+        skip_through: Optional[str] = None
+        if resume_after is not None:
+            stack, skip_through = self._resume_frontier(root_path, resume_after, walked_trees)
+
+        while stack:
+            directory_path, depth = stack.pop()
+            if directory_callback is not None:
+                directory_callback(directory_path)
+
+            subdirectories: List[str] = []
+            listed, _ = yield from self._list_directory(
+                directory_path, depth, subdirectories, walked_trees, skip_through
+            )
+            skip_through = None
+            if not listed:
+                continue
+
+            # Reversed so subdirectories are visited in listing order
+            for subdirectory in reversed(self._included(subdirectories)):
+                stack.append((subdirectory, depth + 1))
+
+    def walk_parallel(
+        self,
+        root_path: str,
+        threads: int,
+        directory_callback: Optional[Callable[[str], None]] = None
+    ) -> Iterator[FileInfo]:
+        """
+        Walk directory tree listing up to threads directories at once.
+
+        Every thread owns a deque of directories to list. It pushes the
+        subdirectories it finds onto its own deque and takes the newest
+        one next, so each thread walks its part of the tree depth-first.
+        A thread whose deque is empty steals the oldest directory of
+        another thread, which is usually the largest remaining subtree.
+
+        Yields the same files as walk(). The files of a directory keep
+        their listing order, but files of different directories are
+        interleaved in the order their listings complete, which may vary
+        between runs; sort the result where a fixed order is needed. The
+        walk cannot be resumed with resume_after. Closing the generator
+        early stops all threads.
+
+        Args:
+            root_path (str): Directory to walk.
+            threads (int): Number of directories listed at once.
+                Must be positive integer; 1 walks like walk().
+            directory_callback (Optional[Callable[[str], None]]): Called with
+                each directory path before it is listed, from the listing
+                thread. Defaults to None.
+
+        Yields:
+            FileInfo: Information about each regular file found.
+
+        Raises:
+            ValueError: If threads is not positive
+        """
+        if threads <= 0:
+            raise ValueError("threads must be positive")
+        if threads == 1:
+            yield from self.walk(root_path, directory_callback)
+            return
+
+        walked_trees = [os.path.realpath(root_path)]
+        deques: List[Deque[Tuple[str, int]]] = [deque() for _ in range(threads)]
+        deques[0].append((root_path, 0))
+        condition = threading.Condition()
+        stop_event = threading.Event()
+        output: queue.Queue = queue.Queue(maxsize=threads * 2)
+        # Directories queued or being listed; the walk ends when none are left
+        pending = [1]
+        errors: List[BaseException] = []
+
+        def emit(item: object) -> None:
+            while not stop_event.is_set():
+                try:
+                    output.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def take(index: int) -> Optional[Tuple[str, int]]:
+            with condition:
+                while not stop_event.is_set() and pending[0]:
+                    if deques[index]:
+                        return deques[index].pop()
+                    for offset in range(1, threads):
+                        victim = deques[(index + offset) % threads]
+                        if victim:
+                            return victim.popleft()
+                    condition.wait()
+                return None
+
+        def run(index: int) -> None:
+            try:
+                while True:
+                    task = take(index)
+                    if task is None:
+                        return
+                    directory_path, depth = task
+                    if directory_callback is not None:
+                        directory_callback(directory_path)
+
+                    subdirectories: List[str] = []
+                    listing = self._list_directory(directory_path, depth, subdirectories, walked_trees)
+                    chunk: List[FileInfo] = []
+                    while True:
+                        try:
+                            chunk.append(next(listing))
+                        except StopIteration as done:
+                            listed = done.value[0]
+                            break
+                        if len(chunk) >= PARALLEL_CHUNK_SIZE:
+                            emit(chunk)
+                            chunk = []
+                            if stop_event.is_set():
+                                listing.close()
+                                return
+                    if chunk:
+                        emit(chunk)
+
+                    subdirectories = self._included(subdirectories) if listed else []
+                    with condition:
+                        # Reversed so the owner takes them in listing order
+                        deques[index].extend((path, depth + 1) for path in reversed(subdirectories))
+                        pending[0] += len(subdirectories) - 1
+                        condition.notify_all()
+            except BaseException as e:
+                errors.append(e)
+                stop_event.set()
+                with condition:
+                    condition.notify_all()
+            finally:
+                # Reports the thread as finished unless the walk was stopped
+                emit(index)
+
+        workers = [
+            threading.Thread(target=run, args=(index,), name=f"walk-{index}", daemon=True)
+            for index in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            finished = 0
+            while finished < threads:
+                try:
+                    item = output.get(timeout=0.1)
+                except queue.Empty:
+                    # Set when a thread failed; the others stop without reporting
+                    if stop_event.is_set():
+                        break
+                    continue
+                if isinstance(item, int):
+                    finished += 1
+                    continue
+                yield from item
+            if errors:
+                raise errors[0]
+        finally:
+            stop_event.set()
+            with condition:
+                condition.notify_all()
+            for worker in workers:
+                worker.join()
+
+    def walk_pruned(
+        self,
+        root_path: str,
+        known_directories: Dict[str, int],
+        known_files: Dict[str, List[str]],
+        directory_mtimes: Dict[str, int],
+        directory_callback: Optional[Callable[[str], None]] = None
+    ) -> Iterator[FileInfo]:
+        """
+        Walk directory tree, skipping listings of unchanged directories.
+
+        A directory's modification time changes whenever an entry is
+        added, removed or renamed in it. Directories whose mtime equals
+        the recorded one are therefore not listed again: their known
+        files are only stat'ed, which still catches in-place content
+        changes, and their known subdirectories are walked in turn.
+        Other directories are listed with os.scandir as in walk().
+        Directories that could not be listed, that contain excluded
+        subdirectories or that contain files skipped for their size are
+        recorded with RELIST_MTIME_NS, so they stay known subdirectories
+        of their parent but are listed again on the next walk. A pattern
+        removed later therefore cannot hide a subtree, and a skipped file
+        is checked again after it is rewritten in place.
+
+        Args:
+            root_path (str): Directory to walk.
+            known_directories (Dict[str, int]): Recorded directory
+                modification times in nanoseconds, by path.
+            known_files (Dict[str, List[str]]): Recorded file paths, by
+                parent directory.
+            directory_mtimes (Dict[str, int]): Filled with the current
+                modification time of every directory walked.
+            directory_callback (Optional[Callable[[str], None]]): Called with
+                each directory path before it is listed or pruned.
+                Defaults to None.
+
+        Yields:
+            FileInfo: Information about each regular file found.
+        """
+        known_subdirectories: Dict[str, List[str]] = {}
+        for path in known_directories:
+            if path != root_path:
+                known_subdirectories.setdefault(os.path.dirname(path), []).append(path)
+
+        walked_trees = [os.path.realpath(root_path)]
+        stack: List[Tuple[str, int]] = [(root_path, 0)]
+
+        while stack:
+            directory_path, depth = stack.pop()
+            if directory_callback is not None:
+                directory_callback(directory_path)
+
+            try:
+                mtime_ns = os.stat(directory_path).st_mtime_ns
+            except OSError as e:
+                logger.warning(f"Failed to stat directory {directory_path}: {e}")
+                continue
+            directory_mtimes[directory_path] = mtime_ns
+
+            if known_directories.get(directory_path) != mtime_ns:
+                candidates: List[str] = []
+                listed, complete = yield from self._list_directory(directory_path, depth, candidates, walked_trees)
+                if not listed:
+                    directory_mtimes[directory_path] = RELIST_MTIME_NS
+                    continue
+            else:
+                complete = True
+                for file_path in known_files.get(directory_path, []):
+                    if self.accept_file_name is not None and not self.accept_file_name(os.path.basename(file_path)):
+                        continue
+                    try:
+                        stat_result = os.stat(file_path)
+                    except OSError as e:
+                        logger.warning(f"Failed to stat {file_path}: {e}")
+                        continue
+                    if self.accept_file_size is not None and not self.accept_file_size(stat_result.st_size):
+                        complete = False
+                        continue
+                    yield FileInfo.from_stat(file_path, stat_result)
+                candidates = [
+                    path for path in known_subdirectories.get(directory_path, [])
+                    if not os.path.islink(path) or claim_linked_directory(path, walked_trees)
+                ] if depth < self.max_depth else []
+
+            subdirectories = self._included(candidates)
+            if not complete or len(subdirectories) != len(candidates):
+                directory_mtimes[directory_path] = RELIST_MTIME_NS
+
+            # Reversed so subdirectories are visited in listing order
+            for subdirectory in reversed(subdirectories):
+                stack.append((subdirectory, depth + 1))
+
+    def _resume_frontier(
+        self,
+        root_path: str,
+        resume_after: str,
+        walked_trees: List[str]
+    ) -> Tuple[List[Tuple[str, int]], Optional[str]]:
+        """
+        Rebuild the walk stack of an interrupted walk.
+
+        Lists every directory between root_path and the last file handled
+        and keeps the subdirectories listed after the one leading to it.
+
+        Args:
+            root_path (str): Directory being walked.
+            resume_after (str): Path of the last file handled.
+            walked_trees (List[str]): Real paths of trees walked so far,
+                see claim_linked_directory.
+
+        Returns:
+            Tuple[List[Tuple[str, int]], Optional[str]]: Walk stack with
+                the directory of the last file on top, and the name of
+                the last file, whose predecessors in that directory are
+                skipped. The name is None if the walk cannot continue at
+                the file.
+        """
+        relative = os.path.relpath(resume_after, root_path)
+        if relative == os.curdir or relative.split(os.sep)[0] == os.pardir:
+            logger.warning(f"Cannot resume walk of {root_path}: {resume_after} is not below it")
+            return [(root_path, 0)], None
+
+        parts = relative.split(os.sep)
+        stack: List[Tuple[str, int]] = []
+        directory_path = root_path
+        for depth, name in enumerate(parts[:-1]):
+            subdirectories = self._list_subdirectories(directory_path, depth, walked_trees)
+            next_directory = os.path.join(directory_path, name)
+            if next_directory not in subdirectories:
+                # Changed since the walk was interrupted; walk it in full
+                logger.warning(f"Cannot resume walk at {next_directory}; walking {directory_path} again")
+                stack.extend((path, depth + 1) for path in reversed(subdirectories))
+                return stack, None
+
+            later = subdirectories[subdirectories.index(next_directory) + 1:]
+            stack.extend((path, depth + 1) for path in reversed(later))
+            directory_path = next_directory
+
+        stack.append((directory_path, len(parts) - 1))
+        return stack, parts[-1]
+
+    def _list_subdirectories(
+        self,
+        directory_path: str,
+        depth: int,
+        walked_trees: List[str]
+    ) -> List[str]:
+        """
+        List the subdirectories of a directory that a walk would enter.
+
+        Args:
+            directory_path (str): Directory to list.
+            depth (int): Depth of the directory below the walk root.
+            walked_trees (List[str]): Real paths of trees walked so far,
+                see claim_linked_directory.
+
+        Returns:
+            List[str]: Subdirectory paths in listing order; empty if the
+                directory cannot be listed.
+        """
+        if depth >= self.max_depth:
+            return []
+
+        subdirectories: List[str] = []
+        try:
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() or not entry.is_dir():
+                            continue
+                        if entry.is_symlink() and not claim_linked_directory(entry.path, walked_trees):
+                            continue
+                        subdirectories.append(entry.path)
+                    except OSError as e:
+                        logger.warning(f"Failed to read entry {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to list directory {directory_path}: {e}")
+            return []
+        return self._included(subdirectories)
+
+    def _included(self, subdirectories: List[str]) -> List[str]:
+        """
+        Drop excluded subdirectories.
+
+        Args:
+            subdirectories (List[str]): Subdirectory paths.
+
+        Returns:
+            List[str]: Subdirectories not rejected by exclude_directory.
+        """
+        if self.exclude_directory is None or not subdirectories:
+            return subdirectories
+        return [path for path in subdirectories if not self.exclude_directory(path)]
+
+    def _list_directory(
+        self,
+        directory_path: str,
+        depth: int,
+        subdirectories: List[str],
+        walked_trees: List[str],
+        skip_through: Optional[str] = None
+    ) -> Generator[FileInfo, None, Tuple[bool, bool]]:
+        """
+        List one directory with os.scandir.
+
+        Args:
+            directory_path (str): Directory to list.
+            depth (int): Depth of the directory below the walk root.
+            subdirectories (List[str]): Filled with subdirectories to enter.
+            walked_trees (List[str]): Real paths of trees walked so far,
+                see claim_linked_directory.
+            skip_through (Optional[str]): Name of a file; it and the files
+                listed before it are not yielded. If no such file is
+                listed, all files are yielded. Defaults to None.
+
+        Yields:
+            FileInfo: Information about each regular file in the directory
+                that passes the file name and size checks.
+
+        Returns:
+            Tuple[bool, bool]: Whether the directory could be listed, and
+                whether no file was skipped for its size.
+        """
+        accept_file_name = self.accept_file_name
+        accept_file_size = self.accept_file_size
+        complete = True
+        try:
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            if skip_through is not None:
+                                if entry.name == skip_through:
+                                    skip_through = None
+                                continue
+                            if accept_file_name is not None and not accept_file_name(entry.name):
+                                continue
+                            stat_result = entry.stat()
+                            if accept_file_size is not None and not accept_file_size(stat_result.st_size):
+                                complete = False
+                                continue
+                            yield FileInfo.from_stat(entry.path, stat_result)
+                        elif entry.is_dir() and depth < self.max_depth:
+                            if entry.is_symlink() and not claim_linked_directory(entry.path, walked_trees):
+                                continue
+                            subdirectories.append(entry.path)
+                    except OSError as e:
+                        logger.warning(f"Failed to read entry {entry.path}: {e}")
+        except PermissionError as e:
+            logger.warning(f"Permission denied accessing {directory_path}: {e}")
+            return False, complete
+        except OSError as e:
+            logger.error(f"Error scanning directory {directory_path}: {e}")
+            return False, complete
+
+        if skip_through is not None:
+            # The file to resume after is gone, so nothing was yielded
+            logger.warning(f"{os.path.join(directory_path, skip_through)} not found; listing its directory in full")
+            return (yield from self._list_directory(directory_path, depth, [], walked_trees))
+        return True, complete
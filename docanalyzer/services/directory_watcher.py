@@ -0,0 +1,506 @@
+"""
+Directory Watcher - Event Driven Change Detection with Linux inotify
+
+Watches a directory tree with the Linux inotify API, called through a
+ctypes binding to libc, and reports files that were written, moved in,
+deleted or moved out. Watches are registered recursively at start and
+for every directory created or moved into the tree later, in a worker
+thread so that registering a large tree does not block the event loop.
+Watches of directories moved out of the tree are removed.
+
+The inotify file descriptor is non-blocking and registered with the
+event loop reader, so an idle watched tree costs no CPU and no disk
+I/O. If the kernel event queue overflows, events are lost and the
+watcher reports an overflow event; callers then reconcile the tree with
+DirectoryScanner.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+import threading
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from docanalyzer.services.directory_walker import DEFAULT_MAX_DEPTH
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE = 0.2
+READ_BUFFER_SIZE = 64 * 1024
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW | IN_EXCL_UNLINK
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+EVENT_CHANGED = "changed"
+EVENT_DELETED = "deleted"
+EVENT_OVERFLOW = "overflow"
+
+_libc = None
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """
+    Load libc with inotify functions.
+
+    Returns:
+        Optional[ctypes.CDLL]: libc handle, None if inotify is not available.
+    """
+    global _libc
+    if _libc is None:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_init1.restype = ctypes.c_int
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_add_watch.restype = ctypes.c_int
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            libc.inotify_rm_watch.restype = ctypes.c_int
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify is not available: {e}")
+            return None
+        _libc = libc
+    return _libc
+
+
+def inotify_available() -> bool:
+    """
+    Check whether inotify can be used on this system.
+
+    Returns:
+        bool: True on Linux with a libc that provides inotify.
+    """
+    return _load_libc() is not None
+
+
+@dataclass
+class WatchEvent:
+    """
+    Watch Event - Coalesced change of one path.
+
+    Attributes:
+        event_type (str): 'changed' for files written or moved in,
+            'deleted' for paths removed or moved out, 'overflow' when
+            events were lost and the tree must be rescanned.
+        path (str): Absolute path of the changed file or directory.
+            The watched root for overflow events.
+        is_directory (bool): Whether path is a directory.
+    """
+    event_type: str
+    path: str
+    is_directory: bool = False
+
+
+class DirectoryWatcher:
+    """
+    Directory Watcher - Recursive inotify watch of a directory tree.
+
+    Files are reported as changed when they are closed after writing or
+    moved into the tree, so partially written files are not reported.
+    Files already present in a directory created or moved into the
+    tree are reported as changed too. Events are coalesced per path for
+    debounce seconds and handed out in batches.
+
+    Attributes:
+        root_path (str): Resolved path of the watched directory.
+        max_depth (int): Maximum depth of directories to watch.
+        debounce (float): Seconds events are collected before a batch
+            is handed out.
+
+    Example:
+        >>> watcher = DirectoryWatcher("/path/to/directory")
+        >>> await watcher.start()
+        >>> async for events in watcher.batches():
+        ...     for event in events:
+        ...         print(event.event_type, event.path)
+    """
+
+    def __init__(
+        self,
+        root_path: str,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        debounce: float = DEFAULT_DEBOUNCE
+    ):
+        """
+        Initialize DirectoryWatcher instance.
+
+        Args:
+            root_path (str): Directory to watch.
+                Must be existing directory path.
+            max_depth (int): Maximum depth of directories to watch.
+                Must be non-negative integer. Defaults to 10.
+            debounce (float): Event coalescing window in seconds.
+                Must be non-negative. Defaults to 0.2.
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if not root_path or not isinstance(root_path, str):
+            raise ValueError("root_path must be non-empty string")
+        if max_depth < 0:
+            raise ValueError("max_depth must be non-negative")
+        if debounce < 0:
+            raise ValueError("debounce must be non-negative")
+
+        self.root_path = os.path.realpath(root_path)
+        self.max_depth = max_depth
+        self.debounce = debounce
+
+        self._fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._watches: Dict[int, Tuple[str, int]] = {}
+        self._watches_lock = threading.Lock()
+        self._pending: Dict[str, WatchEvent] = {}
+        self._overflow = False
+        # Created in start(), on Python 3.9 an Event binds to the loop current at creation
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tree_tasks: Set[asyncio.Task] = set()
+        self._closed = False
+
+        # Statistics
+        self._events_read = 0
+        self._overflow_count = 0
+
+    @property
+    def watch_count(self) -> int:
+        """
+        Get number of watched directories.
+
+        Returns:
+            int: Number of registered inotify watches.
+        """
+        with self._watches_lock:
+            return len(self._watches)
+
+    async def start(self) -> None:
+        """
+        Create the inotify instance and watch the tree.
+
+        Raises:
+            FileNotFoundError: If root directory doesn't exist
+            OSError: If inotify is not available or the watch limit
+                (fs.inotify.max_user_watches) is reached
+        """
+        if self._fd is not None:
+            return
+        if not os.path.isdir(self.root_path):
+            raise FileNotFoundError(f"Directory not found: {self.root_path}")
+
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this system")
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._fd = fd
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._closed = False
+
+        try:
+            await self._loop.run_in_executor(None, self._add_tree, self.root_path, 0, True)
+        except Exception:
+            os.close(fd)
+            self._fd = None
+            raise
+
+        self._loop.add_reader(fd, self._read_events)
+        logger.info(f"Watching {self.root_path} with {self.watch_count} inotify watches")
+
+    async def close(self) -> None:
+        """
+        Stop watching and release the inotify instance.
+
+        Ends iteration of batches() after pending events are handed out.
+        Registration of new directory trees still running is cancelled.
+        """
+        self._closed = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        for task in list(self._tree_tasks):
+            task.cancel()
+        if self._tree_tasks:
+            await asyncio.gather(*self._tree_tasks, return_exceptions=True)
+        if self._fd is not None:
+            if self._loop is not None:
+                self._loop.remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = None
+        with self._watches_lock:
+            self._watches.clear()
+
+    async def batches(self) -> AsyncIterator[List[WatchEvent]]:
+        """
+        Yield coalesced batches of watch events.
+
+        An overflow replaces all events of the batch with a single
+        overflow event for the root directory.
+
+        Yields:
+            List[WatchEvent]: Events collected during the debounce window,
+                in order of their last change.
+
+        Raises:
+            RuntimeError: If the watcher was never started
+        """
+        if self._wakeup is None:
+            raise RuntimeError("DirectoryWatcher is not started")
+
+        while True:
+            if not self._pending and not self._overflow:
+                if self._closed:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            if self.debounce and not self._closed:
+                await asyncio.sleep(self.debounce)
+
+            if self._overflow:
+                self._overflow = False
+                self._pending = {}
+                # Directories created while events were lost are not watched yet
+                if self._fd is not None:
+                    await asyncio.get_running_loop().run_in_executor(None, self._add_tree, self.root_path, 0)
+                batch = [WatchEvent(EVENT_OVERFLOW, self.root_path, is_directory=True)]
+            else:
+                batch = list(self._pending.values())
+            self._pending = {}
+            yield batch
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Get watcher statistics.
+
+        Returns:
+            Dict[str, int]: Number of watches, events read and overflows.
+        """
+        return {
+            "watches": self.watch_count,
+            "events_read": self._events_read,
+            "overflows": self._overflow_count
+        }
+
+    def _add_tree(self, directory_path: str, depth: int, strict: bool = False) -> List[str]:
+        """
+        Watch a directory and its subdirectories.
+
+        Blocking; runs in a worker thread. Watches are recorded before subdirectories are listed, so events
+        of a directory are never read before its watch is known.
+
+        Args:
+            directory_path (str): Directory to watch.
+            depth (int): Depth of directory below the root.
+            strict (bool): Whether a reached watch limit is raised instead
+                of logged. Defaults to False.
+
+        Returns:
+            List[str]: Regular files found in the watched directories.
+
+        Raises:
+            OSError: If strict and the watch limit is reached
+        """
+        files = []
+        stack = [(directory_path, depth)]
+        while stack:
+            path, path_depth = stack.pop()
+            fd = self._fd
+            if fd is None:
+                break
+            wd = _libc.inotify_add_watch(fd, os.fsencode(path), WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOSPC:
+                    message = f"inotify watch limit reached at {path}; raise fs.inotify.max_user_watches"
+                    if strict:
+                        raise OSError(err, message)
+                    logger.error(message)
+                    break
+                # Removed or unreadable before it could be watched
+                logger.debug(f"Cannot watch {path}: {os.strerror(err)}")
+                continue
+            with self._watches_lock:
+                self._watches[wd] = (path, path_depth)
+
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if path_depth < self.max_depth:
+                                    stack.append((entry.path, path_depth + 1))
+                            elif entry.is_file(follow_symlinks=False):
+                                files.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.debug(f"Cannot list {path}: {e}")
+        return files
+
+    def _read_events(self) -> None:
+        """
+        Read and dispatch all queued inotify events.
+
+        Event loop reader callback for the inotify descriptor.
+        """
+        while self._fd is not None:
+            try:
+                data = os.read(self._fd, READ_BUFFER_SIZE)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                logger.error(f"Failed to read inotify events: {e}")
+                break
+            if not data:
+                break
+            self._dispatch(data)
+        if self._pending or self._overflow:
+            self._wakeup.set()
+
+    def _dispatch(self, data: bytes) -> None:
+        """
+        Decode inotify events and record the resulting watch events.
+
+        Args:
+            data (bytes): Raw inotify_event records.
+        """
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, name_length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0")
+            offset += name_length
+            self._events_read += 1
+
+            if mask & IN_Q_OVERFLOW:
+                logger.warning(f"inotify queue overflow while watching {self.root_path}")
+                self._overflow_count += 1
+                self._overflow = True
+                continue
+
+            with self._watches_lock:
+                watch = self._watches.get(wd)
+                if mask & IN_IGNORED:
+                    self._watches.pop(wd, None)
+            if watch is None or mask & IN_IGNORED:
+                continue
+
+            directory_path, depth = watch
+            if not name:
+                # Events of the watched directory itself
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF) and directory_path == self.root_path:
+                    logger.warning(f"Watched root {self.root_path} was removed or moved")
+                continue
+
+            path = os.path.join(directory_path, os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    if depth < self.max_depth:
+                        self._start_tree_task(path, depth + 1)
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    if mask & IN_MOVED_FROM:
+                        # Watches of deleted directories are removed by the kernel
+                        self._remove_tree(path)
+                    self._record(WatchEvent(EVENT_DELETED, path, is_directory=True))
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                self._record(WatchEvent(EVENT_CHANGED, path))
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                self._record(WatchEvent(EVENT_DELETED, path))
+
+    def _start_tree_task(self, directory_path: str, depth: int) -> None:
+        """
+        Watch a new directory tree in a worker thread.
+
+        Args:
+            directory_path (str): Directory created or moved into the tree.
+            depth (int): Depth of directory below the root.
+        """
+        task = self._loop.create_task(self._watch_tree(directory_path, depth))
+        self._tree_tasks.add(task)
+        task.add_done_callback(self._tree_tasks.discard)
+
+    async def _watch_tree(self, directory_path: str, depth: int) -> None:
+        """
+        Watch a new directory tree and report the files found in it.
+
+        Args:
+            directory_path (str): Directory created or moved into the tree.
+            depth (int): Depth of directory below the root.
+        """
+        try:
+            files = await self._loop.run_in_executor(None, self._add_tree, directory_path, depth)
+        except Exception as e:
+            logger.error(f"Failed to watch {directory_path}: {e}")
+            return
+
+        if self._closed:
+            return
+        for file_path in files:
+            self._record(WatchEvent(EVENT_CHANGED, file_path))
+        if files:
+            self._wakeup.set()
+
+    def _remove_tree(self, directory_path: str) -> None:
+        """
+        Stop watching a directory moved out of the tree and its subdirectories.
+
+        Args:
+            directory_path (str): Previous path of the moved directory.
+        """
+        prefix = directory_path + os.sep
+        with self._watches_lock:
+            removed = [
+                wd for wd, (path, _depth) in self._watches.items()
+                if path == directory_path or path.startswith(prefix)
+            ]
+            for wd in removed:
+                del self._watches[wd]
+
+        fd = self._fd
+        if fd is not None:
+            for wd in removed:
+                _libc.inotify_rm_watch(fd, wd)
+
+    def _record(self, event: WatchEvent) -> None:
+        """
+        Record event, replacing an earlier event for the same path.
+
+        Args:
+            event (WatchEvent): Event to record.
+        """
+        self._pending.pop(event.path, None)
+        self._pending[event.path] = event
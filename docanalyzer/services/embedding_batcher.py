@@ -0,0 +1,369 @@
+"""
+Embedding Batcher - Cross-File Embedding Micro-Batching Service
+
+Provides a shared queue in front of the embedding service. Callers from
+different files submit texts and await futures while a background task
+collects submitted texts into batches and sends them through a single
+EmbeddingClient.
+
+A batch is flushed when it reaches the configured number of texts, the
+configured total UTF-8 size, or when the oldest queued text has waited
+for the configured number of milliseconds. Workloads with many small
+files therefore fill embedding batches that no single file could fill
+alone. With an EmbeddingCache, texts embedded before are served from the
+cache and only missing texts are queued.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+from docanalyzer.config.unified_config import EmbeddingConfig
+from docanalyzer.services.embedding_cache import EmbeddingCache
+from docanalyzer.models.errors import ProcessingError, ErrorCategory
+from docanalyzer.services.embedding_client import (
+    EmbeddingClient, DEFAULT_MAX_BATCH_TEXTS, DEFAULT_MAX_BATCH_BYTES
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WAIT_MS = 10
+
+_PendingItem = Tuple[str, int, asyncio.Future]
+
+
+class EmbeddingBatcher:
+    """
+    Embedding Batcher - Shared micro-batching queue for embeddings.
+
+    Exposes the same embed_text/embed_texts interface as EmbeddingClient,
+    so it can be passed to ChunkingManager and FileProcessor wherever an
+    embedding client is expected. All texts submitted by concurrent
+    callers are merged into shared batches.
+
+    Attributes:
+        embedding_client (EmbeddingClient): Client used to send batches.
+        max_batch_texts (int): Flush when this many texts are queued.
+        max_batch_bytes (int): Flush when queued texts reach this UTF-8 size.
+        max_wait_ms (int): Flush after the oldest queued text waited this long.
+        embedding_cache (Optional[EmbeddingCache]): Cache consulted before
+            texts are queued. Not closed by stop().
+        is_running (bool): Whether the background flush task is running.
+        batches_sent (int): Number of batches sent to the embedding service.
+        texts_sent (int): Number of texts sent to the embedding service.
+
+    Example:
+        >>> batcher = EmbeddingBatcher()
+        >>> await batcher.start()
+        >>> embedding = await batcher.embed_text("chunk text")
+        >>> await batcher.stop()
+    """
+
+    def __init__(
+        self,
+        embedding_client: Optional[EmbeddingClient] = None,
+        config: Optional[EmbeddingConfig] = None,
+        max_batch_texts: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        max_wait_ms: Optional[int] = None,
+        embedding_cache: Optional[EmbeddingCache] = None
+    ):
+        """
+        Initialize EmbeddingBatcher instance.
+
+        Args:
+            embedding_client (Optional[EmbeddingClient]): Client used to send
+                batches. If None, a client is created from config and closed
+                by stop(). Defaults to None.
+            config (Optional[EmbeddingConfig]): Embedding configuration.
+                If None, uses embedding section of unified config. Defaults to None.
+            max_batch_texts (Optional[int]): Maximum texts per batch.
+                If None, taken from config. Must be positive. Defaults to None.
+            max_batch_bytes (Optional[int]): Maximum UTF-8 bytes per batch.
+                If None, taken from config. Must be positive. Defaults to None.
+            max_wait_ms (Optional[int]): Maximum time a text waits before its
+                batch is flushed. If None, taken from config. Must be
+                non-negative. Defaults to None.
+            embedding_cache (Optional[EmbeddingCache]): Persistent cache
+                serving previously embedded texts. Defaults to None.
+
+        Raises:
+            ValueError: If batch limits are not positive or max_wait_ms is negative
+        """
+        if config is None:
+            if embedding_client is not None:
+                config = embedding_client.config
+            else:
+                from docanalyzer.config import get_unified_config
+                config = get_unified_config().embedding
+
+        if max_batch_texts is None:
+            max_batch_texts = getattr(config, "max_batch_texts", DEFAULT_MAX_BATCH_TEXTS)
+        if max_batch_bytes is None:
+            max_batch_bytes = getattr(config, "max_batch_bytes", DEFAULT_MAX_BATCH_BYTES)
+        if max_wait_ms is None:
+            max_wait_ms = getattr(config, "max_wait_ms", DEFAULT_MAX_WAIT_MS)
+
+        if max_batch_texts <= 0:
+            raise ValueError("max_batch_texts must be positive")
+        if max_batch_bytes <= 0:
+            raise ValueError("max_batch_bytes must be positive")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be non-negative")
+
+        self._owns_client = embedding_client is None
+        if embedding_client is None:
+            embedding_client = EmbeddingClient(
+                config,
+                max_batch_texts=max_batch_texts,
+                max_batch_bytes=max_batch_bytes
+            )
+
+        self.embedding_client = embedding_client
+        self.config = config
+        self.max_batch_texts = max_batch_texts
+        self.max_batch_bytes = max_batch_bytes
+        self.max_wait_ms = max_wait_ms
+        self.embedding_cache = embedding_cache
+        self.is_running = False
+        self.batches_sent = 0
+        self.texts_sent = 0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: set = set()
+        self._carry: Optional[_PendingItem] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """
+        Start the background flush task.
+
+        Safe to call multiple times. Called automatically on first submit.
+        """
+        if self.is_running:
+            return
+
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        self.is_running = True
+        logger.debug(
+            f"EmbeddingBatcher started (max_batch_texts={self.max_batch_texts}, "
+            f"max_batch_bytes={self.max_batch_bytes}, max_wait_ms={self.max_wait_ms})"
+        )
+
+    async def stop(self) -> None:
+        """
+        Flush queued texts and stop the background flush task.
+
+        Waits for in-flight batches to complete and closes the embedding
+        client if it was created by the batcher. Texts submitted while
+        stopping are rejected. Safe to call multiple times.
+        """
+        if self.is_running:
+            self._stopping = True
+            try:
+                await self._queue.put(None)
+                await self._worker
+                if self._in_flight:
+                    await asyncio.gather(*self._in_flight, return_exceptions=True)
+            finally:
+                self.is_running = False
+                self._stopping = False
+                self._worker = None
+                self._queue = None
+
+        if self._owns_client:
+            await self.embedding_client.cleanup()
+
+    async def submit(self, text: str) -> asyncio.Future:
+        """
+        Queue text for embedding.
+
+        Args:
+            text (str): Text to embed.
+
+        Returns:
+            asyncio.Future: Future resolved with the embedding vector or
+                with the error raised for the batch containing the text.
+
+        Raises:
+            ProcessingError: If stop() is in progress
+        """
+        if self._stopping:
+            raise ProcessingError("EmbeddingError", "EmbeddingBatcher is stopping", ErrorCategory.PROCESSING)
+        if not self.is_running:
+            await self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, len(text.encode("utf-8")), future))
+        return future
+
+    async def embed_text(self, text: str) -> List[float]:
+        """
+        Generate embedding for a single text through the shared queue.
+
+        Args:
+            text (str): Text to embed.
+
+        Returns:
+            List[float]: Embedding vector.
+
+        Raises:
+            ProcessingError: If the batch containing the text fails
+        """
+        if self.embedding_cache is not None:
+            return (await self.embed_texts([text]))[0]
+        return await (await self.submit(text))
+
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for many texts through the shared queue.
+
+        Args:
+            texts (List[str]): Texts to embed.
+
+        Returns:
+            List[List[float]]: Embedding vectors in input order.
+
+        Raises:
+            ProcessingError: If any batch containing the texts fails
+        """
+        if self.embedding_cache is not None:
+            return await self.embedding_cache.get_or_embed(texts, self._embed_queued)
+        return await self._embed_queued(texts)
+
+    async def _embed_queued(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts through the shared queue without consulting the cache.
+
+        Args:
+            texts (List[str]): Texts to embed.
+
+        Returns:
+            List[List[float]]: Embedding vectors in input order.
+        """
+        if not texts:
+            return []
+
+        futures = [await self.submit(text) for text in texts]
+        return list(await asyncio.gather(*futures))
+
+    async def cleanup(self) -> None:
+        """
+        Release batcher resources.
+
+        Alias for stop() so the batcher can be used wherever an
+        EmbeddingClient is expected.
+        """
+        await self.stop()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dict[str, Any]: Sent batch and text counts, average batch size
+                and number of texts currently queued.
+        """
+        return {
+            "batches_sent": self.batches_sent,
+            "texts_sent": self.texts_sent,
+            "average_batch_size": (
+                self.texts_sent / self.batches_sent if self.batches_sent else 0.0
+            ),
+            "queued_texts": self._queue.qsize() if self._queue else 0
+        }
+
+    async def _run(self) -> None:
+        """
+        Background task collecting queued texts into batches.
+
+        Blocks for the first text of a batch, then keeps collecting until
+        a limit is reached or max_wait_ms has passed since the first text
+        arrived. Full batches are sent without waiting for the previous
+        request to finish.
+        """
+        stopping = False
+        while not stopping:
+            if self._carry is not None:
+                first, self._carry = self._carry, None
+            else:
+                first = await self._queue.get()
+                if first is None:
+                    break
+
+            batch = [first]
+            batch_bytes = first[1]
+            deadline = time.monotonic() + self.max_wait_ms / 1000.0
+
+            while len(batch) < self.max_batch_texts:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+
+                if item is None:
+                    stopping = True
+                    break
+
+                if batch_bytes + item[1] > self.max_batch_bytes:
+                    self._carry = item
+                    break
+
+                batch.append(item)
+                batch_bytes += item[1]
+
+            self._dispatch(batch)
+
+        if self._carry is not None:
+            self._dispatch([self._carry])
+            self._carry = None
+
+        # Drain anything queued after the stop marker
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                self._dispatch([item])
+
+    def _dispatch(self, batch: List[_PendingItem]) -> None:
+        """
+        Send batch in a separate task so collection continues meanwhile.
+
+        Args:
+            batch (List[_PendingItem]): Queued texts with their futures.
+        """
+        task = asyncio.create_task(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: List[_PendingItem]) -> None:
+        """
+        Send one batch and resolve its futures.
+
+        Args:
+            batch (List[_PendingItem]): Queued texts with their futures.
+        """
+        texts = [item[0] for item in batch]
+        try:
+            embeddings = await self.embedding_client.embed_texts(texts)
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(texts)} texts failed: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches_sent += 1
+        self.texts_sent += len(texts)
+        for (_, _, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
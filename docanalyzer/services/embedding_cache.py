@@ -0,0 +1,398 @@
+"""
+Embedding Cache - Persistent Content-Addressed Embedding Storage
+
+Provides an on-disk cache of embedding vectors keyed by the embedding
+model/endpoint and a hash of the normalized chunk text. Vectors are
+stored as float32 blobs in a local SQLite file with a byte-size cap and
+least-recently-used eviction.
+
+Unchanged text that was embedded before - after restarts, re-scans or
+in boilerplate shared between files - is served from the cache without
+calling the embedding service.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from typing import Awaitable, Callable, List, Dict, Any, Optional
+
+from docanalyzer.config.unified_config import EmbeddingConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "./data/embedding_cache.sqlite"
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+SQLITE_MAX_PARAMS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    namespace TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (namespace, text_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize chunk text before hashing.
+
+    Applies Unicode NFC normalization and collapses runs of whitespace,
+    so texts differing only in line wrapping or trailing spaces share
+    one cache entry.
+
+    Args:
+        text (str): Text to normalize.
+
+    Returns:
+        str: Normalized text.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def hash_text(text: str) -> str:
+    """
+    Compute content hash of normalized text.
+
+    Args:
+        text (str): Text to hash.
+
+    Returns:
+        str: Hex SHA-256 digest of normalized text.
+    """
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Embedding Cache - SQLite-backed LRU cache of embedding vectors.
+
+    Entries are keyed by (namespace, text hash) where the namespace
+    identifies the embedding model and endpoint, so vectors from
+    different models never mix. Total stored vector bytes are kept
+    under max_bytes by evicting least recently used entries.
+
+    The database is opened on first use. Methods are blocking and
+    thread-safe; async callers run them in an executor.
+
+    Attributes:
+        cache_path (str): Path to the SQLite cache file.
+        max_bytes (int): Maximum total size of stored vectors in bytes.
+        namespace (str): Model/endpoint identifier for cache keys.
+        hits (int): Number of texts served from cache.
+        misses (int): Number of texts not found in cache.
+        evictions (int): Number of entries evicted by the size cap.
+
+    Example:
+        >>> cache = EmbeddingCache()
+        >>> found = cache.get_many(["text"])
+        >>> cache.put_many(["text"], [[0.1] * 384])
+        >>> cache.close()
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        namespace: Optional[str] = None,
+        config: Optional[EmbeddingConfig] = None
+    ):
+        """
+        Initialize EmbeddingCache instance.
+
+        Args:
+            cache_path (Optional[str]): Path to SQLite cache file.
+                If None, taken from config. Defaults to None.
+            max_bytes (Optional[int]): Maximum total vector bytes.
+                If None, taken from config. Must be positive. Defaults to None.
+            namespace (Optional[str]): Model/endpoint identifier.
+                If None, built from config model_name, base_url and port.
+                Defaults to None.
+            config (Optional[EmbeddingConfig]): Embedding configuration.
+                If None, uses embedding section of unified config. Defaults to None.
+
+        Raises:
+            ValueError: If cache_path is empty or max_bytes is not positive
+        """
+        if config is None and (cache_path is None or max_bytes is None or namespace is None):
+            from docanalyzer.config import get_unified_config
+            config = get_unified_config().embedding
+
+        if cache_path is None:
+            cache_path = getattr(config, "cache_path", DEFAULT_CACHE_PATH)
+        if max_bytes is None:
+            max_bytes = getattr(config, "cache_max_bytes", DEFAULT_CACHE_MAX_BYTES)
+        if namespace is None:
+            model_name = getattr(config, "model_name", "default")
+            namespace = f"{model_name}@{config.base_url}:{config.port}"
+
+        if not cache_path:
+            raise ValueError("cache_path cannot be empty")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self._last_tick = 0
+        self._lock = threading.Lock()
+
+    def get_many(self, texts: List[str]) -> Dict[int, List[float]]:
+        """
+        Look up cached embeddings for texts.
+
+        Found entries are marked as recently used.
+
+        Args:
+            texts (List[str]): Texts to look up.
+
+        Returns:
+            Dict[int, List[float]]: Embeddings by index in texts for every
+                text found in cache.
+        """
+        if not texts:
+            return {}
+
+        hashes = [hash_text(text) for text in texts]
+        found_vectors: Dict[str, List[float]] = {}
+
+        with self._lock:
+            connection = self._connect()
+            unique_hashes = list(dict.fromkeys(hashes))
+            for start in range(0, len(unique_hashes), SQLITE_MAX_PARAMS):
+                part = unique_hashes[start:start + SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(part))
+                rows = connection.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE namespace = ? AND text_hash IN ({placeholders})",
+                    [self.namespace, *part]
+                ).fetchall()
+                for text_hash, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found_vectors[text_hash] = vector.tolist()
+
+            if found_vectors:
+                now = self._tick()
+                connection.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE namespace = ? AND text_hash = ?",
+                    [(now, self.namespace, text_hash) for text_hash in found_vectors]
+                )
+                connection.commit()
+
+        result = {
+            index: found_vectors[text_hash]
+            for index, text_hash in enumerate(hashes)
+            if text_hash in found_vectors
+        }
+        self.hits += len(result)
+        self.misses += len(texts) - len(result)
+        return result
+
+    def put_many(self, texts: List[str], embeddings: List[List[float]]) -> None:
+        """
+        Store embeddings for texts.
+
+        Evicts least recently used entries if the size cap is exceeded.
+
+        Args:
+            texts (List[str]): Embedded texts.
+            embeddings (List[List[float]]): Embeddings in the same order.
+
+        Raises:
+            ValueError: If texts and embeddings lengths differ
+        """
+        if len(texts) != len(embeddings):
+            raise ValueError("texts and embeddings must have the same length")
+        if not texts:
+            return
+
+        rows = {}
+        for text, embedding in zip(texts, embeddings):
+            text_hash = hash_text(text)
+            blob = array("f", embedding).tobytes()
+            rows[text_hash] = (self.namespace, text_hash, blob, len(blob))
+
+        with self._lock:
+            connection = self._connect()
+            now = self._tick()
+            # Entries being replaced must not be counted twice
+            hashes = list(rows)
+            for start in range(0, len(hashes), SQLITE_MAX_PARAMS):
+                part = hashes[start:start + SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(part))
+                replaced = connection.execute(
+                    f"SELECT COALESCE(SUM(size), 0) FROM embeddings "
+                    f"WHERE namespace = ? AND text_hash IN ({placeholders})",
+                    [self.namespace, *part]
+                ).fetchone()[0]
+                self._total_bytes -= replaced
+
+            connection.executemany(
+                "INSERT OR REPLACE INTO embeddings "
+                "(namespace, text_hash, vector, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                [row + (now,) for row in rows.values()]
+            )
+            self._total_bytes += sum(row[3] for row in rows.values())
+
+            if self._total_bytes > self.max_bytes:
+                self._evict(connection)
+
+            connection.commit()
+
+    async def get_or_embed(
+        self,
+        texts: List[str],
+        embed_texts: Callable[[List[str]], Awaitable[List[List[float]]]]
+    ) -> List[List[float]]:
+        """
+        Serve texts from the cache and embed only the missing ones.
+
+        Duplicate uncached texts are embedded once and new embeddings are
+        added to the cache. Cache errors are logged and the texts are
+        embedded as if they were not cached.
+
+        Args:
+            texts (List[str]): Texts to embed.
+            embed_texts (Callable[[List[str]], Awaitable[List[List[float]]]]):
+                Coroutine function embedding texts missing from the cache.
+
+        Returns:
+            List[List[float]]: Embedding vectors in input order.
+        """
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        try:
+            cached = await loop.run_in_executor(None, self.get_many, texts)
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            cached = {}
+
+        # Embed each distinct uncached text once
+        missing_texts = list(dict.fromkeys(
+            text for index, text in enumerate(texts) if index not in cached
+        ))
+        by_text: Dict[str, List[float]] = {}
+        if missing_texts:
+            new_embeddings = await embed_texts(missing_texts)
+            try:
+                await loop.run_in_executor(None, self.put_many, missing_texts, new_embeddings)
+            except Exception as e:
+                logger.warning(f"Embedding cache update failed: {e}")
+            by_text = dict(zip(missing_texts, new_embeddings))
+
+        logger.debug(f"Embedding cache served {len(cached)}/{len(texts)} texts")
+        return [
+            cached[index] if index in cached else by_text[text]
+            for index, text in enumerate(texts)
+        ]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit, miss and eviction counts, hit rate and
+                stored vector bytes.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes
+        }
+
+    def close(self) -> None:
+        """
+        Close the cache database. Safe to call multiple times.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open cache database on first use.
+
+        Returns:
+            sqlite3.Connection: Open connection.
+        """
+        if self._connection is None:
+            directory = os.path.dirname(os.path.abspath(self.cache_path))
+            os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(self.cache_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._total_bytes, self._last_tick = connection.execute(
+                "SELECT COALESCE(SUM(size), 0), COALESCE(MAX(last_used), 0) FROM embeddings"
+            ).fetchone()
+            self._connection = connection
+            logger.debug(f"Opened embedding cache {self.cache_path} ({self._total_bytes} bytes)")
+
+        return self._connection
+
+    def _tick(self) -> int:
+        """
+        Get strictly increasing recency stamp.
+
+        Based on wall-clock nanoseconds so stamps keep increasing across
+        restarts, but never repeats within one process.
+
+        Returns:
+            int: Recency stamp for last_used.
+        """
+        self._last_tick = max(time.time_ns(), self._last_tick + 1)
+        return self._last_tick
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """
+        Remove least recently used entries until under the size cap.
+
+        Args:
+            connection (sqlite3.Connection): Open connection.
+        """
+        excess = self._total_bytes - self.max_bytes
+        victims = []
+        freed = 0
+        for namespace, text_hash, size in connection.execute(
+            "SELECT namespace, text_hash, size FROM embeddings ORDER BY last_used"
+        ):
+            victims.append((namespace, text_hash))
+            freed += size
+            if freed >= excess:
+                break
+
+        connection.executemany(
+            "DELETE FROM embeddings WHERE namespace = ? AND text_hash = ?",
+            victims
+        )
+        self._total_bytes -= freed
+        self.evictions += len(victims)
+        logger.debug(f"Evicted {len(victims)} embeddings ({freed} bytes) from cache")
@@ -0,0 +1,317 @@
+"""
+Embedding Client - Pooled, Batched Embedding Service Client
+
+Provides a long-lived client for the embedding service that keeps one
+pooled keep-alive HTTP connection and sends many texts per JSON-RPC
+``embed`` call instead of opening a new connection for every chunk.
+
+Batches are bounded both by the number of texts and by the total UTF-8
+size of the texts, so large chunks do not produce oversized requests.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import logging
+from typing import List, Dict, Any, Optional
+
+from docanalyzer.config.unified_config import EmbeddingConfig
+from docanalyzer.models.errors import ProcessingError, ErrorCategory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_TEXTS = 64
+DEFAULT_MAX_BATCH_BYTES = 1024 * 1024
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_EMBEDDING_DIMENSION = 384
+EMBED_ENDPOINT = "/cmd"
+
+
+class EmbeddingClient:
+    """
+    Embedding Client - Pooled JSON-RPC client for the embedding service.
+
+    Owns a single httpx.AsyncClient with keep-alive connections that is
+    reused for the whole lifetime of the client. Texts are split into
+    batches limited by max_batch_texts and max_batch_bytes and each batch
+    is sent as one JSON-RPC ``embed`` call.
+
+    Attributes:
+        config (EmbeddingConfig): Embedding service configuration.
+            Provides base_url, port, timeout and batch limits.
+        base_url (str): Full embedding service URL built from config.
+        max_batch_texts (int): Maximum number of texts per request.
+        max_batch_bytes (int): Maximum total UTF-8 size of texts per request.
+        max_connections (int): Maximum pooled connections.
+        expected_dimension (Optional[int]): Expected embedding size.
+            If None, dimensions are not validated.
+        is_initialized (bool): Whether the HTTP client is open.
+
+    Example:
+        >>> client = EmbeddingClient()
+        >>> await client.initialize()
+        >>> embeddings = await client.embed_texts(["first", "second"])
+        >>> await client.cleanup()
+
+    Raises:
+        ProcessingError: If embedding requests fail
+    """
+
+    def __init__(
+        self,
+        config: Optional[EmbeddingConfig] = None,
+        max_batch_texts: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        expected_dimension: Optional[int] = DEFAULT_EMBEDDING_DIMENSION
+    ):
+        """
+        Initialize EmbeddingClient instance.
+
+        Args:
+            config (Optional[EmbeddingConfig]): Embedding configuration.
+                If None, uses embedding section of unified config. Defaults to None.
+            max_batch_texts (Optional[int]): Maximum texts per request.
+                If None, taken from config. Must be positive. Defaults to None.
+            max_batch_bytes (Optional[int]): Maximum UTF-8 bytes per request.
+                If None, taken from config. Must be positive. Defaults to None.
+            max_connections (int): Maximum pooled connections.
+                Must be positive. Defaults to 4.
+            expected_dimension (Optional[int]): Expected embedding size.
+                Defaults to 384. None disables the check.
+
+        Raises:
+            ValueError: If batch limits or max_connections are not positive
+        """
+        if config is None:
+            from docanalyzer.config import get_unified_config
+            config = get_unified_config().embedding
+
+        self.config = config
+        if max_batch_texts is None:
+            max_batch_texts = getattr(config, "max_batch_texts", DEFAULT_MAX_BATCH_TEXTS)
+        if max_batch_bytes is None:
+            max_batch_bytes = getattr(config, "max_batch_bytes", DEFAULT_MAX_BATCH_BYTES)
+
+        self.max_batch_texts = max_batch_texts
+        self.max_batch_bytes = max_batch_bytes
+
+        if self.max_batch_texts <= 0:
+            raise ValueError("max_batch_texts must be positive")
+        if self.max_batch_bytes <= 0:
+            raise ValueError("max_batch_bytes must be positive")
+        if max_connections <= 0:
+            raise ValueError("max_connections must be positive")
+
+        self.base_url = f"{config.base_url}:{config.port}"
+        self.timeout = float(config.timeout)
+        self.max_connections = max_connections
+        self.expected_dimension = expected_dimension
+        self.is_initialized = False
+
+        self._client = None
+        self._request_id = 0
+
+        logger.info(
+            f"EmbeddingClient configured for {self.base_url} "
+            f"(max_batch_texts={self.max_batch_texts}, max_batch_bytes={self.max_batch_bytes})"
+        )
+
+    async def initialize(self) -> None:
+        """
+        Open the pooled HTTP client.
+
+        Safe to call multiple times; the client is created only once.
+        Called automatically by embed_texts if needed.
+        """
+        if self.is_initialized:
+            return
+
+        import httpx
+
+        # No await between the check and assignment, so concurrent
+        # callers cannot open two pools
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            )
+        )
+        self.is_initialized = True
+        logger.debug(f"Opened embedding connection pool to {self.base_url}")
+
+    async def cleanup(self) -> None:
+        """
+        Close the pooled HTTP client.
+
+        Safe to call multiple times.
+        """
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing embedding client: {e}")
+
+        self._client = None
+        self.is_initialized = False
+
+    async def embed_text(self, text: str) -> List[float]:
+        """
+        Generate embedding for a single text.
+
+        Args:
+            text (str): Text to embed.
+
+        Returns:
+            List[float]: Embedding vector.
+
+        Raises:
+            ProcessingError: If embedding generation fails
+        """
+        embeddings = await self.embed_texts([text])
+        return embeddings[0]
+
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for many texts.
+
+        Splits texts into batches bounded by max_batch_texts and
+        max_batch_bytes and sends one JSON-RPC call per batch over the
+        pooled connection. Result order matches input order.
+
+        Args:
+            texts (List[str]): Texts to embed.
+
+        Returns:
+            List[List[float]]: Embedding vectors in input order.
+
+        Raises:
+            ProcessingError: If any batch fails
+        """
+        if not texts:
+            return []
+
+        if not self.is_initialized:
+            await self.initialize()
+
+        embeddings: List[List[float]] = []
+        for batch in self.split_batches(texts):
+            embeddings.extend(await self._embed_batch(batch))
+
+        return embeddings
+
+    def split_batches(self, texts: List[str]) -> List[List[str]]:
+        """
+        Split texts into request-sized batches.
+
+        A batch is closed when adding the next text would exceed
+        max_batch_texts or max_batch_bytes. A single text larger than
+        max_batch_bytes is sent alone.
+
+        Args:
+            texts (List[str]): Texts to split.
+
+        Returns:
+            List[List[str]]: Batches in input order.
+        """
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_bytes = 0
+
+        for text in texts:
+            text_bytes = len(text.encode("utf-8"))
+            if current and (
+                len(current) >= self.max_batch_texts
+                or current_bytes + text_bytes > self.max_batch_bytes
+            ):
+                batches.append(current)
+                current = []
+                current_bytes = 0
+
+            current.append(text)
+            current_bytes += text_bytes
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Send one JSON-RPC embed call for a batch of texts.
+
+        Args:
+            texts (List[str]): Batch of texts.
+
+        Returns:
+            List[List[float]]: Embeddings for the batch.
+
+        Raises:
+            ProcessingError: If request fails or response is invalid
+        """
+        self._request_id += 1
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "embed",
+            "params": {"texts": texts},
+            "id": self._request_id
+        }
+
+        try:
+            response = await self._client.post(EMBED_ENDPOINT, json=payload)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            logger.error(f"Embedding request failed: {e}")
+            raise ProcessingError(
+                "EmbeddingError",
+                f"Embedding request failed: {e}",
+                ErrorCategory.NETWORK
+            )
+
+        return self._parse_embeddings(data, len(texts))
+
+    def _parse_embeddings(self, data: Dict[str, Any], expected_count: int) -> List[List[float]]:
+        """
+        Extract and validate embeddings from JSON-RPC response.
+
+        Args:
+            data (Dict[str, Any]): Decoded JSON-RPC response.
+            expected_count (int): Number of texts in the request.
+
+        Returns:
+            List[List[float]]: Validated embeddings.
+
+        Raises:
+            ProcessingError: If response is unsuccessful or malformed
+        """
+        result = data.get("result") or {}
+        if not result.get("success"):
+            error = result.get("error") or data.get("error") or "unknown error"
+            raise ProcessingError(
+                "EmbeddingError",
+                f"Failed to generate embedding: {error}",
+                ErrorCategory.PROCESSING
+            )
+
+        embeddings = (result.get("data") or {}).get("embeddings") or []
+        if len(embeddings) != expected_count:
+            raise ProcessingError(
+                "EmbeddingError",
+                f"Expected {expected_count} embeddings, got {len(embeddings)}",
+                ErrorCategory.PROCESSING
+            )
+
+        for embedding in embeddings:
+            if not embedding:
+                raise ProcessingError("EmbeddingError", "No embedding returned", ErrorCategory.PROCESSING)
+            if self.expected_dimension and len(embedding) != self.expected_dimension:
+                raise ProcessingError(
+                    "EmbeddingError",
+                    f"Invalid embedding dimensions: {len(embedding)}",
+                    ErrorCategory.PROCESSING
+                )
+
+        return embeddings
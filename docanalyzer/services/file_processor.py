@@ -14,17 +14,20 @@ Version: 1.0.0
 """
 
 import asyncio
+import inspect
+import itertools
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterator, Tuple
 from uuid import uuid4
 from datetime import datetime
 
 from docanalyzer.models.file_system import FileInfo
 from docanalyzer.models.processing import ProcessingBlock, FileProcessingResult, ProcessingStatus
-from docanalyzer.processors.base_processor import BaseProcessor
+from docanalyzer.processors.base_processor import BaseProcessor, ProcessorResult
 from docanalyzer.processors.text_processor import TextProcessor
 from docanalyzer.processors.markdown_processor import MarkdownProcessor
+from docanalyzer.processors.processor_executor import ProcessorExecutor
 from docanalyzer.services.vector_store_wrapper import VectorStoreWrapper
 from docanalyzer.services.database_manager import DatabaseManager
 from docanalyzer.models.errors import ProcessingError, ErrorCategory
@@ -34,6 +37,8 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CHUNK_SIZE = 1000
 DEFAULT_CHUNK_OVERLAP = 200
+DEFAULT_STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+DEFAULT_STREAM_BATCH_SIZE = 100
 
 
 class MetadataExtractor:
@@ -115,6 +120,15 @@ class FileProcessor:
         metadata_extractor (MetadataExtractor): Extractor for minimal metadata
         chunk_size (int): Maximum size of text chunks
         chunk_overlap (int): Overlap between consecutive chunks
+        bulk_storage (bool): Whether chunks are stored in adapter-sized batches
+        embedding_client (Optional[Any]): EmbeddingClient or shared
+            EmbeddingBatcher used to precompute embeddings in bulk mode
+        processor_executor (Optional[ProcessorExecutor]): Pool running
+            processors off the event loop, or None to run them inline
+        stream_threshold_bytes (int): File size above which files of
+            streaming processors are extracted and stored in batches
+        stream_batch_size (int): Blocks extracted and stored per batch
+            when streaming
         processors (Dict[str, BaseProcessor]): Mapping of file extensions to processors
     
     Example:
@@ -128,7 +142,13 @@ class FileProcessor:
         vector_store: VectorStoreWrapper,
         database_manager: DatabaseManager,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
-        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+        bulk_storage: bool = False,
+        embedding_client: Optional[Any] = None,
+        processor_executor: Optional[ProcessorExecutor] = None,
+        stream_threshold_bytes: int = DEFAULT_STREAM_THRESHOLD_BYTES,
+        stream_batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+        use_mmap: bool = False
     ):
         """
         Initialize FileProcessor instance.
@@ -142,9 +162,27 @@ class FileProcessor:
                 Must be positive integer. Defaults to 1000.
             chunk_overlap (int): Overlap between consecutive chunks in characters.
                 Must be non-negative integer. Defaults to 200.
+            bulk_storage (bool): Whether to store all chunks of a file with
+                batched vector store requests instead of one request per chunk.
+                Defaults to False.
+            embedding_client (Optional[Any]): Object with async embed_texts(),
+                usually an EmbeddingBatcher shared with ChunkingManager. When
+                set and bulk_storage is enabled, chunk embeddings are computed
+                through it before storage. Defaults to None.
+            processor_executor (Optional[ProcessorExecutor]): Executor running
+                processor parsing in a process or thread pool. If None,
+                processors run on the event loop. Defaults to None.
+            stream_threshold_bytes (int): Files larger than this, or than
+                the processor's max_file_size_bytes, are streamed if the
+                processor supports it. Defaults to 10MB.
+            stream_batch_size (int): Blocks extracted, chunked and stored
+                per batch when streaming. Defaults to 100.
+            use_mmap (bool): Whether text and Markdown processors read files
+                through a memory mapping. Defaults to False.
         
         Raises:
-            ValueError: If chunk_size is not positive or chunk_overlap is negative
+            ValueError: If chunk_size is not positive or chunk_overlap is negative,
+                or if stream_threshold_bytes or stream_batch_size is not positive
             TypeError: If vector_store or database_manager are not of correct types
         """
         if not isinstance(vector_store, VectorStoreWrapper):
@@ -158,20 +196,32 @@ class FileProcessor:
             raise ValueError("chunk_overlap must be non-negative integer")
         if chunk_overlap >= chunk_size:
             raise ValueError("chunk_overlap must be less than chunk_size")
+        if stream_threshold_bytes <= 0:
+            raise ValueError("stream_threshold_bytes must be positive integer")
+        if stream_batch_size <= 0:
+            raise ValueError("stream_batch_size must be positive integer")
         
         self.vector_store = vector_store
         self.database_manager = database_manager
         self.metadata_extractor = MetadataExtractor()
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.bulk_storage = bulk_storage
+        self.embedding_client = embedding_client
+        self.processor_executor = processor_executor
+        self.stream_threshold_bytes = stream_threshold_bytes
+        self.stream_batch_size = stream_batch_size
         
         # Initialize processors mapping
         self.processors = {
-            ".txt": TextProcessor(),
-            ".md": MarkdownProcessor()
+            ".txt": TextProcessor(use_mmap=use_mmap),
+            ".md": MarkdownProcessor(use_mmap=use_mmap)
         }
         
-        logger.info(f"FileProcessor initialized with chunk_size={chunk_size}, chunk_overlap={chunk_overlap}")
+        logger.info(
+            f"FileProcessor initialized with chunk_size={chunk_size}, chunk_overlap={chunk_overlap}, "
+            f"bulk_storage={bulk_storage}"
+        )
     
     async def process_file(self, file_path: str) -> FileProcessingResult:
         """
@@ -233,8 +283,14 @@ class FileProcessor:
             # Get appropriate processor
             processor = self._get_processor(file_path)
             
+            # Large files are extracted and stored in batches
+            if self._should_stream(processor, file_size):
+                return await self._process_file_streaming(
+                    processor, file_path, file_size, processing_id, start_time
+                )
+            
             # Extract blocks from file
-            processor_result = await processor.process_file(file_path)
+            processor_result = await self._run_processor(processor, file_path)
             if not processor_result.success:
                 raise ProcessingError(
                     error_type="ProcessingError",
@@ -529,10 +585,192 @@ class FileProcessor:
         logger.debug(f"Selected processor {type(processor).__name__} for file {file_path}")
         return processor
     
+    async def _run_processor(self, processor: BaseProcessor, file_path: str) -> ProcessorResult:
+        """
+        Run processor on file, in the processor executor if configured.
+        
+        Args:
+            processor (BaseProcessor): Processor selected for the file.
+            file_path (str): Path to file to process.
+        
+        Returns:
+            ProcessorResult: Result of processing.
+        """
+        if self.processor_executor is not None:
+            return await self.processor_executor.process_file(processor, file_path)
+        
+        result = processor.process_file(file_path)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    
+    def _should_stream(self, processor: BaseProcessor, file_size: int) -> bool:
+        """
+        Check whether a file is extracted and stored in batches.
+        
+        Args:
+            processor (BaseProcessor): Processor selected for the file.
+            file_size (int): File size in bytes.
+        
+        Returns:
+            bool: True if the processor can stream and the file is larger
+                than stream_threshold_bytes or than the processor accepts
+                for process_file().
+        """
+        if not isinstance(processor, BaseProcessor) or not processor.supports_streaming:
+            return False
+        return file_size > min(self.stream_threshold_bytes, processor.max_file_size_bytes)
+    
+    async def _process_file_streaming(
+        self,
+        processor: BaseProcessor,
+        file_path: str,
+        file_size: int,
+        processing_id: str,
+        start_time: datetime
+    ) -> FileProcessingResult:
+        """
+        Process a large file with bounded memory.
+        
+        Stores the chunks with _store_file_stream() and records the file
+        like process_file(). Blocks are not kept, so the result has no
+        blocks; counts are in its processing_metadata. Errors propagate
+        to process_file(), which records the failure.
+        
+        Args:
+            processor (BaseProcessor): Streaming processor for the file.
+            file_path (str): Path to the file.
+            file_size (int): File size in bytes.
+            processing_id (str): File processing logger identifier.
+            start_time (datetime): When processing of the file started.
+        
+        Returns:
+            FileProcessingResult: Completed result without blocks.
+        
+        Raises:
+            ProcessingError: If chunks cannot be stored
+        """
+        block_count, chunk_ids = await self._store_file_stream(processor, file_path)
+        counts = {"blocks_extracted": block_count, "chunks_created": len(chunk_ids)}
+        
+        try:
+            file_stat = Path(file_path).stat()
+            file_info = FileInfo(
+                file_path=file_path,
+                file_size=file_stat.st_size,
+                modification_time=datetime.fromtimestamp(file_stat.st_mtime),
+                processing_status="completed"
+            )
+            await self.database_manager.create_file_record(
+                file_path=file_path,
+                file_info=file_info,
+                metadata={"chunks_created": len(chunk_ids), "blocks_count": block_count}
+            )
+        except Exception:
+            if chunk_ids:
+                await self._rollback_chunks(chunk_ids)
+            raise
+        
+        processing_time = (datetime.now() - start_time).total_seconds()
+        logger.info(
+            f"Successfully streamed file {file_path}: {block_count} blocks -> "
+            f"{len(chunk_ids)} chunks in {processing_time:.2f}s"
+        )
+        
+        file_processing_logger.log_processing_end(
+            processing_id=processing_id,
+            file_path=file_path,
+            success=True,
+            processing_time=processing_time,
+            chunks_created=len(chunk_ids),
+            additional_data=dict(counts, streamed=True)
+        )
+        
+        return FileProcessingResult(
+            file_path=file_path,
+            blocks=[],
+            processing_status=ProcessingStatus.COMPLETED,
+            processing_time_seconds=processing_time,
+            error_message=None,
+            processing_metadata=dict(counts, streamed=True),
+            file_size_bytes=file_size
+        )
+    
+    async def _store_file_stream(self, processor: BaseProcessor, file_path: str) -> Tuple[int, List[str]]:
+        """
+        Extract, chunk and store a file in batches of stream_batch_size blocks.
+        
+        Blocks are pulled from processor.iter_file_blocks() in a worker
+        thread, and each batch is chunked and stored with bulk requests
+        before the next one is read, so only one batch of blocks and
+        chunks is held in memory; of earlier batches only the chunk IDs
+        are kept, for rollback. Streaming does not use the processor
+        executor, since the block iterator cannot leave this process. If
+        a batch fails, every chunk stored for the file is rolled back.
+        
+        Args:
+            processor (BaseProcessor): Streaming processor for the file.
+            file_path (str): Path to the file.
+        
+        Returns:
+            Tuple[int, List[str]]: Number of blocks extracted and IDs of
+                the stored chunks.
+        
+        Raises:
+            ProcessingError: If a batch cannot be stored
+        """
+        loop = asyncio.get_running_loop()
+        # Validation and encoding detection read the file, keep them off the loop
+        blocks = await loop.run_in_executor(None, processor.iter_file_blocks, file_path)
+        metadata = self.metadata_extractor.extract_metadata(file_path)
+        block_count = 0
+        stored_chunk_ids: List[str] = []
+        
+        try:
+            while True:
+                batch = await loop.run_in_executor(None, self._next_block_batch, blocks)
+                if not batch:
+                    break
+                
+                chunks = self._create_chunks_from_blocks(batch, metadata, start_index=block_count)
+                block_count += len(batch)
+                
+                # Failed batch is rolled back by _store_chunks_bulk
+                if not await self._store_chunks_bulk(chunks):
+                    raise ProcessingError(
+                        error_type="StorageError",
+                        error_message=f"Failed to store chunks for file: {file_path}",
+                        error_category=ErrorCategory.DATABASE
+                    )
+                stored_chunk_ids.extend(chunk["chunk_id"] for chunk in chunks)
+        except Exception:
+            if stored_chunk_ids:
+                await self._rollback_chunks(stored_chunk_ids)
+            raise
+        finally:
+            if hasattr(blocks, "close"):
+                blocks.close()
+        
+        return block_count, stored_chunk_ids
+    
+    def _next_block_batch(self, blocks: Iterator[ProcessingBlock]) -> List[ProcessingBlock]:
+        """
+        Take the next batch of blocks from a block iterator.
+        
+        Args:
+            blocks (Iterator[ProcessingBlock]): Iterator from iter_file_blocks().
+        
+        Returns:
+            List[ProcessingBlock]: Up to stream_batch_size blocks, empty
+                when the iterator is exhausted.
+        """
+        return list(itertools.islice(blocks, self.stream_batch_size))
+    
     def _create_chunks_from_blocks(
         self, 
         blocks: List[ProcessingBlock], 
-        metadata: Dict[str, Any]
+        metadata: Dict[str, Any],
+        start_index: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Create chunks from processing blocks with metadata.
@@ -551,13 +789,16 @@ class FileProcessor:
                 Must be list of valid ProcessingBlock instances.
             metadata (Dict[str, Any]): Minimal metadata for chunks.
                 Must contain source_path, source_id, and status.
+            start_index (int): Index in the file of the first block, for
+                blocks extracted in batches. Defaults to 0.
         
         Returns:
             List[Dict[str, Any]]: List of chunk dictionaries ready for vector storage.
                 Each chunk has content, chunk_id, and metadata fields.
         
         Raises:
-            ValueError: If blocks is empty or metadata is invalid
+            ValueError: If blocks is empty, metadata is invalid or a mapped
+                source changed since it was mapped
             TypeError: If blocks contains invalid ProcessingBlock instances
         
         Example:
@@ -579,6 +820,11 @@ class FileProcessor:
             if key not in metadata:
                 raise ValueError(f"metadata must contain key: {key}")
         
+        # Mapped sources are checked for changes once per batch
+        ProcessingBlock.validate_sources(
+            block for block in blocks if isinstance(block, ProcessingBlock)
+        )
+        
         chunks = []
         
         for i, block in enumerate(blocks):
@@ -594,7 +840,11 @@ class FileProcessor:
                     "source_id": metadata["source_id"],
                     "status": metadata["status"],
                     "block_type": block.block_type,
-                    "block_index": i,
+                    "block_index": start_index + i,
+                    "start_line": block.start_line,
+                    "end_line": block.end_line,
+                    "start_char": block.start_char,
+                    "end_char": block.end_char,
                     "block_metadata": block.metadata or {}
                 }
             }
@@ -613,6 +863,8 @@ class FileProcessor:
         
         Stores all chunks in a single atomic transaction. If any chunk
         fails to store, all chunks are rolled back to maintain consistency.
+        When bulk_storage is enabled, chunks are sent in adapter-sized
+        batches via _store_chunks_bulk.
         
         Args:
             chunks (List[Dict[str, Any]]): Chunks to store in vector database.
@@ -637,6 +889,9 @@ class FileProcessor:
         if not isinstance(chunks, list):
             raise ValueError("chunks must be a list")
         
+        if self.bulk_storage:
+            return await self._store_chunks_bulk(chunks)
+        
         stored_chunk_ids = []
         
         try:
@@ -677,6 +932,94 @@ class FileProcessor:
                 await self._rollback_chunks(stored_chunk_ids)
             return False
     
+    async def _store_chunks_bulk(
+        self,
+        chunks: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Store chunks in vector database using batched requests.
+        
+        Hands all chunks of a file to the vector store in batches sized by
+        the adapter batch_size. Reports per-chunk failures and rolls back
+        every stored chunk if any chunk fails, keeping the same
+        all-or-nothing guarantee as per-chunk storage. If an embedding
+        client is configured, embeddings are computed before storage.
+        
+        Args:
+            chunks (List[Dict[str, Any]]): Chunks to store in vector database.
+                Must be list of valid chunk dictionaries from one file.
+        
+        Returns:
+            bool: True if all chunks stored successfully, False otherwise.
+        
+        Example:
+            >>> processor.bulk_storage = True
+            >>> success = await processor._store_chunks_bulk(chunks)
+        """
+        for chunk in chunks:
+            if not isinstance(chunk, dict):
+                raise ValueError("Each chunk must be a dictionary")
+            
+            for key in ["chunk_id", "content", "metadata"]:
+                if key not in chunk:
+                    raise ValueError(f"Chunk missing required key: {key}")
+        
+        first_metadata = chunks[0]["metadata"]
+        stored_chunk_ids = []
+        
+        try:
+            # Chunks may already carry embeddings from the pipeline embed stage
+            if self.embedding_client is not None and not all("embedding" in chunk for chunk in chunks):
+                await self._attach_embeddings(chunks)
+            
+            result = await self.vector_store.create_chunks_bulk(
+                chunks=chunks,
+                file_path=first_metadata.get("source_path", ""),
+                source_id=first_metadata.get("source_id")
+            )
+            stored_chunk_ids = result.get("stored_chunk_ids", [])
+            
+            if not result.get("success", False):
+                errors = result.get("errors", {})
+                for chunk_id in result.get("failed_chunk_ids", []):
+                    logger.error(f"Failed to store chunk {chunk_id}: {errors.get(chunk_id, 'unknown error')}")
+                if stored_chunk_ids:
+                    await self._rollback_chunks(stored_chunk_ids)
+                return False
+            
+            logger.info(
+                f"Successfully stored {len(chunks)} chunks atomically "
+                f"in {result.get('batch_count', 0)} batches"
+            )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error storing chunks in bulk: {e}")
+            if stored_chunk_ids:
+                await self._rollback_chunks(stored_chunk_ids)
+            return False
+    
+    async def _attach_embeddings(self, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Compute embeddings for chunks through the embedding client.
+        
+        All chunk texts of the file are submitted at once, so a shared
+        EmbeddingBatcher can merge them with texts from other files.
+        Each chunk dictionary gets an "embedding" key.
+        
+        Args:
+            chunks (List[Dict[str, Any]]): Chunks to embed.
+                Must be list of valid chunk dictionaries.
+        
+        Raises:
+            ProcessingError: If embedding generation fails
+        """
+        embeddings = await self.embedding_client.embed_texts(
+            [chunk["content"] for chunk in chunks]
+        )
+        for chunk, embedding in zip(chunks, embeddings):
+            chunk["embedding"] = embedding
+    
     async def _rollback_chunks(
         self, 
         chunk_ids: List[str]
@@ -710,6 +1053,17 @@ class FileProcessor:
         if not isinstance(chunk_ids, list):
             raise ValueError("chunk_ids must be a list")
         
+        if self.bulk_storage:
+            try:
+                logger.info(f"Starting bulk rollback of {len(chunk_ids)} chunks")
+                success = await self.vector_store.delete_chunks(chunk_ids)
+                if not success:
+                    logger.error(f"Bulk rollback of {len(chunk_ids)} chunks reported failures")
+                return success
+            except Exception as e:
+                logger.error(f"Error during bulk rollback operation: {e}")
+                return False
+        
         rollback_failures = []
         
         try:
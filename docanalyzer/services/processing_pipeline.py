@@ -0,0 +1,705 @@
+"""
+Processing Pipeline - Staged File Processing Engine
+
+Provides a staged alternative to FileProcessor.process_file where every
+processing step runs in its own pool of workers:
+
+    read -> parse -> chunk -> embed -> store -> record
+
+Stages are connected by bounded asyncio queues. A slow stage fills its
+input queue and the stages before it block on put(), which provides
+backpressure instead of unbounded buffering. Blocking stages (file
+reading and parsing) run in a thread pool so they do not stall the event
+loop used by network-bound stages.
+
+Each stage reports its queue depth, number of processed and failed
+items, busy time and throughput, so stages can be sized separately.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable, Iterable, AsyncIterable, Awaitable, Union
+
+from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+from docanalyzer.models.errors import ProcessingError, ErrorCategory
+from docanalyzer.services.file_processor import FileProcessor
+from docanalyzer.utils.file_processing_logger import file_processing_logger
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_WORKERS = 4
+DEFAULT_PARSE_WORKERS = os.cpu_count() or 2
+DEFAULT_CHUNK_WORKERS = 1
+DEFAULT_EMBED_WORKERS = 4
+DEFAULT_STORE_WORKERS = 4
+DEFAULT_RECORD_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 64
+
+STAGE_NAMES = ["read", "parse", "chunk", "embed", "store", "record"]
+
+_STOP = object()
+
+
+class PipelineConfig:
+    """
+    Configuration for staged processing pipeline.
+
+    Contains worker counts of every stage and capacity of queues
+    between stages.
+
+    Attributes:
+        read_workers (int): Workers reading files. Defaults to 4.
+        parse_workers (int): Workers running BaseProcessor parsing.
+            Defaults to number of CPUs.
+        chunk_workers (int): Workers creating chunks. Defaults to 1.
+        embed_workers (int): Workers requesting embeddings. Defaults to 4.
+        store_workers (int): Workers writing to vector store. Defaults to 4.
+        record_workers (int): Workers updating database records. Defaults to 2.
+        queue_size (int): Capacity of each queue between stages.
+            Defaults to 64.
+    """
+
+    def __init__(
+        self,
+        read_workers: int = DEFAULT_READ_WORKERS,
+        parse_workers: int = DEFAULT_PARSE_WORKERS,
+        chunk_workers: int = DEFAULT_CHUNK_WORKERS,
+        embed_workers: int = DEFAULT_EMBED_WORKERS,
+        store_workers: int = DEFAULT_STORE_WORKERS,
+        record_workers: int = DEFAULT_RECORD_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE
+    ):
+        """
+        Initialize PipelineConfig instance.
+
+        Args:
+            read_workers (int): Workers reading files.
+                Must be positive integer. Defaults to 4.
+            parse_workers (int): Workers parsing file content.
+                Must be positive integer. Defaults to number of CPUs.
+            chunk_workers (int): Workers creating chunks.
+                Must be positive integer. Defaults to 1.
+            embed_workers (int): Workers requesting embeddings.
+                Must be positive integer. Defaults to 4.
+            store_workers (int): Workers writing to vector store.
+                Must be positive integer. Defaults to 4.
+            record_workers (int): Workers updating database records.
+                Must be positive integer. Defaults to 2.
+            queue_size (int): Capacity of each queue between stages.
+                Must be positive integer. Defaults to 64.
+
+        Raises:
+            ValueError: If any parameter is not positive
+        """
+        workers = {
+            "read_workers": read_workers,
+            "parse_workers": parse_workers,
+            "chunk_workers": chunk_workers,
+            "embed_workers": embed_workers,
+            "store_workers": store_workers,
+            "record_workers": record_workers,
+            "queue_size": queue_size
+        }
+        for name, value in workers.items():
+            if value <= 0:
+                raise ValueError(f"{name} must be positive")
+
+        self.read_workers = read_workers
+        self.parse_workers = parse_workers
+        self.chunk_workers = chunk_workers
+        self.embed_workers = embed_workers
+        self.store_workers = store_workers
+        self.record_workers = record_workers
+        self.queue_size = queue_size
+
+    def get_workers(self, stage_name: str) -> int:
+        """
+        Get worker count of a stage.
+
+        Args:
+            stage_name (str): Stage name from STAGE_NAMES.
+
+        Returns:
+            int: Number of workers for the stage.
+        """
+        return getattr(self, f"{stage_name}_workers")
+
+
+class PipelineItem:
+    """
+    Work item carried through pipeline stages for one file.
+
+    Attributes:
+        file_path (str): Path to the file.
+        processor (Optional[BaseProcessor]): Processor selected for the file.
+        content (Optional[str]): File content read by the read stage.
+        blocks (List[ProcessingBlock]): Blocks extracted by the parse stage.
+        chunks (List[Dict[str, Any]]): Chunks created by the chunk stage.
+        stored_chunk_ids (List[str]): Chunks written to vector store.
+        streamed (bool): Whether the file is extracted and stored in
+            batches by the store stage instead of parsed whole.
+        streamed_blocks (int): Blocks extracted from a streamed file.
+        error (Optional[Exception]): First error raised by any stage.
+        processing_id (Optional[str]): File processing logger identifier.
+        start_time (datetime): When the item entered the pipeline.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize PipelineItem instance.
+
+        Args:
+            file_path (str): Path to the file.
+        """
+        self.file_path = file_path
+        self.processor = None
+        self.content: Optional[str] = None
+        self.blocks: List[Any] = []
+        self.chunks: List[Dict[str, Any]] = []
+        self.stored_chunk_ids: List[str] = []
+        self.streamed = False
+        self.streamed_blocks = 0
+        self.error: Optional[Exception] = None
+        self.processing_id: Optional[str] = None
+        self.start_time = datetime.now()
+
+
+class PipelineStage:
+    """
+    One pipeline stage with its worker pool and input queue.
+
+    Workers take items from the input queue, run the handler and put
+    items on the output queue. Items that already failed in an earlier
+    stage are passed on without running the handler, except in stages
+    created with handle_failed=True.
+
+    Attributes:
+        name (str): Stage name.
+        workers (int): Number of workers.
+        input_queue (asyncio.Queue): Bounded queue feeding the stage.
+        processed (int): Items handled successfully.
+        failed (int): Items whose handler raised an error.
+        busy_seconds (float): Total time spent in handler by all workers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[PipelineItem], Awaitable[None]],
+        workers: int,
+        queue_size: int,
+        handle_failed: bool = False
+    ):
+        """
+        Initialize PipelineStage instance.
+
+        Args:
+            name (str): Stage name.
+            handler (Callable[[PipelineItem], Awaitable[None]]): Coroutine
+                function processing one item in place.
+            workers (int): Number of workers.
+            queue_size (int): Capacity of the input queue.
+            handle_failed (bool): Whether handler also receives failed items.
+                Defaults to False.
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.handle_failed = handle_failed
+        self.input_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.output_queue: Optional[asyncio.Queue] = None
+        self.next_stage_workers = 0
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._active_workers = 0
+
+    def start(self) -> List[asyncio.Task]:
+        """
+        Start stage workers.
+
+        Returns:
+            List[asyncio.Task]: Worker tasks.
+        """
+        self.started_at = time.monotonic()
+        self._active_workers = self.workers
+        return [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def _work(self) -> None:
+        """
+        Worker loop of the stage.
+
+        Stops on stop marker. The last worker to stop forwards one stop
+        marker per worker of the next stage.
+        """
+        while True:
+            item = await self.input_queue.get()
+            if item is _STOP:
+                break
+
+            if item.error is None or self.handle_failed:
+                started = time.monotonic()
+                try:
+                    await self.handler(item)
+                    self.processed += 1
+                except Exception as e:
+                    self.failed += 1
+                    if item.error is None:
+                        item.error = e
+                    logger.debug(f"Pipeline stage {self.name} failed for {item.file_path}: {e}")
+                finally:
+                    self.busy_seconds += time.monotonic() - started
+
+            if self.output_queue is not None:
+                await self.output_queue.put(item)
+
+        self._active_workers -= 1
+        if self._active_workers == 0:
+            self.finished_at = time.monotonic()
+            if self.output_queue is not None:
+                for _ in range(self.next_stage_workers):
+                    await self.output_queue.put(_STOP)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get stage statistics.
+
+        Returns:
+            Dict[str, Any]: Worker count, queue depth and capacity,
+                processed and failed counts, busy time, worker utilization
+                and throughput in items per second.
+        """
+        elapsed = 0.0
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.monotonic()) - self.started_at
+
+        return {
+            "workers": self.workers,
+            "queue_depth": self.input_queue.qsize(),
+            "queue_capacity": self.input_queue.maxsize,
+            "processed": self.processed,
+            "failed": self.failed,
+            "busy_seconds": self.busy_seconds,
+            "utilization": self.busy_seconds / (elapsed * self.workers) if elapsed > 0 else 0.0,
+            "throughput_per_second": self.processed / elapsed if elapsed > 0 else 0.0
+        }
+
+
+class ProcessingPipeline:
+    """
+    Processing Pipeline - Staged file processing with backpressure.
+
+    Runs the same steps as FileProcessor.process_file - read, parse,
+    chunk, embed, store and database record - as separate stages with
+    their own workers. Uses the processors, metadata extractor, storage
+    settings and embedding client of the given FileProcessor.
+
+    Attributes:
+        file_processor (FileProcessor): Processor providing components and settings.
+        config (PipelineConfig): Stage worker counts and queue size.
+        stages (List[PipelineStage]): Stages of the last or current run.
+
+    Example:
+        >>> pipeline = ProcessingPipeline(file_processor, PipelineConfig(parse_workers=8))
+        >>> results = await pipeline.run(["/docs/a.md", "/docs/b.txt"])
+        >>> print(pipeline.get_statistics()["embed"]["queue_depth"])
+    """
+
+    def __init__(
+        self,
+        file_processor: FileProcessor,
+        config: Optional[PipelineConfig] = None
+    ):
+        """
+        Initialize ProcessingPipeline instance.
+
+        Args:
+            file_processor (FileProcessor): File processor providing
+                processors, storage and database components.
+            config (Optional[PipelineConfig]): Pipeline configuration.
+                Defaults to PipelineConfig().
+
+        Raises:
+            TypeError: If file_processor is not FileProcessor instance
+        """
+        if not isinstance(file_processor, FileProcessor):
+            raise TypeError("file_processor must be FileProcessor instance")
+
+        self.file_processor = file_processor
+        self.config = config or PipelineConfig()
+        self.stages: List[PipelineStage] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def run(
+        self,
+        file_paths: Union[Iterable[str], AsyncIterable[str]],
+        result_callback: Optional[Callable[[FileProcessingResult], None]] = None
+    ) -> List[FileProcessingResult]:
+        """
+        Process files through all stages.
+
+        Files are fed to the read stage as queue capacity allows, so
+        at most queue_size items wait in front of any stage.
+
+        Args:
+            file_paths (Union[Iterable[str], AsyncIterable[str]]): Paths of
+                files to process. An async iterable, such as a streaming
+                directory scan, is consumed as the read stage accepts items.
+            result_callback (Optional[Callable[[FileProcessingResult], None]]):
+                Called with each result as soon as its file leaves the
+                last stage. Results are then not collected, so memory
+                does not grow with the number of files. Defaults to None.
+
+        Returns:
+            List[FileProcessingResult]: Results in completion order, or an
+                empty list if result_callback is given. Results carry
+                block and chunk counts in processing_metadata instead of
+                the stored blocks.
+        """
+        results: List[FileProcessingResult] = []
+        recorded_count = 0
+
+        async def collect(item: PipelineItem) -> None:
+            try:
+                result = await self._record(item)
+            except Exception as e:
+                # Every file gets a result, even if recording it fails
+                error_message = f"Error recording file {item.file_path}: {str(e)}"
+                logger.error(error_message)
+                result = FileProcessingResult(
+                    file_path=item.file_path,
+                    blocks=[],
+                    processing_status=ProcessingStatus.FAILED,
+                    processing_time_seconds=(datetime.now() - item.start_time).total_seconds(),
+                    error_message=error_message
+                )
+            nonlocal recorded_count
+            recorded_count += 1
+            if result_callback is not None:
+                result_callback(result)
+            else:
+                results.append(result)
+
+        handlers = [self._read, self._parse, self._chunk, self._embed, self._store, collect]
+        self.stages = [
+            PipelineStage(
+                name,
+                handler,
+                self.config.get_workers(name),
+                self.config.queue_size,
+                handle_failed=(name == "record")
+            )
+            for name, handler in zip(STAGE_NAMES, handlers)
+        ]
+        for stage, next_stage in zip(self.stages, self.stages[1:]):
+            stage.output_queue = next_stage.input_queue
+            stage.next_stage_workers = next_stage.workers
+
+        blocking_workers = self.config.read_workers + self.config.parse_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=blocking_workers,
+            thread_name_prefix="pipeline"
+        )
+
+        tasks: List[asyncio.Task] = []
+        try:
+            for stage in self.stages:
+                tasks.extend(stage.start())
+
+            first_queue = self.stages[0].input_queue
+            source_error: Optional[Exception] = None
+            try:
+                if isinstance(file_paths, AsyncIterable):
+                    async for file_path in file_paths:
+                        await first_queue.put(PipelineItem(file_path))
+                else:
+                    for file_path in file_paths:
+                        await first_queue.put(PipelineItem(file_path))
+            except Exception as e:
+                # Finish files already fed before reporting the source failure
+                source_error = e
+            for _ in range(self.stages[0].workers):
+                await first_queue.put(_STOP)
+
+            await asyncio.gather(*tasks)
+            if source_error is not None:
+                raise source_error
+        finally:
+            # Stage workers block on their queues if run() is cancelled
+            # or feeding fails with a BaseException
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        logger.info(
+            f"Pipeline processed {recorded_count} files: "
+            + ", ".join(
+                f"{stage.name}={stage.get_statistics()['throughput_per_second']:.1f}/s"
+                for stage in self.stages
+            )
+        )
+        return results
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-stage statistics.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics by stage name, see
+                PipelineStage.get_statistics().
+        """
+        return {stage.name: stage.get_statistics() for stage in self.stages}
+
+    async def _run_blocking(self, func: Callable, *args) -> Any:
+        """
+        Run blocking function in the pipeline thread pool.
+
+        Args:
+            func (Callable): Function to run.
+            *args: Function arguments.
+
+        Returns:
+            Any: Function result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _read(self, item: PipelineItem) -> None:
+        """
+        Read stage: validate file, select processor and read content.
+
+        Args:
+            item (PipelineItem): Item to update.
+        """
+        path = Path(item.file_path)
+        stat = await self._run_blocking(os.stat, item.file_path)
+
+        item.processing_id = file_processing_logger.log_processing_start(
+            file_path=item.file_path,
+            file_size=stat.st_size,
+            file_type=path.suffix.lower().lstrip('.') or "unknown"
+        )
+
+        item.processor = self.file_processor._get_processor(item.file_path)
+        if self.file_processor._should_stream(item.processor, stat.st_size):
+            # Large files are read batch by batch in the store stage
+            item.streamed = True
+        elif item.processor.supports_content_processing:
+            item.content = await self._run_blocking(item.processor.read_file, item.file_path)
+
+    async def _parse(self, item: PipelineItem) -> None:
+        """
+        Parse stage: extract blocks with the file processor.
+
+        Uses the file processor's ProcessorExecutor when configured,
+        otherwise the pipeline thread pool.
+
+        Args:
+            item (PipelineItem): Item to update.
+
+        Raises:
+            ProcessingError: If processor reports failure
+        """
+        if item.streamed:
+            return
+        
+        processor_executor = self.file_processor.processor_executor
+        if item.content is not None:
+            if processor_executor is not None:
+                result = await processor_executor.process_content(item.processor, item.content, item.file_path)
+            else:
+                result = await self._run_blocking(item.processor.process_content, item.content, item.file_path)
+            item.content = None
+        elif processor_executor is not None:
+            result = await processor_executor.process_file(item.processor, item.file_path)
+        else:
+            result = await self._run_blocking(item.processor.process_file, item.file_path)
+
+        if not result.success:
+            raise ProcessingError(
+                error_type="ProcessingError",
+                error_message=f"Failed to process file: {result.error_message}",
+                error_category=ErrorCategory.PROCESSING
+            )
+
+        item.blocks = result.blocks
+
+    async def _chunk(self, item: PipelineItem) -> None:
+        """
+        Chunk stage: create chunks with minimal metadata.
+
+        Args:
+            item (PipelineItem): Item to update.
+        """
+        if item.streamed:
+            return
+        if not item.blocks:
+            logger.warning(f"No blocks extracted from file: {item.file_path}")
+            return
+
+        metadata = self.file_processor.metadata_extractor.extract_metadata(item.file_path)
+        item.chunks = self.file_processor._create_chunks_from_blocks(item.blocks, metadata)
+
+    async def _embed(self, item: PipelineItem) -> None:
+        """
+        Embed stage: compute chunk embeddings when the file processor
+        stores chunks in bulk with an embedding client.
+
+        Args:
+            item (PipelineItem): Item to update.
+        """
+        processor = self.file_processor
+        if item.chunks and processor.bulk_storage and processor.embedding_client is not None:
+            await processor._attach_embeddings(item.chunks)
+
+    async def _store(self, item: PipelineItem) -> None:
+        """
+        Store stage: write chunks to vector store atomically.
+
+        Streamed files are extracted, chunked, embedded and stored here
+        in batches with bounded memory.
+
+        Args:
+            item (PipelineItem): Item to update.
+
+        Raises:
+            ProcessingError: If chunks cannot be stored
+        """
+        if item.streamed:
+            item.streamed_blocks, item.stored_chunk_ids = await self.file_processor._store_file_stream(
+                item.processor, item.file_path
+            )
+            return
+
+        if not item.chunks:
+            return
+
+        item.stored_chunk_ids = [chunk["chunk_id"] for chunk in item.chunks]
+        if not await self.file_processor._store_chunks_atomic(item.chunks):
+            raise ProcessingError(
+                error_type="StorageError",
+                error_message=f"Failed to store chunks for file: {item.file_path}",
+                error_category=ErrorCategory.DATABASE
+            )
+
+    async def _record(self, item: PipelineItem) -> FileProcessingResult:
+        """
+        Record stage: update database record and build file result.
+
+        Failed items are rolled back and recorded as failed, matching
+        FileProcessor.process_file.
+
+        Args:
+            item (PipelineItem): Item leaving the pipeline.
+
+        Returns:
+            FileProcessingResult: Result for the file.
+        """
+        from docanalyzer.models.file_system import FileInfo
+
+        database_manager = self.file_processor.database_manager
+        if item.streamed:
+            block_count, chunk_count = item.streamed_blocks, len(item.stored_chunk_ids)
+        else:
+            block_count, chunk_count = len(item.blocks), len(item.chunks)
+
+        if item.error is None and chunk_count:
+            try:
+                stat = os.stat(item.file_path)
+                file_info = FileInfo(
+                    file_path=item.file_path,
+                    file_size=stat.st_size,
+                    modification_time=datetime.fromtimestamp(stat.st_mtime),
+                    processing_status="completed"
+                )
+                await database_manager.create_file_record(
+                    file_path=item.file_path,
+                    file_info=file_info,
+                    metadata={"chunks_created": chunk_count, "blocks_count": block_count}
+                )
+            except Exception as e:
+                item.error = e
+
+        processing_time = (datetime.now() - item.start_time).total_seconds()
+
+        if item.error is None:
+            if item.processing_id:
+                file_processing_logger.log_processing_end(
+                    processing_id=item.processing_id,
+                    file_path=item.file_path,
+                    success=True,
+                    processing_time=processing_time,
+                    chunks_created=chunk_count,
+                    additional_data={
+                        "blocks_extracted": block_count,
+                        "chunks_created": chunk_count
+                    }
+                )
+
+            # Stored blocks are not kept, they may hold memory-mapped files open
+            processing_metadata = {"blocks_extracted": block_count, "chunks_created": chunk_count}
+            if item.streamed:
+                processing_metadata["streamed"] = True
+            return FileProcessingResult(
+                file_path=item.file_path,
+                blocks=[],
+                processing_status=ProcessingStatus.COMPLETED,
+                processing_time_seconds=processing_time,
+                error_message=None,
+                processing_metadata=processing_metadata
+            )
+
+        error_message = f"Error processing file {item.file_path}: {str(item.error)}"
+        logger.error(error_message)
+
+        if item.processing_id:
+            file_processing_logger.log_processing_error(
+                processing_id=item.processing_id,
+                file_path=item.file_path,
+                error_type=type(item.error).__name__,
+                error_message=error_message,
+                additional_data={
+                    "processing_time_seconds": processing_time,
+                    "chunks_stored": len(item.stored_chunk_ids)
+                }
+            )
+
+        if item.stored_chunk_ids:
+            await self.file_processor._rollback_chunks(item.stored_chunk_ids)
+
+        try:
+            file_info = FileInfo(
+                file_path=item.file_path,
+                file_size=0,
+                modification_time=datetime.now(),
+                processing_status="failed"
+            )
+            await database_manager.create_file_record(
+                file_path=item.file_path,
+                file_info=file_info,
+                metadata={"error": error_message}
+            )
+        except Exception as db_error:
+            logger.error(f"Failed to record error in database: {db_error}")
+
+        return FileProcessingResult(
+            file_path=item.file_path,
+            blocks=[],
+            processing_status=ProcessingStatus.FAILED,
+            processing_time_seconds=processing_time,
+            error_message=error_message
+        )
@@ -0,0 +1,516 @@
+"""
+Scan Manifest - Persistent Record of Scanned Files
+
+Provides an on-disk manifest of the files found by previous directory
+scans. For every file it stores path, device, inode, size, modification
+time in nanoseconds and a content digest in a local SQLite file, and
+the modification time of every directory that was listed. Streaming
+scans also record a checkpoint, the last file handled, so an
+interrupted scan can resume where it stopped.
+
+Incremental scans compare a fresh stat walk with the manifest and report
+only created, modified, deleted and moved files, so unchanged documents
+are neither read nor reprocessed.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from docanalyzer.models.file_system import FileInfo
+from docanalyzer.utils.file_utils import get_file_digest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST_PATH = "./data/scan_manifest.sqlite"
+# Stays below SQLite's limit on bound parameters per statement
+LOOKUP_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS manifest (
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT,
+    PRIMARY KEY (root, path)
+);
+CREATE TABLE IF NOT EXISTS directories (
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    PRIMARY KEY (root, path)
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    root TEXT PRIMARY KEY,
+    path TEXT NOT NULL
+);
+"""
+
+
+def digest_file(file_path: str) -> str:
+    """
+    Compute content digest of a file.
+
+    Reads the file in chunks so memory use does not depend on file size.
+    See get_file_digest.
+
+    Args:
+        file_path (str): Path to file.
+
+    Returns:
+        str: Hex BLAKE2b digest of file content.
+
+    Raises:
+        OSError: If file cannot be read
+    """
+    return get_file_digest(file_path)
+
+
+@dataclass
+class ManifestEntry:
+    """
+    Manifest Entry - Recorded state of one file.
+
+    Attributes:
+        path (str): Absolute file path.
+        device (int): Device number (st_dev).
+        inode (int): Inode number (st_ino).
+        size (int): File size in bytes.
+        mtime_ns (int): Modification time in nanoseconds.
+        digest (Optional[str]): Content digest, None if not computed.
+    """
+    path: str
+    device: int
+    inode: int
+    size: int
+    mtime_ns: int
+    digest: Optional[str] = None
+
+    @classmethod
+    def from_stat(cls, path: str, stat_result: os.stat_result, digest: Optional[str] = None) -> "ManifestEntry":
+        """
+        Create entry from stat data.
+
+        Args:
+            path (str): File path.
+            stat_result (os.stat_result): Stat data of the file.
+            digest (Optional[str]): Content digest. Defaults to None.
+
+        Returns:
+            ManifestEntry: New entry.
+        """
+        return cls(
+            path=path,
+            device=stat_result.st_dev,
+            inode=stat_result.st_ino,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            digest=digest
+        )
+
+    def matches(self, other: "ManifestEntry") -> bool:
+        """
+        Check whether stat data of other entry is unchanged.
+
+        Args:
+            other (ManifestEntry): Entry built from a fresh stat.
+
+        Returns:
+            bool: True if inode, size and modification time are equal.
+        """
+        return (
+            self.inode == other.inode
+            and self.size == other.size
+            and self.mtime_ns == other.mtime_ns
+        )
+
+
+def match_moves(
+    created: Dict[str, ManifestEntry],
+    deleted: Dict[str, ManifestEntry]
+) -> Dict[str, str]:
+    """
+    Pair new files with vanished files they were renamed from.
+
+    A new file is paired with a vanished file on the same device and
+    inode, which is what a rename leaves behind; otherwise with a
+    vanished file of the same content digest, which covers copies across
+    file systems and fresh checkouts. Content digests must be equal in
+    both cases, so files edited while being moved are not paired. Each
+    file is paired at most once.
+
+    Args:
+        created (Dict[str, ManifestEntry]): Entries of new files, by path.
+        deleted (Dict[str, ManifestEntry]): Recorded entries of files that
+            no longer exist, by path.
+
+    Returns:
+        Dict[str, str]: New path by previous path.
+    """
+    by_inode: Dict[Tuple[int, int], ManifestEntry] = {}
+    by_digest: Dict[str, List[ManifestEntry]] = {}
+    for entry in deleted.values():
+        if entry.digest is None:
+            continue
+        by_inode[(entry.device, entry.inode)] = entry
+        by_digest.setdefault(entry.digest, []).append(entry)
+
+    moves: Dict[str, str] = {}
+    unpaired: List[ManifestEntry] = []
+    for entry in created.values():
+        previous = by_inode.get((entry.device, entry.inode))
+        if (previous is not None and previous.digest == entry.digest
+                and previous.path not in moves):
+            moves[previous.path] = entry.path
+        elif entry.digest is not None:
+            unpaired.append(entry)
+
+    for entry in unpaired:
+        for previous in by_digest.get(entry.digest, ()):
+            if previous.path not in moves:
+                moves[previous.path] = entry.path
+                break
+
+    return moves
+
+
+@dataclass
+class ScanChanges:
+    """
+    Scan Changes - Result of an incremental scan.
+
+    Attributes:
+        directory_path (str): Scanned root directory.
+        created (List[FileInfo]): Files not present in the manifest.
+        modified (List[FileInfo]): Files whose content changed.
+        deleted (List[str]): Paths in the manifest that no longer exist.
+        moved (Dict[str, FileInfo]): Renamed or moved files with unchanged
+            content, by their previous path. Neither listed as created
+            nor as deleted.
+        unchanged_count (int): Number of files found unchanged.
+        entries (Dict[str, ManifestEntry]): New manifest entries for
+            created, modified, moved and touched-but-unchanged files,
+            by path.
+        directories (Optional[Dict[str, int]]): Modification times of
+            the directories walked, by path, replacing the recorded ones
+            on commit. None leaves recorded directories unchanged.
+    """
+    directory_path: str
+    created: List[FileInfo] = field(default_factory=list)
+    modified: List[FileInfo] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    moved: Dict[str, FileInfo] = field(default_factory=dict)
+    unchanged_count: int = 0
+    entries: Dict[str, ManifestEntry] = field(default_factory=dict)
+    directories: Optional[Dict[str, int]] = None
+
+    @property
+    def changed_files(self) -> List[FileInfo]:
+        """
+        Get created and modified files.
+
+        Returns:
+            List[FileInfo]: Files that need processing.
+        """
+        return self.created + self.modified
+
+    @property
+    def has_changes(self) -> bool:
+        """
+        Check whether any file was created, modified, deleted or moved.
+
+        Returns:
+            bool: True if there are changes.
+        """
+        return bool(self.created or self.modified or self.deleted or self.moved)
+
+    def record_moves(self, moves: Dict[str, str]) -> None:
+        """
+        Report files as moved instead of deleted and new.
+
+        Args:
+            moves (Dict[str, str]): New path by previous path, as returned
+                by match_moves. New paths must be in created or modified,
+                previous paths in deleted.
+        """
+        if not moves:
+            return
+
+        moved_to = {new_path: old_path for old_path, new_path in moves.items()}
+        for file_info in self.created + self.modified:
+            if file_info.file_path in moved_to:
+                self.moved[moved_to[file_info.file_path]] = file_info
+        self.created = [f for f in self.created if f.file_path not in moved_to]
+        self.modified = [f for f in self.modified if f.file_path not in moved_to]
+        self.deleted = [path for path in self.deleted if path not in moves]
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Get change counts.
+
+        Returns:
+            Dict[str, int]: Number of created, modified, deleted, moved
+                and unchanged files.
+        """
+        return {
+            "created": len(self.created),
+            "modified": len(self.modified),
+            "deleted": len(self.deleted),
+            "moved": len(self.moved),
+            "unchanged": self.unchanged_count
+        }
+
+
+class ScanManifest:
+    """
+    Scan Manifest - SQLite-backed record of scanned files.
+
+    Entries are grouped by scan root, so one manifest file can serve
+    several watched directories. The database is opened on first use.
+    Methods are blocking and thread-safe; async callers run them in an
+    executor.
+
+    Attributes:
+        manifest_path (str): Path to the SQLite manifest file.
+
+    Example:
+        >>> manifest = ScanManifest("./data/scan_manifest.sqlite")
+        >>> entries = manifest.load("/docs")
+        >>> manifest.upsert("/docs", [ManifestEntry.from_stat(path, os.stat(path))])
+        >>> manifest.close()
+    """
+
+    def __init__(self, manifest_path: str = DEFAULT_MANIFEST_PATH):
+        """
+        Initialize ScanManifest instance.
+
+        Args:
+            manifest_path (str): Path to SQLite manifest file.
+                Defaults to "./data/scan_manifest.sqlite".
+
+        Raises:
+            ValueError: If manifest_path is empty
+        """
+        if not manifest_path:
+            raise ValueError("manifest_path cannot be empty")
+
+        self.manifest_path = manifest_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def load(self, root: str) -> Dict[str, ManifestEntry]:
+        """
+        Load all entries recorded for a scan root.
+
+        Args:
+            root (str): Scan root directory.
+
+        Returns:
+            Dict[str, ManifestEntry]: Entries by file path.
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT path, device, inode, size, mtime_ns, digest FROM manifest WHERE root = ?",
+                (root,)
+            ).fetchall()
+        return {row[0]: ManifestEntry(*row) for row in rows}
+
+    def load_paths(self, root: str, paths: Iterable[str]) -> Dict[str, ManifestEntry]:
+        """
+        Load entries of specific files of a scan root.
+
+        Args:
+            root (str): Scan root directory.
+            paths (Iterable[str]): File paths to look up.
+
+        Returns:
+            Dict[str, ManifestEntry]: Recorded entries by file path; paths
+                without an entry are omitted.
+        """
+        paths = list(paths)
+        entries: Dict[str, ManifestEntry] = {}
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(paths), LOOKUP_BATCH_SIZE):
+                batch = paths[start:start + LOOKUP_BATCH_SIZE]
+                rows = connection.execute(
+                    "SELECT path, device, inode, size, mtime_ns, digest FROM manifest "
+                    f"WHERE root = ? AND path IN ({', '.join('?' * len(batch))})",
+                    (root, *batch)
+                ).fetchall()
+                entries.update((row[0], ManifestEntry(*row)) for row in rows)
+        return entries
+
+    def upsert(self, root: str, entries: Iterable[ManifestEntry]) -> None:
+        """
+        Insert or replace entries of a scan root.
+
+        Args:
+            root (str): Scan root directory.
+            entries (Iterable[ManifestEntry]): Entries to store.
+        """
+        rows = [
+            (root, e.path, e.device, e.inode, e.size, e.mtime_ns, e.digest)
+            for e in entries
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            connection.executemany(
+                "INSERT OR REPLACE INTO manifest "
+                "(root, path, device, inode, size, mtime_ns, digest) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            connection.commit()
+
+    def delete(self, root: str, paths: Iterable[str]) -> None:
+        """
+        Remove entries of a scan root.
+
+        Args:
+            root (str): Scan root directory.
+            paths (Iterable[str]): File paths to remove.
+        """
+        rows = [(root, path) for path in paths]
+        if not rows:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            connection.executemany("DELETE FROM manifest WHERE root = ? AND path = ?", rows)
+            connection.commit()
+
+    def load_directories(self, root: str) -> Dict[str, int]:
+        """
+        Load recorded directory modification times of a scan root.
+
+        Args:
+            root (str): Scan root directory.
+
+        Returns:
+            Dict[str, int]: Modification times in nanoseconds by directory path.
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT path, mtime_ns FROM directories WHERE root = ?",
+                (root,)
+            ).fetchall()
+        return dict(rows)
+
+    def replace_directories(self, root: str, directories: Dict[str, int]) -> None:
+        """
+        Replace recorded directory modification times of a scan root.
+
+        Args:
+            root (str): Scan root directory.
+            directories (Dict[str, int]): Modification times in
+                nanoseconds by directory path.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM directories WHERE root = ?", (root,))
+            connection.executemany(
+                "INSERT INTO directories (root, path, mtime_ns) VALUES (?, ?, ?)",
+                [(root, path, mtime_ns) for path, mtime_ns in directories.items()]
+            )
+            connection.commit()
+
+    def load_checkpoint(self, root: str) -> Optional[str]:
+        """
+        Load the scan checkpoint of a scan root.
+
+        Args:
+            root (str): Scan root directory.
+
+        Returns:
+            Optional[str]: Path of the last file handled by an unfinished
+                scan, or None if no scan of the root was interrupted.
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT path FROM checkpoints WHERE root = ?",
+                (root,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save_checkpoint(self, root: str, path: str) -> None:
+        """
+        Record the last file handled by a scan of a root.
+
+        Args:
+            root (str): Scan root directory.
+            path (str): Path of the last file handled.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (root, path) VALUES (?, ?)",
+                (root, path)
+            )
+            connection.commit()
+
+    def clear_checkpoint(self, root: str) -> None:
+        """
+        Remove the scan checkpoint of a scan root.
+
+        Args:
+            root (str): Scan root directory.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM checkpoints WHERE root = ?", (root,))
+            connection.commit()
+
+    def clear(self, root: str) -> None:
+        """
+        Remove all entries, directories and the checkpoint of a scan root.
+
+        Args:
+            root (str): Scan root directory.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM manifest WHERE root = ?", (root,))
+            connection.execute("DELETE FROM directories WHERE root = ?", (root,))
+            connection.execute("DELETE FROM checkpoints WHERE root = ?", (root,))
+            connection.commit()
+
+    def close(self) -> None:
+        """
+        Close the manifest database. Safe to call multiple times.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open manifest database on first use.
+
+        Returns:
+            sqlite3.Connection: Open connection.
+        """
+        if self._connection is None:
+            directory = os.path.dirname(os.path.abspath(self.manifest_path))
+            os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(self.manifest_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            logger.debug(f"Opened scan manifest {self.manifest_path}")
+
+        return self._connection
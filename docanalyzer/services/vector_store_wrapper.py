@@ -406,6 +406,60 @@ class VectorStoreWrapper:
             )
             self._handle_operation_error(e, "delete_file_chunks", {"file_path": file_path})
     
+    async def move_file_chunks(
+        self,
+        file_path: str,
+        new_file_path: str
+    ) -> int:
+        """
+        Point all chunks of a renamed file to its new path.
+        
+        Updates source_path of the stored chunks and keeps their content
+        and embeddings, so a moved file is not parsed or embedded again.
+        
+        Args:
+            file_path (str): Previous path of the file.
+                Must be non-empty string.
+            new_file_path (str): Current path of the file.
+                Must be non-empty string.
+        
+        Returns:
+            int: Number of chunks moved, 0 if no chunks were found for
+                file_path.
+        
+        Raises:
+            ValidationError: If a path is invalid
+            ProcessingError: If the update fails
+            ConnectionError: If vector store is not connected
+        """
+        self._validate_initialization()
+        
+        start_time = datetime.now()
+        
+        try:
+            moved_count = await self.adapter.update_source_path(file_path, new_file_path, limit=1000)
+            
+            self._collect_operation_metrics(
+                operation="move_file_chunks",
+                start_time=start_time,
+                success=True,
+                result_count=moved_count
+            )
+            
+            logger.info(f"Moved {moved_count} chunks from {file_path} to {new_file_path}")
+            return moved_count
+        
+        except Exception as e:
+            self._collect_operation_metrics(
+                operation="move_file_chunks",
+                start_time=start_time,
+                success=False,
+                error_message=str(e)
+            )
+            self._handle_operation_error(
+                e, "move_file_chunks", {"file_path": file_path, "new_file_path": new_file_path}
+            )
+    
     async def get_file_chunks(
         self,
         file_path: str,
@@ -733,6 +787,198 @@ class VectorStoreWrapper:
             )
             self._handle_operation_error(e, "create_chunk", {"chunk_id": chunk_id})
     
+    async def create_chunks_bulk(
+        self,
+        chunks: List[Dict[str, Any]],
+        file_path: str,
+        source_id: Optional[str] = None,
+        stop_on_failure: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Create many chunks in vector store using batched requests.
+
+        Converts chunk dictionaries (as produced by FileProcessor) to
+        ProcessingBlock objects and hands them to the adapter in batches
+        of adapter.batch_size, so a file costs one round trip per batch
+        instead of one per chunk. Chunk IDs are preserved as chunk UUIDs,
+        which allows callers to roll back exactly what was stored.
+
+        Args:
+            chunks (List[Dict[str, Any]]): Chunks to create.
+                Each chunk must contain chunk_id, content and metadata keys.
+            file_path (str): Path to source file.
+                Used as source_path for all chunks.
+            source_id (Optional[str]): Source identifier UUID.
+                If None, adapter generates one. Defaults to None.
+            stop_on_failure (bool): Whether to stop sending batches after
+                the first failed batch. Defaults to True.
+
+        Returns:
+            Dict[str, Any]: Bulk creation results.
+                Contains success status, created_count, failed_count,
+                stored_chunk_ids, failed_chunk_ids, batch_count, errors
+                (mapping of chunk_id to error message) and processing_time.
+
+        Raises:
+            ProcessingError: If service is not initialized
+            ValidationError: If chunks list is empty
+        """
+        self._validate_initialization()
+
+        if not chunks:
+            raise ValidationError("Chunks list cannot be empty")
+
+        start_time = datetime.now()
+        batch_size = self.adapter.batch_size
+        stored_chunk_ids: List[str] = []
+        failed_chunk_ids: List[str] = []
+        errors: Dict[str, str] = {}
+        batch_count = 0
+
+        for offset in range(0, len(chunks), batch_size):
+            batch = chunks[offset:offset + batch_size]
+            batch_ids = [chunk["chunk_id"] for chunk in batch]
+
+            if failed_chunk_ids and stop_on_failure:
+                # Remaining chunks are never sent once atomicity is broken
+                failed_chunk_ids.extend(batch_ids)
+                for chunk_id in batch_ids:
+                    errors[chunk_id] = "Skipped after previous batch failure"
+                continue
+
+            batch_count += 1
+            try:
+                blocks = [self._chunk_to_processing_block(chunk) for chunk in batch]
+                response = await self.adapter.create_chunks(
+                    processing_blocks=blocks,
+                    source_path=file_path,
+                    source_id=source_id
+                )
+
+                if response.success:
+                    stored_chunk_ids.extend(batch_ids)
+                else:
+                    failed_chunk_ids.extend(batch_ids)
+                    for chunk_id in batch_ids:
+                        errors[chunk_id] = "Batch creation failed"
+                    logger.warning(f"Bulk batch {batch_count} failed for {file_path}")
+
+            except Exception as e:
+                failed_chunk_ids.extend(batch_ids)
+                for chunk_id in batch_ids:
+                    errors[chunk_id] = str(e)
+                logger.error(f"Bulk batch {batch_count} error for {file_path}: {e}")
+
+        success = not failed_chunk_ids
+
+        self._collect_operation_metrics(
+            operation="create_chunks_bulk",
+            start_time=start_time,
+            success=success,
+            result_count=len(stored_chunk_ids),
+            error_message=None if success else f"{len(failed_chunk_ids)} chunks failed"
+        )
+
+        logger.info(
+            f"Bulk stored {len(stored_chunk_ids)}/{len(chunks)} chunks for {file_path} "
+            f"in {batch_count} batches"
+        )
+
+        return {
+            "success": success,
+            "created_count": len(stored_chunk_ids),
+            "failed_count": len(failed_chunk_ids),
+            "stored_chunk_ids": stored_chunk_ids,
+            "failed_chunk_ids": failed_chunk_ids,
+            "batch_count": batch_count,
+            "errors": errors,
+            "file_path": file_path,
+            "source_id": source_id,
+            "processing_time": (datetime.now() - start_time).total_seconds()
+        }
+
+    async def delete_chunks(self, chunk_ids: List[str]) -> bool:
+        """
+        Delete many chunks from vector store using batched requests.
+
+        Counterpart of create_chunks_bulk, used by FileProcessor to roll
+        back a partially stored file in batches of adapter.batch_size.
+
+        Args:
+            chunk_ids (List[str]): UUIDs of the chunks to delete.
+                Must be non-empty list of valid UUID strings.
+
+        Returns:
+            bool: True if all chunks were deleted successfully.
+
+        Raises:
+            ProcessingError: If chunk deletion fails
+            ValidationError: If chunk_ids is empty
+        """
+        self._validate_initialization()
+
+        start_time = datetime.now()
+
+        try:
+            success = await self.adapter.delete_chunks(chunk_ids)
+
+            self._collect_operation_metrics(
+                operation="delete_chunks",
+                start_time=start_time,
+                success=success,
+                result_count=len(chunk_ids) if success else 0
+            )
+
+            return success
+
+        except Exception as e:
+            self._collect_operation_metrics(
+                operation="delete_chunks",
+                start_time=start_time,
+                success=False,
+                error_message=str(e)
+            )
+            self._handle_operation_error(e, "delete_chunks", {"chunk_count": len(chunk_ids)})
+
+    def _chunk_to_processing_block(self, chunk: Dict[str, Any]) -> ProcessingBlock:
+        """
+        Convert FileProcessor chunk dictionary to ProcessingBlock.
+
+        Internal method used by bulk operations. Position fields are taken
+        from chunk metadata when present. The chunk_id is stored as block
+        UUID so the adapter creates the chunk under the same identifier.
+        A precomputed chunk embedding is passed on in block metadata.
+
+        Args:
+            chunk (Dict[str, Any]): Chunk dictionary.
+                Must contain chunk_id, content and metadata keys.
+
+        Returns:
+            ProcessingBlock: Block ready for adapter.create_chunks.
+
+        Raises:
+            ValueError: If chunk content or positions are invalid
+        """
+        content = chunk["content"]
+        metadata = chunk.get("metadata") or {}
+        start_line = metadata.get("start_line") or 1
+        start_char = metadata.get("start_char") or 0
+
+        block_metadata = {**metadata, "uuid": chunk["chunk_id"]}
+        if chunk.get("embedding"):
+            block_metadata["embedding"] = chunk["embedding"]
+
+        return ProcessingBlock(
+            content=content,
+            block_type=metadata.get("block_type") or "text",
+            start_line=start_line,
+            end_line=max(metadata.get("end_line") or start_line, start_line),
+            start_char=start_char,
+            end_char=max(metadata.get("end_char") or start_char + len(content), start_char),
+            block_id=chunk["chunk_id"],
+            metadata=block_metadata
+        )
+
     async def delete_chunk(self, chunk_id: str) -> bool:
         """
         Delete a single chunk from vector store.
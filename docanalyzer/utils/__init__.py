@@ -17,7 +17,10 @@ from .file_utils import (
     safe_remove_file,
     get_file_size,
     get_file_modified_time,
+    get_file_digest,
     normalize_path,
+    is_path_within,
+    collapse_nested_paths,
     ensure_directory_exists,
 )
 
@@ -31,6 +34,9 @@ __all__ = [
     "safe_remove_file",
     "get_file_size",
     "get_file_modified_time",
+    "get_file_digest",
     "normalize_path",
+    "is_path_within",
+    "collapse_nested_paths",
     "ensure_directory_exists",
 ] 
\ No newline at end of file
@@ -8,15 +8,18 @@ Author: File Watcher Team
 Version: 1.0.0
 """
 
+import hashlib
 import os
 import stat
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+DIGEST_CHUNK_SIZE = 1024 * 1024  # 1MB
+
 
 def is_directory(path: str) -> bool:
     """
@@ -271,6 +274,45 @@ def get_file_modified_time(path: str) -> datetime:
         raise
 
 
+def get_file_digest(path: str, chunk_size: int = DIGEST_CHUNK_SIZE) -> str:
+    """
+    Compute BLAKE2b digest of file content.
+    
+    Reads the file in fixed-size chunks into one reused buffer, so memory
+    use does not depend on file size and no per-chunk objects are
+    allocated. Hashing releases the GIL, so files can be digested in
+    parallel worker threads.
+    
+    Args:
+        path (str): Path to file.
+            Must be existing file path.
+        chunk_size (int): Read size in bytes. Must be positive.
+            Defaults to 1MB.
+    
+    Returns:
+        str: Hex BLAKE2b digest of file content.
+    
+    Raises:
+        ValueError: If chunk_size is not positive
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If cannot read file
+        OSError: If file system error occurs
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    
+    digest = hashlib.blake2b()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            read_size = f.readinto(buffer)
+            if not read_size:
+                break
+            digest.update(view[:read_size])
+    return digest.hexdigest()
+
+
 def normalize_path(path: str) -> str:
     """
     Normalize file path.
@@ -292,6 +334,55 @@ def normalize_path(path: str) -> str:
         raise
 
 
+def is_path_within(path: str, parent: str) -> bool:
+    """
+    Check whether path equals parent or lies below it.
+    
+    Compares path components, so "/docs-old" is not within "/docs".
+    Paths are compared as given; resolve them first to account for
+    symbolic links.
+    
+    Args:
+        path (str): Absolute path to check.
+        parent (str): Absolute path of possible parent directory.
+    
+    Returns:
+        bool: True if path is parent or a descendant of it.
+    """
+    try:
+        return os.path.commonpath([path, parent]) == parent
+    except ValueError:
+        # Mixed absolute and relative paths, or different drives
+        return False
+
+
+def collapse_nested_paths(paths: List[str]) -> List[str]:
+    """
+    Drop directories that lie inside another directory of the list.
+    
+    Paths are compared by their real location, so a directory listed
+    twice, or reachable through a symbolic link, is kept once. The first
+    of several equal paths is kept and order is preserved.
+    
+    Args:
+        paths (List[str]): Directory paths.
+    
+    Returns:
+        List[str]: Paths not covered by another path, as given.
+    """
+    real_paths = [os.path.realpath(path) for path in paths]
+    collapsed = []
+    for index, real_path in enumerate(real_paths):
+        covered = any(
+            is_path_within(real_path, other) and (other != real_path or other_index < index)
+            for other_index, other in enumerate(real_paths)
+            if other_index != index
+        )
+        if not covered:
+            collapsed.append(paths[index])
+    return collapsed
+
+
 def ensure_directory_exists(path: str) -> None:
     """
     Ensure directory exists, create if necessary.
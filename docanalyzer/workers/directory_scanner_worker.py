@@ -15,7 +15,7 @@ import asyncio
 import multiprocessing
 import signal
 import sys
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, AsyncIterator
 from pathlib import Path
 import logging
 from datetime import datetime
@@ -57,6 +57,11 @@ class WorkerConfig:
             Defaults to True.
         max_retry_attempts (int): Maximum number of retry attempts for failed operations.
             Must be non-negative integer. Defaults to 3.
+        streaming_scan (bool): Whether batches are processed while the
+            directory is still being scanned. Defaults to False.
+        checkpoint_scans (bool): Whether streaming scans record a checkpoint
+            after each processed batch and resume from it after a restart.
+            Defaults to False.
     """
     
     def __init__(
@@ -66,7 +71,9 @@ class WorkerConfig:
         progress_interval: int = DEFAULT_PROGRESS_INTERVAL,
         enable_detailed_logging: bool = True,
         enable_progress_reports: bool = True,
-        max_retry_attempts: int = 3
+        max_retry_attempts: int = 3,
+        streaming_scan: bool = False,
+        checkpoint_scans: bool = False
     ):
         """
         Initialize WorkerConfig instance.
@@ -84,6 +91,13 @@ class WorkerConfig:
                 Defaults to True.
             max_retry_attempts (int): Maximum number of retry attempts for failed operations.
                 Must be non-negative integer. Defaults to 3.
+            streaming_scan (bool): Whether to process files as they are
+                discovered using DirectoryScanner.scan_directory_iter.
+                Defaults to False.
+            checkpoint_scans (bool): Whether streaming scans record the last
+                processed file in the scan manifest and continue after it
+                when the same directory is scanned again. Only used with
+                streaming_scan. Defaults to False.
         
         Raises:
             ValueError: If any parameter has invalid value
@@ -103,6 +117,8 @@ class WorkerConfig:
         self.enable_detailed_logging = enable_detailed_logging
         self.enable_progress_reports = enable_progress_reports
         self.max_retry_attempts = max_retry_attempts
+        self.streaming_scan = streaming_scan
+        self.checkpoint_scans = checkpoint_scans
 
 
 class WorkerStatus:
@@ -349,8 +365,19 @@ class DirectoryScannerWorker:
             await self.communication.start_heartbeat()
             
             # Scan directory
-            files = await self._scan_directory(directory_path)
-            self.status.files_found = len(files)
+            checkpoint_directory = None
+            if self.config.streaming_scan:
+                resume_after = None
+                if self.config.checkpoint_scans:
+                    checkpoint_directory = directory_path
+                    resume_after = await self.directory_scanner.load_scan_checkpoint(directory_path)
+                    if resume_after:
+                        logger.info(f"Worker {self.worker_id} resuming scan after {resume_after}")
+                # files_found grows as the scan discovers files
+                files = self._scan_directory_iter(directory_path, resume_after)
+            else:
+                files = await self._scan_directory(directory_path)
+                self.status.files_found = len(files)
             
             if self._shutdown_event.is_set():
                 return ProcessingResult(
@@ -361,7 +388,7 @@ class DirectoryScannerWorker:
             
             # Process files
             self.status.status = "processing"
-            result = await self._process_files(files)
+            result = await self._process_files(files, checkpoint_directory)
             
             # Check for cancellation after processing
             if self._shutdown_event.is_set() or not result.success:
@@ -371,6 +398,9 @@ class DirectoryScannerWorker:
                     processing_time=(datetime.now() - start_time).total_seconds()
                 )
             
+            if checkpoint_directory is not None:
+                await self.directory_scanner.clear_scan_checkpoint(checkpoint_directory)
+            
             # Update final status
             self.status.status = "completed" if result.success else "failed"
             self.status.last_activity = datetime.now()
@@ -510,15 +540,87 @@ class DirectoryScannerWorker:
         except Exception as e:
             raise ProcessingError("DirectoryScanningError", f"Directory scanning failed: {str(e)}", ErrorCategory.FILE_SYSTEM, operation="directory_scanning")
     
-    async def _process_files(self, files: List[FileInfo]) -> ProcessingResult:
+    async def _scan_directory_iter(
+        self,
+        directory_path: str,
+        resume_after: Optional[str] = None
+    ) -> AsyncIterator[FileInfo]:
+        """
+        Scan directory and yield files as they are discovered.
+        
+        Checkpointed scans walk with a single thread, since resuming
+        depends on a fixed walk order.
+        
+        Args:
+            directory_path (str): Path to directory to scan.
+            resume_after (Optional[str]): Path of the last file processed by
+                an interrupted scan. Defaults to None.
+        
+        Yields:
+            FileInfo: Discovered files that pass filters.
+        
+        Raises:
+            ProcessingError: If scanning fails
+        """
+        try:
+            walk_threads = 1 if self.config.checkpoint_scans else None
+            async for file_info in self.directory_scanner.scan_directory_iter(
+                directory_path, resume_after=resume_after, walk_threads=walk_threads
+            ):
+                self.status.files_found += 1
+                yield file_info
+        except Exception as e:
+            raise ProcessingError("DirectoryScanningError", f"Directory scanning failed: {str(e)}", ErrorCategory.FILE_SYSTEM, operation="directory_scanning")
+    
+    async def _iter_batches(
+        self,
+        files: Union[List[FileInfo], AsyncIterator[FileInfo]]
+    ) -> AsyncIterator[List[FileInfo]]:
+        """
+        Split files into batches of batch_size.
+        
+        Args:
+            files (Union[List[FileInfo], AsyncIterator[FileInfo]]): Files to split.
+        
+        Yields:
+            List[FileInfo]: Next batch of files.
+        """
+        if isinstance(files, list):
+            for i in range(0, len(files), self.config.batch_size):
+                yield files[i:i + self.config.batch_size]
+            return
+        
+        batch = []
+        try:
+            async for file_info in files:
+                batch.append(file_info)
+                if len(batch) >= self.config.batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            if hasattr(files, "aclose"):
+                await files.aclose()
+    
+    async def _process_files(
+        self,
+        files: Union[List[FileInfo], AsyncIterator[FileInfo]],
+        checkpoint_directory: Optional[str] = None
+    ) -> ProcessingResult:
         """
         Process discovered files.
         
         Processes the list of discovered files in batches and
-        communicates results back to the parent process.
+        communicates results back to the parent process. files may also
+        be an async iterator from a streaming scan; each batch is then
+        processed as soon as it has been discovered.
         
         Args:
-            files (List[FileInfo]): List of files to process.
+            files (Union[List[FileInfo], AsyncIterator[FileInfo]]): Files to process.
+            checkpoint_directory (Optional[str]): Scanned directory whose scan
+                checkpoint is advanced to the last file of each processed
+                batch. Defaults to None.
         
         Returns:
             ProcessingResult: Result of processing operation.
@@ -526,8 +628,9 @@ class DirectoryScannerWorker:
         Raises:
             ProcessingError: If processing fails
         """
+        batches = self._iter_batches(files)
         try:
-            total_files = len(files)
+            total_files = len(files) if isinstance(files, list) else 0
             processed_count = 0
             failed_count = 0
             
@@ -539,23 +642,31 @@ class DirectoryScannerWorker:
                 )
             
             # Process files in batches
-            for i in range(0, total_files, self.config.batch_size):
+            batch_number = 0
+            async for batch in batches:
                 if self._shutdown_event.is_set():
                     break
                 
-                batch = files[i:i + self.config.batch_size]
+                batch_number += 1
+                if not isinstance(files, list):
+                    total_files += len(batch)
                 batch_result = await self._process_file_batch(batch)
                 
                 processed_count += batch_result["processed"]
                 failed_count += batch_result["failed"]
                 
+                if checkpoint_directory is not None:
+                    await self.directory_scanner.save_scan_checkpoint(
+                        checkpoint_directory, batch[-1].file_path
+                    )
+                
                 # Update progress
                 await self._update_progress(processed_count, total_files)
                 
                 # Send result to parent
                 result = ProcessingResult(
                     success=True,
-                    message=f"Processed batch {i//self.config.batch_size + 1}",
+                    message=f"Processed batch {batch_number}",
                     data=batch_result
                 )
                 await self.communication.send_result(result)
@@ -576,6 +687,9 @@ class DirectoryScannerWorker:
             
         except Exception as e:
             raise ProcessingError("FileProcessingError", f"File processing failed: {str(e)}", ErrorCategory.PROCESSING)
+        finally:
+            # Stops a streaming scan that was left early
+            await batches.aclose()
     
     async def _process_file_batch(self, batch: List[FileInfo]) -> Dict[str, Any]:
         """
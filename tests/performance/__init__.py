@@ -0,0 +1,10 @@
+"""
+Performance Benchmarks Package - Benchmark Scripts
+
+This package contains standalone benchmark scripts for performance
+critical components of the DocAnalyzer service. Scripts are not
+collected by pytest and are run directly with python -m.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
@@ -0,0 +1,139 @@
+"""
+Directory Scan Benchmark - Scan Engine Comparison
+
+Builds a synthetic directory tree of empty files and measures how long
+DirectoryScanner takes to discover all files with each scan engine, and
+how long the event loop is blocked while the scan runs.
+
+Usage:
+    python -m tests.performance.bench_directory_scan --files 1000000
+    python -m tests.performance.bench_directory_scan --root /tmp/tree --keep
+
+The tree is spread over directories of --files-per-dir files nested
+--depth levels deep. With --keep an existing tree at --root is reused.
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, Any
+
+from docanalyzer.filters.file_filter import FileFilter
+from docanalyzer.services.directory_scanner import DirectoryScanner, ScanProgress, SCAN_ENGINES
+from docanalyzer.services.lock_manager import LockManager
+
+TICK_INTERVAL = 0.01
+
+
+def build_tree(root: str, total_files: int, files_per_dir: int, depth: int) -> None:
+    """
+    Create synthetic tree of empty .txt files.
+
+    Args:
+        root (str): Root directory of the tree.
+        total_files (int): Number of files to create.
+        files_per_dir (int): Number of files in each leaf directory.
+        depth (int): Nesting depth of leaf directories.
+    """
+    created = 0
+    directory_index = 0
+    while created < total_files:
+        parts = [f"d{(directory_index // (10 ** level)) % 10}" for level in range(depth - 1, -1, -1)]
+        directory = os.path.join(root, *parts, f"leaf{directory_index}")
+        os.makedirs(directory, exist_ok=True)
+        for file_index in range(min(files_per_dir, total_files - created)):
+            fd = os.open(os.path.join(directory, f"f{file_index}.txt"), os.O_CREAT | os.O_WRONLY, 0o644)
+            os.close(fd)
+        created += min(files_per_dir, total_files - created)
+        directory_index += 1
+
+
+async def measure(scanner: DirectoryScanner, root: str) -> Dict[str, Any]:
+    """
+    Scan tree once and measure duration and event loop stalls.
+
+    Args:
+        scanner (DirectoryScanner): Scanner configured with the engine.
+        root (str): Root directory of the tree.
+
+    Returns:
+        Dict[str, Any]: Number of files, seconds and longest loop stall.
+    """
+    max_stall = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal max_stall
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(TICK_INTERVAL)
+            now = time.perf_counter()
+            max_stall = max(max_stall, now - last - TICK_INTERVAL)
+            last = now
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)  # let the ticker take its first timestamp
+    start = time.perf_counter()
+    files = await scanner._scan_tree(root, ScanProgress())
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker_task
+
+    return {"files": len(files), "seconds": elapsed, "max_loop_stall": max_stall}
+
+
+async def run(root: str, depth: int) -> None:
+    """
+    Run benchmark for every scan engine and print results.
+
+    Args:
+        root (str): Root directory of the tree.
+        depth (int): Nesting depth used when building the tree.
+    """
+    for engine in SCAN_ENGINES:
+        scanner = DirectoryScanner(
+            file_filter=FileFilter(),
+            lock_manager=LockManager(),
+            max_depth=depth + 1,
+            scan_engine=engine
+        )
+        result = await measure(scanner, root)
+        rate = result["files"] / result["seconds"] if result["seconds"] else 0.0
+        print(
+            f"{engine:>8}: {result['files']} files in {result['seconds']:.2f}s "
+            f"({rate:,.0f} files/s), longest event loop stall {result['max_loop_stall'] * 1000:.1f}ms"
+        )
+
+
+def main() -> None:
+    """
+    Parse arguments, build tree and run benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark DirectoryScanner scan engines")
+    parser.add_argument("--files", type=int, default=1_000_000, help="number of files in the tree")
+    parser.add_argument("--files-per-dir", type=int, default=1000, help="files in each leaf directory")
+    parser.add_argument("--depth", type=int, default=3, help="nesting depth of leaf directories")
+    parser.add_argument("--root", help="directory for the tree (temporary if omitted)")
+    parser.add_argument("--keep", action="store_true", help="reuse existing tree and do not delete it")
+    args = parser.parse_args()
+
+    root = args.root or tempfile.mkdtemp(prefix="docanalyzer_scan_bench_")
+    try:
+        if not (args.keep and os.listdir(root)):
+            start = time.perf_counter()
+            build_tree(root, args.files, args.files_per_dir, args.depth)
+            print(f"Built tree with {args.files} files in {time.perf_counter() - start:.1f}s at {root}")
+        asyncio.run(run(root, args.depth))
+    finally:
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
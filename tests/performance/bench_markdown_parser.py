@@ -0,0 +1,341 @@
+"""
+Markdown Parser Benchmark - Tokenizer Comparison
+
+Generates a large synthetic Markdown document, checks that MarkdownParser
+produces the same elements as the previous regex-per-line implementation
+kept here as ReferenceMarkdownParser, and reports how long each takes to
+parse the document.
+
+Usage:
+    python -m tests.performance.bench_markdown_parser --sections 5000
+    python -m tests.performance.bench_markdown_parser --file README.md
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import List, Optional
+
+from docanalyzer.processors.markdown_processor import MarkdownElement, MarkdownParser
+
+WORDS = [
+    "the", "document", "parser", "a", "of", "and", "to", "with", "file", "index",
+    "vector", "chunk", "is", "for", "each", "block", "text", "in", "store", "search"
+]
+MARKUP = [
+    "**bold**", "*italic*", "snake_case", "`code`", "[link](https://example.com)",
+    "![alt](img.png)", "~~old~~", "__strong__"
+]
+# Share of words with inline markup, roughly as in READMEs and docs sites
+MARKUP_RATE = 0.1
+
+
+class ReferenceMarkdownParser(MarkdownParser):
+    """
+    Previous MarkdownParser implementation, kept to compare output and speed.
+    """
+    
+    def parse_markdown(self, markdown_text: str) -> List[MarkdownElement]:
+        """Previous implementation."""
+        if not isinstance(markdown_text, str):
+            raise TypeError("markdown_text must be string")
+        if not markdown_text:
+            raise ValueError("markdown_text cannot be empty")
+        
+        elements = []
+        lines = markdown_text.split('\n')
+        current_line = 1
+        
+        i = 0
+        while i < len(lines):
+            line = lines[i].rstrip()
+            
+            if not line.strip():
+                # Empty line - skip
+                i += 1
+                current_line += 1
+                continue
+            
+            # Check for headers
+            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
+            if header_match:
+                level = len(header_match.group(1))
+                content = header_match.group(2).strip()
+                content = self._clean_content(content)
+                
+                element = MarkdownElement(
+                    element_type="header",
+                    content=content,
+                    level=level,
+                    line_number=current_line
+                )
+                elements.append(element)
+                i += 1
+                current_line += 1
+                continue
+            
+            # Check for code blocks
+            if line.startswith('```'):
+                code_block = self._extract_code_block(lines, i, current_line)
+                if code_block:
+                    elements.append(code_block)
+                    i = code_block.metadata.get('end_line_index', i + 1)
+                    current_line = code_block.metadata.get('end_line_number', current_line + 1)
+                    continue
+            
+            # Check for blockquotes
+            if line.startswith('>'):
+                blockquote = self._extract_blockquote(lines, i, current_line)
+                if blockquote:
+                    elements.append(blockquote)
+                    i = blockquote.metadata.get('end_line_index', i + 1)
+                    current_line = blockquote.metadata.get('end_line_number', current_line + 1)
+                    continue
+            
+            # Check for list items
+            list_match = re.match(r'^(\s*)([-*+]|\d+\.)\s+(.+)$', line)
+            if list_match:
+                list_item = self._extract_list_item(lines, i, current_line)
+                if list_item:
+                    elements.append(list_item)
+                    i = list_item.metadata.get('end_line_index', i + 1)
+                    current_line = list_item.metadata.get('end_line_number', current_line + 1)
+                    continue
+            
+            # Regular paragraph
+            paragraph = self._extract_paragraph(lines, i, current_line)
+            if paragraph:
+                elements.append(paragraph)
+                i = paragraph.metadata.get('end_line_index', i + 1)
+                current_line = paragraph.metadata.get('end_line_number', current_line + 1)
+                continue
+            
+            # Skip unrecognized line
+            i += 1
+            current_line += 1
+        
+        return elements
+
+    def _clean_content(self, content: str) -> str:
+        """Previous implementation."""
+        if not self.clean_markdown:
+            return content
+        
+        # Remove bold/italic
+        content = re.sub(r'\*\*(.*?)\*\*', r'\1', content)
+        content = re.sub(r'\*(.*?)\*', r'\1', content)
+        content = re.sub(r'__(.*?)__', r'\1', content)
+        content = re.sub(r'_(.*?)_', r'\1', content)
+        
+        # Handle links
+        if self.extract_links:
+            content = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', content)
+        else:
+            content = re.sub(r'\[([^\]]+)\]\([^)]+\)', '', content)
+        
+        # Handle images
+        if self.extract_images:
+            content = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'\1', content)
+        else:
+            content = re.sub(r'!\[([^\]]*)\]\([^)]+\)', '', content)
+        
+        # Remove inline code
+        content = re.sub(r'`([^`]+)`', r'\1', content)
+        
+        # Remove strikethrough
+        content = re.sub(r'~~(.*?)~~', r'\1', content)
+        
+        return content.strip()
+
+    def _extract_list_item(self, lines: List[str], start_index: int, start_line: int) -> Optional[MarkdownElement]:
+        """Previous implementation."""
+        line = lines[start_index]
+        list_match = re.match(r'^(\s*)([-*+]|\d+\.)\s+(.+)$', line)
+        if not list_match:
+            return None
+        
+        indent = len(list_match.group(1))
+        marker = list_match.group(2)
+        content = list_match.group(3)
+        
+        # Calculate level based on indentation
+        level = (indent // 2) + 1
+        
+        # Check for continuation lines
+        end_index = start_index + 1
+        end_line = start_line + 1
+        
+        while end_index < len(lines):
+            next_line = lines[end_index]
+            if not next_line.strip():
+                break
+            
+            # Check if it's a continuation (indented content)
+            if re.match(r'^\s+\S', next_line):
+                content += ' ' + next_line.strip()
+                end_index += 1
+                end_line += 1
+            else:
+                break
+        
+        content = self._clean_content(content)
+        
+        return MarkdownElement(
+            element_type="list_item",
+            content=content,
+            level=level,
+            line_number=start_line,
+            metadata={
+                "marker": marker,
+                "indent": indent,
+                "end_line_index": end_index,
+                "end_line_number": end_line
+            }
+        )
+
+    def _extract_paragraph(self, lines: List[str], start_index: int, start_line: int) -> Optional[MarkdownElement]:
+        """Previous implementation."""
+        content_lines = []
+        end_index = start_index
+        end_line = start_line
+        
+        while end_index < len(lines):
+            line = lines[end_index]
+            if not line.strip():
+                break
+            
+            # Check if it's a special Markdown element
+            if (re.match(r'^(#{1,6})\s+', line) or
+                line.startswith('```') or
+                line.startswith('>') or
+                re.match(r'^(\s*)([-*+]|\d+\.)\s+', line)):
+                break
+            
+            content_lines.append(line.strip())
+            end_index += 1
+            end_line += 1
+        
+        if not content_lines:
+            return None
+        
+        content = ' '.join(content_lines)
+        content = self._clean_content(content)
+        
+        return MarkdownElement(
+            element_type="paragraph",
+            content=content,
+            level=1,
+            line_number=start_line,
+            metadata={
+                "end_line_index": end_index,
+                "end_line_number": end_line
+            }
+        )
+
+
+def build_document(sections: int, seed: int = 0) -> str:
+    """
+    Generate a Markdown document with every element type.
+
+    Args:
+        sections (int): Number of sections to generate.
+        seed (int): Random seed. Defaults to 0.
+
+    Returns:
+        str: Markdown text.
+    """
+    rng = random.Random(seed)
+
+    def sentence() -> str:
+        return " ".join(
+            rng.choice(MARKUP if rng.random() < MARKUP_RATE else WORDS)
+            for _ in range(rng.randint(5, 20))
+        )
+
+    parts = []
+    for index in range(sections):
+        parts.append(f"{'#' * rng.randint(1, 4)} Section {index} {sentence()}")
+        parts.append("")
+        parts.append("\n".join(sentence() for _ in range(rng.randint(1, 6))))
+        parts.append("")
+        parts.append("\n".join(f"{rng.choice(['-', '*', '1.'])} {sentence()}" for _ in range(rng.randint(1, 5))))
+        parts.append("  continued " + sentence())
+        parts.append("")
+        parts.append("> " + sentence())
+        parts.append("> " + sentence())
+        parts.append("")
+        parts.append("```python\nprint('hello')\nvalue = 1\n```")
+        parts.append("")
+    return "\n".join(parts)
+
+
+def describe(elements: List[MarkdownElement]) -> List[tuple]:
+    """
+    Reduce elements to comparable tuples.
+
+    Args:
+        elements (List[MarkdownElement]): Parsed elements.
+
+    Returns:
+        List[tuple]: Type, content, level, line number and metadata.
+    """
+    return [
+        (e.element_type, e.content, e.level, e.line_number, sorted(e.metadata.items()))
+        for e in elements
+    ]
+
+
+def best_time(parser: MarkdownParser, text: str, repeat: int) -> float:
+    """
+    Parse text repeatedly and return the fastest run.
+
+    Args:
+        parser (MarkdownParser): Parser to time.
+        text (str): Markdown text.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: Fastest run in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser.parse_markdown(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Parse arguments, compare output and print timings.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark MarkdownParser against the previous implementation")
+    parser.add_argument("--sections", type=int, default=5000, help="sections in the generated document")
+    parser.add_argument("--file", help="parse this Markdown file instead of a generated document")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per parser; the fastest is reported")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            text = f.read()
+    else:
+        text = build_document(args.sections)
+
+    current = MarkdownParser()
+    reference = ReferenceMarkdownParser()
+    if describe(current.parse_markdown(text)) != describe(reference.parse_markdown(text)):
+        raise SystemExit("MarkdownParser output differs from the reference implementation")
+
+    reference_time = best_time(reference, text, args.repeat)
+    current_time = best_time(current, text, args.repeat)
+    print(f"document: {len(text):,} characters, {text.count(chr(10)) + 1:,} lines")
+    print(f"reference: {reference_time * 1000:.1f}ms")
+    print(f"   current: {current_time * 1000:.1f}ms ({reference_time / current_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
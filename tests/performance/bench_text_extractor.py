@@ -0,0 +1,238 @@
+"""
+Text Extractor Benchmark - Block Splitting Comparison
+
+Generates pathological plain text documents (one giant paragraph, many
+tiny paragraphs, thousands of custom delimiters), checks that
+TextBlockExtractor produces the same blocks as the previous
+concatenating implementation kept here as ReferenceTextBlockExtractor,
+and reports how long each takes to extract the blocks.
+
+Usage:
+    python -m tests.performance.bench_text_extractor --size 2000000
+    python -m tests.performance.bench_text_extractor --delimiters 1000
+
+Author: DocAnalyzer Team
+Version: 1.0.0
+"""
+
+import argparse
+import time
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+from docanalyzer.processors.text_processor import TextBlockExtractor
+
+
+class ReferenceTextBlockExtractor(TextBlockExtractor):
+    """
+    Previous TextBlockExtractor implementation, kept to compare output and speed.
+    """
+
+    def _iter_stream_parts(self, chunks: Iterable[str], max_segment_size: int) -> Iterator[str]:
+        """Previous implementation."""
+        separator = {"paragraph": "\n\n", "line": "\n"}.get(self.strategy) or self.custom_delimiters[0]
+        pending = ""
+
+        for chunk in chunks:
+            pending += chunk
+            segments = pending.split(separator)
+            pending = segments.pop()
+            for segment in segments:
+                yield from self._split_segment(segment)
+
+            while len(pending) > max_segment_size:
+                cut = max(
+                    pending.rfind(" ", 0, max_segment_size),
+                    pending.rfind("\n", 0, max_segment_size)
+                )
+                if cut <= 0:
+                    cut = max_segment_size
+                yield from self._split_segment(pending[:cut])
+                pending = pending[cut:]
+
+        yield from self._split_segment(pending)
+
+    def _split_segment(self, segment: str) -> List[str]:
+        """Previous implementation."""
+        segment = segment.strip()
+        if not segment:
+            return []
+
+        parts = [segment]
+        if self.strategy == "custom":
+            for delimiter in self.custom_delimiters[1:]:
+                new_parts = []
+                for part in parts:
+                    new_parts.extend(part.split(delimiter))
+                parts = [p.strip() for p in new_parts if p.strip()]
+
+        return parts
+
+    def _extract_custom_blocks(self, text: str) -> List[str]:
+        """Previous implementation."""
+        blocks = [text]
+
+        for delimiter in self.custom_delimiters:
+            new_blocks = []
+            for block in blocks:
+                new_blocks.extend(block.split(delimiter))
+            blocks = [b.strip() for b in new_blocks if b.strip()]
+
+        return list(self._iter_custom_blocks(blocks))
+
+    def _iter_paragraph_blocks(self, paragraphs: Iterable[str]) -> Iterator[str]:
+        """Previous implementation."""
+        current_block = ""
+
+        for paragraph in paragraphs:
+            if len(paragraph) >= self.min_block_size and len(paragraph) <= self.max_block_size:
+                if current_block:
+                    if len(current_block) >= self.min_block_size:
+                        yield current_block
+                    current_block = ""
+                yield paragraph
+            elif len(current_block) + len(paragraph) + 2 <= self.max_block_size:
+                if current_block:
+                    current_block += "\n\n" + paragraph
+                else:
+                    current_block = paragraph
+            else:
+                if current_block:
+                    if len(current_block) >= self.min_block_size:
+                        yield current_block
+                    current_block = paragraph
+                else:
+                    yield from self._split_large_block(paragraph)
+
+        if current_block and len(current_block) >= self.min_block_size:
+            yield current_block
+
+    def _iter_custom_blocks(self, blocks: Iterable[str]) -> Iterator[str]:
+        """Previous implementation."""
+        current_block = ""
+
+        for block in blocks:
+            if len(block) >= self.min_block_size and len(block) <= self.max_block_size:
+                if current_block:
+                    if len(current_block) >= self.min_block_size:
+                        yield current_block
+                    current_block = ""
+                yield block
+            elif len(current_block) + len(block) + 1 <= self.max_block_size:
+                if current_block:
+                    current_block += " " + block
+                else:
+                    current_block = block
+            else:
+                if current_block:
+                    if len(current_block) >= self.min_block_size:
+                        yield current_block
+                    current_block = block
+                else:
+                    yield from self._split_large_block(block)
+
+        if current_block and len(current_block) >= self.min_block_size:
+            yield current_block
+
+    def _split_large_block(self, block: str) -> List[str]:
+        """Previous implementation."""
+        if len(block) <= self.max_block_size:
+            return [block] if len(block) >= self.min_block_size else []
+
+        parts = block.split('. ')
+        if len(parts) == 1:
+            parts = block.split(' ')
+
+        result = []
+        current_part = ""
+
+        for part in parts:
+            if len(current_part) + len(part) + 1 <= self.max_block_size:
+                if current_part:
+                    current_part += " " + part
+                else:
+                    current_part = part
+            else:
+                if current_part and len(current_part) >= self.min_block_size:
+                    result.append(current_part)
+                current_part = part
+
+        if current_part and len(current_part) >= self.min_block_size:
+            result.append(current_part)
+
+        return result
+
+
+def build_cases(size: int, delimiters: int) -> List[Tuple[str, dict, str]]:
+    """
+    Generate pathological documents with their extractor settings.
+
+    Args:
+        size (int): Approximate characters per document.
+        delimiters (int): Number of custom delimiters.
+
+    Returns:
+        List[Tuple[str, dict, str]]: Case name, extractor arguments and text.
+    """
+    separators = [f"<sep{i}>" for i in range(delimiters)]
+    custom = "".join(
+        f"part {i} {separators[i % delimiters]} "
+        for i in range(size // 16)
+    )
+    return [
+        ("giant paragraph", {"max_block_size": 100000}, "word " * (size // 5)),
+        ("tiny paragraphs", {"max_block_size": 100000}, "ab\n\n" * (size // 4)),
+        ("custom delimiters", {"strategy": "custom", "min_block_size": 5, "custom_delimiters": separators}, custom),
+    ]
+
+
+def best_time(run: Callable[[], List[str]], repeat: int) -> float:
+    """
+    Run extraction repeatedly and return the fastest run.
+
+    Args:
+        run (Callable[[], List[str]]): Extraction to time.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: Fastest run in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Parse arguments, compare output and print timings.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark TextBlockExtractor against the previous implementation")
+    parser.add_argument("--size", type=int, default=2000000, help="approximate characters per document")
+    parser.add_argument("--delimiters", type=int, default=200, help="custom delimiters in the custom case")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per extractor; the fastest is reported")
+    args = parser.parse_args()
+
+    for name, options, text in build_cases(args.size, args.delimiters):
+        current = TextBlockExtractor(**options)
+        reference = ReferenceTextBlockExtractor(**options)
+        chunks = [text[i:i + 4096] for i in range(0, len(text), 4096)]
+        runs = {
+            "extract_blocks": (lambda e: lambda: e.extract_blocks(text)),
+            "iter_blocks": (lambda e: lambda: list(e.iter_blocks(chunks))),
+        }
+
+        print(f"{name}: {len(text):,} characters")
+        for method, bind in runs.items():
+            if bind(current)() != bind(reference)():
+                raise SystemExit(f"{method} output differs from the reference implementation on {name}")
+
+            reference_time = best_time(bind(reference), args.repeat)
+            current_time = best_time(bind(current), args.repeat)
+            print(f"  {method} reference: {reference_time * 1000:.1f}ms")
+            print(f"  {method}   current: {current_time * 1000:.1f}ms ({reference_time / current_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
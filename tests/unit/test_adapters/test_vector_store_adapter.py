@@ -10,6 +10,8 @@ import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from typing import List, Dict, Any
 
+from vector_store_client.models import SearchResult, SemanticChunk as VSCSemanticChunk
+
 from docanalyzer.adapters.vector_store_adapter import VectorStoreAdapter
 from docanalyzer.config.integration import DocAnalyzerConfig
 from docanalyzer.models.processing import ProcessingBlock
@@ -276,6 +278,93 @@ class TestVectorStoreAdapter:
         with pytest.raises(Exception, match="Chunk UUIDs list cannot be empty"):
             await adapter.delete_chunks([])
     
+    @pytest.mark.asyncio
+    async def test_update_source_path_success(self, adapter):
+        """Test chunks are stored under the new path with their embeddings, then old ones deleted."""
+        adapter.client = AsyncMock()
+        adapter.is_connected = True
+        chunk = VSCSemanticChunk(body="Moved content", source_path="/test/old.txt", embedding=[0.1] * 384)
+        adapter.client.search_by_metadata.return_value = [SearchResult(chunk=chunk, score=1.0, rank=1)]
+        adapter.client.create_chunks.return_value = Mock(success=True, failed_count=0)
+        adapter.client.delete_chunks.return_value = Mock(success=True, deleted_count=1, failed_count=0)
+        
+        result = await adapter.update_source_path("/test/old.txt", "/test/new.txt")
+        
+        assert result == 1
+        copy = adapter.client.create_chunks.call_args.args[0][0]
+        assert copy.source_path == "/test/new.txt"
+        assert copy.embedding == chunk.embedding
+        assert copy.uuid != chunk.uuid
+        adapter.client.delete_chunks.assert_called_once_with([chunk.uuid])
+    
+    @pytest.mark.asyncio
+    async def test_update_source_path_keeps_old_chunks_on_failure(self, adapter):
+        """Test old chunks are kept when the copies cannot be stored."""
+        adapter.client = AsyncMock()
+        adapter.is_connected = True
+        adapter.batch_size = 1
+        chunks = [
+            VSCSemanticChunk(body=f"Content {i}", source_path="/test/old.txt", embedding=[0.1] * 384)
+            for i in range(2)
+        ]
+        adapter.client.search_by_metadata.return_value = [
+            SearchResult(chunk=chunk, score=1.0, rank=i + 1) for i, chunk in enumerate(chunks)
+        ]
+        adapter.client.create_chunks.side_effect = [
+            Mock(success=True, failed_count=0),
+            Mock(success=False, failed_count=1)
+        ]
+        
+        with pytest.raises(ProcessingError):
+            await adapter.update_source_path("/test/old.txt", "/test/new.txt")
+        
+        stored_copy = adapter.client.create_chunks.call_args_list[0].args[0][0]
+        adapter.client.delete_chunks.assert_called_once_with([stored_copy.uuid])
+    
+    @pytest.mark.asyncio
+    async def test_update_source_path_removes_copies_when_delete_fails(self, adapter):
+        """Test copies under the new path are removed when old chunks cannot be deleted."""
+        adapter.client = AsyncMock()
+        adapter.is_connected = True
+        chunk = VSCSemanticChunk(body="Moved content", source_path="/test/old.txt", embedding=[0.1] * 384)
+        adapter.client.search_by_metadata.return_value = [SearchResult(chunk=chunk, score=1.0, rank=1)]
+        adapter.client.create_chunks.return_value = Mock(success=True, failed_count=0)
+        adapter.client.delete_chunks.side_effect = [
+            Mock(success=False, deleted_count=0, failed_count=1),
+            Mock(success=True, deleted_count=1, failed_count=0)
+        ]
+        
+        with pytest.raises(ProcessingError):
+            await adapter.update_source_path("/test/old.txt", "/test/new.txt")
+        
+        stored_copy = adapter.client.create_chunks.call_args.args[0][0]
+        assert adapter.client.delete_chunks.call_args_list[-1].args[0] == [stored_copy.uuid]
+    
+    @pytest.mark.asyncio
+    async def test_update_source_path_without_embeddings(self, adapter):
+        """Test chunks returned without embeddings are not moved."""
+        adapter.client = AsyncMock()
+        adapter.is_connected = True
+        chunk = VSCSemanticChunk(body="Moved content", source_path="/test/old.txt")
+        adapter.client.search_by_metadata.return_value = [SearchResult(chunk=chunk, score=1.0, rank=1)]
+        
+        with pytest.raises(ProcessingError, match="without embeddings"):
+            await adapter.update_source_path("/test/old.txt", "/test/new.txt")
+        
+        adapter.client.create_chunks.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_update_source_path_no_chunks(self, adapter):
+        """Test nothing is stored when the old path has no chunks."""
+        adapter.client = AsyncMock()
+        adapter.is_connected = True
+        adapter.client.search_by_metadata.return_value = []
+        
+        result = await adapter.update_source_path("/test/old.txt", "/test/new.txt")
+        
+        assert result == 0
+        adapter.client.create_chunks.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_get_chunk_count_success(self, adapter):
         """Test successful chunk count retrieval."""
@@ -303,6 +392,32 @@ class TestVectorStoreAdapter:
         assert chunk.source_path == "/test/file.txt"
         assert chunk.uuid is not None
     
+    def test_convert_processing_block_keeps_assigned_uuid(self, adapter, sample_processing_block):
+        """Test conversion keeps chunk UUID supplied in block metadata."""
+        chunk_uuid = "0f6c0a1e-3b8f-4d59-9f7e-1a2b3c4d5e6f"
+        sample_processing_block.metadata["uuid"] = chunk_uuid
+        
+        chunk = adapter._convert_processing_block_to_chunk(
+            sample_processing_block,
+            "/test/file.txt",
+            "e587072e-b016-49ef-8a1d-a17cd22d94cb"
+        )
+        
+        assert chunk.uuid == chunk_uuid
+    
+    def test_convert_processing_block_moves_embedding_to_chunk(self, adapter, sample_processing_block):
+        """Test conversion moves precomputed embedding out of chunk metadata."""
+        sample_processing_block.metadata["embedding"] = [0.5] * 384
+        
+        chunk = adapter._convert_processing_block_to_chunk(
+            sample_processing_block,
+            "/test/file.txt",
+            "e587072e-b016-49ef-8a1d-a17cd22d94cb"
+        )
+        
+        assert chunk.embedding == [0.5] * 384
+        assert "embedding" not in chunk.metadata
+    
     def test_validate_connection_success(self, adapter):
         """Test successful connection validation."""
         adapter.is_connected = True
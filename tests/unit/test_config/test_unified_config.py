@@ -601,6 +601,14 @@ class TestValidationError:
 class TestGlobalConfig:
     """Test suite for global configuration functions."""
     
+    @pytest.fixture(autouse=True)
+    def restore_global_config(self):
+        """Restore global configuration instance replaced by tests."""
+        import docanalyzer.config.unified_config as config_module
+        saved_config = config_module._unified_config
+        yield
+        config_module._unified_config = saved_config
+    
     @patch('docanalyzer.config.unified_config._unified_config')
     def test_get_unified_config_existing(self, mock_global_config):
         """Test get_unified_config with existing instance."""
@@ -194,6 +194,21 @@ class TestValidateFileWatcherSettings:
         # Assert
         assert "file_watcher.scan_interval must be positive" in errors
     
+    @patch('docanalyzer.config.validation.get_file_watcher_settings')
+    def test_validate_file_watcher_settings_invalid_watch_mode(self, mock_get_settings):
+        """Test file watcher settings validation with invalid watch mode."""
+        # Arrange
+        mock_get_settings.return_value = {
+            'directories': ['/path1'],
+            'watch_mode': 'fanotify'
+        }
+        
+        # Act
+        errors = validate_file_watcher_settings()
+        
+        # Assert
+        assert "file_watcher.watch_mode must be 'inotify' or 'poll'" in errors
+    
     @patch('docanalyzer.config.validation.get_file_watcher_settings')
     def test_validate_file_watcher_settings_invalid_directories_type(self, mock_get_settings):
         """Test file watcher settings validation with invalid directories type."""
@@ -173,6 +173,7 @@ class TestDirectoryScanner:
     def file_filter(self):
         """Create test file filter."""
         filter_mock = Mock(spec=FileFilter)
+        filter_mock.is_directory_excluded.return_value = False
         filter_mock.filter_files.return_value = [
             Mock(should_process=True),
             Mock(should_process=False),
@@ -25,7 +25,10 @@ from docanalyzer.utils.file_utils import (
     safe_remove_file,
     get_file_size,
     get_file_modified_time,
+    get_file_digest,
     normalize_path,
+    is_path_within,
+    collapse_nested_paths,
     ensure_directory_exists,
 )
 
@@ -495,6 +498,61 @@ class TestFileUtils:
         with pytest.raises(OSError):
             get_file_modified_time("/test/path")
     
+    def test_get_file_digest(self, tmp_path):
+        """Test digest matches BLAKE2b of content across chunk boundaries."""
+        import hashlib
+        file_path = tmp_path / "data.bin"
+        content = os.urandom(10000)
+        file_path.write_bytes(content)
+        
+        expected = hashlib.blake2b(content).hexdigest()
+        assert get_file_digest(str(file_path)) == expected
+        assert get_file_digest(str(file_path), chunk_size=4096) == expected
+    
+    def test_get_file_digest_empty_file(self, tmp_path):
+        """Test digest of empty file."""
+        import hashlib
+        file_path = tmp_path / "empty.txt"
+        file_path.write_bytes(b"")
+        
+        assert get_file_digest(str(file_path)) == hashlib.blake2b(b"").hexdigest()
+    
+    def test_get_file_digest_errors(self, tmp_path):
+        """Test digest errors for missing file and invalid chunk size."""
+        with pytest.raises(FileNotFoundError):
+            get_file_digest(str(tmp_path / "missing.txt"))
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            get_file_digest(str(tmp_path / "missing.txt"), chunk_size=0)
+    
+    def test_is_path_within(self):
+        """Test containment compares whole path components."""
+        assert is_path_within("/docs/api", "/docs") is True
+        assert is_path_within("/docs", "/docs") is True
+        assert is_path_within("/docs-old", "/docs") is False
+        assert is_path_within("/docs", "/docs/api") is False
+        assert is_path_within("/docs", "/") is True
+    
+    def test_collapse_nested_paths(self, tmp_path):
+        """Test nested, repeated and symlinked directories are collapsed."""
+        # Arrange
+        docs = tmp_path / "docs"
+        (docs / "api").mkdir(parents=True)
+        (tmp_path / "other").mkdir()
+        (tmp_path / "docs-link").symlink_to(docs)
+        paths = [
+            str(docs / "api"),
+            str(docs),
+            str(tmp_path / "other"),
+            str(tmp_path / "docs-link"),
+            str(docs) + "/",
+        ]
+        
+        # Act
+        collapsed = collapse_nested_paths(paths)
+        
+        # Assert
+        assert collapsed == [str(docs), str(tmp_path / "other")]
+    
     def test_normalize_path_success(self, test_file):
         """Test successful path normalization."""
         # Act
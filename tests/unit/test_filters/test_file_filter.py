@@ -373,7 +373,46 @@ class TestFileFilter:
         
         assert result.should_process is True
         assert "No pattern restrictions" in result.reason
-    
+
+    def test_check_patterns_after_patterns_change(self, file_filter):
+        """Test pattern check follows changes to the pattern lists."""
+        file_info = create_test_file_info("/test/file.txt", 1024, ".txt")
+        assert file_filter._check_patterns(file_info).should_process is True
+
+        file_filter.exclude_patterns.append("file.*")
+        result = file_filter._check_patterns(file_info)
+
+        assert result.should_process is False
+        assert result.metadata["matched_pattern"] == "file.*"
+
+    def test_is_directory_excluded(self):
+        """Test directory exclusion by exclude patterns."""
+        filter_instance = FileFilter(exclude_patterns=["node_modules", "build/*", "*.tmp"])
+
+        assert filter_instance.is_directory_excluded("/project/node_modules") is True
+        assert filter_instance.is_directory_excluded("/project/build/output") is True
+        assert filter_instance.is_directory_excluded("/project/build") is False
+        assert filter_instance.is_directory_excluded("/project/src") is False
+        assert FileFilter().is_directory_excluded("/project/node_modules") is False
+        with pytest.raises(ValueError, match="directory_path cannot be empty"):
+            filter_instance.is_directory_excluded("")
+
+    def test_accepts_file_name_matches_extension_check(self, file_filter):
+        """Test name pre-check agrees with the extension check of filter_file."""
+        for path in ["/test/a.txt", "/test/B.MD", "/test/c.py", "/test/d.tmp",
+                     "/test/.txt", "/test/noext", "/test/trailing.", "/test/x.tar.md"]:
+            file_info = create_test_file_info(path, 1024, Path(path).suffix)
+            expected = file_filter._check_extension(file_info).should_process
+            assert file_filter.accepts_file_name(Path(path).name) is expected, path
+        assert FileFilter().accepts_file_name("anything.bin") is True
+
+    def test_accepts_file_size(self, file_filter):
+        """Test size pre-check uses the configured limits."""
+        assert file_filter.accepts_file_size(100) is True
+        assert file_filter.accepts_file_size(1024 * 1024) is True
+        assert file_filter.accepts_file_size(99) is False
+        assert file_filter.accepts_file_size(1024 * 1024 + 1) is False
+
     def test_get_supported_extensions(self, file_filter):
         """Test getting supported extensions."""
         extensions = file_filter.get_supported_extensions()
@@ -0,0 +1,62 @@
+"""
+Tests for Pattern Matcher
+
+Unit tests for compiled glob pattern sets, checked against PurePath.match.
+"""
+
+import pytest
+from pathlib import PurePosixPath
+
+from docanalyzer.filters.pattern_matcher import PatternMatcher
+
+PATTERNS = [
+    "*.log", "*.tar.gz", "node_modules", ".git", "build/*", "*/cache/*.bin",
+    "/abs/*.txt", "doc?.md", "[abc]*.py", "[!x]y.txt", "a*b*c", "*", "weird[.txt"
+]
+
+PATHS = [
+    "/project/app.log", "/project/.log", "/project/app.log.1", "/project/pkg.tar.gz",
+    "/project/node_modules", "/project/node_modules/pkg/index.js", "/.git",
+    "/project/build/out.txt", "/project/build/sub/out.txt", "build/out.txt",
+    "/project/x/cache/blob.bin", "/abs/notes.txt", "/other/abs/notes.txt", "abs/notes.txt",
+    "/project/doc1.md", "/project/doc10.md", "/project/alpha.py", "/project/delta.py",
+    "/project/ay.txt", "/project/xy.txt", "/project/a-b-c", "/project/a/b/c",
+    "/project/weird[.txt", "README", "/"
+]
+
+
+class TestPatternMatcher:
+    """Test suite for PatternMatcher class."""
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    def test_match_equals_path_match(self, pattern):
+        """Test each pattern matches exactly the paths PurePosixPath.match does."""
+        matcher = PatternMatcher([pattern])
+
+        for path in PATHS:
+            expected = PurePosixPath(path).match(pattern)
+            assert (matcher.match(path) == pattern) is expected, path
+
+    def test_match_combined_patterns(self):
+        """Test combined matcher reports a matching pattern or None."""
+        # Arrange
+        matcher = PatternMatcher(["*.log", "node_modules", "build/*", "/abs/*.txt"])
+
+        # Act & Assert
+        assert matcher.match("/project/debug.log") == "*.log"
+        assert matcher.match("/project/node_modules") == "node_modules"
+        assert matcher.match("/project/build/out.txt") == "build/*"
+        assert matcher.match("/abs/notes.txt") == "/abs/*.txt"
+        assert matcher.match("/project/README.md") is None
+        assert len(matcher) == 4
+
+    def test_empty_matcher(self):
+        """Test matcher without patterns matches nothing."""
+        assert PatternMatcher([]).match("/project/file.txt") is None
+
+    def test_invalid_patterns(self):
+        """Test empty and non-string patterns are rejected."""
+        with pytest.raises(ValueError, match="pattern cannot be empty"):
+            PatternMatcher([""])
+        with pytest.raises(TypeError, match="pattern must be string"):
+            PatternMatcher([None])
@@ -273,6 +273,67 @@ class TestFileInfo:
         assert file_info.file_path in repr_str
         assert str(file_info.file_size) in repr_str
         assert file_info.processing_status in repr_str
+    
+    def test_from_stat(self, temp_file):
+        """Test trusted creation from stat data without further system calls."""
+        # Arrange
+        stat_result = os.stat(temp_file)
+        
+        # Act
+        with patch("os.path.exists") as mock_exists, patch("os.stat") as mock_stat:
+            file_info = FileInfo.from_stat(temp_file, stat_result)
+            file_id = file_info.file_id
+            mtime_ns = file_info.mtime_ns
+        
+        # Assert
+        mock_exists.assert_not_called()
+        mock_stat.assert_not_called()
+        assert file_info.file_size == stat_result.st_size
+        assert file_info.processing_status == "pending"
+        assert file_id == (stat_result.st_dev, stat_result.st_ino)
+        assert mtime_ns == stat_result.st_mtime_ns
+        assert file_info.modification_time == datetime.fromtimestamp(stat_result.st_mtime_ns / 1_000_000_000)
+        assert file_info.metadata["extension"] == ".txt"
+        assert file_info.metadata["inode"] == stat_result.st_ino
+        assert file_info == FileInfo(temp_file, stat_result.st_size, file_info.modification_time)
+    
+    def test_slots(self, file_info):
+        """Test instances have no per-instance dictionary."""
+        with pytest.raises(AttributeError):
+            file_info.unknown_attribute = 1
+    
+    def test_mtime_ns_and_file_id_without_stat(self, temp_file):
+        """Test nanosecond mtime and file id fall back to metadata."""
+        # Arrange
+        modification_time = datetime(2024, 1, 2, 3, 4, 5)
+        
+        # Act
+        plain = FileInfo(temp_file, 12, modification_time)
+        recorded = FileInfo(temp_file, 12, modification_time, metadata={"device": 1, "inode": 2, "mtime_ns": 5})
+        
+        # Assert
+        assert plain.file_id is None
+        assert plain.mtime_ns == int(modification_time.timestamp() * 1_000_000_000)
+        assert recorded.file_id == (1, 2)
+        assert recorded.mtime_ns == 5
+    
+    def test_set_modification_time_updates_mtime_ns(self, temp_file):
+        """Test setting modification_time replaces nanosecond mtime everywhere."""
+        # Arrange
+        modification_time = datetime(2024, 1, 2, 3, 4, 5)
+        expected = int(modification_time.timestamp() * 1_000_000_000)
+        recorded = FileInfo(temp_file, 12, datetime.now(), metadata={"mtime_ns": 5})
+        scanned = FileInfo.from_stat(temp_file, os.stat(temp_file))
+        
+        # Act
+        recorded.modification_time = modification_time
+        scanned.modification_time = modification_time
+        
+        # Assert
+        for file_info in (recorded, scanned):
+            assert file_info.modification_time == modification_time
+            assert file_info.mtime_ns == expected
+            assert file_info.metadata["mtime_ns"] == expected
 
 
 class TestDirectory:
@@ -298,6 +298,53 @@ class TestProcessingBlock:
         assert processing_block.block_type in repr_str
         assert "lines=1-1" in repr_str
         assert processing_block.processing_status.value in repr_str
+    
+    def test_map_to_source(self, processing_block):
+        """Test content is decoded from source after mapping."""
+        # Arrange
+        source = Mock()
+        source.decode.return_value = "Hello world"
+        
+        # Act
+        processing_block.map_to_source(source, 5, 16)
+        
+        # Assert
+        assert processing_block.is_mapped is True
+        assert processing_block.content == "Hello world"
+        assert processing_block.content_length == 11
+        source.decode.assert_called_with(5, 16)
+    
+    def test_update_content_detaches_source(self, processing_block):
+        """Test setting content drops the source mapping."""
+        # Arrange
+        processing_block.map_to_source(Mock(), 5, 16)
+        
+        # Act
+        processing_block.update_content("New content")
+        
+        # Assert
+        assert processing_block.is_mapped is False
+        assert processing_block.source is None
+        assert processing_block.start_byte is None
+        assert processing_block.content == "New content"
+    
+    def test_pickle_mapped_block(self, processing_block):
+        """Test pickling a mapped block stores its decoded content."""
+        import pickle
+        
+        # Arrange
+        source = Mock()
+        source.decode.return_value = "Hello world"
+        processing_block.map_to_source(source, 5, 16)
+        
+        # Act
+        restored = pickle.loads(pickle.dumps(processing_block))
+        
+        # Assert
+        assert restored.is_mapped is False
+        assert restored.source is None
+        assert restored == processing_block
+        assert processing_block.is_mapped is True
 
 
 class TestFileProcessingResult:
@@ -360,6 +360,21 @@ class TestBaseProcessor:
         with pytest.raises(ValueError, match="File too large"):
             processor.validate_file_path(str(test_file))
     
+    def test_validate_file_path_without_size_check(self, tmp_path):
+        """Test validate_file_path skipping the size limit."""
+        processor = ConcreteProcessor(max_file_size_bytes=10)
+        
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("this content is longer than 10 bytes")
+        other_file = tmp_path / "test.pdf"
+        other_file.write_text("this content is longer than 10 bytes")
+        
+        # Should not raise any exception
+        processor.validate_file_path(str(test_file), check_size=False)
+        
+        with pytest.raises(ValueError, match="File type not supported"):
+            processor.validate_file_path(str(other_file), check_size=False)
+    
     def test_validate_file_path_unsupported_type(self, tmp_path):
         """Test validate_file_path with unsupported file type."""
         processor = ConcreteProcessor(supported_extensions=["txt"])
@@ -0,0 +1,116 @@
+"""
+Tests for Encoding Detector
+
+Unit tests for byte order mark and prefix based encoding detection.
+"""
+
+import codecs
+
+import pytest
+
+from docanalyzer.processors.encoding_detector import EncodingDetector
+
+
+class TestEncodingDetector:
+    """Test suite for EncodingDetector class."""
+
+    def test_init_invalid(self):
+        """Test initialization with invalid parameters."""
+        with pytest.raises(ValueError, match="encodings cannot be empty"):
+            EncodingDetector([])
+
+        with pytest.raises(ValueError, match="prefix_size must be positive integer"):
+            EncodingDetector(["utf-8"], prefix_size=0)
+
+        with pytest.raises(LookupError):
+            EncodingDetector(["no-such-encoding"])
+
+    @pytest.mark.parametrize("data, encoding", [
+        (codecs.BOM_UTF8 + b"text", "utf-8-sig"),
+        (codecs.BOM_UTF16_LE + "text".encode("utf-16-le"), "utf-16"),
+        (codecs.BOM_UTF16_BE + "text".encode("utf-16-be"), "utf-16"),
+        (codecs.BOM_UTF32_LE + "text".encode("utf-32-le"), "utf-32"),
+        (b"text", None),
+    ])
+    def test_sniff_bom(self, data, encoding):
+        """Test byte order marks select their encoding."""
+        detector = EncodingDetector(["utf-8", "latin-1"])
+
+        assert detector.sniff_bom(data) == encoding
+
+    def test_candidates_bom_first(self):
+        """Test byte order mark encoding is tried before the fallbacks."""
+        detector = EncodingDetector(["utf-8", "latin-1"])
+
+        assert detector.candidates(codecs.BOM_UTF8 + b"text") == ["utf-8-sig", "utf-8", "latin-1"]
+        assert detector.candidates(codecs.BOM_UTF16_LE + b"\xe9") == ["utf-16", "latin-1"]
+
+    def test_decode_false_bom_falls_back(self):
+        """Test content starting with BOM bytes falls back to other encodings."""
+        detector = EncodingDetector(["utf-8", "latin-1"])
+
+        # UTF-16 surrogate without its pair after a UTF-16 BOM
+        data = codecs.BOM_UTF16_LE + b"\x00\xd8ab"
+
+        assert detector.decode(data) == (str(data, "latin-1"), "latin-1")
+
+    def test_decode_bom(self):
+        """Test byte order mark is tried first and is stripped."""
+        detector = EncodingDetector(["utf-8", "latin-1"])
+
+        assert detector.decode(codecs.BOM_UTF8 + b"Caf\xc3\xa9") == ("Café", "utf-8-sig")
+        assert detector.decode("Größe\r\n".encode("utf-16")) == ("Größe\n", "utf-16")
+
+    def test_decode_translates_newlines(self):
+        """Test text equals reading in text mode."""
+        detector = EncodingDetector(["utf-8"])
+
+        assert detector.decode(b"a\r\nb\rc\n") == ("a\nb\nc\n", "utf-8")
+        assert detector.decode(b"") == ("", "utf-8")
+
+    def test_candidates_reject_prefix(self):
+        """Test encodings failing on the prefix are not candidates."""
+        detector = EncodingDetector(["utf-8", "ascii", "latin-1"])
+
+        assert detector.candidates(b"Caf\xe9 ") == ["latin-1"]
+        assert detector.candidates(b"Caf\xc3\xa9") == ["utf-8", "latin-1"]
+
+    def test_candidates_partial_sequence(self):
+        """Test sequence cut at the end of a partial prefix is accepted."""
+        detector = EncodingDetector(["utf-8", "latin-1"])
+
+        assert detector.candidates(b"Caf\xc3") == ["utf-8", "latin-1"]
+        assert detector.candidates(b"Caf\xc3", final=True) == ["latin-1"]
+
+    def test_decode_error_after_prefix(self):
+        """Test next candidate is used when decoding fails after the prefix."""
+        detector = EncodingDetector(["utf-8", "latin-1"], prefix_size=4)
+
+        assert detector.decode(b"Text Caf\xe9") == ("Text Café", "latin-1")
+
+    def test_decode_no_encoding(self):
+        """Test error when no candidate decodes the content."""
+        detector = EncodingDetector(["utf-8", "ascii"])
+
+        with pytest.raises(UnicodeDecodeError):
+            detector.decode(b"Caf\xe9")
+
+    def test_detect_file(self, tmp_path):
+        """Test file detection validates the whole file in chunks."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_bytes(b"x" * 100 + b"Caf\xe9")
+        detector = EncodingDetector(["utf-8", "latin-1"], prefix_size=10)
+
+        assert detector.detect_file(str(file_path), chunk_size=7) == "latin-1"
+
+        file_path.write_bytes(("x" * 100 + "Café").encode("utf-8"))
+        assert detector.detect_file(str(file_path), chunk_size=7) == "utf-8"
+
+    def test_detect_file_no_encoding(self, tmp_path):
+        """Test file detection error when no candidate decodes the file."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_bytes(b"x" * 100 + b"Caf\xe9")
+        detector = EncodingDetector(["utf-8"], prefix_size=10)
+
+        with pytest.raises(UnicodeDecodeError):
+            detector.detect_file(str(file_path))
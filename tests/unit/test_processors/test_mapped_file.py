@@ -0,0 +1,226 @@
+"""
+Tests for Mapped File
+
+Unit tests for memory-mapped source files and offset-only blocks.
+"""
+
+import os
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from docanalyzer.models.processing import ProcessingBlock
+from docanalyzer.processors.encoding_detector import EncodingDetector
+from docanalyzer.processors.mapped_file import MappedFile
+from docanalyzer.processors.markdown_processor import MarkdownProcessor
+from docanalyzer.processors.text_processor import TextProcessor, TextBlockExtractor
+
+
+UTF8 = EncodingDetector(["utf-8"])
+
+
+def make_block(content):
+    """Create ProcessingBlock with given content."""
+    return ProcessingBlock(content, "text_paragraph", 1, 1, 0, len(content))
+
+
+class TestMappedFile:
+    """Test suite for MappedFile class."""
+
+    def test_read_text_translates_newlines(self, tmp_path):
+        """Test text equals reading the file in text mode."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_bytes("Line 1\r\nLine 2\rLine é\n".encode("utf-8"))
+
+        with MappedFile(str(file_path), UTF8) as mapped_file:
+            assert mapped_file.read_text() == file_path.read_text(encoding="utf-8")
+            assert mapped_file.encoding == "utf-8"
+
+    def test_read_text_encoding_fallback(self, tmp_path):
+        """Test next encoding is used when decoding fails."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_bytes(b"Caf\xe9")
+
+        with MappedFile(str(file_path), EncodingDetector(["utf-8", "latin-1"])) as mapped_file:
+            assert mapped_file.read_text() == "Café"
+            assert mapped_file.encoding == "latin-1"
+
+        with MappedFile(str(file_path), UTF8) as mapped_file:
+            with pytest.raises(UnicodeDecodeError):
+                mapped_file.read_text()
+
+    def test_map_blocks_after_bom(self, tmp_path):
+        """Test byte order mark is neither decoded nor mapped."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_bytes(b"\xef\xbb\xbfFirst.\n\nSecond.")
+        blocks = [make_block("First."), make_block("Second.")]
+
+        with MappedFile(str(file_path), UTF8) as mapped_file:
+            assert mapped_file.read_text() == "First.\n\nSecond."
+            assert mapped_file.encoding == "utf-8-sig"
+            assert mapped_file.map_blocks(blocks) == 2
+            assert (blocks[0].start_byte, blocks[0].end_byte) == (3, 9)
+            assert [block.content for block in blocks] == ["First.", "Second."]
+
+    def test_empty_file(self, tmp_path):
+        """Test empty files are read without a mapping."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("")
+
+        with MappedFile(str(file_path), UTF8) as mapped_file:
+            assert mapped_file.read_text() == ""
+            assert mapped_file.map_blocks([make_block("text")]) == 0
+
+    def test_map_blocks(self, tmp_path):
+        """Test verbatim blocks are mapped and others keep content."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("Größe one.\n\n**Bold** two.\n\nThree.", encoding="utf-8")
+        blocks = [make_block("Größe one."), make_block("Bold two."), make_block("Three.")]
+
+        mapped_file = MappedFile(str(file_path), UTF8)
+        mapped_file.read_text()
+
+        assert mapped_file.map_blocks(blocks) == 2
+        assert [block.is_mapped for block in blocks] == [True, False, True]
+        assert (blocks[0].start_byte, blocks[0].end_byte) == (0, len("Größe one.".encode("utf-8")))
+        assert [block.content for block in blocks] == ["Größe one.", "Bold two.", "Three."]
+
+    def test_decode_after_close(self, tmp_path):
+        """Test mapped blocks cannot decode from a closed mapping."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("Some text")
+        block = make_block("Some text")
+
+        mapped_file = MappedFile(str(file_path), UTF8)
+        mapped_file.read_text()
+        mapped_file.map_blocks([block])
+        mapped_file.close()
+
+        with pytest.raises(ValueError, match="is closed"):
+            block.content
+
+    def test_decode_after_truncation(self, tmp_path):
+        """Test truncated files raise instead of faulting."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("x" * 10000)
+        block = make_block("x" * 10000)
+
+        with MappedFile(str(file_path), UTF8) as mapped_file:
+            mapped_file.read_text()
+            mapped_file.map_blocks([block])
+            os.truncate(file_path, 0)
+
+            with pytest.raises(ValueError, match="changed since it was mapped"):
+                ProcessingBlock.validate_sources([block])
+
+    def test_decode_after_modification(self, tmp_path):
+        """Test rewriting the file with the same size is detected."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("First paragraph.")
+        block = make_block("First paragraph.")
+
+        with MappedFile(str(file_path), UTF8) as mapped_file:
+            mapped_file.read_text()
+            mapped_file.map_blocks([block])
+            file_path.write_text("Other paragraph.")
+            stat_result = os.stat(file_path)
+            os.utime(file_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1000000))
+
+            with pytest.raises(ValueError, match="changed since it was mapped"):
+                mapped_file.validate()
+
+    def test_decode_does_not_stat_file(self, tmp_path):
+        """Test block content is decoded without checking the file each time."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("First paragraph.\n\nSecond paragraph.")
+        blocks = [make_block("First paragraph."), make_block("Second paragraph.")]
+
+        with MappedFile(str(file_path), UTF8) as mapped_file:
+            mapped_file.read_text()
+            mapped_file.map_blocks(blocks)
+
+            with patch("docanalyzer.processors.mapped_file.os.stat", wraps=os.stat) as stat:
+                ProcessingBlock.validate_sources(blocks)
+                contents = [block.content for block in blocks * 3]
+
+        assert stat.call_count == 1
+        assert contents == ["First paragraph.", "Second paragraph."] * 3
+
+    def test_pickle_keeps_offsets(self, tmp_path):
+        """Test pickled blocks map the file again instead of copying content."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("First paragraph.\n\nSecond paragraph.")
+        blocks = [make_block("First paragraph."), make_block("Second paragraph.")]
+        mapped_file = MappedFile(str(file_path), UTF8)
+        mapped_file.read_text()
+        mapped_file.map_blocks(blocks)
+
+        data = pickle.dumps(blocks)
+        restored = pickle.loads(data)
+
+        assert b"Second paragraph." not in data
+        assert all(block.is_mapped for block in restored)
+        assert restored[0].source is restored[1].source
+        assert [block.content for block in restored] == ["First paragraph.", "Second paragraph."]
+
+    def test_unpickle_after_modification(self, tmp_path):
+        """Test blocks unpickled after the file changed fail to decode."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("First paragraph.")
+        block = make_block("First paragraph.")
+        mapped_file = MappedFile(str(file_path), UTF8)
+        mapped_file.read_text()
+        mapped_file.map_blocks([block])
+        data = pickle.dumps(block)
+
+        file_path.write_text("Changed")
+        restored = pickle.loads(data)
+
+        with pytest.raises(ValueError, match="changed since it was mapped"):
+            ProcessingBlock.validate_sources([restored])
+
+
+class TestMappedProcessing:
+    """Test suite for processors reading through MappedFile."""
+
+    def test_text_processor_use_mmap(self, tmp_path):
+        """Test mapped text blocks equal blocks read as string."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("First  paragraph.\n\nSecond paragraph.\n\nThird paragraph.")
+        extractor = TextBlockExtractor(min_block_size=5)
+
+        expected = TextProcessor(block_extractor=extractor).process_file(str(file_path))
+        result = TextProcessor(block_extractor=extractor, use_mmap=True).process_file(str(file_path))
+
+        assert result.success is True
+        assert result.processing_metadata["mapped_blocks"] == 2
+        assert [block.is_mapped for block in result.blocks] == [False, True, True]
+        assert [block.content for block in result.blocks] == [block.content for block in expected.blocks]
+
+    def test_markdown_processor_use_mmap(self, tmp_path):
+        """Test mapped Markdown blocks equal blocks read as string."""
+        file_path = tmp_path / "readme.md"
+        file_path.write_text("# Title\n\nText with *emphasis*.\n\n```python\nprint(1)\n```\n")
+
+        expected = MarkdownProcessor().process_file(str(file_path))
+        result = MarkdownProcessor(use_mmap=True).process_file(str(file_path))
+
+        assert result.processing_metadata["mapped_blocks"] == 2
+        assert [block.content for block in result.blocks] == [block.content for block in expected.blocks]
+
+        # Blocks leave worker processes as offsets into the same file
+        restored = pickle.loads(pickle.dumps(result.blocks))
+        assert [block.is_mapped for block in restored] == [block.is_mapped for block in result.blocks]
+        assert restored == result.blocks
+
+    def test_use_mmap_read_error(self, tmp_path):
+        """Test failed decoding returns failed result."""
+        file_path = tmp_path / "test.txt"
+        file_path.write_bytes(b"text")
+        error = UnicodeDecodeError("utf-8", b"", 0, 1, "invalid")
+
+        with patch.object(MappedFile, "read_text", side_effect=error):
+            result = TextProcessor(use_mmap=True).process_file(str(file_path))
+
+        assert result.success is False
@@ -289,6 +289,41 @@ class TestMarkdownParser:
         
         assert "~~strikethrough~~" not in cleaned
         assert "strikethrough" in cleaned
+    
+    def test_clean_content_passes_apply_in_order(self):
+        """Test later passes see the output of earlier ones."""
+        parser = MarkdownParser()
+        
+        assert parser._clean_content("*a **b** c*") == "a b c"
+        assert parser._clean_content("  plain text  ") == "plain text"
+        assert parser._clean_content("![](img.png) and [x](y)") == "and x"
+    
+    def test_parse_markdown_skips_bare_markers(self):
+        """Test markers without content end paragraphs and are skipped."""
+        parser = MarkdownParser()
+        markdown = "text\n- \nmore\n#  \n```\nafter fence\n>\n> quoted"
+        
+        elements = parser.parse_markdown(markdown)
+        
+        assert [(e.element_type, e.content, e.line_number) for e in elements] == [
+            ("paragraph", "text", 1),
+            ("paragraph", "more", 3),
+            ("paragraph", "after fence", 6),
+            ("blockquote", "quoted", 7)
+        ]
+    
+    def test_parse_markdown_list_continuation(self):
+        """Test indented lines continue the list item above them."""
+        parser = MarkdownParser()
+        markdown = "- first\n  still first\n  - nested\n2. second"
+        
+        elements = parser.parse_markdown(markdown)
+        
+        assert [(e.content, e.level, e.metadata["marker"]) for e in elements] == [
+            ("first still first - nested", 1, "-"),
+            ("second", 1, "2.")
+        ]
+        assert elements[1].line_number == 4
 
 
 class TestMarkdownProcessor:
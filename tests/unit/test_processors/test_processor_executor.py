@@ -0,0 +1,122 @@
+"""
+Tests for Processor Executor
+
+Unit tests for running file processors in process and thread pools.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from docanalyzer.processors.processor_executor import ProcessorExecutor
+from docanalyzer.processors.text_processor import TextProcessor
+from docanalyzer.processors.markdown_processor import MarkdownProcessor
+
+
+class TestProcessorExecutor:
+    """Test suite for ProcessorExecutor class."""
+
+    @pytest.fixture
+    def markdown_file(self, tmp_path):
+        """Create sample Markdown file."""
+        file_path = tmp_path / "readme.md"
+        file_path.write_text("# Title\n\nFirst paragraph.\n\n## Section\n\nSecond paragraph.")
+        return str(file_path)
+
+    @pytest.fixture
+    def text_file(self, tmp_path):
+        """Create sample text file."""
+        file_path = tmp_path / "notes.txt"
+        file_path.write_text("First paragraph of the notes.\n\nSecond paragraph of the notes.")
+        return str(file_path)
+
+    def test_init_invalid_mode(self):
+        """Test initialization with invalid mode."""
+        with pytest.raises(ValueError, match="mode must be one of"):
+            ProcessorExecutor(mode="fiber")
+
+    def test_init_invalid_max_workers(self):
+        """Test initialization with invalid worker count."""
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            ProcessorExecutor(max_workers=0)
+
+    def test_init_invalid_start_method(self):
+        """Test initialization with unknown start method."""
+        with pytest.raises(ValueError, match="start_method must be one of"):
+            ProcessorExecutor(start_method="clone")
+
+    def test_process_pool_uses_start_method(self):
+        """Test worker processes are not started with fork by default."""
+        executor = ProcessorExecutor(mode="process", max_workers=1)
+        try:
+            pool = executor._get_pool("notes.md")
+            assert executor.start_method != "fork"
+            assert pool._mp_context.get_start_method() == executor.start_method
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_process_file_in_process_pool(self, markdown_file):
+        """Test processing result is returned from worker process."""
+        # Arrange
+        executor = ProcessorExecutor(mode="process", max_workers=1)
+        processor = MarkdownProcessor()
+        expected = processor.process_file(markdown_file)
+
+        # Act
+        try:
+            result = await executor.process_file(processor, markdown_file)
+        finally:
+            executor.shutdown()
+
+        # Assert
+        assert result.success is True
+        assert [block.content for block in result.blocks] == [block.content for block in expected.blocks]
+
+    @pytest.mark.asyncio
+    async def test_thread_extensions_use_thread_pool(self, text_file):
+        """Test listed extensions run in the thread pool."""
+        # Arrange
+        executor = ProcessorExecutor(mode="process", max_workers=1, thread_extensions=[".TXT"])
+
+        # Act
+        try:
+            result = await executor.process_file(TextProcessor(), text_file)
+            used_process_pool = executor._process_pool is not None
+        finally:
+            executor.shutdown()
+
+        # Assert
+        assert result.success is True
+        assert used_process_pool is False
+
+    @pytest.mark.asyncio
+    async def test_process_content_in_thread_pool(self, text_file):
+        """Test content processing runs in thread mode."""
+        # Arrange
+        executor = ProcessorExecutor(mode="thread", max_workers=2)
+
+        # Act
+        result = await executor.process_content(
+            TextProcessor(), "Some text content long enough to form a block of its own.", text_file
+        )
+        executor.shutdown()
+
+        # Assert
+        assert result.success is True
+        assert result.total_blocks >= 1
+
+    @pytest.mark.asyncio
+    async def test_worker_exception_returns_failed_result(self, text_file):
+        """Test exceptions raised in workers become failed results."""
+        # Arrange
+        executor = ProcessorExecutor(mode="thread", max_workers=1)
+        processor = Mock()
+        processor.process_file.side_effect = RuntimeError("parser crashed")
+
+        # Act
+        result = await executor.process_file(processor, text_file)
+        executor.shutdown()
+
+        # Assert
+        assert result.success is False
+        assert "parser crashed" in result.error_message
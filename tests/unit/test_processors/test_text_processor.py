@@ -238,6 +238,86 @@ class TestTextBlockExtractor:
         blocks = extractor._split_large_block(text)
         
         assert len(blocks) == 0  # Should be filtered out
+    
+    @pytest.mark.parametrize("strategy,delimiters", [
+        ("paragraph", None),
+        ("line", None),
+        ("custom", ["---", "##"])
+    ])
+    def test_iter_blocks_matches_extract_blocks(self, strategy, delimiters):
+        """Test streamed extraction with separators across chunk edges."""
+        extractor = TextBlockExtractor(
+            strategy, min_block_size=5, max_block_size=40, custom_delimiters=delimiters
+        )
+        text = (
+            "First paragraph here.\n\nSecond one --- with ## parts.\n"
+            "Third line\n\n\n" + "word " * 30 + "\n\nEnd ---"
+        )
+        
+        for size in (1, 2, 3, 7, len(text)):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            assert list(extractor.iter_blocks(chunks)) == extractor.extract_blocks(text)
+    
+    def test_iter_blocks_cuts_long_segments(self):
+        """Test segments without separator are cut at max_segment_size."""
+        extractor = TextBlockExtractor("line", min_block_size=1, max_block_size=100)
+        text = "aaaa bbbb cccc dddd"
+        
+        blocks = list(extractor.iter_blocks([text], max_segment_size=8))
+        
+        assert blocks == ["aaaa\nbbbb\ncccc\ndddd"]
+        assert list(extractor.iter_blocks(["abcdefghij"], max_segment_size=4)) == ["abcd\nefgh\nij"]
+    
+    def test_iter_blocks_invalid_segment_size(self):
+        """Test iter_blocks with invalid max_segment_size."""
+        extractor = TextBlockExtractor()
+        
+        with pytest.raises(ValueError, match="max_segment_size must be positive integer"):
+            extractor.iter_blocks(["text"], max_segment_size=0)
+    
+    @pytest.mark.parametrize("delimiters,compiled", [
+        (["---", "##", "@@"], True),
+        (["--", "---"], False),
+        (["ab", "bc"], False),
+        ([" |"], False)
+    ])
+    def test_custom_delimiters_split_in_order(self, delimiters, compiled):
+        """Test single-pass splitting equals splitting by each delimiter in turn."""
+        extractor = TextBlockExtractor(
+            "custom", min_block_size=1, max_block_size=1, custom_delimiters=delimiters
+        )
+        text = "x---y##z@@ abc a--b---c | d |e"
+        
+        expected = [text]
+        for delimiter in delimiters:
+            parts = [piece for part in expected for piece in part.split(delimiter)]
+            expected = [part.strip() for part in parts if part.strip()]
+        
+        assert (extractor._delimiter_re is not None) is compiled
+        assert extractor._split_delimited(text, delimiters, extractor._delimiter_re) == expected
+    
+    def test_extract_blocks_many_delimiters(self):
+        """Test extraction with thousands of delimiters and occurrences."""
+        delimiters = [f"<sep{i}>" for i in range(2000)]
+        extractor = TextBlockExtractor(
+            "custom", min_block_size=1, max_block_size=10, custom_delimiters=delimiters
+        )
+        text = "".join(f"part{i}{delimiters[i]}" for i in range(2000))
+        
+        blocks = extractor.extract_blocks(text)
+        
+        assert blocks == [f"part{i}" for i in range(2000)]
+    
+    def test_extract_blocks_giant_paragraph(self):
+        """Test one paragraph larger than many blocks is split by words."""
+        extractor = TextBlockExtractor(min_block_size=10, max_block_size=100)
+        text = "word " * 100000
+        
+        blocks = extractor.extract_blocks(text)
+        
+        assert " ".join(blocks) == text.strip()
+        assert all(len(block) <= 100 for block in blocks)
+        assert list(extractor.iter_blocks([text[i:i + 7] for i in range(0, len(text), 7)])) == blocks
 
 
 class TestTextProcessor:
@@ -278,6 +358,11 @@ class TestTextProcessor:
         with pytest.raises(ValueError, match="encoding cannot be empty"):
             TextProcessor(encoding="")
     
+    def test_init_invalid_stream_buffer_size(self):
+        """Test initialization with invalid stream buffer size."""
+        with pytest.raises(ValueError, match="stream_buffer_size must be positive integer"):
+            TextProcessor(stream_buffer_size=0)
+    
     def test_process_file_success(self, tmp_path):
         """Test successful file processing."""
         extractor = TextBlockExtractor(min_block_size=5)
@@ -359,6 +444,55 @@ class TestTextProcessor:
         with pytest.raises(ValueError, match="File too large"):
             processor.process_file(str(test_file))
     
+    def test_iter_file_blocks_matches_process_file(self, tmp_path):
+        """Test streamed blocks equal blocks of process_file."""
+        extractor = TextBlockExtractor(min_block_size=5, max_block_size=60)
+        processor = TextProcessor(block_extractor=extractor, stream_buffer_size=7)
+        
+        test_file = tmp_path / "test.txt"
+        test_file.write_text(
+            "  Leading   spaces.\n\n\n\nSecond    paragraph\nwith lines.\n \n \n"
+            "Third paragraph is a bit longer than the others. " * 3 + "\n\n\n"
+        )
+        
+        expected = processor.process_file(str(test_file)).blocks
+        blocks = list(processor.iter_file_blocks(str(test_file)))
+        
+        assert [b.content for b in blocks] == [b.content for b in expected]
+        assert [b.start_char for b in blocks] == [b.start_char for b in expected]
+        assert [b.metadata for b in blocks] == [b.metadata for b in expected]
+    
+    def test_iter_file_blocks_ignores_size_limit(self, tmp_path):
+        """Test streaming is not limited by max_file_size_bytes."""
+        extractor = TextBlockExtractor(min_block_size=5)
+        processor = TextProcessor(block_extractor=extractor, max_file_size_bytes=10)
+        
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Paragraph 1.\n\nParagraph 2.")
+        
+        blocks = list(processor.iter_file_blocks(str(test_file)))
+        
+        assert [b.content for b in blocks] == ["Paragraph 1.", "Paragraph 2."]
+    
+    def test_iter_file_blocks_encoding_fallback(self, tmp_path):
+        """Test streaming falls back before yielding any block."""
+        extractor = TextBlockExtractor(min_block_size=5)
+        processor = TextProcessor(block_extractor=extractor, stream_buffer_size=4)
+        
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"Valid start.\n\nThen \xe9 later")
+        
+        blocks = list(processor.iter_file_blocks(str(test_file)))
+        
+        assert [b.content for b in blocks] == ["Valid start.", "Then \xe9 later"]
+    
+    def test_iter_file_blocks_nonexistent(self):
+        """Test streaming a nonexistent file."""
+        processor = TextProcessor()
+        
+        with pytest.raises(FileNotFoundError):
+            processor.iter_file_blocks("/nonexistent/file.txt")
+    
     def test_process_file_with_normalization(self, tmp_path):
         """Test file processing with whitespace normalization."""
         extractor = TextBlockExtractor(min_block_size=5)
@@ -19,6 +19,9 @@ from docanalyzer.models.processing import ProcessingBlock, FileProcessingResult,
 from docanalyzer.models.file_system.file_info import FileInfo
 from docanalyzer.models.errors import ValidationError
 from docanalyzer.services.vector_store_wrapper import VectorStoreWrapper
+from docanalyzer.services.embedding_client import EmbeddingClient
+from docanalyzer.services.embedding_cache import EmbeddingCache
+from docanalyzer.config.unified_config import EmbeddingConfig
 
 
 @pytest.fixture
@@ -701,8 +704,8 @@ class TestChunkingManager:
     async def test_generate_embedding_success(self, mock_client, chunking_manager):
         """Test successful embedding generation."""
         # Arrange
-        mock_response = AsyncMock()
-        mock_response.json = AsyncMock(return_value={
+        mock_response = Mock()
+        mock_response.json = Mock(return_value={
             "result": {
                 "success": True,
                 "data": {
@@ -711,9 +714,8 @@ class TestChunkingManager:
             }
         })
         
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_client.return_value.post = AsyncMock(return_value=mock_response)
+        chunking_manager.embedding_client = EmbeddingClient(EmbeddingConfig())
         
         # Act
         embedding = await chunking_manager._generate_embedding("Test text")
@@ -727,17 +729,16 @@ class TestChunkingManager:
     async def test_generate_embedding_failure(self, mock_client, chunking_manager):
         """Test embedding generation failure."""
         # Arrange
-        mock_response = AsyncMock()
-        mock_response.json = AsyncMock(return_value={
+        mock_response = Mock()
+        mock_response.json = Mock(return_value={
             "result": {
                 "success": False,
                 "error": "Embedding failed"
             }
         })
         
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_client.return_value.post = AsyncMock(return_value=mock_response)
+        chunking_manager.embedding_client = EmbeddingClient(EmbeddingConfig())
         
         # Act & Assert
         with pytest.raises(Exception, match="Failed to generate embedding"):
@@ -748,8 +749,8 @@ class TestChunkingManager:
     async def test_generate_embedding_invalid_dimensions(self, mock_client, chunking_manager):
         """Test embedding generation with invalid dimensions."""
         # Arrange
-        mock_response = AsyncMock()
-        mock_response.json = AsyncMock(return_value={
+        mock_response = Mock()
+        mock_response.json = Mock(return_value={
             "result": {
                 "success": True,
                 "data": {
@@ -758,9 +759,8 @@ class TestChunkingManager:
             }
         })
         
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post = AsyncMock(return_value=mock_response)
-        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_client.return_value.post = AsyncMock(return_value=mock_response)
+        chunking_manager.embedding_client = EmbeddingClient(EmbeddingConfig())
         
         # Act & Assert
         with pytest.raises(Exception, match="Invalid embedding dimensions"):
@@ -827,7 +827,7 @@ class TestChunkingManager:
         
         # Mock validation and embedding generation
         chunking_manager.validate_chunk = AsyncMock(return_value=True)
-        chunking_manager._generate_embedding = AsyncMock(return_value=[0.1] * 384)
+        chunking_manager._generate_embeddings = AsyncMock(return_value=[[0.1] * 384])
         
         # Mock vector store response
         mock_response = Mock()
@@ -843,6 +843,63 @@ class TestChunkingManager:
         assert errors == []
         chunking_manager.vector_store_wrapper.create_chunks.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_save_chunks_atomic_embeds_all_chunks_in_one_call(self, chunking_manager):
+        """Test atomic saving requests embeddings for all chunks together."""
+        # Arrange
+        from docanalyzer.services.chunking_manager import SemanticChunk
+        import uuid
+        
+        source_id = str(uuid.uuid4())
+        chunks = [
+            SemanticChunk("/path/to/file.txt", source_id, f"Content {i}")
+            for i in range(3)
+        ]
+        
+        embedding_client = Mock(spec=EmbeddingClient)
+        embedding_client.embed_texts = AsyncMock(return_value=[[0.1] * 384] * 3)
+        chunking_manager.embedding_client = embedding_client
+        
+        mock_response = Mock()
+        mock_response.success = True
+        mock_response.created_count = 3
+        chunking_manager.vector_store_wrapper.create_chunks.return_value = mock_response
+        
+        # Act
+        saved_count, errors = await chunking_manager.save_chunks_atomic(chunks)
+        
+        # Assert
+        assert saved_count == 3
+        assert errors == []
+        embedding_client.embed_texts.assert_called_once_with(
+            ["Content 0", "Content 1", "Content 2"]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_uses_cache(self, chunking_manager, tmp_path):
+        """Test cached texts are not sent to embedding service."""
+        # Arrange
+        cache = EmbeddingCache(
+            cache_path=str(tmp_path / "cache.sqlite"), max_bytes=1024 * 1024, namespace="test"
+        )
+        cache.put_many(["Licence header"], [[0.5] * 4])
+        embedding_client = Mock(spec=EmbeddingClient)
+        embedding_client.embed_texts = AsyncMock(return_value=[[0.25] * 4])
+        chunking_manager.embedding_client = embedding_client
+        chunking_manager.embedding_cache = cache
+        
+        # Act
+        embeddings = await chunking_manager._generate_embeddings(
+            ["Licence header", "New text", "New text"]
+        )
+        repeated = await chunking_manager._generate_embeddings(["New text"])
+        
+        # Assert
+        assert embeddings == [[0.5] * 4, [0.25] * 4, [0.25] * 4]
+        assert repeated == [[0.25] * 4]
+        embedding_client.embed_texts.assert_called_once_with(["New text"])
+        await chunking_manager.cleanup()
+    
     @pytest.mark.asyncio
     async def test_save_chunks_atomic_empty_list(self, chunking_manager):
         """Test atomic saving with empty chunks list."""
@@ -890,7 +947,7 @@ class TestChunkingManager:
         chunks = [chunk]
         
         chunking_manager.validate_chunk = AsyncMock(return_value=True)
-        chunking_manager._generate_embedding = AsyncMock(side_effect=Exception("Embedding failed"))
+        chunking_manager._generate_embeddings = AsyncMock(side_effect=Exception("Embedding failed"))
         
         # Act
         saved_count, errors = await chunking_manager.save_chunks_atomic(chunks)
@@ -916,7 +973,7 @@ class TestChunkingManager:
         chunks = [chunk]
         
         chunking_manager.validate_chunk = AsyncMock(return_value=True)
-        chunking_manager._generate_embedding = AsyncMock(return_value=[0.1] * 384)
+        chunking_manager._generate_embeddings = AsyncMock(return_value=[[0.1] * 384])
         
         # Mock vector store failure
         mock_response = Mock()
@@ -56,6 +56,23 @@ class TestOrchestratorConfig:
         assert config.enable_progress_tracking is True
         assert config.enable_error_recovery is True
         assert config.enable_cleanup_on_failure is True
+        assert config.max_concurrent_files == 8
+    
+    def test_init_invalid_max_concurrent_files(self):
+        """Test initialization with invalid max_concurrent_files."""
+        with pytest.raises(ValueError, match="max_concurrent_files must be positive"):
+            OrchestratorConfig(max_concurrent_files=0)
+    
+    def test_init_invalid_processor_executor_mode(self):
+        """Test initialization with invalid processor executor settings."""
+        with pytest.raises(ValueError, match="processor_executor_mode must be one of"):
+            OrchestratorConfig(processor_executor_mode="fiber")
+        
+        with pytest.raises(ValueError, match="processor_workers must be positive"):
+            OrchestratorConfig(processor_executor_mode="process", processor_workers=0)
+        
+        with pytest.raises(ValueError, match="processor_start_method must be one of"):
+            OrchestratorConfig(processor_start_method="clone")
     
     def test_init_invalid_max_concurrent_directories(self):
         """Test initialization with invalid max_concurrent_directories."""
@@ -71,6 +88,17 @@ class TestOrchestratorConfig:
         """Test initialization with invalid retry_attempts."""
         with pytest.raises(ValueError, match="retry_attempts must be non-negative"):
             OrchestratorConfig(retry_attempts=-1)
+    
+    def test_init_invalid_watch_settings(self):
+        """Test initialization with invalid watch settings."""
+        with pytest.raises(ValueError, match="watch_mode must be one of"):
+            OrchestratorConfig(watch_mode="fanotify")
+        
+        with pytest.raises(ValueError, match="scan_interval must be positive"):
+            OrchestratorConfig(scan_interval=0)
+        
+        with pytest.raises(ValueError, match="watch_debounce must be non-negative"):
+            OrchestratorConfig(watch_debounce=-1)
 
 
 class TestDirectoryProcessingStatus:
@@ -326,6 +354,71 @@ class TestDirectoryOrchestrator:
             assert len(orchestrator.active_directories) == 0
             assert orchestrator._processing is False
     
+    def test_init_file_processor_settings(self):
+        """Test file processor gets use_mmap, bulk storage and the shared batcher."""
+        with patch('docanalyzer.services.directory_orchestrator.LockManager'), \
+             patch('docanalyzer.services.directory_orchestrator.DirectoryScanner'), \
+             patch('docanalyzer.services.directory_orchestrator.FileProcessor') as file_processor_class, \
+             patch('docanalyzer.services.directory_orchestrator.ChunkingManager'), \
+             patch('docanalyzer.services.directory_orchestrator.DatabaseManager'), \
+             patch('docanalyzer.services.directory_orchestrator.VectorStoreWrapper'), \
+             patch('docanalyzer.services.directory_orchestrator.MainProcessManager'), \
+             patch('docanalyzer.services.directory_orchestrator.ChildProcessManager'):
+            
+            orchestrator = DirectoryOrchestrator(OrchestratorConfig(use_mmap=True))
+            
+            kwargs = file_processor_class.call_args.kwargs
+            assert kwargs["use_mmap"] is True
+            # Chunk embeddings go through the shared batcher only in bulk mode
+            assert kwargs["bulk_storage"] is True
+            assert kwargs["embedding_client"] is orchestrator.embedding_batcher
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_text_is_embedded_once(self, tmp_path):
+        """Test a second pass over unchanged files makes no embedding calls."""
+        from docanalyzer.config.unified_config import EmbeddingConfig
+        from docanalyzer.services.database_manager import DatabaseManager
+        from docanalyzer.services.vector_store_wrapper import VectorStoreWrapper
+        
+        embedding_config = EmbeddingConfig(cache_path=str(tmp_path / "cache.sqlite"))
+        vector_store = Mock(spec=VectorStoreWrapper)
+        vector_store.create_chunks_bulk = AsyncMock(
+            side_effect=lambda chunks, **kwargs: {
+                "success": True,
+                "stored_chunk_ids": [chunk["chunk_id"] for chunk in chunks]
+            }
+        )
+        database_manager = Mock(spec=DatabaseManager)
+        database_manager.create_file_record = AsyncMock()
+        files = []
+        for name in ("a.txt", "b.txt"):
+            file_path = tmp_path / name
+            file_path.write_text("Shared boilerplate paragraph.\n\nAnother shared paragraph.")
+            files.append(FileInfo(file_path=str(file_path), file_size=10, modification_time=datetime.now()))
+        
+        with patch('docanalyzer.services.directory_orchestrator.get_unified_config') as get_config, \
+             patch('docanalyzer.services.directory_orchestrator.LockManager'), \
+             patch('docanalyzer.services.directory_orchestrator.DirectoryScanner'), \
+             patch('docanalyzer.services.directory_orchestrator.DatabaseManager', return_value=database_manager), \
+             patch('docanalyzer.services.directory_orchestrator.VectorStoreWrapper', return_value=vector_store), \
+             patch('docanalyzer.services.directory_orchestrator.MainProcessManager'), \
+             patch('docanalyzer.services.directory_orchestrator.ChildProcessManager'):
+            get_config.return_value.embedding = embedding_config
+            orchestrator = DirectoryOrchestrator(OrchestratorConfig())
+        
+        embed_texts = AsyncMock(side_effect=lambda texts: [[float(len(text))] for text in texts])
+        orchestrator.embedding_batcher.embedding_client.embed_texts = embed_texts
+        
+        first = await orchestrator._process_files(files, str(tmp_path))
+        calls_after_first = embed_texts.call_count
+        second = await orchestrator._process_files(files, str(tmp_path))
+        await orchestrator.stop_all_processing()
+        
+        assert first.success is True and second.success is True
+        assert calls_after_first > 0
+        assert embed_texts.call_count == calls_after_first
+        assert orchestrator.embedding_cache._connection is None
+    
     def test_init_invalid_config(self):
         """Test orchestrator initialization with invalid config."""
         with pytest.raises(ValueError, match="config must be OrchestratorConfig instance"):
@@ -392,7 +485,7 @@ class TestDirectoryOrchestrator:
             assert result.files_processed == 2  # Updated by _process_files
             assert result.chunks_created == 4
             assert len(result.status_updates) > 0
-            mock_scan.assert_called_once_with(str(test_dir))
+            mock_scan.assert_called_once_with(str(test_dir), None)
             mock_process.assert_called_once()
             mock_chunk.assert_called_once()
             mock_store.assert_called_once()
@@ -464,6 +557,61 @@ class TestDirectoryOrchestrator:
             assert all(result.success for result in results)
             assert mock_process.call_count == 2
     
+    @pytest.mark.asyncio
+    async def test_process_multiple_directories_skips_nested(self, orchestrator, tmp_path):
+        """Test directories inside another listed directory are not processed again."""
+        docs = tmp_path / "docs"
+        (docs / "api").mkdir(parents=True)
+        
+        with patch.object(orchestrator, 'process_directory', new_callable=AsyncMock) as mock_process:
+            mock_process.return_value = OrchestrationResult(success=True, directory_path=str(docs))
+            
+            results = await orchestrator.process_multiple_directories([str(docs / "api"), str(docs)])
+        
+        mock_process.assert_called_once_with(str(docs), set())
+        assert [result.directory_path for result in results] == [str(docs / "api"), str(docs)]
+        assert all(result.success for result in results)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("incremental_scan", [False, True])
+    async def test_process_multiple_directories_linked_file_once(self, orchestrator, tmp_path, incremental_scan):
+        """Test a file hard linked into two directories is processed once per call."""
+        from docanalyzer.services.directory_scanner import DirectoryScanner
+        from docanalyzer.services.lock_manager import LockManager
+        from docanalyzer.services.scan_manifest import ScanManifest
+        from docanalyzer.filters.file_filter import FileFilter
+        from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+        
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        (first_dir / "shared.txt").write_text("shared content")
+        os.link(first_dir / "shared.txt", second_dir / "shared.txt")
+        (second_dir / "own.txt").write_text("own content")
+        manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        orchestrator.config.incremental_scan = incremental_scan
+        orchestrator.directory_scanner = DirectoryScanner(FileFilter(), Mock(spec=LockManager), manifest=manifest)
+        orchestrator.vector_store_wrapper.delete_file_chunks = AsyncMock(return_value=True)
+        
+        async def process_file(file_path):
+            return FileProcessingResult(
+                file_path=file_path,
+                blocks=[],
+                processing_status=ProcessingStatus.COMPLETED,
+                processing_time_seconds=0.01
+            )
+        
+        with patch.object(orchestrator.file_processor, 'process_file', side_effect=process_file) as mock_process, \
+             patch.object(orchestrator, '_create_chunks', new_callable=AsyncMock, return_value=Mock(success=True)), \
+             patch.object(orchestrator, '_store_results', new_callable=AsyncMock, return_value=True):
+            results = await orchestrator.process_multiple_directories([str(first_dir), str(second_dir)])
+        manifest.close()
+        
+        assert all(result.success for result in results)
+        processed = sorted(os.path.basename(c.args[0]) for c in mock_process.call_args_list)
+        assert processed == ["own.txt", "shared.txt"]
+    
     @pytest.mark.asyncio
     async def test_process_multiple_directories_empty_list(self, orchestrator):
         """Test processing empty directory list."""
@@ -636,7 +784,7 @@ class TestDirectoryOrchestrator:
             
             assert len(files) == 1
             assert files[0].file_path == str(test_file)
-            mock_scan.assert_called_once_with("/test/directory")
+            mock_scan.assert_called_once_with("/test/directory", seen_files=None)
     
     @pytest.mark.asyncio
     async def test_scan_directory_error(self, orchestrator):
@@ -685,6 +833,452 @@ class TestDirectoryOrchestrator:
             assert "Processed 2/2 files successfully" in result.message
             assert mock_process.call_count == 2
     
+    @pytest.mark.asyncio
+    async def test_process_files_concurrent_limit(self, orchestrator, tmp_path):
+        """Test concurrent file processing respects in-flight limit."""
+        from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+        
+        orchestrator.config.max_concurrent_files = 3
+        files = []
+        for i in range(10):
+            test_file = tmp_path / f"file_{i}.txt"
+            test_file.write_text(f"Content {i}")
+            files.append(FileInfo(file_path=str(test_file), file_size=10, modification_time=datetime.now()))
+        
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def mock_process_file(file_path):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return FileProcessingResult(
+                file_path=file_path,
+                blocks=[],
+                processing_status=ProcessingStatus.COMPLETED,
+                processing_time_seconds=0.01
+            )
+        
+        orchestrator.active_directories["/test/directory"] = DirectoryProcessingStatus(
+            directory_path="/test/directory",
+            status="processing"
+        )
+        
+        with patch.object(orchestrator.file_processor, 'process_file', side_effect=mock_process_file):
+            result = await orchestrator._process_files(files, "/test/directory")
+        
+        status = orchestrator.active_directories["/test/directory"]
+        assert result.success is True
+        assert max_in_flight == 3
+        assert status.files_processed == 10
+        assert status.progress_percentage == 100.0
+    
+    @pytest.mark.asyncio
+    async def test_process_files_streaming_scan(self, orchestrator, tmp_path):
+        """Test files from a streaming scan are processed while scanning continues."""
+        from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+        
+        orchestrator.config.max_concurrent_files = 2
+        for i in range(6):
+            (tmp_path / f"file_{i}.txt").write_text(f"Content {i}")
+        
+        events = []
+        
+        async def stream():
+            for i in range(6):
+                events.append(f"found {i}")
+                yield FileInfo(file_path=str(tmp_path / f"file_{i}.txt"), file_size=10, modification_time=datetime.now())
+        
+        async def mock_process_file(file_path):
+            events.append(f"processed {file_path}")
+            await asyncio.sleep(0)
+            return FileProcessingResult(
+                file_path=file_path,
+                blocks=[],
+                processing_status=ProcessingStatus.COMPLETED,
+                processing_time_seconds=0.01
+            )
+        
+        orchestrator.active_directories["/test/directory"] = DirectoryProcessingStatus(
+            directory_path="/test/directory",
+            status="processing"
+        )
+        
+        with patch.object(orchestrator.file_processor, 'process_file', side_effect=mock_process_file):
+            result = await orchestrator._process_files(stream(), "/test/directory")
+        
+        status = orchestrator.active_directories["/test/directory"]
+        assert result.success is True
+        assert result.data["total_files"] == 6
+        assert status.files_processed == 6
+        # Processing started before the scan finished
+        assert events.index("found 5") > next(i for i, e in enumerate(events) if e.startswith("processed"))
+    
+    @pytest.mark.asyncio
+    async def test_process_files_scan_failure_cancels_workers(self, orchestrator, tmp_path):
+        """Test workers still processing are cancelled when the scan fails."""
+        from docanalyzer.models.errors import ProcessingError
+        
+        orchestrator.config.max_concurrent_files = 2
+        (tmp_path / "file.txt").write_text("content")
+        started = asyncio.Event()
+        cancelled = []
+        
+        async def stream():
+            yield FileInfo(file_path=str(tmp_path / "file.txt"), file_size=7, modification_time=datetime.now())
+            await started.wait()
+            raise OSError("scan failed")
+        
+        async def mock_process_file(file_path):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(file_path)
+                raise
+        
+        with patch.object(orchestrator.file_processor, 'process_file', side_effect=mock_process_file):
+            with pytest.raises(ProcessingError, match="scan failed"):
+                await asyncio.wait_for(orchestrator._process_files(stream(), "/test/directory"), 1.0)
+        
+        assert cancelled == [str(tmp_path / "file.txt")]
+    
+    @pytest.mark.asyncio
+    async def test_process_directory_streaming_scan(self, orchestrator, tmp_path):
+        """Test process_directory consumes scan_directory_iter when streaming is enabled."""
+        from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+        
+        orchestrator.config.streaming_scan = True
+        (tmp_path / "file.txt").write_text("content")
+        
+        async def scan_iter(directory_path, seen_files=None):
+            yield FileInfo(file_path=str(tmp_path / "file.txt"), file_size=7, modification_time=datetime.now())
+        
+        completed = FileProcessingResult(
+            file_path=str(tmp_path / "file.txt"),
+            blocks=[],
+            processing_status=ProcessingStatus.COMPLETED,
+            processing_time_seconds=0.01
+        )
+        
+        with patch.object(orchestrator.directory_scanner, 'scan_directory_iter', side_effect=scan_iter), \
+             patch.object(orchestrator.directory_scanner, 'scan_directory', new_callable=AsyncMock) as mock_scan, \
+             patch.object(orchestrator.file_processor, 'process_file', new_callable=AsyncMock, return_value=completed), \
+             patch.object(orchestrator, '_create_chunks', new_callable=AsyncMock, return_value=Mock(success=True)), \
+             patch.object(orchestrator, '_store_results', new_callable=AsyncMock, return_value=True):
+            result = await orchestrator.process_directory(str(tmp_path))
+        
+        assert result.success is True
+        assert result.files_processed == 1
+        mock_scan.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_process_directory_incremental_scan(self, orchestrator, tmp_path):
+        """Test incremental mode processes changed files and removes stale chunks."""
+        from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+        from docanalyzer.services.scan_manifest import ScanChanges
+        
+        orchestrator.config.incremental_scan = True
+        (tmp_path / "changed.txt").write_text("changed")
+        changed = str(tmp_path / "changed.txt")
+        deleted = str(tmp_path / "deleted.txt")
+        changes = ScanChanges(
+            directory_path=str(tmp_path),
+            modified=[FileInfo(file_path=changed, file_size=7, modification_time=datetime.now())],
+            deleted=[deleted],
+            unchanged_count=3
+        )
+        
+        completed = FileProcessingResult(
+            file_path=changed,
+            blocks=[],
+            processing_status=ProcessingStatus.COMPLETED,
+            processing_time_seconds=0.01
+        )
+        orchestrator.vector_store_wrapper.delete_file_chunks = AsyncMock(return_value=True)
+        
+        with patch.object(orchestrator.directory_scanner, 'scan_directory_incremental', new_callable=AsyncMock, return_value=changes), \
+             patch.object(orchestrator.directory_scanner, 'commit_scan_changes', new_callable=AsyncMock) as mock_commit, \
+             patch.object(orchestrator.directory_scanner, 'scan_directory', new_callable=AsyncMock) as mock_scan, \
+             patch.object(orchestrator.file_processor, 'process_file', new_callable=AsyncMock, return_value=completed) as mock_process, \
+             patch.object(orchestrator, '_create_chunks', new_callable=AsyncMock, return_value=Mock(success=True)), \
+             patch.object(orchestrator, '_store_results', new_callable=AsyncMock, return_value=True):
+            result = await orchestrator.process_directory(str(tmp_path))
+        
+        assert result.success is True
+        assert [c.args[0] for c in mock_process.call_args_list] == [changed]
+        deleted_paths = {c.args[0] for c in orchestrator.vector_store_wrapper.delete_file_chunks.call_args_list}
+        assert deleted_paths == {changed, deleted}
+        mock_commit.assert_awaited_once_with(changes, exclude_paths=set())
+        mock_scan.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_process_watch_events(self, orchestrator, tmp_path):
+        """Test watch events remove stale chunks and process changed files directly."""
+        from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+        from docanalyzer.services.directory_watcher import WatchEvent, EVENT_CHANGED, EVENT_DELETED
+        from docanalyzer.filters.file_filter import FileFilter
+        
+        (tmp_path / "changed.txt").write_text("changed")
+        (tmp_path / "image.png").write_bytes(b"png")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "readme.txt").write_text("vendored")
+        changed = str(tmp_path / "changed.txt")
+        deleted = str(tmp_path / "deleted.txt")
+        events = [
+            WatchEvent(EVENT_CHANGED, changed),
+            WatchEvent(EVENT_CHANGED, str(tmp_path / "image.png")),
+            WatchEvent(EVENT_CHANGED, str(tmp_path / "node_modules" / "pkg" / "readme.txt")),
+            WatchEvent(EVENT_CHANGED, str(tmp_path / "vanished.txt")),
+            WatchEvent(EVENT_DELETED, deleted)
+        ]
+        completed = FileProcessingResult(
+            file_path=changed,
+            blocks=[],
+            processing_status=ProcessingStatus.COMPLETED,
+            processing_time_seconds=0.01
+        )
+        orchestrator.directory_scanner.file_filter = FileFilter(
+            supported_extensions={".txt"},
+            exclude_patterns=["node_modules"]
+        )
+        orchestrator.vector_store_wrapper.delete_file_chunks = AsyncMock(return_value=True)
+        
+        with patch.object(orchestrator.file_processor, 'process_file', new_callable=AsyncMock, return_value=completed) as mock_process, \
+             patch.object(orchestrator, 'process_directory', new_callable=AsyncMock) as mock_rescan:
+            await orchestrator._process_watch_events(str(tmp_path), events)
+        
+        assert [c.args[0] for c in mock_process.call_args_list] == [changed]
+        deleted_paths = {c.args[0] for c in orchestrator.vector_store_wrapper.delete_file_chunks.call_args_list}
+        assert deleted_paths == {changed, deleted}
+        mock_rescan.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_process_watch_events_touched_file_not_reprocessed(self, orchestrator, tmp_path):
+        """Test files with unchanged content digest only get their manifest entry refreshed."""
+        from docanalyzer.services.directory_watcher import WatchEvent, EVENT_CHANGED
+        from docanalyzer.services.scan_manifest import ScanManifest, ManifestEntry, digest_file
+        from docanalyzer.filters.file_filter import FileFilter
+        
+        touched = tmp_path / "touched.txt"
+        touched.write_text("same content")
+        root = str(tmp_path.resolve())
+        manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        manifest.upsert(root, [ManifestEntry.from_stat(str(touched), os.stat(touched), digest_file(str(touched)))])
+        mtime_ns = os.stat(touched).st_mtime_ns + 10 ** 9
+        os.utime(touched, ns=(mtime_ns, mtime_ns))
+        orchestrator.config.incremental_scan = True
+        orchestrator.directory_scanner.file_filter = FileFilter()
+        orchestrator.directory_scanner.manifest = manifest
+        
+        with patch.object(orchestrator.file_processor, 'process_file', new_callable=AsyncMock) as mock_process, \
+             patch.object(orchestrator.directory_scanner, 'commit_scan_changes', new_callable=AsyncMock) as mock_commit:
+            await orchestrator._process_watch_events(str(tmp_path), [WatchEvent(EVENT_CHANGED, str(touched))])
+        manifest.close()
+        
+        mock_process.assert_not_called()
+        committed = mock_commit.call_args.args[0]
+        assert committed.has_changes is False
+        assert committed.entries[str(touched)].mtime_ns == mtime_ns
+    
+    @pytest.mark.asyncio
+    async def test_process_watch_events_renamed_file_moves_chunks(self, orchestrator, tmp_path):
+        """Test a renamed file gets its chunks moved instead of being reprocessed."""
+        from docanalyzer.services.directory_watcher import WatchEvent, EVENT_CHANGED, EVENT_DELETED
+        from docanalyzer.services.scan_manifest import ScanManifest, ManifestEntry, digest_file
+        from docanalyzer.filters.file_filter import FileFilter
+        
+        old_path = tmp_path / "old.txt"
+        old_path.write_text("same content")
+        root = str(tmp_path.resolve())
+        manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        manifest.upsert(root, [ManifestEntry.from_stat(str(old_path), os.stat(old_path), digest_file(str(old_path)))])
+        new_path = tmp_path / "new.txt"
+        old_path.rename(new_path)
+        orchestrator.config.incremental_scan = True
+        orchestrator.directory_scanner.file_filter = FileFilter()
+        orchestrator.directory_scanner.manifest = manifest
+        orchestrator.vector_store_wrapper.move_file_chunks = AsyncMock(return_value=3)
+        orchestrator.vector_store_wrapper.delete_file_chunks = AsyncMock(return_value=True)
+        events = [WatchEvent(EVENT_DELETED, str(old_path)), WatchEvent(EVENT_CHANGED, str(new_path))]
+        
+        with patch.object(orchestrator.file_processor, 'process_file', new_callable=AsyncMock) as mock_process, \
+             patch.object(orchestrator.directory_scanner, 'commit_scan_changes', new_callable=AsyncMock) as mock_commit:
+            await orchestrator._process_watch_events(str(tmp_path), events)
+        manifest.close()
+        
+        mock_process.assert_not_called()
+        orchestrator.vector_store_wrapper.move_file_chunks.assert_called_once_with(str(old_path), str(new_path))
+        orchestrator.vector_store_wrapper.delete_file_chunks.assert_not_called()
+        committed = mock_commit.call_args.args[0]
+        assert list(committed.moved) == [str(old_path)]
+        assert committed.deleted == []
+        assert set(committed.entries) == {str(new_path)}
+    
+    @pytest.mark.asyncio
+    async def test_move_renamed_chunks_falls_back_to_processing(self, orchestrator, tmp_path):
+        """Test moves without stored chunks are handled as deleted and created files."""
+        from docanalyzer.services.scan_manifest import ScanChanges
+        
+        for name in ["b.txt", "d.txt", "f.txt"]:
+            (tmp_path / name).write_text("x")
+        moved, failed, kept = [
+            FileInfo(file_path=str(tmp_path / name), file_size=1, modification_time=datetime.now())
+            for name in ["b.txt", "d.txt", "f.txt"]
+        ]
+        changes = ScanChanges(
+            directory_path=str(tmp_path),
+            moved={"/docs/a.txt": moved, "/docs/c.txt": failed, "/docs/e.txt": kept}
+        )
+        orchestrator.vector_store_wrapper.move_file_chunks = AsyncMock(
+            side_effect=[0, ProcessingError("vector_store_error", "down", ErrorCategory.PROCESSING), 2]
+        )
+        orchestrator.vector_store_wrapper.delete_file_chunks = AsyncMock(return_value=True)
+        orchestrator.directory_scanner.commit_scan_changes = AsyncMock()
+        
+        await orchestrator._move_renamed_chunks(changes)
+        
+        assert changes.moved == {"/docs/e.txt": kept}
+        assert changes.created == [moved, failed]
+        assert changes.deleted == ["/docs/a.txt", "/docs/c.txt"]
+        # Chunks left at the new path by an unrecorded earlier move are removed
+        deleted_paths = [call.args[0] for call in orchestrator.vector_store_wrapper.delete_file_chunks.call_args_list]
+        assert deleted_paths == [moved.file_path, failed.file_path]
+        # Successful move is recorded before processing
+        committed = orchestrator.directory_scanner.commit_scan_changes.call_args.args[0]
+        assert committed.moved == {"/docs/e.txt": kept}
+    
+    @pytest.mark.asyncio
+    async def test_moved_file_not_duplicated_after_failed_processing(self, orchestrator, tmp_path):
+        """Test a move is not repeated when processing fails before the rescan."""
+        from docanalyzer.services.directory_scanner import DirectoryScanner
+        from docanalyzer.services.lock_manager import LockManager
+        from docanalyzer.services.scan_manifest import ScanManifest, ManifestEntry, digest_file
+        from docanalyzer.filters.file_filter import FileFilter
+        from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+        
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        old_path = docs / "old.txt"
+        old_path.write_text("same content")
+        broken = docs / "broken.txt"
+        broken.write_text("new content")
+        root = str(docs.resolve())
+        manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        manifest.upsert(root, [ManifestEntry.from_stat(str(old_path), os.stat(old_path), digest_file(str(old_path)))])
+        new_path = docs / "new.txt"
+        old_path.rename(new_path)
+        orchestrator.config.incremental_scan = True
+        orchestrator.directory_scanner = DirectoryScanner(FileFilter(), Mock(spec=LockManager), manifest=manifest)
+        orchestrator.vector_store_wrapper.move_file_chunks = AsyncMock(side_effect=[3, 0])
+        orchestrator.vector_store_wrapper.delete_file_chunks = AsyncMock(return_value=True)
+        failed = FileProcessingResult(
+            file_path=str(broken),
+            blocks=[],
+            processing_status=ProcessingStatus.FAILED,
+            processing_time_seconds=0.01,
+            error_message="parse error"
+        )
+        
+        with patch.object(orchestrator.file_processor, 'process_file', new_callable=AsyncMock, return_value=failed) as mock_process:
+            first = await orchestrator.process_directory(str(docs))
+            second = await orchestrator.process_directory(str(docs))
+        manifest.close()
+        
+        assert first.success is False and second.success is False
+        orchestrator.vector_store_wrapper.move_file_chunks.assert_called_once_with(str(old_path), str(new_path))
+        orchestrator.vector_store_wrapper.delete_file_chunks.assert_not_called()
+        assert [call.args[0] for call in mock_process.call_args_list] == [str(broken), str(broken)]
+    
+    @pytest.mark.asyncio
+    async def test_process_watch_events_overflow_rescans(self, orchestrator, tmp_path):
+        """Test kernel queue overflow falls back to a directory scan."""
+        from docanalyzer.services.directory_watcher import WatchEvent, EVENT_OVERFLOW
+        
+        events = [WatchEvent(EVENT_OVERFLOW, str(tmp_path), is_directory=True)]
+        
+        with patch.object(orchestrator, 'process_directory', new_callable=AsyncMock) as mock_rescan, \
+             patch.object(orchestrator.file_processor, 'process_file', new_callable=AsyncMock) as mock_process:
+            await orchestrator._process_watch_events(str(tmp_path), events)
+        
+        mock_rescan.assert_awaited_once_with(str(tmp_path))
+        mock_process.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_watch_directory_processes_new_files(self, orchestrator, tmp_path):
+        """Test watch mode processes a file written after the initial pass."""
+        from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+        from docanalyzer.services.directory_watcher import inotify_available
+        from docanalyzer.filters.file_filter import FileFilter
+        
+        if not inotify_available():
+            pytest.skip("inotify is not available")
+        
+        orchestrator.config.watch_debounce = 0.01
+        orchestrator.directory_scanner.max_depth = 10
+        orchestrator.directory_scanner.file_filter = FileFilter()
+        orchestrator.vector_store_wrapper.delete_file_chunks = AsyncMock(return_value=True)
+        processed = asyncio.Event()
+        
+        async def mock_process_file(file_path):
+            processed.set()
+            return FileProcessingResult(
+                file_path=file_path,
+                blocks=[],
+                processing_status=ProcessingStatus.COMPLETED,
+                processing_time_seconds=0.01
+            )
+        
+        with patch.object(orchestrator, 'process_directory', new_callable=AsyncMock) as mock_initial, \
+             patch.object(orchestrator.file_processor, 'process_file', side_effect=mock_process_file) as mock_process:
+            watch_task = asyncio.create_task(orchestrator.watch_directory(str(tmp_path)))
+            while not mock_initial.await_count:
+                await asyncio.sleep(0.01)
+            (tmp_path / "new.txt").write_text("new document")
+            await asyncio.wait_for(processed.wait(), timeout=5)
+            await orchestrator.stop_all_processing()
+            await asyncio.wait_for(watch_task, timeout=5)
+        
+        mock_initial.assert_awaited_once_with(str(tmp_path))
+        assert [c.args[0] for c in mock_process.call_args_list] == [str(tmp_path / "new.txt")]
+    
+    @pytest.mark.asyncio
+    async def test_process_files_concurrent_failure_isolation(self, orchestrator, tmp_path):
+        """Test one failing file does not stop other concurrent files."""
+        from docanalyzer.models.processing import FileProcessingResult, ProcessingStatus
+        
+        files = []
+        for i in range(4):
+            test_file = tmp_path / f"file_{i}.txt"
+            test_file.write_text(f"Content {i}")
+            files.append(FileInfo(file_path=str(test_file), file_size=10, modification_time=datetime.now()))
+        
+        async def mock_process_file(file_path):
+            if file_path.endswith("file_1.txt"):
+                raise RuntimeError("Vector store unavailable")
+            return FileProcessingResult(
+                file_path=file_path,
+                blocks=[],
+                processing_status=ProcessingStatus.COMPLETED,
+                processing_time_seconds=0.01
+            )
+        
+        orchestrator.active_directories["/test/directory"] = DirectoryProcessingStatus(
+            directory_path="/test/directory",
+            status="processing"
+        )
+        
+        with patch.object(orchestrator.file_processor, 'process_file', side_effect=mock_process_file):
+            result = await orchestrator._process_files(files, "/test/directory")
+        
+        status = orchestrator.active_directories["/test/directory"]
+        assert result.data["processed_files"] == 3
+        assert result.data["failed_files"] == 1
+        assert status.files_failed == 1
+        assert status.progress_percentage == 75.0
+    
     @pytest.mark.asyncio
     async def test_create_chunks(self, orchestrator):
         """Test chunk creation."""
@@ -4,6 +4,7 @@ Tests for Directory Scanner Service
 Comprehensive test suite for directory scanning functionality.
 """
 
+import os
 import pytest
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
@@ -224,6 +225,7 @@ class TestDirectoryScanner:
     def mock_file_filter(self):
         """Create mock file filter."""
         filter_mock = Mock(spec=FileFilter)
+        filter_mock.is_directory_excluded.return_value = False
         filter_mock.filter_files.return_value = [
             Mock(should_process=True),
             Mock(should_process=False)
@@ -308,6 +310,406 @@ class TestDirectoryScanner:
                 timeout=0
             )
     
+    def test_init_invalid_scan_engine(self, mock_file_filter, mock_lock_manager):
+        """Test initialization with invalid scan engine."""
+        with pytest.raises(ValueError, match="scan_engine must be one of"):
+            DirectoryScanner(
+                file_filter=mock_file_filter,
+                lock_manager=mock_lock_manager,
+                scan_engine="walk"
+            )
+    
+    @pytest.mark.asyncio
+    async def test_scan_engines_find_same_files(self, mock_file_filter, mock_lock_manager, tmp_path):
+        """Test scandir and pathlib engines discover the same files."""
+        # Arrange
+        (tmp_path / "file1.txt").write_text("content1")
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "a" / "file2.md").write_text("content2")
+        (tmp_path / "a" / "b" / "file3.txt").write_text("content3")
+        
+        results = {}
+        for engine in ["scandir", "pathlib"]:
+            scanner = DirectoryScanner(
+                file_filter=mock_file_filter,
+                lock_manager=mock_lock_manager,
+                max_depth=1,
+                scan_engine=engine
+            )
+            
+            # Act
+            files = await scanner._scan_tree(str(tmp_path), ScanProgress())
+            results[engine] = sorted(
+                (f.file_path, f.file_size, f.modification_time, f.metadata["extension"])
+                for f in files
+            )
+        
+        # Assert
+        assert len(results["scandir"]) == 2
+        assert results["scandir"] == results["pathlib"]
+
+    @pytest.mark.asyncio
+    async def test_scan_engines_skip_excluded_directories(self, mock_lock_manager, tmp_path):
+        """Test both engines skip directories matching exclude patterns."""
+        # Arrange
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.txt").write_text("main")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.txt").write_text("vendored")
+        file_filter = FileFilter(exclude_patterns=["node_modules"])
+
+        for engine in ["scandir", "pathlib"]:
+            scanner = DirectoryScanner(
+                file_filter=file_filter,
+                lock_manager=mock_lock_manager,
+                scan_engine=engine
+            )
+
+            # Act
+            with patch.object(file_filter, 'is_directory_excluded', wraps=file_filter.is_directory_excluded) as mock_excluded:
+                files = await scanner._scan_tree(str(tmp_path), ScanProgress())
+
+            # Assert
+            assert [f.file_path for f in files] == [str(tmp_path / "src" / "main.txt")]
+            checked = {c.args[0] for c in mock_excluded.call_args_list}
+            assert checked == {str(tmp_path / "src"), str(tmp_path / "node_modules")}
+
+    @pytest.mark.asyncio
+    async def test_scan_engines_stop_at_symlink_loops(self, mock_lock_manager, tmp_path):
+        """Test both engines walk each directory once despite symlink cycles."""
+        # Arrange
+        (tmp_path / "docs" / "guide").mkdir(parents=True)
+        (tmp_path / "docs" / "guide" / "intro.txt").write_text("intro")
+        (tmp_path / "docs" / "guide" / "up").symlink_to(tmp_path / "docs")
+        (tmp_path / "docs" / "same").symlink_to(tmp_path / "docs" / "guide")
+
+        for engine in ["scandir", "pathlib"]:
+            scanner = DirectoryScanner(
+                file_filter=FileFilter(),
+                lock_manager=mock_lock_manager,
+                max_depth=10,
+                scan_engine=engine
+            )
+
+            # Act
+            files = await scanner._scan_tree(str(tmp_path / "docs"), ScanProgress())
+
+            # Assert
+            assert [f.file_path for f in files] == [str(tmp_path / "docs" / "guide" / "intro.txt")]
+
+    @pytest.mark.asyncio
+    async def test_scan_tree_prefilters_extension_and_size(self, mock_lock_manager, tmp_path):
+        """Test unsupported and oversize files never become FileInfo."""
+        # Arrange
+        (tmp_path / "doc.txt").write_text("text")
+        (tmp_path / "image.png").write_bytes(b"png")
+        (tmp_path / "huge.txt").write_text("x" * 2048)
+        file_filter = FileFilter(supported_extensions={".txt"}, max_file_size=1024)
+
+        for engine in ["scandir", "pathlib"]:
+            scanner = DirectoryScanner(
+                file_filter=file_filter,
+                lock_manager=mock_lock_manager,
+                scan_engine=engine
+            )
+
+            # Act
+            files = await scanner._scan_tree(str(tmp_path), ScanProgress())
+
+            # Assert
+            names = sorted(Path(f.file_path).name for f in files)
+            assert "image.png" not in names
+            if engine == "scandir":
+                assert names == ["doc.txt"]
+
+    @pytest.mark.asyncio
+    async def test_scan_directory_iter_yields_filtered_files(self, directory_scanner, tmp_path):
+        """Test streaming scan yields files passing filters in batches."""
+        # Arrange
+        for i in range(25):
+            (tmp_path / f"file{i}.txt").write_text("content")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "skip.log").write_text("log")
+        directory_scanner.file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=f.file_path.endswith(".txt")) for f in batch
+        ]
+        progress_calls = []
+        
+        # Act
+        files = [
+            f async for f in directory_scanner.scan_directory_iter(str(tmp_path), progress_calls.append)
+        ]
+        
+        # Assert
+        assert len(files) == 25
+        assert all(isinstance(f, FileInfo) for f in files)
+        assert directory_scanner.file_filter.filter_files.call_count == 3  # batch_size=10
+        assert progress_calls[-1].status == "completed"
+        directory_scanner.lock_manager.remove_lock.assert_awaited_once()
+        stats = directory_scanner.get_scan_statistics()
+        assert stats["total_files_discovered"] == 26
+        assert stats["total_files_filtered"] == 25
+    
+    @pytest.mark.asyncio
+    async def test_scan_directory_iter_early_close_stops_walk(self, directory_scanner, tmp_path):
+        """Test closing the generator early stops the walk and releases the lock."""
+        # Arrange
+        for i in range(100):
+            (tmp_path / f"file{i}.txt").write_text("content")
+        directory_scanner.file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=True) for _ in batch
+        ]
+        iterator = directory_scanner.scan_directory_iter(str(tmp_path))
+        
+        # Act
+        first = await iterator.__anext__()
+        await iterator.aclose()
+        
+        # Assert
+        assert isinstance(first, FileInfo)
+        directory_scanner.lock_manager.remove_lock.assert_awaited_once()
+        assert directory_scanner.file_filter.filter_files.call_count < 10
+    
+    @pytest.mark.asyncio
+    async def test_scan_directory_iter_resumes_from_checkpoint(self, directory_scanner, tmp_path):
+        """Test a scan interrupted after a checkpoint continues after the last handled file."""
+        # Arrange
+        from docanalyzer.services.scan_manifest import ScanManifest
+        root = tmp_path / "docs"
+        for name in ["a", "b"]:
+            (root / name).mkdir(parents=True)
+            for i in range(15):
+                (root / name / f"file{i}.txt").write_text("content")
+        directory_scanner.file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=True) for _ in batch
+        ]
+        directory_scanner.manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        expected = [f.file_path async for f in directory_scanner.scan_directory_iter(str(root))]
+        
+        iterator = directory_scanner.scan_directory_iter(str(root))
+        handled = [(await iterator.__anext__()).file_path for _ in range(17)]
+        await directory_scanner.save_scan_checkpoint(str(root), handled[-1])
+        await iterator.aclose()
+        
+        # Act
+        resume_after = await directory_scanner.load_scan_checkpoint(str(root))
+        resumed = [
+            f.file_path async for f in directory_scanner.scan_directory_iter(str(root), resume_after=resume_after)
+        ]
+        await directory_scanner.clear_scan_checkpoint(str(root))
+        
+        # Assert
+        assert handled + resumed == expected
+        assert await directory_scanner.load_scan_checkpoint(str(root)) is None
+        directory_scanner.manifest.close()
+    
+    @pytest.mark.asyncio
+    async def test_scan_directory_parallel_walk_per_root(self, mock_file_filter, mock_lock_manager, tmp_path):
+        """Test roots configured with several walk threads find the same files."""
+        # Arrange
+        for i in range(10):
+            (tmp_path / f"dir{i}").mkdir()
+            (tmp_path / f"dir{i}" / "doc.txt").write_text("content")
+        mock_file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=True) for _ in batch
+        ]
+        scanner = DirectoryScanner(
+            file_filter=mock_file_filter,
+            lock_manager=mock_lock_manager,
+            batch_size=3,
+            root_walk_threads={str(tmp_path): 4}
+        )
+        
+        # Act
+        with patch.object(scanner._walker, "walk_parallel", wraps=scanner._walker.walk_parallel) as mock_walk:
+            files = await scanner.scan_directory(str(tmp_path))
+            streamed = [f async for f in scanner.scan_directory_iter(str(tmp_path))]
+        
+        # Assert
+        assert len(files) == 10
+        assert sorted(f.file_path for f in streamed) == [f.file_path for f in files]
+        assert [call.args[1] for call in mock_walk.call_args_list] == [4, 4]
+        assert scanner._walk_threads("/elsewhere") == 1
+    
+    def test_init_invalid_walk_threads(self, mock_file_filter, mock_lock_manager):
+        """Test walk thread counts must be positive."""
+        with pytest.raises(ValueError, match="walk_threads must be positive"):
+            DirectoryScanner(mock_file_filter, mock_lock_manager, root_walk_threads={"/docs": 0})
+    
+    @pytest.mark.asyncio
+    async def test_scan_directory_iter_resume_requires_single_thread(self, directory_scanner, tmp_path):
+        """Test resuming is refused for parallel walks, whose order is not fixed."""
+        with pytest.raises(ValueError, match="resume_after requires walk_threads=1"):
+            async for _ in directory_scanner.scan_directory_iter(
+                str(tmp_path), resume_after=str(tmp_path / "a.txt"), walk_threads=2
+            ):
+                pass
+    
+    @pytest.mark.asyncio
+    async def test_scan_directory_iter_nonexistent(self, directory_scanner):
+        """Test streaming scan of nonexistent directory."""
+        with pytest.raises(FileNotFoundError):
+            async for _ in directory_scanner.scan_directory_iter("/nonexistent/directory"):
+                pass
+    
+    @pytest.mark.asyncio
+    async def test_scan_directory_incremental(self, directory_scanner, tmp_path):
+        """Test incremental scan reports created, modified and deleted files."""
+        # Arrange
+        from docanalyzer.services.scan_manifest import ScanManifest
+        directory_scanner.manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        directory_scanner.file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=f.file_path.endswith(".txt")) for f in batch
+        ]
+        root = tmp_path / "docs"
+        root.mkdir()
+        for name in ["keep.txt", "edit.txt", "touch.txt", "gone.txt"]:
+            (root / name).write_text(f"content of {name}")
+        
+        # Act
+        first = await directory_scanner.scan_directory_incremental(str(root))
+        (root / "edit.txt").write_text("changed content")
+        touched = os.stat(root / "touch.txt").st_mtime_ns + 10 ** 9
+        os.utime(root / "touch.txt", ns=(touched, touched))
+        (root / "gone.txt").unlink()
+        (root / "new.txt").write_text("new")
+        second = await directory_scanner.scan_directory_incremental(str(root))
+        third = await directory_scanner.scan_directory_incremental(str(root))
+        directory_scanner.manifest.close()
+        
+        # Assert
+        assert len(first.created) == 4
+        assert [Path(f.file_path).name for f in second.created] == ["new.txt"]
+        assert [Path(f.file_path).name for f in second.modified] == ["edit.txt"]
+        assert [Path(p).name for p in second.deleted] == ["gone.txt"]
+        assert second.unchanged_count == 2
+        assert third.has_changes is False
+        assert third.unchanged_count == 4
+    
+    @pytest.mark.asyncio
+    async def test_scan_directory_incremental_prunes_unchanged_directories(self, directory_scanner, tmp_path):
+        """Test unchanged directories are not listed but in-place edits are found."""
+        # Arrange
+        from docanalyzer.services.scan_manifest import ScanManifest
+        directory_scanner.manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        directory_scanner.file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=True) for _ in batch
+        ]
+        root = tmp_path / "docs"
+        (root / "archive").mkdir(parents=True)
+        (root / "archive" / "old.txt").write_text("old")
+        (root / "fresh.txt").write_text("fresh")
+        old = os.stat(root).st_mtime_ns - 10 * 10 ** 9
+        for path in [root, root / "archive"]:
+            os.utime(path, ns=(old, old))
+        await directory_scanner.scan_directory_incremental(str(root))
+        real_scandir = os.scandir
+        listed = []
+        
+        def scandir(path):
+            listed.append(path)
+            return real_scandir(path)
+        
+        # Act
+        with open(root / "archive" / "old.txt", "a") as f:
+            f.write(" edited in place")
+        with patch("docanalyzer.services.directory_walker.os.scandir", side_effect=scandir):
+            changes = await directory_scanner.scan_directory_incremental(str(root))
+        directory_scanner.manifest.close()
+        
+        # Assert
+        assert listed == []
+        assert [Path(f.file_path).name for f in changes.modified] == ["old.txt"]
+        assert changes.unchanged_count == 1
+
+    @pytest.mark.asyncio
+    async def test_scan_directory_incremental_walks_recent_subdirectories(self, directory_scanner, tmp_path):
+        """Test recently changed subdirectories of a pruned directory are still walked."""
+        # Arrange
+        from docanalyzer.services.scan_manifest import ScanManifest
+        directory_scanner.manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        directory_scanner.file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=True) for _ in batch
+        ]
+        root = tmp_path / "docs"
+        (root / "recent").mkdir(parents=True)
+        (root / "recent" / "new.txt").write_text("new")
+        (root / "fresh.txt").write_text("fresh")
+        old = os.stat(root).st_mtime_ns - 10 * 10 ** 9
+        os.utime(root, ns=(old, old))
+
+        # Act
+        first = await directory_scanner.scan_directory_incremental(str(root))
+        second = await directory_scanner.scan_directory_incremental(str(root))
+        directory_scanner.manifest.close()
+
+        # Assert
+        assert len(first.created) == 2
+        assert second.has_changes is False
+        assert second.unchanged_count == 2
+
+    @pytest.mark.asyncio
+    async def test_scan_directory_incremental_reports_moved_files(self, directory_scanner, tmp_path):
+        """Test renamed files are reported as moved, not as deleted and created."""
+        # Arrange
+        from docanalyzer.services.scan_manifest import ScanManifest
+        directory_scanner.manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        directory_scanner.file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=True) for _ in batch
+        ]
+        root = tmp_path / "docs"
+        root.mkdir()
+        (root / "guide.txt").write_text("guide")
+        (root / "notes.txt").write_text("notes")
+        await directory_scanner.scan_directory_incremental(str(root))
+        
+        # Act
+        (root / "manual").mkdir()
+        (root / "guide.txt").rename(root / "manual" / "guide.txt")
+        (root / "notes.txt").unlink()
+        (root / "notes-copy.txt").write_text("notes")
+        changes = await directory_scanner.scan_directory_incremental(str(root))
+        rescan = await directory_scanner.scan_directory_incremental(str(root))
+        directory_scanner.manifest.close()
+        
+        # Assert
+        assert {Path(old).name: Path(f.file_path).name for old, f in changes.moved.items()} == {
+            "guide.txt": "guide.txt", "notes.txt": "notes-copy.txt"
+        }
+        assert str(root / "manual" / "guide.txt") in {f.file_path for f in changes.moved.values()}
+        assert changes.created == []
+        assert changes.deleted == []
+        assert rescan.has_changes is False
+        assert rescan.unchanged_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_scan_directory_incremental_uncommitted_files_reported_again(self, directory_scanner, tmp_path):
+        """Test files excluded from commit are reported again by the next scan."""
+        # Arrange
+        from docanalyzer.services.scan_manifest import ScanManifest
+        directory_scanner.manifest = ScanManifest(str(tmp_path / "manifest.sqlite"))
+        directory_scanner.file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=True) for _ in batch
+        ]
+        root = tmp_path / "docs"
+        root.mkdir()
+        (root / "ok.txt").write_text("ok")
+        (root / "failed.txt").write_text("failed")
+        # Old enough to be recorded for pruning
+        old = os.stat(root).st_mtime_ns - 10 * 10 ** 9
+        os.utime(root, ns=(old, old))
+        
+        # Act
+        changes = await directory_scanner.scan_directory_incremental(str(root), commit=False)
+        failed_path = next(f.file_path for f in changes.created if f.file_path.endswith("failed.txt"))
+        await directory_scanner.commit_scan_changes(changes, exclude_paths={failed_path})
+        rescan = await directory_scanner.scan_directory_incremental(str(root))
+        directory_scanner.manifest.close()
+        
+        # Assert
+        assert [f.file_path for f in rescan.created] == [failed_path]
+        assert rescan.unchanged_count == 1
+    
     @pytest.mark.asyncio
     async def test_scan_directory_success(self, directory_scanner, tmp_path):
         """Test successful directory scanning."""
@@ -424,7 +826,7 @@ class TestDirectoryScanner:
         test_dir.mkdir()
         
         # Mock recursive scan to raise TimeoutError
-        with patch.object(directory_scanner, '_scan_directory_recursive', 
+        with patch.object(directory_scanner, '_scan_tree', 
                          side_effect=asyncio.TimeoutError()):
             with pytest.raises(TimeoutError, match="Scan exceeded timeout"):
                 await directory_scanner.scan_directory(str(test_dir))
@@ -436,7 +838,7 @@ class TestDirectoryScanner:
         test_dir.mkdir()
         
         # Mock recursive scan to raise general exception
-        with patch.object(directory_scanner, '_scan_directory_recursive', 
+        with patch.object(directory_scanner, '_scan_tree', 
                          side_effect=Exception("General error")):
             with pytest.raises(Exception, match="General error"):
                 await directory_scanner.scan_directory(str(test_dir))
@@ -451,7 +853,7 @@ class TestDirectoryScanner:
         directory_scanner.lock_manager.remove_lock.side_effect = Exception("Remove lock error")
         
         # Should still complete successfully despite lock removal error
-        with patch.object(directory_scanner, '_scan_directory_recursive', return_value=[]):
+        with patch.object(directory_scanner, '_scan_tree', return_value=[]):
             files = await directory_scanner.scan_directory(str(test_dir))
             assert files == []
     
@@ -490,6 +892,32 @@ class TestDirectoryScanner:
         assert len(results[str(dir1)]) == 1
         assert len(results[str(dir2)]) == 1
     
+    @pytest.mark.asyncio
+    async def test_scan_directories_reports_each_file_once(self, directory_scanner, tmp_path):
+        """Test nested roots are collapsed and linked files are reported once."""
+        # Arrange
+        docs = tmp_path / "docs"
+        (docs / "api").mkdir(parents=True)
+        (docs / "guide.txt").write_text("guide")
+        (docs / "api" / "reference.txt").write_text("reference")
+        (docs / "api" / "reference-link.txt").symlink_to(docs / "api" / "reference.txt")
+        other = tmp_path / "other"
+        other.mkdir()
+        os.link(docs / "guide.txt", other / "guide-hardlink.txt")
+        (other / "notes.txt").write_text("notes")
+        directory_scanner.file_filter.filter_files.side_effect = lambda batch: [
+            Mock(should_process=True) for _ in batch
+        ]
+        
+        # Act
+        results = await directory_scanner.scan_directories([str(docs / "api"), str(docs), str(other)])
+        
+        # Assert
+        assert results[str(docs / "api")] == []
+        assert sorted(Path(f.file_path).name for f in results[str(docs)]) == ["guide.txt", "reference.txt"]
+        assert [Path(f.file_path).name for f in results[str(other)]] == ["notes.txt"]
+        assert directory_scanner.lock_manager.create_lock.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_scan_directories_empty_list(self, directory_scanner):
         """Test scanning with empty directory list."""
@@ -0,0 +1,351 @@
+"""
+Tests for Directory Walker
+
+Unit tests for os.scandir based iterative directory traversal.
+"""
+
+import os
+import threading
+import pytest
+from unittest.mock import patch
+
+from docanalyzer.models.file_system import FileInfo
+from docanalyzer.services.directory_walker import DirectoryWalker, RELIST_MTIME_NS
+
+
+class TestDirectoryWalker:
+    """Test suite for DirectoryWalker class."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Create sample directory tree."""
+        (tmp_path / "root.txt").write_text("root")
+        (tmp_path / "level1" / "level2" / "level3").mkdir(parents=True)
+        (tmp_path / "level1" / "one.md").write_text("one")
+        (tmp_path / "level1" / "level2" / "two.txt").write_text("two")
+        (tmp_path / "level1" / "level2" / "level3" / "three.txt").write_text("three")
+        return tmp_path
+
+    def test_init_invalid_max_depth(self):
+        """Test initialization with invalid max depth."""
+        with pytest.raises(ValueError, match="max_depth must be non-negative"):
+            DirectoryWalker(max_depth=-1)
+
+    def test_walk_finds_all_files(self, tree):
+        """Test all files are yielded with stat metadata."""
+        # Act
+        files = list(DirectoryWalker().walk(str(tree)))
+
+        # Assert
+        names = sorted(os.path.basename(f.file_path) for f in files)
+        assert names == ["one.md", "root.txt", "three.txt", "two.txt"]
+        root_file = next(f for f in files if f.file_path.endswith("root.txt"))
+        assert root_file.file_size == 4
+        assert root_file.metadata["extension"] == ".txt"
+        assert root_file.processing_status == "pending"
+
+    def test_walk_respects_max_depth(self, tree):
+        """Test directories deeper than max_depth are not entered."""
+        # Act
+        files = list(DirectoryWalker(max_depth=1).walk(str(tree)))
+
+        # Assert
+        names = sorted(os.path.basename(f.file_path) for f in files)
+        assert names == ["one.md", "root.txt"]
+
+    def test_walk_reports_directories(self, tree):
+        """Test directory callback is called for every listed directory."""
+        # Arrange
+        visited = []
+
+        # Act
+        list(DirectoryWalker().walk(str(tree), visited.append))
+
+        # Assert
+        assert visited[0] == str(tree)
+        assert len(visited) == 4
+
+    def test_walk_skips_unreadable_directory(self, tree):
+        """Test permission errors skip the directory and continue."""
+        # Arrange
+        real_scandir = os.scandir
+        blocked = str(tree / "level1" / "level2")
+
+        def scandir(path):
+            if path == blocked:
+                raise PermissionError("Permission denied")
+            return real_scandir(path)
+
+        # Act
+        with patch("docanalyzer.services.directory_walker.os.scandir", side_effect=scandir):
+            files = list(DirectoryWalker().walk(str(tree)))
+
+        # Assert
+        names = sorted(os.path.basename(f.file_path) for f in files)
+        assert names == ["one.md", "root.txt"]
+
+    def test_walk_uses_one_stat_per_file(self, tree):
+        """Test file metadata is built from DirEntry stat without extra checks."""
+        with patch("os.path.exists") as mock_exists, patch("os.stat") as mock_stat:
+            files = list(DirectoryWalker().walk(str(tree)))
+
+        assert len(files) == 4
+        mock_exists.assert_not_called()
+        mock_stat.assert_not_called()
+
+    def test_walk_pruned_skips_unchanged_directories(self, tree):
+        """Test directories with recorded mtime are not listed but their files are stat'ed."""
+        # Arrange
+        walker = DirectoryWalker()
+        first_mtimes = {}
+        list(walker.walk_pruned(str(tree), {}, {}, first_mtimes))
+        level2 = str(tree / "level1" / "level2")
+        known_files = {level2: [os.path.join(level2, "two.txt")]}
+        (tree / "level1" / "new.txt").write_text("new")
+        real_scandir = os.scandir
+        listed = []
+
+        def scandir(path):
+            listed.append(path)
+            return real_scandir(path)
+
+        # Act
+        second_mtimes = {}
+        with patch("docanalyzer.services.directory_walker.os.scandir", side_effect=scandir):
+            files = list(walker.walk_pruned(str(tree), first_mtimes, known_files, second_mtimes))
+
+        # Assert
+        names = sorted(os.path.basename(f.file_path) for f in files)
+        assert names == ["new.txt", "one.md", "two.txt"]
+        assert listed == [str(tree / "level1")]
+        assert set(second_mtimes) == set(first_mtimes)
+        assert len(first_mtimes) == 4
+
+    def test_walk_skips_excluded_directories(self, tree):
+        """Test excluded subdirectories are neither listed nor walked."""
+        # Arrange
+        walker = DirectoryWalker(exclude_directory=lambda path: path.endswith("level2"))
+        listed = []
+
+        # Act
+        files = list(walker.walk(str(tree), listed.append))
+
+        # Assert
+        names = sorted(os.path.basename(f.file_path) for f in files)
+        assert names == ["one.md", "root.txt"]
+        assert listed == [str(tree), str(tree / "level1")]
+
+    def test_walk_pruned_relists_directories_with_excluded_subdirectories(self, tree):
+        """Test parents of excluded directories are listed again, so exclusions can be lifted."""
+        # Arrange
+        excluded = {str(tree / "level1" / "level2")}
+        walker = DirectoryWalker(exclude_directory=lambda path: path in excluded)
+        first_mtimes = {}
+        list(walker.walk_pruned(str(tree), {}, {}, first_mtimes))
+
+        # Act
+        excluded.clear()
+        second_mtimes = {}
+        files = list(walker.walk_pruned(str(tree), first_mtimes, {}, second_mtimes))
+
+        # Assert
+        assert first_mtimes[str(tree / "level1")] == RELIST_MTIME_NS
+        assert len(first_mtimes) == 2
+        names = sorted(os.path.basename(f.file_path) for f in files)
+        assert names == ["one.md", "three.txt", "two.txt"]
+        assert len(second_mtimes) == 4
+
+    def test_walk_prefilters_files_before_stat(self, tree):
+        """Test rejected file names are not stat'ed and rejected sizes are not yielded."""
+        # Arrange
+        (tree / "big.txt").write_text("x" * 100)
+        sizes = []
+
+        def accept_file_size(size):
+            sizes.append(size)
+            return size < 50
+
+        walker = DirectoryWalker(
+            accept_file_name=lambda name: name.endswith(".txt"),
+            accept_file_size=accept_file_size
+        )
+
+        # Act
+        with patch.object(FileInfo, "from_stat", wraps=FileInfo.from_stat) as mock_build:
+            files = list(walker.walk(str(tree)))
+
+        # Assert
+        names = sorted(os.path.basename(f.file_path) for f in files)
+        assert names == ["root.txt", "three.txt", "two.txt"]
+        assert len(sizes) == 4
+        assert mock_build.call_count == 3
+
+    def test_walk_pruned_relists_directories_with_size_rejected_files(self, tree):
+        """Test a file skipped for its size is found after it shrinks in place."""
+        # Arrange
+        big = tree / "level1" / "big.txt"
+        big.write_text("x" * 100)
+        walker = DirectoryWalker(accept_file_size=lambda size: size < 50)
+        first_mtimes = {}
+        list(walker.walk_pruned(str(tree), {}, {}, first_mtimes))
+        mtime_ns = os.stat(tree / "level1").st_mtime_ns
+
+        # Act
+        big.write_text("small")
+        os.utime(tree / "level1", ns=(mtime_ns, mtime_ns))
+        files = list(walker.walk_pruned(str(tree), first_mtimes, {}, {}))
+
+        # Assert
+        assert first_mtimes[str(tree / "level1")] == RELIST_MTIME_NS
+        assert str(big) in {f.file_path for f in files}
+
+    def test_walk_stops_at_symlink_loops(self, tree):
+        """Test links back into the walked tree are not followed."""
+        # Arrange
+        (tree / "level1" / "level2" / "loop").symlink_to(tree)
+        (tree / "level1" / "alias").symlink_to(tree / "level1" / "level2")
+
+        # Act
+        files = list(DirectoryWalker(max_depth=20).walk(str(tree)))
+
+        # Assert
+        names = sorted(os.path.basename(f.file_path) for f in files)
+        assert names == ["one.md", "root.txt", "three.txt", "two.txt"]
+
+    def test_walk_follows_links_outside_tree_once(self, tree, tmp_path_factory):
+        """Test a directory linked twice from outside the tree is walked once."""
+        # Arrange
+        shared = tmp_path_factory.mktemp("shared")
+        (shared / "nested").mkdir()
+        (shared / "nested" / "shared.txt").write_text("shared")
+        (tree / "first").symlink_to(shared)
+        (tree / "level1" / "second").symlink_to(shared / "nested")
+        (shared / "nested" / "back").symlink_to(shared)
+
+        # Act
+        files = list(DirectoryWalker().walk(str(tree)))
+        pruned_files = list(DirectoryWalker().walk_pruned(str(tree), {}, {}, {}))
+
+        # Assert
+        shared_files = [f.file_path for f in files if f.file_path.endswith("shared.txt")]
+        assert len(shared_files) == 1
+        assert len(files) == 5
+        assert sorted(f.file_path for f in pruned_files) == sorted(f.file_path for f in files)
+
+    def test_walk_pruned_does_not_follow_recorded_loops(self, tree):
+        """Test a recorded symlinked directory is checked again when its parent is pruned."""
+        # Arrange
+        walker = DirectoryWalker(max_depth=20)
+        (tree / "level1" / "link").symlink_to(tree / "level1" / "level2")
+        known = {str(tree): 0, str(tree / "level1"): 0, str(tree / "level1" / "link"): 0}
+        mtimes = {path: os.stat(path).st_mtime_ns for path in known}
+
+        # Act
+        files = list(walker.walk_pruned(str(tree), mtimes, {}, {}))
+
+        # Assert
+        assert not any("link" in f.file_path for f in files)
+
+    def test_walk_resumes_after_last_file(self, tree):
+        """Test a resumed walk yields exactly the files after the given one."""
+        # Arrange
+        (tree / "level1" / "sibling").mkdir()
+        (tree / "level1" / "sibling" / "four.txt").write_text("four")
+        (tree / "level1" / "level2" / "five.txt").write_text("five")
+        walker = DirectoryWalker()
+        paths = [f.file_path for f in walker.walk(str(tree))]
+
+        for index, resume_after in enumerate(paths):
+            # Act
+            resumed = [f.file_path for f in walker.walk(str(tree), resume_after=resume_after)]
+
+            # Assert
+            assert resumed == paths[index + 1:]
+
+    def test_walk_resume_lists_directory_of_missing_file_again(self, tree):
+        """Test a missing last file resumes at the start of its directory."""
+        # Arrange
+        walker = DirectoryWalker()
+        resume_after = str(tree / "level1" / "gone.md")
+
+        # Act
+        resumed = sorted(os.path.basename(f.file_path)
+                         for f in walker.walk(str(tree), resume_after=resume_after))
+
+        # Assert
+        assert resumed == ["one.md", "three.txt", "two.txt"]
+
+    def test_walk_resume_walks_parent_of_missing_directory(self, tree):
+        """Test a missing directory on the resume path walks its parent's subdirectories."""
+        # Arrange
+        walker = DirectoryWalker()
+        resume_after = str(tree / "gone" / "file.txt")
+
+        # Act
+        resumed = sorted(os.path.basename(f.file_path)
+                         for f in walker.walk(str(tree), resume_after=resume_after))
+
+        # Assert
+        assert resumed == ["one.md", "three.txt", "two.txt"]
+
+    def test_walk_resume_outside_root_walks_everything(self, tree, tmp_path_factory):
+        """Test a resume path outside the root is ignored."""
+        # Arrange
+        outside = tmp_path_factory.mktemp("outside") / "file.txt"
+
+        # Act
+        files = list(DirectoryWalker().walk(str(tree), resume_after=str(outside)))
+
+        # Assert
+        assert len(files) == 4
+
+    def test_walk_parallel_finds_same_files_as_walk(self, tree):
+        """Test a parallel walk yields every file once, keeping listing order per directory."""
+        # Arrange
+        for i in range(20):
+            (tree / f"dir{i}" / "sub").mkdir(parents=True)
+            for j in range(3):
+                (tree / f"dir{i}" / "sub" / f"file{j}.txt").write_text("content")
+        (tree / "level1" / "link").symlink_to(tree / "dir0")
+        walker = DirectoryWalker()
+        expected = [f.file_path for f in walker.walk(str(tree))]
+
+        # Act
+        paths = [f.file_path for f in walker.walk_parallel(str(tree), 4)]
+
+        # Assert
+        assert sorted(paths) == sorted(expected)
+        directory = str(tree / "dir7" / "sub")
+        assert [p for p in paths if os.path.dirname(p) == directory] == \
+            [p for p in expected if os.path.dirname(p) == directory]
+
+    def test_walk_parallel_invalid_threads(self, tree):
+        """Test thread count must be positive."""
+        with pytest.raises(ValueError, match="threads must be positive"):
+            list(DirectoryWalker().walk_parallel(str(tree), 0))
+
+    def test_walk_parallel_early_close_stops_threads(self, tree):
+        """Test closing a parallel walk early ends its threads."""
+        # Arrange
+        for i in range(50):
+            (tree / f"dir{i}").mkdir()
+            (tree / f"dir{i}" / "file.txt").write_text("content")
+        walk = DirectoryWalker().walk_parallel(str(tree), 4)
+
+        # Act
+        next(walk)
+        walk.close()
+
+        # Assert
+        assert not [t for t in threading.enumerate() if t.name.startswith("walk-")]
+
+    def test_walk_parallel_raises_callback_errors(self, tree):
+        """Test an error in a listing thread is raised to the consumer."""
+        # Arrange
+        def directory_callback(path):
+            if path.endswith("level2"):
+                raise RuntimeError("callback failed")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="callback failed"):
+            list(DirectoryWalker().walk_parallel(str(tree), 3, directory_callback))
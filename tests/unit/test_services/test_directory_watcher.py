@@ -0,0 +1,195 @@
+"""
+Tests for Directory Watcher
+
+Unit tests for the inotify based directory watcher including recursive
+watch registration, event coalescing and overflow handling.
+"""
+
+import asyncio
+import os
+import struct
+from contextlib import asynccontextmanager
+import pytest
+
+from docanalyzer.services.directory_watcher import (
+    DirectoryWatcher,
+    WatchEvent,
+    inotify_available,
+    EVENT_CHANGED,
+    EVENT_DELETED,
+    EVENT_OVERFLOW,
+    IN_Q_OVERFLOW
+)
+
+requires_inotify = pytest.mark.skipif(not inotify_available(), reason="inotify is not available")
+
+
+@asynccontextmanager
+async def started_watcher(root_path):
+    """Start DirectoryWatcher on root_path and close it afterwards."""
+    (root_path / "sub").mkdir(exist_ok=True)
+    watcher = DirectoryWatcher(str(root_path), debounce=0.05)
+    await watcher.start()
+    try:
+        yield watcher
+    finally:
+        await watcher.close()
+
+
+async def next_batch(watcher, timeout=5.0):
+    """Get next batch of events from watcher."""
+    batches = watcher.batches()
+    try:
+        return await asyncio.wait_for(batches.__anext__(), timeout)
+    finally:
+        await batches.aclose()
+
+
+class TestDirectoryWatcher:
+    """Test suite for DirectoryWatcher class."""
+
+    def test_init_invalid_parameters(self):
+        """Test initialization with invalid parameters."""
+        with pytest.raises(ValueError, match="root_path must be non-empty string"):
+            DirectoryWatcher("")
+        with pytest.raises(ValueError, match="max_depth must be non-negative"):
+            DirectoryWatcher("/tmp", max_depth=-1)
+        with pytest.raises(ValueError, match="debounce must be non-negative"):
+            DirectoryWatcher("/tmp", debounce=-1)
+
+    @pytest.mark.asyncio
+    @requires_inotify
+    async def test_start_missing_directory(self, tmp_path):
+        """Test starting on a directory that does not exist."""
+        watcher = DirectoryWatcher(str(tmp_path / "missing"))
+        with pytest.raises(FileNotFoundError):
+            await watcher.start()
+
+    @pytest.mark.asyncio
+    @requires_inotify
+    async def test_watches_are_recursive(self, tmp_path):
+        """Test root and existing subdirectories are watched."""
+        async with started_watcher(tmp_path) as watcher:
+            assert watcher.watch_count == 2
+
+    @pytest.mark.asyncio
+    @requires_inotify
+    async def test_written_file_reported_once(self, tmp_path):
+        """Test repeated writes of one file are coalesced."""
+        async with started_watcher(tmp_path) as watcher:
+            # Arrange
+            file_path = tmp_path / "sub" / "doc.txt"
+
+            # Act
+            file_path.write_text("first")
+            file_path.write_text("second")
+            events = await next_batch(watcher)
+
+            # Assert
+            assert events == [WatchEvent(EVENT_CHANGED, str(file_path))]
+
+    @pytest.mark.asyncio
+    @requires_inotify
+    async def test_deleted_and_moved_out_files(self, tmp_path):
+        """Test deleted and moved out files are reported deleted."""
+        async with started_watcher(tmp_path) as watcher:
+            # Arrange
+            removed = tmp_path / "removed.txt"
+            moved = tmp_path / "moved.txt"
+            removed.write_text("a")
+            moved.write_text("b")
+            await next_batch(watcher)
+            outside = tmp_path.parent / f"{tmp_path.name}_outside.txt"
+
+            # Act
+            removed.unlink()
+            os.rename(moved, outside)
+            events = await next_batch(watcher)
+            outside.unlink()
+
+            # Assert
+            assert {(e.event_type, e.path) for e in events} == {
+                (EVENT_DELETED, str(removed)),
+                (EVENT_DELETED, str(moved))
+            }
+
+    @pytest.mark.asyncio
+    @requires_inotify
+    async def test_new_directory_is_watched(self, tmp_path):
+        """Test directories created later are watched and their files reported."""
+        async with started_watcher(tmp_path) as watcher:
+            # Arrange
+            new_dir = tmp_path / "new"
+
+            # Act
+            new_dir.mkdir()
+            (new_dir / "early.txt").write_text("early")
+            first = await next_batch(watcher)
+            (new_dir / "late.txt").write_text("late")
+            second = await next_batch(watcher)
+
+            # Assert
+            assert WatchEvent(EVENT_CHANGED, str(new_dir / "early.txt")) in first
+            assert second == [WatchEvent(EVENT_CHANGED, str(new_dir / "late.txt"))]
+            assert watcher.watch_count == 3
+
+    @pytest.mark.asyncio
+    @requires_inotify
+    async def test_moved_out_directory_is_unwatched(self, tmp_path):
+        """Test directories moved out of the tree lose their watches."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "sub" / "deep").mkdir(parents=True)
+        async with started_watcher(root) as watcher:
+            # Arrange
+            assert watcher.watch_count == 3
+
+            # Act
+            os.rename(root / "sub", outside / "sub")
+            moved = await next_batch(watcher)
+            (outside / "sub" / "deep" / "doc.txt").write_text("content")
+            (root / "marker.txt").write_text("marker")
+            after = await next_batch(watcher)
+
+            # Assert
+            assert moved == [WatchEvent(EVENT_DELETED, str(root / "sub"), is_directory=True)]
+            assert after == [WatchEvent(EVENT_CHANGED, str(root / "marker.txt"))]
+            assert watcher.watch_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_requires_start(self, tmp_path):
+        """Test batches() refuses a watcher that was never started."""
+        watcher = DirectoryWatcher(str(tmp_path))
+
+        with pytest.raises(RuntimeError):
+            await watcher.batches().__anext__()
+
+    @pytest.mark.asyncio
+    @requires_inotify
+    async def test_overflow_replaces_batch(self, tmp_path):
+        """Test queue overflow is reported as single overflow event."""
+        async with started_watcher(tmp_path) as watcher:
+            # Arrange
+            (tmp_path / "doc.txt").write_text("content")
+            await asyncio.sleep(0.05)
+
+            # Act
+            watcher._dispatch(struct.pack("iIII", -1, IN_Q_OVERFLOW, 0, 0))
+            events = await next_batch(watcher)
+
+            # Assert
+            assert events == [WatchEvent(EVENT_OVERFLOW, str(tmp_path), is_directory=True)]
+            assert watcher.get_statistics()["overflows"] == 1
+
+    @pytest.mark.asyncio
+    @requires_inotify
+    async def test_close_ends_batches(self, tmp_path):
+        """Test closing the watcher ends iteration."""
+        async with started_watcher(tmp_path) as watcher:
+            # Act
+            await watcher.close()
+
+            # Assert
+            assert [batch async for batch in watcher.batches()] == []
@@ -0,0 +1,207 @@
+"""
+Tests for Embedding Batcher
+
+Unit tests for cross-file embedding micro-batching including flush on
+text count, byte size and max-wait deadline, and error propagation.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from docanalyzer.services.embedding_batcher import EmbeddingBatcher
+from docanalyzer.services.embedding_cache import EmbeddingCache
+from docanalyzer.services.embedding_client import EmbeddingClient
+from docanalyzer.config.unified_config import EmbeddingConfig
+from docanalyzer.models.errors import ProcessingError, ErrorCategory
+
+
+def fake_embed_texts(texts):
+    """Return one-element embedding per text holding its length."""
+    return [[float(len(text))] for text in texts]
+
+
+class TestEmbeddingBatcher:
+    """Test suite for EmbeddingBatcher class."""
+
+    @pytest.fixture
+    def embedding_client(self):
+        """Create mock embedding client."""
+        client = Mock(spec=EmbeddingClient)
+        client.config = EmbeddingConfig()
+        client.embed_texts = AsyncMock(side_effect=fake_embed_texts)
+        client.cleanup = AsyncMock()
+        return client
+
+    def test_init_invalid_parameters(self, embedding_client):
+        """Test initialization with invalid limits."""
+        with pytest.raises(ValueError, match="max_batch_texts must be positive"):
+            EmbeddingBatcher(embedding_client, max_batch_texts=0)
+
+        with pytest.raises(ValueError, match="max_batch_bytes must be positive"):
+            EmbeddingBatcher(embedding_client, max_batch_bytes=0)
+
+        with pytest.raises(ValueError, match="max_wait_ms must be non-negative"):
+            EmbeddingBatcher(embedding_client, max_wait_ms=-1)
+
+    def test_init_uses_config_limits(self, embedding_client):
+        """Test limits default to embedding configuration."""
+        # Act
+        batcher = EmbeddingBatcher(embedding_client)
+
+        # Assert
+        assert batcher.max_batch_texts == embedding_client.config.max_batch_texts
+        assert batcher.max_batch_bytes == embedding_client.config.max_batch_bytes
+        assert batcher.max_wait_ms == embedding_client.config.max_wait_ms
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_batch(self, embedding_client):
+        """Test texts from concurrent callers are merged into one batch."""
+        # Arrange
+        batcher = EmbeddingBatcher(embedding_client, max_batch_texts=10, max_wait_ms=50)
+
+        # Act
+        results = await asyncio.gather(
+            batcher.embed_texts(["a", "bb"]),
+            batcher.embed_texts(["ccc"]),
+            batcher.embed_text("dddd")
+        )
+        await batcher.stop()
+
+        # Assert
+        assert results == [[[1.0], [2.0]], [[3.0]], [4.0]]
+        embedding_client.embed_texts.assert_called_once_with(["a", "bb", "ccc", "dddd"])
+        assert batcher.get_statistics()["batches_sent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_on_max_batch_texts(self, embedding_client):
+        """Test full batches are flushed without waiting for deadline."""
+        # Arrange
+        batcher = EmbeddingBatcher(embedding_client, max_batch_texts=2, max_wait_ms=10000)
+
+        # Act
+        results = await asyncio.wait_for(batcher.embed_texts(["a", "b", "c", "d"]), 1.0)
+        await batcher.stop()
+
+        # Assert
+        assert len(results) == 4
+        batches = [call[0][0] for call in embedding_client.embed_texts.call_args_list]
+        assert batches == [["a", "b"], ["c", "d"]]
+
+    @pytest.mark.asyncio
+    async def test_flush_on_max_batch_bytes(self, embedding_client):
+        """Test text exceeding byte budget starts a new batch."""
+        # Arrange
+        batcher = EmbeddingBatcher(
+            embedding_client, max_batch_texts=10, max_batch_bytes=5, max_wait_ms=20
+        )
+
+        # Act
+        results = await batcher.embed_texts(["aaa", "bb", "cccc"])
+        await batcher.stop()
+
+        # Assert
+        assert results == [[3.0], [2.0], [4.0]]
+        batches = [call[0][0] for call in embedding_client.embed_texts.call_args_list]
+        assert batches == [["aaa", "bb"], ["cccc"]]
+
+    @pytest.mark.asyncio
+    async def test_flush_on_max_wait(self, embedding_client):
+        """Test partial batch is flushed after max-wait deadline."""
+        # Arrange
+        batcher = EmbeddingBatcher(embedding_client, max_batch_texts=100, max_wait_ms=5)
+
+        # Act
+        result = await asyncio.wait_for(batcher.embed_text("abc"), 1.0)
+        await batcher.stop()
+
+        # Assert
+        assert result == [3.0]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_callers(self, embedding_client):
+        """Test batch error is raised to every caller in the batch."""
+        # Arrange
+        embedding_client.embed_texts.side_effect = ProcessingError(
+            "EmbeddingError", "service down", ErrorCategory.NETWORK
+        )
+        batcher = EmbeddingBatcher(embedding_client, max_wait_ms=20)
+
+        # Act
+        results = await asyncio.gather(
+            batcher.embed_text("a"),
+            batcher.embed_text("b"),
+            return_exceptions=True
+        )
+        await batcher.stop()
+
+        # Assert
+        assert all(isinstance(result, ProcessingError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_queued_texts(self, embedding_client):
+        """Test stop sends texts still waiting for the deadline."""
+        # Arrange
+        batcher = EmbeddingBatcher(embedding_client, max_wait_ms=10000)
+        future = await batcher.submit("queued")
+
+        # Act
+        await asyncio.wait_for(batcher.stop(), 1.0)
+
+        # Assert
+        assert future.result() == [6.0]
+        assert batcher.is_running is False
+
+    @pytest.mark.asyncio
+    async def test_submit_during_stop_is_rejected(self, embedding_client):
+        """Test texts submitted while stopping fail instead of hanging."""
+        # Arrange
+        batcher = EmbeddingBatcher(embedding_client, max_wait_ms=10000)
+        queued = await batcher.submit("queued")
+
+        # Act
+        stopping = asyncio.create_task(batcher.stop())
+        await asyncio.sleep(0)
+        with pytest.raises(ProcessingError, match="stopping"):
+            await batcher.submit("late")
+        await asyncio.wait_for(stopping, 1.0)
+
+        # Assert
+        assert queued.result() == [6.0]
+        assert batcher.is_running is False
+        again = await batcher.submit("again")
+        await asyncio.wait_for(batcher.stop(), 1.0)
+        assert again.result() == [5.0]
+
+    @pytest.mark.asyncio
+    async def test_cache_serves_known_texts(self, embedding_client, tmp_path):
+        """Test cached texts are not queued for the embedding service."""
+        # Arrange
+        cache = EmbeddingCache(cache_path=str(tmp_path / "cache.sqlite"), max_bytes=1024 * 1024, namespace="test")
+        batcher = EmbeddingBatcher(embedding_client, max_wait_ms=0, embedding_cache=cache)
+        await batcher.embed_texts(["known"])
+        embedding_client.embed_texts.reset_mock()
+
+        # Act
+        embeddings = await batcher.embed_texts(["known", "new", "known"])
+        single = await batcher.embed_text("new")
+        await batcher.stop()
+        cache.close()
+
+        # Assert
+        assert embeddings == [[5.0], [3.0], [5.0]]
+        assert single == [3.0]
+        embedding_client.embed_texts.assert_called_once_with(["new"])
+
+    @pytest.mark.asyncio
+    async def test_stop_keeps_external_client_open(self, embedding_client):
+        """Test stop does not close a client passed by the caller."""
+        # Arrange
+        batcher = EmbeddingBatcher(embedding_client)
+        await batcher.start()
+
+        # Act
+        await batcher.stop()
+
+        # Assert
+        embedding_client.cleanup.assert_not_called()
@@ -0,0 +1,122 @@
+"""
+Tests for Embedding Cache
+
+Unit tests for persistent embedding cache including text normalization,
+float32 storage, namespacing, persistence and LRU eviction.
+"""
+
+import pytest
+
+from docanalyzer.services.embedding_cache import EmbeddingCache, normalize_text, hash_text
+from docanalyzer.config.unified_config import EmbeddingConfig
+
+
+class TestEmbeddingCache:
+    """Test suite for EmbeddingCache class."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path):
+        """Create path for cache database."""
+        return str(tmp_path / "cache" / "embeddings.sqlite")
+
+    @pytest.fixture
+    def cache(self, cache_path):
+        """Create EmbeddingCache instance."""
+        cache = EmbeddingCache(cache_path=cache_path, max_bytes=1024 * 1024, namespace="model@test")
+        yield cache
+        cache.close()
+
+    def test_normalize_text_collapses_whitespace(self):
+        """Test normalization ignores whitespace differences."""
+        assert normalize_text("  Licence\n\theader  text ") == "Licence header text"
+        assert hash_text("a  b\n") == hash_text("a b")
+
+    def test_init_from_config(self, cache_path):
+        """Test namespace and limits are taken from configuration."""
+        # Arrange
+        config = EmbeddingConfig(
+            base_url="http://embed", port=9001, model_name="mini", cache_max_bytes=4096
+        )
+
+        # Act
+        cache = EmbeddingCache(cache_path=cache_path, config=config)
+
+        # Assert
+        assert cache.namespace == "mini@http://embed:9001"
+        assert cache.max_bytes == 4096
+
+    def test_init_invalid_max_bytes(self, cache_path):
+        """Test initialization with invalid byte cap."""
+        with pytest.raises(ValueError, match="max_bytes must be positive"):
+            EmbeddingCache(cache_path=cache_path, max_bytes=0, namespace="model")
+
+    def test_put_and_get_many(self, cache):
+        """Test stored embeddings are returned by index."""
+        # Arrange
+        cache.put_many(["first", "second"], [[0.5, 1.0], [2.0, -1.5]])
+
+        # Act
+        found = cache.get_many(["second", "missing", "first"])
+
+        # Assert
+        assert found == {0: [2.0, -1.5], 2: [0.5, 1.0]}
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+    def test_vectors_stored_as_float32(self, cache):
+        """Test vectors are stored as 4-byte floats."""
+        # Act
+        cache.put_many(["text"], [[0.1] * 384])
+
+        # Assert
+        assert cache.get_statistics()["total_bytes"] == 384 * 4
+        assert cache.get_many(["text"])[0][0] == pytest.approx(0.1)
+
+    def test_namespaces_are_isolated(self, cache, cache_path):
+        """Test entries of another model are not returned."""
+        # Arrange
+        cache.put_many(["text"], [[1.0]])
+        other = EmbeddingCache(cache_path=cache_path, max_bytes=1024, namespace="other@test")
+
+        # Act
+        found = other.get_many(["text"])
+        other.close()
+
+        # Assert
+        assert found == {}
+
+    def test_persists_across_instances(self, cache, cache_path):
+        """Test embeddings survive reopening the cache file."""
+        # Arrange
+        cache.put_many(["text"], [[1.0, 2.0]])
+        cache.close()
+
+        # Act
+        reopened = EmbeddingCache(cache_path=cache_path, max_bytes=1024, namespace="model@test")
+        found = reopened.get_many(["text"])
+        reopened.close()
+
+        # Assert
+        assert found == {0: [1.0, 2.0]}
+
+    def test_lru_eviction_over_byte_cap(self, cache_path):
+        """Test least recently used entries are evicted when cap is exceeded."""
+        # Arrange - room for two 16-byte vectors
+        cache = EmbeddingCache(cache_path=cache_path, max_bytes=32, namespace="model")
+        cache.put_many(["a"], [[1.0] * 4])
+        cache.put_many(["b"], [[2.0] * 4])
+        cache.get_many(["a"])
+
+        # Act
+        cache.put_many(["c"], [[3.0] * 4])
+
+        # Assert
+        assert set(cache.get_many(["a", "b", "c"])) == {0, 2}
+        assert cache.evictions == 1
+        assert cache.get_statistics()["total_bytes"] == 32
+        cache.close()
+
+    def test_put_many_length_mismatch(self, cache):
+        """Test put_many rejects mismatched inputs."""
+        with pytest.raises(ValueError, match="same length"):
+            cache.put_many(["a", "b"], [[1.0]])
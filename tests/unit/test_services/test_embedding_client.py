@@ -0,0 +1,160 @@
+"""
+Tests for Embedding Client
+
+Unit tests for pooled, batched embedding client including batch splitting,
+request handling and response validation.
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from docanalyzer.services.embedding_client import EmbeddingClient
+from docanalyzer.config.unified_config import EmbeddingConfig
+from docanalyzer.models.errors import ProcessingError
+
+
+def make_response(embeddings, success=True):
+    """Create mock JSON-RPC embed response."""
+    response = Mock()
+    response.raise_for_status = Mock()
+    response.json = Mock(return_value={
+        "result": {
+            "success": success,
+            "data": {"embeddings": embeddings}
+        }
+    })
+    return response
+
+
+class TestEmbeddingClient:
+    """Test suite for EmbeddingClient class."""
+
+    @pytest.fixture
+    def config(self):
+        """Create embedding configuration."""
+        return EmbeddingConfig(base_url="http://embed", port=9001, timeout=10)
+
+    @pytest.fixture
+    def client(self, config):
+        """Create EmbeddingClient with a mocked HTTP client."""
+        client = EmbeddingClient(config, max_batch_texts=2, max_batch_bytes=100)
+        client._client = Mock()
+        client.is_initialized = True
+        return client
+
+    def test_init_uses_config(self, config):
+        """Test initialization takes URL and batch limits from config."""
+        # Act
+        client = EmbeddingClient(config)
+
+        # Assert
+        assert client.base_url == "http://embed:9001"
+        assert client.timeout == 10.0
+        assert client.max_batch_texts == config.max_batch_texts
+        assert client.max_batch_bytes == config.max_batch_bytes
+        assert client.is_initialized is False
+
+    def test_init_invalid_limits(self, config):
+        """Test initialization with invalid batch limits."""
+        with pytest.raises(ValueError, match="max_batch_texts must be positive"):
+            EmbeddingClient(config, max_batch_texts=0)
+
+        with pytest.raises(ValueError, match="max_batch_bytes must be positive"):
+            EmbeddingClient(config, max_batch_bytes=0)
+
+    def test_split_batches_by_count(self, client):
+        """Test batches are limited by number of texts."""
+        # Act
+        batches = client.split_batches(["a", "b", "c", "d", "e"])
+
+        # Assert
+        assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+    def test_split_batches_by_bytes(self, client):
+        """Test batches are limited by total UTF-8 size."""
+        # Arrange
+        large = "x" * 60
+        oversized = "y" * 150
+
+        # Act
+        batches = client.split_batches([large, large, oversized, "z"])
+
+        # Assert
+        assert batches == [[large], [large], [oversized], ["z"]]
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_one_request_per_batch(self, client):
+        """Test embed_texts sends one request per batch and keeps order."""
+        # Arrange
+        client._client.post = AsyncMock(side_effect=[
+            make_response([[1.0] * 384, [2.0] * 384]),
+            make_response([[3.0] * 384])
+        ])
+
+        # Act
+        embeddings = await client.embed_texts(["a", "b", "c"])
+
+        # Assert
+        assert client._client.post.call_count == 2
+        assert [e[0] for e in embeddings] == [1.0, 2.0, 3.0]
+        first_payload = client._client.post.call_args_list[0][1]["json"]
+        assert first_payload["method"] == "embed"
+        assert first_payload["params"]["texts"] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_empty_list(self, client):
+        """Test embed_texts with empty list makes no requests."""
+        # Arrange
+        client._client.post = AsyncMock()
+
+        # Act
+        embeddings = await client.embed_texts([])
+
+        # Assert
+        assert embeddings == []
+        client._client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_service_failure(self, client):
+        """Test unsuccessful service response raises ProcessingError."""
+        # Arrange
+        client._client.post = AsyncMock(return_value=make_response([], success=False))
+
+        # Act & Assert
+        with pytest.raises(ProcessingError, match="Failed to generate embedding"):
+            await client.embed_texts(["a"])
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_count_mismatch(self, client):
+        """Test response with wrong number of embeddings raises ProcessingError."""
+        # Arrange
+        client._client.post = AsyncMock(return_value=make_response([[0.1] * 384]))
+
+        # Act & Assert
+        with pytest.raises(ProcessingError, match="Expected 2 embeddings, got 1"):
+            await client.embed_texts(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_network_error(self, client):
+        """Test transport errors are wrapped in ProcessingError."""
+        # Arrange
+        client._client.post = AsyncMock(side_effect=OSError("connection refused"))
+
+        # Act & Assert
+        with pytest.raises(ProcessingError, match="Embedding request failed"):
+            await client.embed_texts(["a"])
+
+    @pytest.mark.asyncio
+    async def test_cleanup_closes_client(self, client):
+        """Test cleanup closes pooled HTTP client."""
+        # Arrange
+        http_client = client._client
+        http_client.aclose = AsyncMock()
+
+        # Act
+        await client.cleanup()
+
+        # Assert
+        http_client.aclose.assert_called_once()
+        assert client._client is None
+        assert client.is_initialized is False
@@ -22,6 +22,9 @@ from docanalyzer.services.database_manager import DatabaseManager
 from docanalyzer.models.processing import ProcessingBlock, FileProcessingResult, ProcessingStatus
 from docanalyzer.processors.text_processor import TextProcessor
 from docanalyzer.processors.markdown_processor import MarkdownProcessor
+from docanalyzer.processors.encoding_detector import EncodingDetector
+from docanalyzer.processors.mapped_file import MappedFile
+from docanalyzer.processors.processor_executor import ProcessorExecutor
 from docanalyzer.models.errors import ProcessingError
 
 
@@ -166,6 +169,20 @@ class TestFileProcessor:
         assert isinstance(processor.processors[".txt"], TextProcessor)
         assert isinstance(processor.processors[".md"], MarkdownProcessor)
     
+    def test_init_use_mmap(self, mock_vector_store, mock_database_manager):
+        """Test use_mmap is passed to text and Markdown processors."""
+        # Act
+        processor = FileProcessor(
+            vector_store=mock_vector_store,
+            database_manager=mock_database_manager,
+            use_mmap=True
+        )
+        
+        # Assert
+        assert processor.processors[".txt"].use_mmap is True
+        assert processor.processors[".md"].use_mmap is True
+        assert FileProcessor(mock_vector_store, mock_database_manager).processors[".txt"].use_mmap is False
+    
     def test_init_invalid_vector_store_type(self, mock_database_manager):
         """Test initialization with invalid vector store type."""
         # Act & Assert
@@ -309,6 +326,29 @@ class TestFileProcessor:
         with pytest.raises(ValueError, match="metadata must contain key"):
             file_processor._create_chunks_from_blocks(sample_blocks, metadata)
     
+    def test_create_chunks_mapped_file_changed(self, file_processor, tmp_path):
+        """Test chunk creation fails when a mapped source file changed."""
+        # Arrange
+        file_path = tmp_path / "notes.txt"
+        file_path.write_text("First paragraph.")
+        block = ProcessingBlock("First paragraph.", "text_paragraph", 1, 1, 0, 16)
+        mapped_file = MappedFile(str(file_path), EncodingDetector(["utf-8"]))
+        mapped_file.read_text()
+        mapped_file.map_blocks([block])
+        file_path.write_text("First paragraph, edited.")
+        metadata = {
+            "source_path": str(file_path),
+            "source_id": str(uuid4()),
+            "status": "NEW"
+        }
+        
+        # Act & Assert
+        try:
+            with pytest.raises(ValueError, match="changed since it was mapped"):
+                file_processor._create_chunks_from_blocks([block], metadata)
+        finally:
+            mapped_file.close()
+    
     @pytest.mark.asyncio
     async def test_store_chunks_atomic_success(self, file_processor):
         """Test successful atomic chunk storage."""
@@ -433,6 +473,28 @@ class TestFileProcessor:
             assert result.processing_time_seconds > 0
             assert result.error_message is None
     
+    @pytest.mark.asyncio
+    async def test_process_file_with_processor_executor(self, mock_vector_store, mock_database_manager, temp_txt_file):
+        """Test real processor runs through the processor executor."""
+        # Arrange
+        executor = ProcessorExecutor(mode="thread", max_workers=1)
+        file_processor = FileProcessor(
+            mock_vector_store,
+            mock_database_manager,
+            processor_executor=executor
+        )
+        file_processor._store_chunks_atomic = AsyncMock(return_value=True)
+        
+        # Act
+        with patch.object(executor, 'process_file', wraps=executor.process_file) as run_in_executor:
+            result = await file_processor.process_file(temp_txt_file)
+        executor.shutdown()
+        
+        # Assert
+        run_in_executor.assert_called_once()
+        assert result.processing_status == ProcessingStatus.COMPLETED
+        assert result.total_blocks >= 1
+    
     @pytest.mark.asyncio
     async def test_process_file_no_blocks(self, file_processor, temp_txt_file):
         """Test file processing with no blocks extracted."""
@@ -591,6 +653,165 @@ class TestFileProcessor:
             assert results[1].processing_status == ProcessingStatus.FAILED
             assert "Processing error" in results[1].error_message
 
+    
+    @pytest.mark.asyncio
+    async def test_store_chunks_bulk_success(self, file_processor):
+        """Test bulk chunk storage sends all chunks in one wrapper call."""
+        # Arrange
+        file_processor.bulk_storage = True
+        chunks = [
+            {
+                "chunk_id": str(uuid4()),
+                "content": f"Test content {i}",
+                "metadata": {"source_path": "/test/file.txt", "source_id": str(uuid4())}
+            }
+            for i in range(3)
+        ]
+        file_processor.vector_store.create_chunks_bulk = AsyncMock(return_value={
+            "success": True,
+            "stored_chunk_ids": [chunk["chunk_id"] for chunk in chunks],
+            "failed_chunk_ids": [],
+            "batch_count": 1
+        })
+        
+        # Act
+        result = await file_processor._store_chunks_atomic(chunks)
+        
+        # Assert
+        assert result is True
+        file_processor.vector_store.create_chunks_bulk.assert_called_once()
+        file_processor.vector_store.create_chunk.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_store_chunks_bulk_attaches_embeddings(self, file_processor):
+        """Test bulk storage precomputes embeddings through embedding client."""
+        # Arrange
+        file_processor.bulk_storage = True
+        file_processor.embedding_client = Mock()
+        file_processor.embedding_client.embed_texts = AsyncMock(return_value=[[0.1], [0.2]])
+        chunks = [
+            {
+                "chunk_id": str(uuid4()),
+                "content": f"Test content {i}",
+                "metadata": {"source_path": "/test/file.txt"}
+            }
+            for i in range(2)
+        ]
+        file_processor.vector_store.create_chunks_bulk = AsyncMock(return_value={
+            "success": True,
+            "stored_chunk_ids": [chunk["chunk_id"] for chunk in chunks],
+            "failed_chunk_ids": [],
+            "batch_count": 1
+        })
+        
+        # Act
+        result = await file_processor._store_chunks_atomic(chunks)
+        
+        # Assert
+        assert result is True
+        file_processor.embedding_client.embed_texts.assert_called_once_with(
+            ["Test content 0", "Test content 1"]
+        )
+        stored_chunks = file_processor.vector_store.create_chunks_bulk.call_args[1]["chunks"]
+        assert [chunk["embedding"] for chunk in stored_chunks] == [[0.1], [0.2]]
+    
+    @pytest.mark.asyncio
+    async def test_store_chunks_bulk_failure_rolls_back(self, file_processor):
+        """Test bulk chunk storage rolls back stored chunks on partial failure."""
+        # Arrange
+        file_processor.bulk_storage = True
+        chunks = [
+            {
+                "chunk_id": str(uuid4()),
+                "content": f"Test content {i}",
+                "metadata": {"source_path": "/test/file.txt"}
+            }
+            for i in range(2)
+        ]
+        stored_id, failed_id = chunks[0]["chunk_id"], chunks[1]["chunk_id"]
+        file_processor.vector_store.create_chunks_bulk = AsyncMock(return_value={
+            "success": False,
+            "stored_chunk_ids": [stored_id],
+            "failed_chunk_ids": [failed_id],
+            "errors": {failed_id: "Batch creation failed"}
+        })
+        file_processor.vector_store.delete_chunks = AsyncMock(return_value=True)
+        
+        # Act
+        result = await file_processor._store_chunks_atomic(chunks)
+        
+        # Assert
+        assert result is False
+        file_processor.vector_store.delete_chunks.assert_called_once_with([stored_id])
+        file_processor.vector_store.delete_chunk.assert_not_called()
+
+    
+    @pytest.mark.asyncio
+    async def test_process_file_streams_large_file(self, mock_vector_store, mock_database_manager, tmp_path):
+        """Test files over the stream threshold are stored in bulk batches."""
+        # Arrange
+        file_path = tmp_path / "large.txt"
+        file_path.write_text("\n\n".join(f"Paragraph {i} " + "word " * 20 for i in range(5)))
+        mock_database_manager.create_file_record = AsyncMock()
+        mock_vector_store.create_chunks_bulk = AsyncMock(side_effect=lambda chunks, **kwargs: {
+            "success": True,
+            "stored_chunk_ids": [chunk["chunk_id"] for chunk in chunks],
+            "failed_chunk_ids": [],
+            "batch_count": 1
+        })
+        processor = FileProcessor(
+            mock_vector_store, mock_database_manager, stream_threshold_bytes=100, stream_batch_size=2
+        )
+        
+        # Act
+        result = await processor.process_file(str(file_path))
+        
+        # Assert
+        assert result.processing_status == ProcessingStatus.COMPLETED
+        assert result.blocks == []
+        assert result.processing_metadata == {"blocks_extracted": 5, "chunks_created": 5, "streamed": True}
+        batches = [call.kwargs["chunks"] for call in mock_vector_store.create_chunks_bulk.call_args_list]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [chunk["metadata"]["block_index"] for batch in batches for chunk in batch] == [0, 1, 2, 3, 4]
+        mock_database_manager.create_file_record.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_process_file_stream_failure_rolls_back(self, mock_vector_store, mock_database_manager, tmp_path):
+        """Test a failed batch rolls back chunks stored by earlier batches."""
+        # Arrange
+        file_path = tmp_path / "large.txt"
+        file_path.write_text("\n\n".join(f"Paragraph {i} " + "word " * 20 for i in range(4)))
+        mock_database_manager.create_file_record = AsyncMock()
+        stored_ids = []
+        
+        def create_chunks_bulk(chunks, **kwargs):
+            if stored_ids:
+                return {"success": False, "stored_chunk_ids": [], "failed_chunk_ids": []}
+            stored_ids.extend(chunk["chunk_id"] for chunk in chunks)
+            return {"success": True, "stored_chunk_ids": list(stored_ids), "failed_chunk_ids": []}
+        
+        mock_vector_store.create_chunks_bulk = AsyncMock(side_effect=create_chunks_bulk)
+        processor = FileProcessor(
+            mock_vector_store, mock_database_manager, stream_threshold_bytes=100, stream_batch_size=2
+        )
+        
+        # Act
+        result = await processor.process_file(str(file_path))
+        
+        # Assert
+        assert result.processing_status == ProcessingStatus.FAILED
+        rolled_back = [call.args[0] for call in mock_vector_store.delete_chunk.call_args_list]
+        assert rolled_back == stored_ids
+    
+    def test_should_stream(self, file_processor):
+        """Test only streaming processors stream files over the threshold."""
+        text_processor = file_processor.processors[".txt"]
+        markdown_processor = file_processor.processors[".md"]
+        
+        assert file_processor._should_stream(text_processor, file_processor.stream_threshold_bytes + 1)
+        assert not file_processor._should_stream(text_processor, 1024)
+        assert not file_processor._should_stream(markdown_processor, file_processor.stream_threshold_bytes + 1)
+
 
 class TestFileProcessorIntegration:
     """Integration tests for FileProcessor."""
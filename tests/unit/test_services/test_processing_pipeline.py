@@ -0,0 +1,242 @@
+"""
+Tests for Processing Pipeline
+
+Unit tests for staged file processing pipeline including stage
+configuration, end-to-end processing, failure handling, backpressure
+and statistics.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from docanalyzer.services.processing_pipeline import (
+    ProcessingPipeline, PipelineConfig, STAGE_NAMES
+)
+from docanalyzer.services.file_processor import FileProcessor
+from docanalyzer.services.vector_store_wrapper import VectorStoreWrapper
+from docanalyzer.services.database_manager import DatabaseManager
+from docanalyzer.models.processing import ProcessingStatus
+
+
+class TestPipelineConfig:
+    """Test suite for PipelineConfig class."""
+
+    def test_init_defaults(self):
+        """Test configuration defaults."""
+        config = PipelineConfig()
+
+        assert config.read_workers == 4
+        assert config.embed_workers == 4
+        assert config.queue_size == 64
+        assert config.get_workers("parse") >= 1
+
+    def test_init_invalid_workers(self):
+        """Test initialization with invalid worker counts."""
+        with pytest.raises(ValueError, match="store_workers must be positive"):
+            PipelineConfig(store_workers=0)
+
+        with pytest.raises(ValueError, match="queue_size must be positive"):
+            PipelineConfig(queue_size=0)
+
+
+class TestProcessingPipeline:
+    """Test suite for ProcessingPipeline class."""
+
+    @pytest.fixture
+    def file_processor(self):
+        """Create FileProcessor with mocked storage and database."""
+        vector_store = Mock(spec=VectorStoreWrapper)
+        vector_store.create_chunk = AsyncMock(return_value=True)
+        vector_store.delete_chunk = AsyncMock(return_value=True)
+        database_manager = Mock(spec=DatabaseManager)
+        database_manager.create_file_record = AsyncMock()
+        return FileProcessor(vector_store, database_manager)
+
+    @pytest.fixture
+    def sample_files(self, tmp_path):
+        """Create sample text and Markdown files."""
+        paths = []
+        for i in range(3):
+            text_file = tmp_path / f"doc_{i}.txt"
+            text_file.write_text(f"First paragraph of document {i}.\n\nSecond paragraph of document {i}.")
+            paths.append(str(text_file))
+        markdown_file = tmp_path / "readme.md"
+        markdown_file.write_text("# Title\n\nSome markdown content here.")
+        paths.append(str(markdown_file))
+        return paths
+
+    def test_init_invalid_file_processor(self):
+        """Test initialization with invalid file processor."""
+        with pytest.raises(TypeError, match="file_processor must be FileProcessor instance"):
+            ProcessingPipeline("invalid")
+
+    @pytest.mark.asyncio
+    async def test_run_processes_all_files(self, file_processor, sample_files):
+        """Test all files pass through every stage."""
+        # Arrange
+        pipeline = ProcessingPipeline(file_processor, PipelineConfig(queue_size=1))
+        seen = []
+
+        # Act
+        results = await pipeline.run(sample_files, seen.append)
+
+        # Assert
+        assert results == []
+        assert len(seen) == 4
+        assert all(r.processing_status == ProcessingStatus.COMPLETED for r in seen)
+        assert all(r.blocks == [] and r.processing_metadata["chunks_created"] > 0 for r in seen)
+        assert sorted(r.file_path for r in seen) == sorted(sample_files)
+        assert file_processor.vector_store.create_chunk.call_count > 0
+        assert file_processor.database_manager.create_file_record.call_count == 4
+
+        statistics = pipeline.get_statistics()
+        assert list(statistics) == STAGE_NAMES
+        for stage_statistics in statistics.values():
+            assert stage_statistics["processed"] == 4
+            assert stage_statistics["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_run_accepts_async_iterable(self, file_processor, sample_files):
+        """Test paths can be streamed from an async iterable."""
+        # Arrange
+        pipeline = ProcessingPipeline(file_processor, PipelineConfig())
+
+        async def stream():
+            for path in sample_files:
+                yield path
+
+        # Act
+        results = await pipeline.run(stream())
+
+        # Assert
+        assert sorted(r.file_path for r in results) == sorted(sample_files)
+
+    @pytest.mark.asyncio
+    async def test_run_isolates_failed_file(self, file_processor, sample_files, tmp_path):
+        """Test failing file is recorded as failed without stopping others."""
+        # Arrange
+        missing_file = str(tmp_path / "missing.txt")
+        pipeline = ProcessingPipeline(file_processor, PipelineConfig())
+
+        # Act
+        results = await pipeline.run(sample_files + [missing_file])
+
+        # Assert
+        by_path = {r.file_path: r for r in results}
+        assert by_path[missing_file].processing_status == ProcessingStatus.FAILED
+        assert all(
+            by_path[path].processing_status == ProcessingStatus.COMPLETED
+            for path in sample_files
+        )
+        assert pipeline.get_statistics()["read"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_run_storage_failure_marks_file_failed(self, file_processor, sample_files):
+        """Test vector store failure fails the file in the store stage."""
+        # Arrange
+        file_processor.vector_store.create_chunk = AsyncMock(return_value=False)
+        pipeline = ProcessingPipeline(file_processor, PipelineConfig())
+
+        # Act
+        results = await pipeline.run(sample_files[:1])
+
+        # Assert
+        assert results[0].processing_status == ProcessingStatus.FAILED
+        assert "Failed to store chunks" in results[0].error_message
+        assert pipeline.get_statistics()["store"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_run_record_failure_marks_file_failed(self, file_processor, sample_files):
+        """Test file still gets a failed result when recording it raises."""
+        # Arrange
+        file_processor.vector_store.create_chunk = AsyncMock(return_value=False)
+        file_processor._rollback_chunks = AsyncMock(side_effect=RuntimeError("rollback failed"))
+        pipeline = ProcessingPipeline(file_processor, PipelineConfig())
+
+        # Act
+        results = await pipeline.run(sample_files[:2])
+
+        # Assert
+        assert sorted(r.file_path for r in results) == sorted(sample_files[:2])
+        assert all(r.processing_status == ProcessingStatus.FAILED for r in results)
+        assert all("rollback failed" in r.error_message for r in results)
+
+    @pytest.mark.asyncio
+    async def test_run_streams_large_file(self, file_processor, tmp_path):
+        """Test files over the stream threshold are stored batch by batch."""
+        # Arrange
+        large_file = tmp_path / "large.txt"
+        large_file.write_text("\n\n".join(f"Paragraph {i} " + "word " * 20 for i in range(3)))
+        file_processor.stream_threshold_bytes = 100
+        file_processor.stream_batch_size = 1
+        file_processor.vector_store.create_chunks_bulk = AsyncMock(side_effect=lambda chunks, **kwargs: {
+            "success": True,
+            "stored_chunk_ids": [chunk["chunk_id"] for chunk in chunks],
+            "failed_chunk_ids": []
+        })
+        pipeline = ProcessingPipeline(file_processor, PipelineConfig())
+
+        # Act
+        results = await pipeline.run([str(large_file)])
+
+        # Assert
+        assert results[0].processing_status == ProcessingStatus.COMPLETED
+        assert results[0].processing_metadata["chunks_created"] == 3
+        assert file_processor.vector_store.create_chunks_bulk.call_count == 3
+        metadata = file_processor.database_manager.create_file_record.call_args.kwargs["metadata"]
+        assert metadata == {"chunks_created": 3, "blocks_count": 3}
+
+    @pytest.mark.asyncio
+    async def test_slow_stage_applies_backpressure(self, file_processor, sample_files):
+        """Test bounded queues limit items waiting before a slow stage."""
+        # Arrange
+        pipeline = ProcessingPipeline(
+            file_processor,
+            PipelineConfig(store_workers=1, queue_size=1)
+        )
+        max_depth = 0
+
+        async def slow_store(chunks):
+            nonlocal max_depth
+            max_depth = max(max_depth, pipeline.get_statistics()["store"]["queue_depth"])
+            await asyncio.sleep(0.01)
+            return True
+
+        file_processor._store_chunks_atomic = slow_store
+
+        # Act
+        results = await pipeline.run(sample_files * 3)
+
+        # Assert
+        assert len(results) == 12
+        assert max_depth <= 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_run_cancels_stage_workers(self, file_processor, sample_files):
+        """Test cancelling run() leaves no stage worker pending."""
+        # Arrange
+        pipeline = ProcessingPipeline(file_processor, PipelineConfig())
+        stored = asyncio.Event()
+
+        async def blocked_store(chunks):
+            stored.set()
+            await asyncio.sleep(10)
+            return True
+
+        file_processor._store_chunks_atomic = blocked_store
+
+        async def paths():
+            yield sample_files[0]
+            await asyncio.sleep(10)
+
+        # Act
+        run = asyncio.create_task(pipeline.run(paths()))
+        await asyncio.wait_for(stored.wait(), 5.0)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        # Assert
+        others = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        assert others == []
@@ -0,0 +1,225 @@
+"""
+Tests for Scan Manifest
+
+Unit tests for persistent scan manifest including entry storage,
+per-root isolation, digests and stat comparison.
+"""
+
+import hashlib
+import os
+import pytest
+from datetime import datetime
+
+from docanalyzer.models.file_system import FileInfo
+from docanalyzer.services.scan_manifest import ScanManifest, ManifestEntry, ScanChanges, digest_file, match_moves
+
+
+class TestScanManifest:
+    """Test suite for ScanManifest class."""
+
+    @pytest.fixture
+    def manifest_path(self, tmp_path):
+        """Create path for manifest database."""
+        return str(tmp_path / "data" / "manifest.sqlite")
+
+    @pytest.fixture
+    def manifest(self, manifest_path):
+        """Create ScanManifest instance."""
+        manifest = ScanManifest(manifest_path)
+        yield manifest
+        manifest.close()
+
+    def test_init_empty_path(self):
+        """Test initialization with empty path."""
+        with pytest.raises(ValueError, match="manifest_path cannot be empty"):
+            ScanManifest("")
+
+    def test_upsert_and_load(self, manifest):
+        """Test stored entries are loaded by path."""
+        # Arrange
+        entry = ManifestEntry("/docs/a.txt", 1, 100, 10, 123456789, "abc")
+
+        # Act
+        manifest.upsert("/docs", [entry])
+        manifest.upsert("/docs", [ManifestEntry("/docs/a.txt", 1, 100, 12, 223456789, "def")])
+
+        # Assert
+        loaded = manifest.load("/docs")
+        assert list(loaded) == ["/docs/a.txt"]
+        assert loaded["/docs/a.txt"].size == 12
+        assert loaded["/docs/a.txt"].digest == "def"
+
+    def test_roots_are_isolated(self, manifest):
+        """Test entries of one root are not returned for another."""
+        # Arrange
+        manifest.upsert("/docs", [ManifestEntry("/docs/a.txt", 1, 1, 1, 1)])
+
+        # Act & Assert
+        assert manifest.load("/other") == {}
+
+    def test_delete_and_clear(self, manifest):
+        """Test entries can be removed."""
+        # Arrange
+        manifest.upsert("/docs", [
+            ManifestEntry("/docs/a.txt", 1, 1, 1, 1),
+            ManifestEntry("/docs/b.txt", 1, 2, 1, 1)
+        ])
+
+        # Act
+        manifest.delete("/docs", ["/docs/a.txt"])
+        remaining = set(manifest.load("/docs"))
+        manifest.clear("/docs")
+
+        # Assert
+        assert remaining == {"/docs/b.txt"}
+        assert manifest.load("/docs") == {}
+
+    def test_replace_directories(self, manifest):
+        """Test directory mtimes are replaced per root and cleared with it."""
+        # Arrange
+        manifest.replace_directories("/docs", {"/docs": 1, "/docs/old": 2})
+        manifest.replace_directories("/other", {"/other": 3})
+
+        # Act
+        manifest.replace_directories("/docs", {"/docs": 4})
+        replaced = manifest.load_directories("/docs")
+        manifest.clear("/docs")
+
+        # Assert
+        assert replaced == {"/docs": 4}
+        assert manifest.load_directories("/docs") == {}
+        assert manifest.load_directories("/other") == {"/other": 3}
+
+    def test_load_paths(self, manifest):
+        """Test lookup of specific paths across lookup batches."""
+        # Arrange
+        entries = [ManifestEntry(f"/docs/{i}.txt", 1, i, 1, 1, str(i)) for i in range(600)]
+        manifest.upsert("/docs", entries)
+        manifest.upsert("/other", [ManifestEntry("/docs/5.txt", 1, 1, 1, 1, "other")])
+
+        # Act
+        loaded = manifest.load_paths("/docs", ["/docs/5.txt", "/docs/599.txt", "/docs/missing.txt"])
+
+        # Assert
+        assert set(loaded) == {"/docs/5.txt", "/docs/599.txt"}
+        assert loaded["/docs/5.txt"].digest == "5"
+        assert manifest.load_paths("/docs", []) == {}
+
+    def test_checkpoints(self, manifest):
+        """Test scan checkpoints are stored per root and cleared with it."""
+        # Arrange
+        manifest.save_checkpoint("/docs", "/docs/a.txt")
+        manifest.save_checkpoint("/other", "/other/b.txt")
+
+        # Act
+        manifest.save_checkpoint("/docs", "/docs/c.txt")
+        saved = manifest.load_checkpoint("/docs")
+        manifest.clear_checkpoint("/other")
+        manifest.clear("/docs")
+
+        # Assert
+        assert saved == "/docs/c.txt"
+        assert manifest.load_checkpoint("/docs") is None
+        assert manifest.load_checkpoint("/other") is None
+
+    def test_persists_across_instances(self, manifest, manifest_path):
+        """Test manifest survives reopening."""
+        # Arrange
+        manifest.upsert("/docs", [ManifestEntry("/docs/a.txt", 1, 1, 1, 1, "digest")])
+        manifest.close()
+
+        # Act
+        reopened = ScanManifest(manifest_path)
+        loaded = reopened.load("/docs")
+        reopened.close()
+
+        # Assert
+        assert loaded["/docs/a.txt"].digest == "digest"
+
+
+class TestManifestEntry:
+    """Test suite for ManifestEntry and helpers."""
+
+    def test_from_stat_and_matches(self, tmp_path):
+        """Test entry built from stat matches only unchanged stat data."""
+        # Arrange
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("content")
+        entry = ManifestEntry.from_stat(str(file_path), os.stat(file_path))
+
+        # Act
+        os.utime(file_path, ns=(entry.mtime_ns + 1000, entry.mtime_ns + 1000))
+        touched = ManifestEntry.from_stat(str(file_path), os.stat(file_path))
+
+        # Assert
+        assert entry.size == 7
+        assert touched.matches(ManifestEntry.from_stat(str(file_path), os.stat(file_path))) is True
+        assert entry.matches(touched) is False
+
+    def test_digest_file(self, tmp_path):
+        """Test digest is BLAKE2b of file content."""
+        file_path = tmp_path / "a.txt"
+        file_path.write_bytes(b"content")
+
+        assert digest_file(str(file_path)) == hashlib.blake2b(b"content").hexdigest()
+
+    def test_scan_changes_summary(self):
+        """Test change counts and flags."""
+        changes = ScanChanges(directory_path="/docs", deleted=["/docs/gone.txt"], unchanged_count=3)
+
+        assert changes.has_changes is True
+        assert changes.changed_files == []
+        assert changes.to_dict() == {"created": 0, "modified": 0, "deleted": 1, "moved": 0, "unchanged": 3}
+
+    def test_match_moves(self):
+        """Test new files are paired by inode first, then by content digest."""
+        # Arrange
+        deleted = {
+            "/docs/a.txt": ManifestEntry("/docs/a.txt", 1, 10, 5, 0, "aaa"),
+            "/docs/b.txt": ManifestEntry("/docs/b.txt", 1, 11, 5, 0, "bbb"),
+            "/docs/c.txt": ManifestEntry("/docs/c.txt", 1, 12, 5, 0, "ccc"),
+        }
+        created = {
+            # Renamed: same inode and content
+            "/docs/new/a.txt": ManifestEntry("/docs/new/a.txt", 1, 10, 5, 1, "aaa"),
+            # Copied from another file system: new inode, same content
+            "/docs/new/b.txt": ManifestEntry("/docs/new/b.txt", 2, 99, 5, 1, "bbb"),
+            # Renamed and edited: same inode, new content
+            "/docs/new/c.txt": ManifestEntry("/docs/new/c.txt", 1, 12, 6, 1, "edited"),
+        }
+
+        # Act
+        moves = match_moves(created, deleted)
+
+        # Assert
+        assert moves == {"/docs/a.txt": "/docs/new/a.txt", "/docs/b.txt": "/docs/new/b.txt"}
+
+    def test_match_moves_pairs_each_file_once(self):
+        """Test identical new files take over one vanished file each."""
+        deleted = {"/docs/a.txt": ManifestEntry("/docs/a.txt", 1, 10, 5, 0, "same")}
+        created = {
+            "/docs/x.txt": ManifestEntry("/docs/x.txt", 1, 20, 5, 1, "same"),
+            "/docs/y.txt": ManifestEntry("/docs/y.txt", 1, 21, 5, 1, "same"),
+        }
+
+        assert match_moves(created, deleted) == {"/docs/a.txt": "/docs/x.txt"}
+
+    def test_scan_changes_record_moves(self, tmp_path):
+        """Test moved files are removed from created, modified and deleted."""
+        # Arrange
+        (tmp_path / "new.txt").write_text("new")
+        (tmp_path / "other.txt").write_text("other")
+        renamed = FileInfo(file_path=str(tmp_path / "new.txt"), file_size=3, modification_time=datetime.now())
+        other = FileInfo(file_path=str(tmp_path / "other.txt"), file_size=5, modification_time=datetime.now())
+        changes = ScanChanges(
+            directory_path=str(tmp_path), created=[renamed, other], deleted=["/docs/old.txt", "/docs/gone.txt"]
+        )
+
+        # Act
+        changes.record_moves({"/docs/old.txt": renamed.file_path})
+
+        # Assert
+        assert changes.moved == {"/docs/old.txt": renamed}
+        assert changes.created == [other]
+        assert changes.deleted == ["/docs/gone.txt"]
+        assert changes.to_dict()["moved"] == 1
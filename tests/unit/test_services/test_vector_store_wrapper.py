@@ -10,6 +10,7 @@ import asyncio
 from unittest.mock import Mock, patch, AsyncMock
 from typing import List, Dict, Any
 from datetime import datetime
+import uuid
 
 from docanalyzer.services.vector_store_wrapper import VectorStoreWrapper
 from docanalyzer.config.integration import DocAnalyzerConfig
@@ -198,6 +199,52 @@ class TestVectorStoreWrapper:
         with pytest.raises(ProcessingError, match="Vector Store Wrapper Service is not initialized"):
             await wrapper.process_file_blocks([sample_processing_block], "/test/file.txt")
     
+    @pytest.mark.asyncio
+    async def test_create_chunks_bulk_batches_by_adapter_batch_size(self, wrapper):
+        """Test bulk creation sends one adapter call per batch."""
+        wrapper.is_initialized = True
+        wrapper.adapter.batch_size = 2
+        chunks = [
+            {"chunk_id": str(uuid.uuid4()), "content": f"Chunk {i}", "metadata": {"block_type": "text"}}
+            for i in range(5)
+        ]
+        
+        mock_response = Mock()
+        mock_response.success = True
+        
+        with patch.object(wrapper.adapter, 'create_chunks', return_value=mock_response) as mock_create:
+            result = await wrapper.create_chunks_bulk(chunks, "/test/file.txt")
+            
+            assert result["success"] is True
+            assert result["created_count"] == 5
+            assert result["batch_count"] == 3
+            assert result["stored_chunk_ids"] == [chunk["chunk_id"] for chunk in chunks]
+            assert mock_create.call_count == 3
+            sent_blocks = mock_create.call_args_list[0].kwargs["processing_blocks"]
+            assert sent_blocks[0].metadata["uuid"] == chunks[0]["chunk_id"]
+    
+    @pytest.mark.asyncio
+    async def test_create_chunks_bulk_stops_after_failed_batch(self, wrapper):
+        """Test bulk creation reports per-chunk failures and skips later batches."""
+        wrapper.is_initialized = True
+        wrapper.adapter.batch_size = 2
+        chunks = [
+            {"chunk_id": str(uuid.uuid4()), "content": f"Chunk {i}", "metadata": {}}
+            for i in range(6)
+        ]
+        
+        ok_response = Mock(success=True)
+        failed_response = Mock(success=False)
+        
+        with patch.object(wrapper.adapter, 'create_chunks', side_effect=[ok_response, failed_response]) as mock_create:
+            result = await wrapper.create_chunks_bulk(chunks, "/test/file.txt")
+            
+            assert result["success"] is False
+            assert mock_create.call_count == 2
+            assert result["stored_chunk_ids"] == [chunk["chunk_id"] for chunk in chunks[:2]]
+            assert result["failed_chunk_ids"] == [chunk["chunk_id"] for chunk in chunks[2:]]
+            assert "Skipped" in result["errors"][chunks[5]["chunk_id"]]
+    
     @pytest.mark.asyncio
     async def test_search_documents_text_success(self, wrapper):
         """Test successful text search."""
@@ -279,6 +326,29 @@ class TestVectorStoreWrapper:
             
             assert result is True
     
+    @pytest.mark.asyncio
+    async def test_move_file_chunks_success(self, wrapper):
+        """Test moving chunks of a renamed file."""
+        wrapper.is_initialized = True
+        
+        with patch.object(wrapper.adapter, 'update_source_path', return_value=2) as mock_update, \
+             patch.object(wrapper, '_collect_operation_metrics') as mock_metrics:
+            
+            result = await wrapper.move_file_chunks("/test/old.txt", "/test/new.txt")
+            
+            assert result == 2
+            mock_update.assert_called_once_with("/test/old.txt", "/test/new.txt", limit=1000)
+            mock_metrics.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_move_file_chunks_failure(self, wrapper):
+        """Test chunk move failure is reported as ProcessingError."""
+        wrapper.is_initialized = True
+        
+        with patch.object(wrapper.adapter, 'update_source_path', side_effect=Exception("store down")):
+            with pytest.raises(ProcessingError):
+                await wrapper.move_file_chunks("/test/old.txt", "/test/new.txt")
+    
     @pytest.mark.asyncio
     async def test_get_file_chunks_success(self, wrapper):
         """Test successful file chunk retrieval."""
@@ -319,7 +319,7 @@ class TestTextProcessor:
         """Test processing file with encoding error."""
         # Create file with invalid UTF-8
         with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
-            f.write(b'\xff\xfe\x00\x00')  # Invalid UTF-8
+            f.write(b'\xff\xfd\x00\x00')  # Invalid UTF-8 without byte order mark
             temp_file = f.name
         
         try:
@@ -372,7 +372,7 @@ class TestTextProcessor:
         """Test file content reading with encoding error."""
         # Create file with invalid encoding
         with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
-            f.write(b'\xff\xfe\x00\x00')  # Invalid UTF-8
+            f.write(b'\xff\xfd\x00\x00')  # Invalid UTF-8 without byte order mark
             temp_file = f.name
         
         try:
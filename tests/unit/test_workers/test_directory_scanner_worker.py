@@ -51,6 +51,8 @@ class TestWorkerConfig:
         assert config.enable_detailed_logging is True
         assert config.enable_progress_reports is True
         assert config.max_retry_attempts == 3
+        assert config.streaming_scan is False
+        assert config.checkpoint_scans is False
     
     def test_init_invalid_scan_timeout(self):
         """Test configuration with invalid scan timeout."""
@@ -462,6 +464,80 @@ class TestDirectoryScannerWorker:
             assert mock_update.call_count == 1
             assert mock_send.call_count == 1
     
+    @pytest.mark.asyncio
+    async def test_process_files_streaming(self, worker):
+        """Test files from a streaming scan are processed in batches."""
+        with patch('docanalyzer.models.file_system.file_info.os.path.exists', return_value=True):
+            files = [
+                FileInfo(file_path=f"/test/file{i}.txt", file_size=100, modification_time=datetime.now())
+                for i in range(25)
+            ]
+        
+        async def stream():
+            for file_info in files:
+                yield file_info
+        
+        with patch.object(worker, '_process_file_batch') as mock_batch, \
+             patch.object(worker, '_update_progress', new_callable=AsyncMock) as mock_update, \
+             patch.object(worker.communication, 'send_result', new_callable=AsyncMock):
+            
+            mock_batch.side_effect = lambda batch: {"processed": len(batch), "failed": 0}
+            
+            result = await worker._process_files(stream())
+            
+            assert result.success is True
+            assert [len(call.args[0]) for call in mock_batch.call_args_list] == [10, 10, 5]
+            assert result.data["total_files"] == 25
+            assert result.data["processed_files"] == 25
+            mock_update.assert_called_with(25, 25)
+    
+    @pytest.mark.asyncio
+    async def test_process_files_saves_checkpoints(self, worker):
+        """Test the scan checkpoint advances to the last file of each processed batch."""
+        with patch('docanalyzer.models.file_system.file_info.os.path.exists', return_value=True):
+            files = [
+                FileInfo(file_path=f"/test/file{i}.txt", file_size=100, modification_time=datetime.now())
+                for i in range(25)
+            ]
+        
+        async def stream():
+            for file_info in files:
+                yield file_info
+        
+        worker.directory_scanner.save_scan_checkpoint = AsyncMock()
+        
+        with patch.object(worker, '_process_file_batch') as mock_batch, \
+             patch.object(worker, '_update_progress', new_callable=AsyncMock), \
+             patch.object(worker.communication, 'send_result', new_callable=AsyncMock):
+            
+            mock_batch.side_effect = lambda batch: {"processed": len(batch), "failed": 0}
+            
+            result = await worker._process_files(stream(), "/test")
+            
+            assert result.success is True
+            saved = [call.args for call in worker.directory_scanner.save_scan_checkpoint.await_args_list]
+            assert saved == [("/test", "/test/file9.txt"), ("/test", "/test/file19.txt"), ("/test", "/test/file24.txt")]
+    
+    @pytest.mark.asyncio
+    async def test_start_scanning_resumes_from_checkpoint(self, worker, tmp_path):
+        """Test a checkpointed streaming scan resumes after the saved file and clears it when done."""
+        worker.config.streaming_scan = True
+        worker.config.checkpoint_scans = True
+        worker.directory_scanner.load_scan_checkpoint = AsyncMock(return_value=str(tmp_path / "a.txt"))
+        worker.directory_scanner.clear_scan_checkpoint = AsyncMock()
+        
+        with patch.object(worker, '_scan_directory_iter') as mock_scan, \
+             patch.object(worker, '_process_files') as mock_process:
+            
+            mock_process.return_value = ProcessingResult(success=True, message="Processing completed")
+            
+            result = await worker.start_scanning(str(tmp_path))
+            
+            assert result.success is True
+            mock_scan.assert_called_once_with(str(tmp_path), str(tmp_path / "a.txt"))
+            assert mock_process.call_args.args[1] == str(tmp_path)
+            worker.directory_scanner.clear_scan_checkpoint.assert_awaited_once_with(str(tmp_path))
+    
     @pytest.mark.asyncio
     async def test_process_files_error(self, worker):
         """Test file processing error."""